@@ -119,16 +119,20 @@ HIDDEN_IMPORTS = [
     "mixins.event_mixin",
     "core",
     "core.application_state",
+    "core.builtin_translations",
     "core.config_manager",
     "core.language_manager",
     "core.log_manager",
     "core.panel_visibility",
     "core.play_state",
+    "core.startup_cache",
     "core.subscription_manager",
+    "core.user_data_store",
     "core.version",
     "models",
     "models.channel_mappings",
     "models.channel_model",
+    "models.channel_store",
     "services",
     "services.batch_edit_service",
     "services.channel_classifier",
@@ -136,8 +140,17 @@ HIDDEN_IMPORTS = [
     "services.channel_rating_service",
     "services.channel_quick_jump_service",
     "services.channel_dedup_service",
+    "services.clip_export_service",
+    "services.conditional_fetch",
+    "services.mpv_handle_pool",
+    "services.concurrency_controller",
+    "services.scan_checkpoint",
+    "services.scan_farm",
+    "services.multicast_probe",
+    "services.playlist_loader",
     "services.stream_quality_scorer",
     "services.epg_matcher",
+    "services.epg_store",
     "services.epg_reminder_service",
     "services.epg_search_service",
     "services.favorites_service",
@@ -157,6 +170,7 @@ HIDDEN_IMPORTS = [
     "server",
     "server.app",
     "server.routes",
+    "server.stream_relay",
     "ui",
     "ui.dialogs",
     "ui.dialogs.about_dialog",
@@ -199,12 +213,14 @@ HIDDEN_IMPORTS = [
     "utils.error_handler",
     "utils.general_utils",
     "utils.hdr_detect",
+    "utils.lazy_component",
     "utils.logging_helper",
     "utils.memory_manager",
     "utils.progress_manager",
     "utils.resource_cleaner",
     "utils.scan_state_manager",
     "utils.singleton",
+    "utils.startup_profiler",
     "utils.thread_safety",
 ]
 
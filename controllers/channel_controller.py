@@ -209,6 +209,33 @@ class ChannelController:
         except TypeError:
             pass
         QTimer.singleShot(50, lambda: self.load_visible_icons(list_widget, channels))
+        # 可见行的台标先入队，之后再按收藏、其余的优先级预热
+        QTimer.singleShot(100, lambda: self._warmup_logos(channels))
+
+    def _warmup_logos(self, channels):
+        w = self.window
+        logo_svc = getattr(w, '_logo_cache_service', None)
+        if not logo_svc:
+            return
+        from services.logo_cache_service import WARMUP_BACKGROUND, WARMUP_FAVORITE
+
+        strip_chars = '`' + '"' + '\''
+        favorite_urls = set()
+        favorites_ctrl = getattr(w, 'favorites_ctrl', None)
+        if favorites_ctrl:
+            favorite_urls = {fav.get('url', '') for fav in favorites_ctrl.get_favorites()}
+        favorite_logos = []
+        other_logos = []
+        for channel in channels:
+            logo_url = (channel.get('logo') or '').strip(strip_chars)
+            if not logo_url:
+                continue
+            if channel.get('url', '') in favorite_urls:
+                favorite_logos.append(logo_url)
+            else:
+                other_logos.append(logo_url)
+        logo_svc.warmup(favorite_logos, WARMUP_FAVORITE)
+        logo_svc.warmup(other_logos, WARMUP_BACKGROUND)
 
     def load_visible_icons(self, list_widget, channels):
         w = self.window
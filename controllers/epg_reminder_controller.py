@@ -1,15 +1,17 @@
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 from PySide6.QtCore import QTimer
 from core.log_manager import global_logger as logger
 from controllers.main_window_protocol import MainWindowProtocol
-from ui.dialogs.reminder_popup import ReminderPopup
+
+if TYPE_CHECKING:
+    from ui.dialogs.reminder_popup import ReminderPopup
 
 
 class EpgReminderController:
     def __init__(self, main_window: MainWindowProtocol):
         self.window: MainWindowProtocol = main_window
         self._service = None
-        self._active_popups: List[ReminderPopup] = []
+        self._active_popups: List['ReminderPopup'] = []
 
     def init_service(self, config_manager):
         from services.epg_reminder_service import EpgReminderService
@@ -80,6 +82,7 @@ class EpgReminderController:
                     tvg_id = r.get('tvg_id', '')
                     break
             switch_cb = lambda cn=channel_name, tid=tvg_id: self._switch_to_channel(cn, tid)
+            from ui.dialogs.reminder_popup import ReminderPopup
             popup = ReminderPopup(
                 w, channel_name, program_title,
                 start_time_str=start_time,
@@ -5,6 +5,7 @@
 
 from PySide6.QtCore import Qt, QEvent, QTimer
 from controllers.main_window_protocol import MainWindowProtocol
+from utils.lazy_component import peek_component
 
 
 class EventHandler:
@@ -630,9 +631,10 @@ class EventHandler:
                 logger.error(f"终止MPV播放器失败: {e}")
 
         # 3.5 终止多画面控制器
-        if hasattr(self.window, 'multi_screen_ctrl') and self.window.multi_screen_ctrl:
+        multi_screen_ctrl = peek_component(self.window, 'multi_screen_ctrl')
+        if multi_screen_ctrl:
             try:
-                self.window.multi_screen_ctrl.terminate()
+                multi_screen_ctrl.terminate()
             except Exception as e:
                 logger.error(f"终止多画面控制器失败: {e}")
 
@@ -670,11 +672,9 @@ class EventHandler:
         logo_svc = getattr(self.window, '_logo_cache_service', None)
         if logo_svc:
             try:
-                warmup_timer = getattr(logo_svc, '_warmup_timer', None)
-                if warmup_timer:
-                    warmup_timer.stop()
+                logo_svc.shutdown()
             except Exception as e:
-                logger.debug(f"停止台标缓存定时器失败: {e}")
+                logger.debug(f"停止台标缓存服务失败: {e}")
 
         # 6.6 停止DNS预取/连接预热
         for svc_name in ('_dns_prefetcher', '_connection_preheater'):
@@ -742,7 +742,8 @@ class EventHandler:
             'favorites_ctrl', 'epg_reminder_ctrl', 'event_handler',
         ]
         for attr in controller_attrs:
-            ctrl = getattr(self.window, attr, None)
+            # 按需创建的控制器若从未使用过，这里不应把它创建出来
+            ctrl = peek_component(self.window, attr)
             if ctrl is not None:
                 try:
                     if hasattr(ctrl, 'window'):
@@ -2,6 +2,7 @@ import os
 from typing import Dict, Optional, Any
 from PySide6.QtCore import QObject, QTimer
 from core.log_manager import global_logger as logger
+from utils.lazy_component import peek_component
 from ui.multi_screen_widget import MultiScreenWidget, MultiScreenCell
 
 
@@ -31,7 +32,7 @@ class MultiScreenController(QObject):
             self._widget.set_layout(count)
             return
 
-        pip_ctrl = getattr(self.window, 'pip_ctrl', None)
+        pip_ctrl = peek_component(self.window, 'pip_ctrl')
         if pip_ctrl and pip_ctrl.is_active:
             pip_ctrl.toggle()
             logger.info("多画面与PiP互斥：自动退出PiP模式")
@@ -10,6 +10,7 @@ from PySide6.QtCore import QRect
 from core.log_manager import global_logger as logger
 from controllers.main_window_protocol import MainWindowProtocol
 from utils.platform_utils import is_wayland, wayland_move, wayland_set_geometry
+from utils.lazy_component import peek_component
 
 
 class PipButton:
@@ -145,7 +146,7 @@ class PipController:
         if self._is_active:
             return
 
-        multi_ctrl = getattr(self.window, 'multi_screen_ctrl', None)
+        multi_ctrl = peek_component(self.window, 'multi_screen_ctrl')
         if multi_ctrl and multi_ctrl.is_active:
             multi_ctrl.exit_multi_screen()
             from core.log_manager import global_logger as _logger
@@ -7,6 +7,7 @@ from core.log_manager import global_logger as logger
 from controllers.main_window_protocol import MainWindowProtocol
 from ui.styles import AppStyles
 from services.fcc_service import FCCService
+from utils.lazy_component import peek_component
 
 
 class PlaybackController:
@@ -369,7 +370,9 @@ class PlaybackController:
             pause_path = AppStyles.get_icon('pause', btn_color)
             if pause_path:
                 w.play_button.setIcon(QIcon(pause_path))
-            w.pip_ctrl._update_play_btn()
+            pip_ctrl = peek_component(w, 'pip_ctrl')
+            if pip_ctrl:
+                pip_ctrl._update_play_btn()
             w._cancel_source_timeout()
             if hasattr(w, 'video_placeholder') and w.video_placeholder:
                 w.video_placeholder.hide()
@@ -418,7 +421,9 @@ class PlaybackController:
             play_path = AppStyles.get_icon('play', btn_color)
             if play_path:
                 w.play_button.setIcon(QIcon(play_path))
-            w.pip_ctrl._update_play_btn()
+            pip_ctrl = peek_component(w, 'pip_ctrl')
+            if pip_ctrl:
+                pip_ctrl._update_play_btn()
             if hasattr(w, 'update_timer'):
                 w.update_timer.stop()
             if w.play_state.is_idle:
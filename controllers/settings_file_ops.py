@@ -1252,24 +1252,30 @@ class SettingsFileOperations:
     # ==================== 内部文件 I/O ====================
 
     def _load_playlist_file(self, file_path: str):
-        tr = self._tr
         try:
-            content = load_m3u_file(file_path)
-
-            if self.window.channel_model and self.window.channel_model.load_from_file(content):
-                channels = self.window.channel_model.channels
+            model = self.window.channel_model
+            if model:
+                # 流式加载：频道分批进入模型，全部解析完后再同步到播放列表
+                model.load_from_path(
+                    file_path, on_finished=lambda success: self._on_playlist_file_loaded(file_path, success)
+                )
             else:
-                channels = []
+                self._on_playlist_file_loaded(file_path, False)
+        except Exception as e:
+            self._show_playlist_load_error(e)
+
+    def _on_playlist_file_loaded(self, file_path: str, success: bool):
+        try:
+            model = self.window.channel_model
+            # 主窗口的频道列表需要独立的 dict
+            channels = model.channels.to_dicts() if model and success else []
 
             self.window._local_channels = list(channels)
             self.window._local_channels_dirty = True
             app_state.replace_channels(channels)
 
-            if self.window.channel_model:
-                self.window.channel_model._source_file_path = file_path
-
-            if self.window.channel_model:
-                epg_url = getattr(self.window.channel_model, '_last_header_attrs', {}).get('epg_url', '')
+            if model:
+                epg_url = getattr(model, '_last_header_attrs', {}).get('epg_url', '')
                 if epg_url and not global_subscription_manager.get_epg_sources():
                     logger.info(f"本地文件头发现EPG地址，自动加载: {epg_url[:80]}")
                     try:
@@ -1292,12 +1298,16 @@ class SettingsFileOperations:
 
             logger.info(f"成功加载播放列表: {file_path}, 共 {len(channels)} 个频道")
         except Exception as e:
-            logger.error(f"加载播放列表失败: {e}")
-            QMessageBox.critical(
-                self.window,
-                tr("error", "Error"),
-                tr("open_file_error", "Failed to load playlist:\n{error}").format(error=str(e))
-            )
+            self._show_playlist_load_error(e)
+
+    def _show_playlist_load_error(self, e: Exception):
+        tr = self._tr
+        logger.error(f"加载播放列表失败: {e}")
+        QMessageBox.critical(
+            self.window,
+            tr("error", "Error"),
+            tr("open_file_error", "Failed to load playlist:\n{error}").format(error=str(e))
+        )
 
     def _save_playlist_file(self, file_path: str):
         tr = self._tr
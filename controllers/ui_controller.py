@@ -1427,7 +1427,7 @@ class UIController:
 
             pip_action = QAction(tr("menu_pip", "Picture-in-Picture\tP"), self.window)
             pip_action.setCheckable(True)
-            pip_action.triggered.connect(self.window.pip_ctrl.toggle)
+            pip_action.triggered.connect(lambda checked=False: self.window.pip_ctrl.toggle(checked))
             view_menu.addAction(pip_action)
             self.window._pip_menu_action = pip_action
 
@@ -1446,7 +1446,7 @@ class UIController:
             multi_screen_menu.addAction(ms_9)
 
             ms_exit = QAction(tr("menu_multi_exit", "Exit Multi Screen"), self.window)
-            ms_exit.triggered.connect(self.window.multi_screen_ctrl.exit_multi_screen)
+            ms_exit.triggered.connect(lambda: self.window.multi_screen_ctrl.exit_multi_screen())
             multi_screen_menu.addAction(ms_exit)
 
             refresh = QAction(tr("menu_refresh", "Refresh\tF5"), self.window)
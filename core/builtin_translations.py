@@ -0,0 +1,2609 @@
+"""
+内置翻译表（语言代码 -> {键: 文本}）
+
+启动时不直接导入本模块，由 LanguageManager 通过 core.startup_cache 读取编译后的缓存；
+缓存缺失或本文件变化时才会导入。
+"""
+
+BUILTIN_TRANSLATIONS = {
+    'zh': {
+        'language_name': '中文',
+        'app_title': 'ISEP',
+        'video_playback': '视频播放',
+        'play': '播放',
+        'pause': '暂停',
+        'stop': '停止',
+        'volume': '音量',
+        'scan_settings': '扫描设置',
+        'address_format': '地址格式',
+        'address_example': '地址示例',
+        'input_address': '输入地址',
+        'timeout_description': '设置扫描超时时间（秒）',
+        'thread_count_description': '设置扫描线程数',
+        'user_agent': 'User-Agent',
+        'referer': 'Referer',
+        'progress': '进度',
+        'timeout': '超时',
+        'thread_count': '线程数',
+        'scan_timeout': '超时(秒):',
+        'scan_threads': '线程数:',
+        'full_scan': '完整扫描',
+        'stop_scan': '停止扫描',
+        'generate_list': '生成列表',
+        'total_channels': '总数',
+        'valid': '有效',
+        'invalid': '无效',
+        'time_elapsed': '耗时',
+        'channel_list': '频道列表',
+        'validate_effectiveness': '检测有效性',
+        'hide_invalid': '隐藏无效项',
+        'smart_sort': '智能排序',
+        'please_load_list': '请先加载列表',
+        'channel_edit': '频道编辑',
+        'channel_name': '频道名称',
+        'channel_group': '频道分组',
+        'logo_address': 'Logo地址',
+        'channel_url': '频道URL',
+        'edit_channel': '编辑频道',
+        'add_channel': '添加频道',
+        'operation': '操作',
+        'open_list': '打开列表',
+        'save_list': '保存列表',
+        'language': '语言',
+        'about': '关于',
+        'required': '必填',
+        'optional': '可选',
+        'optional_default': '可选，为空使用默认值',
+        'optional_not_used': '可选，为空不使用',
+        'serial_number': '序号',
+        'resolution': '分辨率',
+        'status': '状态',
+        'latency_ms': '延迟(ms)',
+        'tvg_id': 'TVG-ID',
+        'tvg_chno': 'TVG频道号',
+        'tvg_shift': 'TVG时移',
+        'catchup': '回看',
+        'catchup_days': '回看天数',
+        'catchup_source': '回看源',
+        'catchup_correction': '回看时区修正',
+        'about_dialog_title': '关于 ISEP',
+        'current_version': '当前版本',
+        'latest_version': '最新版本',
+        'build_date': '编译日期',
+        'qt_version': 'QT版本',
+        'close_button': '关闭',
+        'checking_update': '检测中...',
+        'update_timeout': '请求超时',
+        'update_failed': '获取失败',
+        'api_limit': 'API限制',
+        'update_progress_title': '在线更新',
+        'update_checking': '正在检查更新...',
+        'update_downloading': '正在下载更新...',
+        'update_complete': '更新下载完成，请重启应用',
+        'update_error': '更新失败',
+        'network_error': '网络错误',
+        'feature_intro': '主要功能说明',
+        'smart_scan': '智能频道扫描',
+        'advanced_validation': '高级流验证',
+        'intelligent_management': '智能频道管理',
+        'integrated_playback': '集成视频播放',
+        'advanced_config': '高级配置管理',
+        'professional_tools': '专业工具集成',
+        'usage_method': '使用方法',
+        'scan_usage': '在扫描设置中输入地址格式，点击"完整扫描"开始',
+        'validation_usage': '打开播放列表后点击"检测有效性"按钮',
+        'management_usage': '右键频道列表或拖拽调整顺序',
+        'playback_usage': '双击频道列表中的任意频道',
+        'config_usage': '所有设置自动保存，无需手动操作',
+        'tools_usage': '通过工具栏访问各专业工具',
+        'cancel_button': '取消',
+        'update_success': '更新完成',
+        'file': '文件',
+        'edit': '编辑',
+        'view': '视图',
+        'tools': '工具',
+        'help': '帮助',
+        'new_playlist': '新建播放列表',
+        'open_playlist': '打开播放列表',
+        'save_playlist': '保存播放列表',
+        'save_as': '另存为...',
+        'import_channels': '导入频道',
+        'export_channels': '导出频道',
+        'exit': '退出',
+        'undo': '撤销',
+        'redo': '重做',
+        'select_all': '全选',
+        'delete_selected': '删除选中',
+        'show_epg': '显示节目单',
+        'show_playlist': '显示播放列表',
+        'fullscreen': '全屏模式',
+        'refresh': '刷新',
+        'reset_layout': '重置布局',
+        'scan_channels': '扫描整理',
+        'verify_channels': '验证频道',
+        'restore_hidden': '恢复隐藏项',
+        'channel_management': '频道管理',
+        'channel_mapping': '频道映射',
+        'favorite_management': '收藏管理',
+        'network_settings': '网络设置',
+        'player_settings': '播放器设置',
+        'usage_instructions': '使用说明',
+        'chinese': '中文',
+        'english': 'English',
+        'loading_channels': '正在加载频道...',
+        'channels_loaded': '成功加载 {count} 个频道',
+        'file_format_error': '文件格式不正确或为空',
+        'open_file_error': '打开文件失败: {error}',
+        'save_success': '保存成功',
+        'save_error': '保存文件失败: {error}',
+        'no_content': '没有可保存的内容',
+        'file_selection_error': '文件选择失败: {error}',
+        'app_name': 'ISEP',
+        'version': '版本 1.0.0',
+        'description': 'IPTV 频道扫描和编辑工具',
+        'usage_title': '使用说明',
+        'usage_content': '## 基本操作\n\n### 1. 打开播放列表\n- 点击"文件"菜单 → "打开播放列表"（Ctrl+O）\n- 支持 M3U、M3U8、TXT 格式\n- 也可将文件直接拖放到主窗口打开\n\n### 2. 播放频道\n- 在频道列表中**双击**频道开始播放\n- 底部控制面板：▶ 播放 / ▮▮ 暂停 / ■ 停止\n- 音量滑块调节音量，点击图标静音/取消静音\n- 倍速按钮切换播放速度，比例按钮切换画面比例\n- 全屏按钮或 F11 进入全屏\n- **↑ ↓** 键切换频道，**← →** 键调整音量\n\n### 3. EPG 电子节目单\n- 左侧面板显示当前频道节目安排\n- 点击 ◀ / ▶ 切换日期查看节目\n- 进度条实时显示当前节目播放进度\n- 支持配置 EPG 数据源自动订阅更新\n- M3U 文件头中的 EPG 地址会自动加载\n\n### 4. 扫描整理\n- 工具菜单 → 扫描整理\n- 输入 IP 范围或流地址（如 `239.3.1.[1-100]:8000`）\n- 设置超时时间和线程数，支持追加扫描和重试\n- 扫描完成后可使用**批量操作**：\n  - **自动分类**：根据频道名称规则自动归类分组\n  - **清理名称**：去除多余括号、HD后缀等，规范化频道名\n  - **匹配台标**：批量匹配频道台标图片\n  - **分配字段**：批量设置分组、台标等属性\n  - **按组排序**：按频道分组自动排序\n\n### 5. 验证频道\n- 批量检测频道有效性，显示延迟、分辨率等参数\n- 支持智能重试失败的项\n\n### 6. 频道管理\n- **拖拽排序**：拖动调整频道顺序\n- **分组筛选**：下拉框按分组过滤频道\n- **右键菜单**：删除、复制、清理名称、匹配台标等操作\n- **频道分类**：基于正则规则自动归类到对应分组\n- **名称清理**：智能去除冗余信息，规范化显示\n- **导出保存**：另存为 M3U / TXT / Excel 格式\n\n## 高级功能\n\n### 订阅设置\n- 工具菜单 → 订阅设置\n- 配置多个播放列表源和 EPG 数据源，独立管理\n- 支持过期自动刷新和增量更新\n- RTSP 传输方式可选 TCP/UDP/LAVF\n\n### 频道映射\n- 工具菜单 → 频道映射管理器\n- 可视化编辑频道名称、LOGO、分组的映射规则\n\n### 文件关联\n- 工具菜单 → 文件关联\n- 勾选需要关联的格式（M3U/M3U8/TXT/视频格式）\n- 关联后可从资源管理器右键打开\n\n### 界面定制\n- **主题切换**：5 种主题即时切换\n- **语言切换**：中文 / English\n- **面板控制**：视图菜单或快捷键\n  - **E** — EPG 节目单面板\n  - **L** — 频道列表面板\n  - **M** — 播放控制面板\n  - **Y** — 隐藏/恢复所有悬浮面板\n  - **Tab** — 切换 OSD 信息遮罩\n- **F5** 刷新界面，**F11** 全屏，**Ctrl+Q** 退出\n\n### 时移/回看\n- 支持多种回看类型：default / append / shift / flussonic / xc\n- 时间变量替换支持自定义格式和时区偏移\n- M3U 文件头可定义全局回看参数',
+        'about_title': '关于',
+        'about_content': 'ISEP\n版本 1.0.0\n\nIPTV 频道扫描和编辑工具\n\n© 2026 ISEP',
+        'epg_title': '节目单',
+        'playlist_title': '播放列表',
+        'not_playing': '未播放',
+        'language_changed': '语言已切换',
+        'no_epg_data': '暂无节目信息',
+        'no_channels': '暂无频道',
+        'media_info': '媒体信息',
+        'menu_file': '文件',
+        'menu_open_playlist': '打开列表\tCtrl+O',
+        'menu_open_stream': '打开串流\tCtrl+U',
+        'menu_open_video': '打开视频\tCtrl+Shift+O',
+        'open_stream': '打开串流',
+        'open_stream_url': '请输入直播地址或串流URL:',
+        'open_video': '打开视频',
+        'video_files': '视频文件 (*.mp4 *.mkv *.avi *.mov *.flv *.wmv *.ts *.webm);;所有文件 (*)',
+        'temp_stream': '临时串流',
+        'stream_name_optional': '频道名称（可选）:',
+        'stream_name_hint': '留空则自动命名',
+        'm3u_download_failed': 'M3U列表下载失败',
+        'm3u_loaded_n_channels': '已加载 {n} 个频道',
+        'invalid_url_prompt': '输入的地址格式不正确，请检查是否包含完整的URL\n（例如 http://example.com/playlist.m3u）',
+        'cancel': '取消',
+        'ok': '确定',
+        'close_confirm_title': '关闭确认',
+        'close_confirm_text': '关闭后将无法接收节目提醒，是否最小化到系统托盘继续运行提醒功能？',
+        'close_minimize_tray': '最小化到托盘',
+        'close_exit': '直接退出',
+        'close_remember_choice': '记住选择，不再询问',
+        'close_behavior_settings': '关闭行为',
+        'close_behavior_ask': '每次询问',
+        'close_action_label': '关闭窗口时:',
+        'local_video': '本地视频',
+        'local_video_file': '本地视频文件',
+        'bluray': '蓝光原盘',
+        'open_bluray': '打开蓝光原盘',
+        'open_bluray_ask': '是否选择蓝光原盘目录？',
+        'select_bluray_dir': '选择蓝光原盘目录',
+        'not_bluray': '非蓝光原盘',
+        'not_bluray_msg': '所选目录不是有效的蓝光原盘结构（未找到BDMV/STREAM目录）',
+        'select_folder': '选择文件夹',
+        'select_confirm': '选定',
+        'select_current_folder': '选定当前文件夹',
+        'parent_folder': '上级目录',
+        'video_files_only': '仅视频文件',
+        'all_files': '所有文件',
+        'no_video_in_folder': '所选文件夹中未找到支持的视频文件',
+        'menu_recent_open': '最近打开',
+        'menu_save_as': '另存为...\tCtrl+S',
+        'menu_exit': '退出\tCtrl+Q',
+        'menu_view': '视图',
+        'menu_epg_list': '节目列表\tE',
+        'menu_playlist': '播放列表\tL',
+        'menu_control_panel': '控制面板\tM',
+        'menu_fullscreen': '全屏模式\tF11',
+        'menu_pip': '画中画\tP',
+        'menu_multi_screen': '多画面',
+        'menu_multi_2x2': '2×2 (4画面)',
+        'menu_multi_3x3': '3×3 (9画面)',
+        'menu_multi_exit': '退出多画面',
+        'multi_screen_entered': '已进入多画面模式',
+        'multi_screen_exited': '已退出多画面模式',
+        'search_channel': '搜索频道...',
+        'epg_no_catchup': '该频道不支持回看',
+        'epg_upcoming': '节目尚未开始',
+        'epg_date_limit': '已到日期范围边界',
+        'exit_catchup': '退出回看',
+        'panel_prev_ch': '上一频道',
+        'panel_next_ch': '下一频道',
+        'panel_pip': '画中画',
+        'panel_favorite': '收藏',
+        'added_to_favorites': '已添加到收藏夹',
+        'removed_from_favorites': '已从收藏夹移除',
+        'add_to_favorites': '加入收藏',
+        'remove_from_favorites': '删除收藏',
+        'clear_history': '清空历史',
+        'channel_deleted': '频道已删除',
+        'history_cleared': '历史已清空',
+        'add_to_local': '添加到本地列表',
+        'added_to_local': '已添加到本地列表',
+        'remove_from_history': '删除此历史记录',
+        'history_removed': '历史记录已删除',
+        'copy_channel_url': '复制频道地址',
+        'copied_to_clipboard': '已复制到剪贴板',
+        'ctx_play_now': '播放',
+        'no_favorites': '暂无收藏',
+        'no_history': '暂无播放历史',
+        'favorites_tab': '收藏',
+        'history_tab': '历史',
+        'reminder_added': '已设置提醒',
+        'reminder_removed': '已取消提醒',
+        'reminder_notify': '提醒: {channel} 即将开播 {title}',
+        'reminder_auto_switch': '提醒: 即将开播 {title}，已自动切换到 {channel}',
+        'reminder_tray_title': 'EPG节目提醒',
+        'reminder_tray_msg': '{channel}: {title} 即将开播',
+        'reminder_popup_title': '节目提醒',
+        'reminder_popup_channel': '频道: {channel}',
+        'reminder_popup_program': '节目: {title}',
+        'reminder_popup_time': '开始时间: {time}',
+        'reminder_popup_switch': '切换频道',
+        'reminder_popup_close': '关闭',
+        'epg_set_reminder': '设置提醒',
+        'epg_cancel_reminder': '取消提醒',
+        'menu_catchup': '回看',
+        'epg_copy_title': '复制节目标题',
+        'epg_copy_info': '复制节目信息',
+        'epg_goto_channel': '定位到当前频道',
+        'reminder_manager': '提醒管理',
+        'reminder_info': '提醒基于具体频道+节目+开始时间，节目开始前60秒触发通知',
+        'reminder_count_info': '共 {count} 个提醒 | 提醒基于具体频道+节目+开始时间，节目开始前60秒触发通知',
+        'remove_selected': '删除选中',
+        'clear_all': '清空全部',
+
+        'global_search': '全局搜索',
+        'global_search_placeholder': '搜索频道名/分组/节目...',
+        'search_no_results': '无结果',
+        'search_type_to_search': '输入关键词开始搜索',
+        'searching': '搜索中...',
+        'search_results_count': '找到 {count} 个结果',
+        'search_results_truncated': '找到 {count}+ 个结果（已截断）',
+        'search_no_scope': '请至少选择一个搜索范围',
+        'search_scope_channel': '频道',
+        'search_scope_epg': 'EPG节目',
+        'search_placeholder': '输入关键词搜索...',
+        'search': '搜索',
+        'epg_program': '节目',
+        'epg_search_result': 'EPG搜索结果',
+        'epg_search': 'EPG搜索',
+        'epg_search_placeholder': '搜索节目名称/描述...',
+        'epg_timeline': 'EPG时间轴',
+        'epg_date': '日期',
+        'epg_no_data': '无EPG数据',
+        'epg_no_programs': '该日期无节目数据',
+        'epg_channels_loaded': '{count}个频道 / {prog}个节目',
+        'menu_epg_timeline': 'EPG时间轴',
+        'menu_epg_search': 'EPG搜索',
+        'menu_search': '搜索',
+        'tooltip_minimize': '最小化',
+        'tooltip_maximize': '最大化',
+        'tooltip_restore': '还原',
+        'tooltip_close': '关闭',
+        'menu_refresh': '刷新界面\tF5',
+        'menu_reset_layout': '重置布局',
+        'menu_log_level': '日志等级',
+        'log_level_debug': '调试',
+        'log_level_info': '信息',
+        'log_level_warning': '警告',
+        'log_level_error': '错误',
+        'menu_edit': '编辑',
+        'menu_undo': '撤销\tCtrl+Z',
+        'menu_redo': '重做\tCtrl+Shift+Z',
+        'menu_clear_history': '清空历史',
+        'menu_playback': '播放',
+        'menu_seek': '快进/快退',
+        'menu_volume': '音量',
+        'menu_speed': '倍速',
+        'menu_audio_subtitle': '音频与字幕',
+        'menu_video_image': '视频与图像',
+        'menu_advanced_tools': '高级工具',
+        'menu_prev_channel': '上一个频道\t↑',
+        'menu_next_channel': '下一个频道\t↓',
+        'menu_prev_channel2': '上一个频道(备选)\tCtrl+Shift+↑',
+        'menu_next_channel2': '下一个频道(备选)\tCtrl+Shift+↓',
+        'menu_back_channel': '切回上一频道\tBackspace',
+        'menu_play_pause': '播放/暂停\tSpace',
+        'menu_stop': '停止\tEsc',
+        'menu_seek_back': '快退\t←',
+        'menu_seek_forward': '快进\t→',
+        'menu_vol_up': '音量+\t滚轮↑',
+        'menu_vol_down': '音量-\t滚轮↓',
+        'menu_mute': '静音\tCtrl+M',
+        'menu_speed_up': '加速\t.',
+        'menu_speed_down': '减速\t,',
+        'menu_screenshot': '截图\tS',
+        'osd_volume': '音量',
+        'osd_muted': '已静音',
+        'osd_speed': '速度',
+        'osd_aspect_ratio': '画面比例',
+        'osd_audio_track': '音频: {}',
+        'osd_audio_track_failed': '音频切换失败',
+        'osd_audio_track_fallback': '音频轨道不可用，已切换至：{}',
+        'osd_subtitle_track': '字幕: {}',
+        'osd_subtitle_track_failed': '字幕切换失败',
+        'osd_sub_track_fallback': '字幕轨道不可用，已切换至：{}',
+        'osd_sub_visible': '字幕：开',
+        'osd_sub_hidden': '字幕：关',
+        'osd_sub_delay': '字幕延迟',
+        'osd_sub_scale': '字幕缩放',
+        'osd_sub_pos': '字幕位置',
+        'menu_subtitle_style': '字幕样式...',
+        'menu_subtitle_download': '在线下载字幕...',
+        'ctx_download_subtitle': '在线下载字幕...',
+        'ctx_subtitle_style': '字幕样式...',
+        'ctx_sub_visibility': '显示字幕',
+        'ctx_sub_delay': '字幕延迟',
+        'ctx_sub_scale': '字幕缩放',
+        'ctx_sub_pos': '字幕位置',
+        'ctx_sub_pos_up': '上移',
+        'ctx_sub_pos_down': '下移',
+        'ctx_sub_pos_reset': '重置',
+        'subtitle_style_title': '字幕样式',
+        'subtitle_download_title': '在线下载字幕',
+        'sub_style_group': '字幕样式',
+        'sub_ctrl_group': '字幕控制',
+        'sub_preset_group': '快速预设',
+        'sub_color': '字幕颜色',
+        'sub_border_color': '边框颜色',
+        'sub_shadow_color': '阴影颜色',
+        'sub_font': '字体',
+        'sub_font_size': '字体大小',
+        'sub_border_size': '边框粗细',
+        'sub_shadow_offset': '阴影偏移',
+        'sub_font_style': '字形',
+        'sub_bold': '加粗',
+        'sub_italic': '斜体',
+        'sub_margin': '边距',
+        'sub_align': '对齐',
+        'sub_delay': '字幕延迟',
+        'sub_scale': '字幕缩放',
+        'sub_pos': '字幕位置',
+        'sub_visibility': '显示字幕',
+        'sub_preset_default': '默认',
+        'sub_preset_yellow': '黄色描边',
+        'sub_preset_outline': '粗描边',
+        'sub_preset_clean': '无阴影',
+        'sub_apply_now': '立即应用',
+        'sub_save': '保存',
+        'sub_reset': '重置默认',
+        'sub_close': '关闭',
+        'sub_osd_applied': '字幕样式已应用',
+        'sub_osd_saved': '字幕样式已保存',
+        'sub_search_placeholder': '片名 / 文件名（留空按文件哈希搜索）',
+        'sub_lang_eng': '英语',
+        'sub_lang_chi': '中文',
+        'sub_lang_cjk': '中日韩',
+        'sub_lang_all': '全部',
+        'sub_search': '搜索',
+        'sub_searching': '正在搜索...',
+        'sub_no_results': '没有找到字幕',
+        'sub_results_count': '找到 {} 条结果',
+        'sub_rating': '评分',
+        'sub_downloads': '下载',
+        'sub_bad': '劣质',
+        'sub_auto_dl': '自动下载',
+        'sub_browser_dl': '浏览器下载',
+        'sub_open_browser_hint': '已在浏览器打开详情页，请手动下载字幕',
+        'sub_download': '下载并加载',
+        'sub_downloading': '正在下载...',
+        'sub_dl_failed': '下载失败',
+        'sub_dl_ok': '下载完成：{}',
+        'sub_loaded': '字幕已加载',
+        'menu_video_eq': '视频图像调整...',
+        'ctx_video_eq': '视频图像调整...',
+        'video_eq_title': '视频图像调整',
+        'video_eq_group_image': '图像参数',
+        'video_eq_group_transform': '画面变换',
+        'video_eq_brightness': '亮度',
+        'video_eq_contrast': '对比度',
+        'video_eq_saturation': '饱和度',
+        'video_eq_hue': '色调',
+        'video_eq_gamma': '伽马',
+        'video_eq_sharpness': '锐度',
+        'video_eq_rotate': '旋转',
+        'video_eq_flip': '镜像翻转',
+        'video_eq_flip_none': '无',
+        'video_eq_flip_horizontal': '水平翻转',
+        'video_eq_flip_vertical': '垂直翻转',
+        'video_eq_flip_both': '双向翻转',
+        'video_eq_reset_on_new_file': '切换文件时自动重置',
+        'video_eq_reset': '重置全部',
+        'video_eq_apply': '应用',
+        'video_eq_save': '保存',
+        'video_eq_close': '关闭',
+        'video_eq_reset_done': '图像参数已重置',
+        'video_eq_applied': '图像参数已应用',
+        'video_eq_saved': '图像参数已保存',
+        'osd_video_brightness': '亮度',
+        'osd_video_contrast': '对比度',
+        'osd_video_saturation': '饱和度',
+        'osd_video_hue': '色调',
+        'osd_video_gamma': '伽马',
+        'osd_video_sharpness': '锐度',
+        'osd_video_rotate': '旋转',
+        'osd_video_flip': '翻转',
+        # ---------- 运动补偿 ----------
+        'video_eq_group_motion_comp': '运动补偿',
+        'mc_strength_label': '强度',
+        'mc_off': '关闭',
+        'mc_low': '轻度（帧混合）',
+        'mc_medium': '中度（运动补偿）',
+        'mc_high': '强力（高级补偿）',
+        'mc_fps_label': '目标帧率',
+        'mc_hint': '需 copy-back 硬解或软解。中度以上会明显增加 CPU 负载',
+        'osd_motion_comp': '运动补偿',
+        # ---------- 分辨率提升 ----------
+        'video_eq_group_super_res': '分辨率提升',
+        'sr_scale_label': '缩放算法',
+        'sr_detail_label': '细节增强',
+        'sr_off': '关闭',
+        'sr_bilinear': '双线性',
+        'sr_bicubic': '双三次',
+        'sr_lanczos': 'Lanczos',
+        'sr_spline': '样条',
+        'sr_ewa_lanczos': 'EWA Lanczos',
+        'sr_ewa_lanczossharp': 'EWA Lanczos Sharp',
+        'sr_detail': '细节',
+        'sr_hint': '缩放算法全局生效；细节增强需 copy-back 硬解或软解',
+        'osd_super_res': '分辨率提升',
+        # 用户着色器
+        'video_eq_group_enhance': '视频增强',
+        'video_eq_group_shader': 'AI 超分辨率着色器',
+        'shader_preset_label': '着色器预设',
+        'shader_off': '关闭',
+        'shader_not_found': '文件未找到，请放入 shaders/ 目录',
+        'shader_not_found': '文件未找到，请放入 shaders/ 目录',
+        'shader_ravu': 'RAVU 锐利放大',
+        'shader_fsrcnnx': 'FSRCNNX 超分辨率',
+        'shader_anime4k': 'Anime4K 动画增强',
+        'shader_krig': 'KrigBilateral 色度升频',
+        'shader_ssim': 'SSim 降频',
+        'shader_esrgan': 'ESRGAN 高质量超分',
+        'shader_adaptive_sharpen': '自适应锐化',
+        'shader_hint': 'GLSL 着色器在 GPU 运行，不影响 CPU。请将 .glsl/.hook 文件放在 shaders/ 目录',
+        'osd_shader': '着色器',
+        # 第三阶段：智能场景检测
+        'group_scene_detect': '智能场景检测',
+        'scene_detect_enable': '自动检测内容类型',
+        'scene_detect_hint': '根据视频分辨率、帧率、码率自动判断内容类型（动画/体育/电影），\n动态调整运动补偿和缩放参数',
+        'scene_detect_on': '智能场景检测已启用',
+        'scene_detect_off': '智能场景检测已关闭',
+        'scene_detect_starting': '检测中...',
+        'scene_detect_label': '场景检测',
+        # 第三阶段：预设管理
+        'group_preset_manage': '预设管理',
+        'btn_apply_preset': '应用',
+        'btn_save_preset': '保存为...',
+        'btn_delete_preset': '删除',
+        'save_preset_title': '保存预设',
+        'save_preset_prompt': '预设名称:',
+        'my_preset': '我的预设',
+        'builtin': '内置',
+        'preset_applied': '预设已应用',
+        'presets_imported': '已导入',
+        'presets_count': '个预设',
+        'confirm_delete': '确认删除',
+        'confirm_delete_preset': '确定删除预设 "{name}" 吗？',
+        # 第三阶段：GPU API
+        'gpu_api_label': 'GPU 渲染后端:',
+        'gpu_api_auto': '自动 (D3D11)',
+        'gpu_api_d3d11': 'D3D11 (默认)',
+        'gpu_api_vulkan': 'Vulkan (实验性)',
+        'gpu_api_hint': 'Vulkan 可能在部分 GPU 上获得更好性能，需重启播放器生效',
+        # 电影预设
+        'preset_movie': '电影模式',
+        # 智能预设
+        'video_eq_group_smart_preset': '智能预设',
+        'preset_auto': '智能推荐',
+        'preset_performance': '性能优先',
+        'preset_quality': '画质优先',
+        'preset_anime': '动画优化',
+        'preset_sports': '体育直播',
+        'osd_smart_preset': '智能预设',
+        # 硬件信息
+        'video_eq_group_hardware': '硬件信息',
+        'menu_audio_eq': '音频调整...',
+        'ctx_audio_eq': '音频调整...',
+        'audio_eq_title': '音频调整',
+        'audio_eq_group_delay': '音频同步',
+        'audio_eq_group_channels': '声道布局',
+        'audio_eq_group_device': '输出设备',
+        'audio_eq_group_pitch': '音调补偿',
+        'audio_eq_group_equalizer': '均衡器',
+        'audio_eq_group_channel_vol': '声道信息',
+        'audio_eq_group_channel_info': '声道信息',
+        'audio_eq_channel_info': '检测中...',
+        'audio_eq_channel_refresh': '刷新',
+        'audio_eq_channel_reset_vol': '重置音量',
+        'audio_eq_channel_no_playback': '未在播放，无法检测声道',
+        'audio_eq_channel_not_detected': '无法检测声道布局',
+        'audio_eq_channel_layout': '布局',
+        'audio_eq_channel_reset_done': '声道音量已重置',
+        'audio_eq_delay': '音频延迟',
+        'audio_eq_channels': '声道',
+        'audio_eq_device': '设备',
+        'audio_eq_pitch': '音调',
+        'audio_eq_reset_on_new_file': '切换文件时自动重置',
+        'audio_eq_reset': '重置全部',
+        'audio_eq_apply': '应用',
+        'audio_eq_save': '保存',
+        'audio_eq_close': '关闭',
+        'audio_eq_reset_done': '音频参数已重置',
+        'osd_channel_vol': '声道音量',
+        'audio_eq_applied': '音频参数已应用',
+        'audio_eq_saved': '音频参数已保存',
+        'audio_eq_preset': '快速预设',
+        'audio_eq_preset_flat': '平直',
+        'audio_eq_preset_bass': '重低音',
+        'audio_eq_preset_treble': '高音',
+        'audio_eq_preset_vocal': '人声',
+        'audio_eq_preset_classical': '古典',
+        'audio_eq_preset_pop': '流行',
+        'audio_eq_preset_rock': '摇滚',
+        'audio_eq_preset_electronic': '电子',
+        'osd_audio_delay': '音频延迟',
+        'osd_audio_channels': '声道',
+        'osd_audio_pitch': '音调',
+        'osd_audio_eq_band': '频段',
+        # ---------- 播放队列与播放控制 ----------
+        'menu_playback_queue': '播放队列与控制...',
+        'ctx_playback_queue': '播放队列与控制...',
+        'playback_queue_title': '播放队列与控制',
+        'playback_queue_group_queue': '播放队列',
+        'playback_queue_group_ab_loop': 'A-B 循环',
+        'playback_queue_group_frame': '逐帧',
+        'playback_queue_group_list': '当前队列',
+        'playback_queue_mode_none': '不循环',
+        'playback_queue_mode_single': '单文件循环',
+        'playback_queue_mode_all': '列表循环',
+        'playback_queue_mode_shuffle': '随机播放',
+        'playback_queue_cycle_mode': '切换循环模式',
+        'playback_queue_toggle_shuffle': '随机播放开关',
+        'playback_queue_play_next': '下一文件\tPgDown',
+        'playback_queue_play_prev': '上一文件\tPgUp',
+        'playback_queue_ab_set_a': '设置 A 点\tA',
+        'playback_queue_ab_set_b': '设置 B 点\tB',
+        'playback_queue_ab_clear': '清除 A-B\tC',
+        'playback_queue_ab_status': 'A-B 循环状态',
+        'playback_queue_ab_active': '已激活（A={a:.2f}s, B={b:.2f}s）',
+        'playback_queue_ab_inactive': '未激活',
+        'playback_queue_ab_only_a': '已设置 A 点（{a:.2f}s）',
+        'playback_queue_ab_only_b': '已设置 B 点（{b:.2f}s）',
+        'playback_queue_frame_forward': '前进一帧\t]',
+        'playback_queue_frame_back': '后退一帧\t[',
+        'playback_queue_close': '关闭',
+        'playback_queue_empty': '队列为空（打开本地视频文件后会自动加入队列）',
+        'playback_queue_current': '当前',
+        'osd_queue_mode': '队列模式',
+        'osd_play_next': '下一文件',
+        'osd_play_prev': '上一文件',
+        'osd_ab_loop_a': 'A 点',
+        'osd_ab_loop_b': 'B 点',
+        'osd_ab_loop_cleared': 'A-B 循环已清除',
+        'osd_ab_loop_inactive': 'A-B 循环未激活（需先设置 A 和 B 点）',
+        'osd_frame_step': '逐帧',
+        'osd_shuffle_on': '随机播放：开',
+        'osd_shuffle_off': '随机播放：关',
+        # ---------- 断点续播 ----------
+        'menu_resume_list': '断点续播列表...',
+        'ctx_resume_list': '断点续播列表...',
+        'resume_list_title': '断点续播',
+        'resume_list_info': '已保存的播放位置。双击列表项可恢复播放，或使用下方按钮操作。',
+        'resume_list_group': '断点列表',
+        'resume_list_resume': '恢复选中',
+        'resume_list_delete': '删除断点',
+        'resume_list_clear_all': '清除全部',
+        'resume_list_empty': '暂无保存的断点',
+        'osd_resume_restored': '已恢复到',
+        'osd_resume_cleared': '断点已清除',
+        'osd_resume_not_in_list': '该文件不在当前播放列表中',
+        # ---------- 网络流媒体增强 ----------
+        'menu_network_enhance': '网络流媒体增强...',
+        'ctx_network_enhance': '网络流媒体增强...',
+        'network_enhance_title': '网络流媒体增强',
+        'network_enhance_group_referer': 'HTTP Referer',
+        'network_enhance_group_proxy': 'HTTP/HTTPS 代理',
+        'network_enhance_group_headers': 'HTTP 头',
+        'network_enhance_referer': 'Referer',
+        'network_enhance_referer_hint': '用于绕过防盗链。留空则不设置。',
+        'network_enhance_proxy': '代理 URL',
+        'network_enhance_proxy_hint': '支持格式：\n  http://host:port\n  https://host:port\n  socks5://host:port\n  socks5h://host:port（DNS 通过代理解析）\n留空则不使用代理。',
+        'network_enhance_headers_hint': '每行一个 HTTP 头，格式：Key: Value',
+        'network_enhance_clear': '清空全部',
+        'network_enhance_apply': '应用',
+        'network_enhance_applied': '网络设置已应用',
+        'network_enhance_saved': '网络设置已保存',
+        # 连拍截图
+        'menu_burst_screenshot': '连拍截图...',
+        'ctx_burst_screenshot': '连拍截图...',
+        'burst_screenshot_title': '连拍截图',
+        'burst_screenshot_group_params': '参数',
+        'burst_screenshot_interval': '间隔',
+        'burst_screenshot_total': '总数',
+        'burst_screenshot_group_progress': '进度',
+        'burst_screenshot_start': '开始',
+        'burst_screenshot_stop': '停止',
+        'burst_screenshot_status_idle': '空闲',
+        'burst_screenshot_status_running': '运行中: {n}/{total}',
+        'burst_screenshot_status_done': '完成: {n}/{total}',
+        'burst_screenshot_not_playing': '没有正在播放的媒体',
+        'burst_screenshot_done': '连拍完成: {n} 张截图',
+        # 切片导出 / GIF
+        'menu_clip_export': '切片导出 / GIF...',
+        'clip_export_title': '切片导出 / GIF 制作',
+        'clip_export_group_time': '时间范围',
+        'clip_export_start_time': '起始时间',
+        'clip_export_duration': '时长',
+        'clip_export_use_current': '使用当前播放位置',
+        'clip_export_group_output': '输出设置',
+        'clip_export_format': '输出格式',
+        'clip_export_format_mp4': 'MP4 (视频)',
+        'clip_export_format_mkv': 'MKV (视频)',
+        'clip_export_format_webm': 'WebM (视频)',
+        'clip_export_format_gif': 'GIF (动画)',
+        'clip_export_stream_copy': '流复制（快，不重新编码）',
+        'clip_export_gif_width': 'GIF 宽度',
+        'clip_export_gif_fps': 'GIF 帧率',
+        'clip_export_browse': '浏览...',
+        'clip_export_output': '输出路径',
+        'clip_export_start_btn': '开始导出',
+        'clip_export_cancel': '取消',
+        'clip_export_exporting': '导出中...',
+        'clip_export_select_output': '选择输出路径',
+        'clip_export_tip': '提示',
+        'clip_export_no_playback': '当前无播放内容，无法导出',
+        'clip_export_source_not_found': '源文件不存在: {path}',
+        'clip_export_no_output_path': '请选择输出路径',
+        'clip_export_service_unavailable': '导出服务未初始化',
+        'clip_export_done': '完成',
+        'clip_export_failed': '失败',
+        'clip_export_error': '异常',
+        'clip_export_busy': '已有导出任务在运行',
+        'clip_export_ffmpeg_not_found_clip': '未找到 ffmpeg，无法导出。请将 ffmpeg 放到 ffmpeg/ 目录或安装到系统 PATH',
+        'clip_export_ffmpeg_not_found_gif': '未找到 ffmpeg，无法生成 GIF',
+        'clip_export_pillow_not_found': '未安装 Pillow，无法生成 GIF（pip install Pillow）',
+        'clip_export_invalid_duration': '时长无效（end <= start）',
+        'clip_export_invalid_duration_short': '时长无效',
+        'clip_export_cancelled': '已取消',
+        'clip_export_exported': '已导出: {path}',
+        'clip_export_export_failed': '导出失败: {err}',
+        'clip_export_exception': '异常: {err}',
+        'clip_export_extract_failed': '抽帧失败: {err}',
+        'clip_export_no_frames': '未抽到帧',
+        'clip_export_read_frames_failed': '读取帧失败',
+        'clip_export_save_gif_failed': '保存 GIF 失败: {err}',
+        'clip_export_generated': '已生成: {path}',
+        # 书签与章节
+        'menu_bookmarks': '书签与章节...',
+        'ctx_bookmarks': '书签与章节...',
+        'bookmark_title': '书签与章节',
+        'bookmark_info': '章节来自视频内置，书签由用户标记。双击跳转到对应位置。',
+        'bookmark_tab_chapters': '章节',
+        'bookmark_tab_bookmarks': '书签',
+        'bookmark_chapter_prev': '上一章',
+        'bookmark_chapter_next': '下一章',
+        'bookmark_chapters_empty': '当前视频没有内置章节',
+        'bookmark_chapter_n': '章节 {}',
+        'bookmark_view_label': '视图:',
+        'bookmark_view_current': '当前文件',
+        'bookmark_view_all': '所有文件',
+        'bookmark_empty': '暂无书签',
+        'bookmark_add': '添加书签',
+        'bookmark_delete': '删除选中',
+        'bookmark_clear_url': '清除当前文件',
+        'bookmark_clear_all': '清除全部',
+        'bookmark_add_title': '添加书签',
+        'bookmark_add_prompt': '书签名称（可选）:',
+        'osd_bookmark_added': '已添加书签',
+        'osd_bookmark_seek': '书签',
+        'osd_bookmark_not_in_list': '文件不在当前列表中',
+        'osd_bookmarks_cleared': '已清除所有书签',
+        'osd_chapter_seek': '章节',
+        'osd_chapter_next': '下一章',
+        'osd_chapter_prev': '上一章',
+        # A/V 同步监控
+        'menu_av_sync': '音视频同步监控...',
+        'ctx_av_sync': '音视频同步监控...',
+        'av_sync_title': '音视频同步监控',
+        'av_sync_group_status': '实时状态',
+        'av_sync_avdiff': 'A/V 差值:',
+        'av_sync_status_ok': '正常',
+        'av_sync_status_minor': '轻微不同步',
+        'av_sync_status_bad': '严重不同步',
+        'av_sync_audio_pts': '音频 PTS:',
+        'av_sync_video_pts': '视频 PTS:',
+        'av_sync_current_delay': '当前音频延迟:',
+        'av_sync_group_wave': 'A/V 差值趋势',
+        'av_sync_group_adjust': '音频延迟调整',
+        'av_sync_reset_delay': '重置',
+        # 流质量检测
+        'menu_stream_quality': '流质量检测...',
+        'ctx_stream_quality': '流质量检测...',
+        'stream_quality_title': '流质量检测',
+        'stream_quality_group_video': '视频',
+        'stream_quality_group_audio': '音频',
+        'stream_quality_group_network': '网络与缓存',
+        'stream_quality_group_drops': '丢帧统计',
+        'stream_quality_group_hw': '硬件与渲染',
+        'stream_quality_video_codec': '编解码器',
+        'stream_quality_resolution': '分辨率',
+        'stream_quality_display_resolution': '显示分辨率',
+        'stream_quality_fps': '帧率',
+        'stream_quality_video_bitrate': '视频码率',
+        'stream_quality_pixel_format': '像素格式',
+        'stream_quality_colormatrix': '色彩矩阵',
+        'stream_quality_primaries': '色彩原色',
+        'stream_quality_gamma': '传输特性',
+        'stream_quality_hdr_type': 'HDR 类型',
+        'stream_quality_video_depth': '视频位深',
+        'stream_quality_aspect_ratio': '宽高比',
+        'stream_quality_audio_codec': '编解码器',
+        'stream_quality_audio_channels': '声道数',
+        'stream_quality_audio_layout': '声道布局',
+        'stream_quality_sample_rate': '采样率',
+        'stream_quality_audio_bitrate': '音频码率',
+        'stream_quality_audio_depth': '音频位深',
+        'stream_quality_container': '容器格式',
+        'stream_quality_protocol': '协议',
+        'stream_quality_demuxer': '解复用器',
+        'stream_quality_cache_duration': '缓存时长',
+        'stream_quality_cache_size': '缓存大小',
+        'stream_quality_cache_speed': '缓存速度',
+        'stream_quality_buffering': '缓冲状态',
+        'stream_quality_demuxer_bitrate': '解复用码率',
+        'stream_quality_vo_drop': 'VO 丢帧',
+        'stream_quality_decoder_drop': '解码器丢帧',
+        'stream_quality_mistimed_frame': '误时帧',
+        'stream_quality_vo_delay': 'VO 延迟帧',
+        'stream_quality_hwdec': '硬解',
+        'stream_quality_vo': '视频输出',
+        'stream_quality_gpu_api': 'GPU API',
+        'stream_quality_gpu_context': 'GPU 上下文',
+        'stream_quality_no_buffer': '无缓冲',
+        # 3D / 360° 视频
+        'menu_3d_video': '3D / 360° 视频...',
+        'ctx_3d_video': '3D / 360° 视频...',
+        'video_3d_title': '3D / 360° 视频',
+        'video_3d_group_stereo': '3D 立体模式',
+        'video_3d_stereo_label': '模式:',
+        'video_3d_stereo_hint': '选择与片源匹配的 3D 格式；普通 2D 视频请选择"普通 2D"',
+        'video_3d_stereo_mono': '普通 2D',
+        'video_3d_stereo_sbs_l': '左右并排 - 左眼优先',
+        'video_3d_stereo_sbs_r': '左右并排 - 右眼优先',
+        'video_3d_stereo_tb_f': '上下并排 - 上前',
+        'video_3d_stereo_tb_s': '上下并排 - 下前',
+        'video_3d_group_360': '360° 视角控制',
+        'video_3d_proj_label': '投影:',
+        'video_3d_proj_equirect': 'Equirectangular (等距柱状)',
+        'video_3d_proj_cubemap': 'Cubemap (立方体贴图)',
+        'video_3d_proj_flat': 'Flat (平面)',
+        'video_3d_yaw': '偏航 (Yaw):',
+        'video_3d_pitch': '俯仰 (Pitch):',
+        'video_3d_roll': '滚转 (Roll):',
+        'video_3d_360_hint': '360° 视角控制依赖 lavfi panorama 滤镜，部分版本可能不支持',
+        'video_3d_reset': '重置全部',
+        'video_3d_apply': '应用',
+        'video_3d_close': '关闭',
+        'osd_video_3d_mode': '3D 模式',
+        'osd_video_360_view': '360° 视角',
+        'osd_video_3d_reset': '3D/360 已重置',
+        'osd_resolution': '分辨率',
+        'osd_codec': '编码',
+        'osd_fps': '帧率',
+        'osd_ar': '宽高比',
+        'osd_hwdec': '硬解',
+        'osd_dynamic': '动态',
+        'osd_pixel': '像素',
+        'osd_depth': '色深',
+        'osd_scan': '扫描',
+        'osd_interlaced': '隔行',
+        'osd_rotate': '旋转',
+        'osd_matrix': '矩阵',
+        'osd_prim': '原色',
+        'osd_tf': '转换',
+        'osd_range': '范围',
+        'osd_peak': '峰值',
+        'osd_avg': '均值',
+        'osd_channels': '声道',
+        'osd_mono': '单声道',
+        'osd_stereo': '立体声',
+        'osd_ch_suffix': '声道',
+        'osd_rate': '采样率',
+        'osd_bitrate': '比特率',
+        'osd_audio_depth': '位深',
+        'osd_total_br': '总码率',
+        'osd_video_br': '视频',
+        'osd_cache': '缓存',
+        'osd_cache_size': '缓存大小',
+        'osd_buffer': '缓冲',
+        'osd_dropped': '丢帧',
+        'osd_container': '容器',
+        'osd_protocol': '协议',
+        'osd_demuxer': '解复用',
+        'osd_vo': '渲染器',
+        'osd_gpu_api': 'GPU接口',
+        'osd_gpu_ctx': '上下文',
+        'osd_url': '地址',
+        'osd_live': '● 直播',
+        'ctx_pause': '暂停',
+        'ctx_play': '播放',
+        'ctx_stop': '停止',
+        'ctx_prev_channel': '上一个频道',
+        'ctx_next_channel': '下一个频道',
+        'ctx_speed': '速度',
+        'ctx_volume': '音量',
+        'ctx_mute': '静音',
+        'ctx_unmute': '取消静音',
+        'ctx_aspect_ratio': '宽高比',
+        'ctx_aspect_default': '默认',
+        'ctx_aspect_stretch': '拉伸',
+        'ctx_aspect_fill': '填充',
+        'ctx_screenshot': '截图\tS',
+        'ctx_fullscreen': '全屏\tF11',
+        'ctx_pip': '画中画\tP',
+        'ctx_view': '视图',
+        'ctx_audio_subtitle': '音频与字幕',
+        'ctx_tools': '工具',
+        'ctx_epg': '节目单\tE',
+        'ctx_playlist': '播放列表\tL',
+        'ctx_control_panel': '控制面板\tM',
+        'ctx_hide_panels': '隐藏悬浮窗\tY',
+        'ctx_reset_layout': '重置布局',
+        'ctx_open_stream': '打开串流\tCtrl+U',
+        'ctx_open_video': '打开视频\tCtrl+Shift+O',
+        'ctx_scan': '扫描整理',
+        'ctx_audio_track': '音轨',
+        'ctx_no_audio_track': '无音轨',
+        'ctx_audio_track_n': '音轨 {}',
+        'ctx_subtitle': '字幕',
+        'ctx_no_subtitle': '无字幕',
+        'ctx_subtitle_track_n': '字幕 {}',
+        'ctx_load_subtitle': '加载外部字幕...',
+        'ctx_subtitle_files': '字幕文件',
+        'ctx_all_files': '所有文件',
+        'panel_audio_track': '音轨',
+        'panel_subtitle': '字幕',
+        'menu_tools': '工具',
+        'menu_scan_channels': '扫描整理',
+        'menu_mapping': '映射管理',
+        'menu_subscription_settings': '订阅设置',
+        'menu_file_association': '文件关联',
+        'file_assoc_title': '选择要关联的文件格式',
+        'file_assoc_hint': '注册后，右键文件即可在\u201c打开方式\u201d中选择本程序',
+        'file_association': '文件关联',
+        'menu_theme': '主题',
+        'menu_help': '帮助',
+        'menu_instructions': '说明',
+        'menu_about': '关于',
+        'today': '今天',
+        'yesterday': '昨天',
+        'tomorrow': '明天',
+        'no_channel_selected': '未选择频道',
+        'select_channel_to_play': '请选择频道开始播放',
+        'open_playlist_or_import': '打开播放列表文件或导入频道以开始观看',
+        'waiting_to_play': '等待播放...',
+
+        'playing': '正在播放',
+        'paused': '已暂停',
+        'stopped': '已停止',
+        'play_error': '播放错误',
+        'pip_mode': '画中画模式',
+        'to_exit': '退出',
+        'pip_exited': '已退出',
+        'playing_channel': '正在播放: {name}',
+        'paused_channel': '已暂停: {name}',
+        'stopped_play': '停止播放',
+        'playback_stopped': '播放已停止',
+        'catchup_playing': '正在回看: {name}',
+        'catchup_paused': '已暂停回看: {name}',
+        'subscription_settings_title': '订阅设置',
+        'protocol_settings': '回放协议设置',
+        'protocol_type': '协议类型',
+        'rtsp_transport_colon': 'RTSP传输方式:',
+        'hwdec_label': '硬件解码',
+        'hwdec_auto_copy': '硬解 Copy-back（支持滤镜）',
+        'hwdec_auto': '硬解 原生（最快）',
+        'hwdec_no': '软解',
+        'tls_verify_label': 'TLS验证',
+        'network_timeout_colon': '网络超时:',
+        'audio_passthrough_colon': '音频直通:',
+        'passthrough_never': '从不（解码输出）',
+        'passthrough_spdif': 'SPDIF (AC3/EAC3/DTS)',
+        'passthrough_hd': '高清编码 (DTS-HD/TrueHD)',
+        'passthrough_lossless': '仅无损 (FLAC/ALAC/TrueHD)',
+        'passthrough_all': '全部编码',
+        'hdr_output_mode_colon': 'HDR输出:',
+        'hdr_disable': '禁用（强制SDR输出）',
+        'hdr_auto': '自动（Windows HDR开启时用scRGB）',
+        'hdr_scrgb': 'scRGB（Windows HDR开启）',
+        'hdr_passthrough': 'PQ直通（Windows HDR关闭）',
+        'hdr_tonemap': '色调映射到SDR',
+        # 高级播放器参数：视频输出 / 视频同步 / 丢帧策略 / 缓存 override
+        'vo_label': '视频输出 (vo):',
+        'vo_auto': '自动（推荐 - 按 HDR 模式推导）',
+        'vo_gpu': 'gpu（默认跨平台 VO）',
+        'vo_gpu_next': 'gpu-next（新一代，HDR 直通/scRGB）',
+        'vo_libmpv': 'libmpv（Render API，macOS 默认）',
+        'vo_direct3d': 'direct3d（Windows 旧版 VO）',
+        'vo_desc': '选择视频输出后端。"自动" 会按 HDR 模式推导（gpu/gpu-next）。'
+                   'macOS 上 vo 始终被强制为 libmpv（mpv v0.41+ 不再支持 wid 嵌入）。'
+                   'Windows 上 HDR 直通/scRGB 需要 gpu-next。',
+        'video_sync_label': '视频同步 (video-sync):',
+        'vsync_audio': 'audio（默认，按音频时钟同步）',
+        'vsync_display_resample': 'display-resample（重采样音频到显示器）',
+        'vsync_display_tempo': 'display-tempo（按节奏伸缩音频）',
+        'vsync_resample': 'resample（重采样音频，可能漂移）',
+        'vsync_display_desync': 'display-desync（不同步，可能丢帧/重复）',
+        'vsync_desync': 'desync（完全异步）',
+        'video_sync_desc': '音视频同步基准。"audio" 是最安全的默认值。'
+                           '"display-resample"/"display-tempo" 同步到显示器刷新率（更平滑但可能引起音频变调）。',
+        'framedrop_label': '丢帧策略 (framedrop):',
+        'framedrop_vo': 'vo（默认，VO 慢时丢帧）',
+        'framedrop_decoder': 'decoder（解码阶段丢帧，CPU 占用低）',
+        'framedrop_insert': 'insert（按 1:1 插入帧，可能卡顿）',
+        'framedrop_none': 'none（永不丢帧）',
+        'framedrop_never': 'never（none 的别名）',
+        'framedrop_desc': '视频输出落后时的丢帧策略。"vo" 仅在输出阶段丢帧（保持解码质量）。'
+                          '"decoder" 在更早阶段丢帧（弱机器省 CPU）。',
+        'deinterlace_label': '反交错:',
+        'deinterlace_no': '关闭（不反交错）',
+        'deinterlace_auto': '自动（Yadif Bob，保持帧率流畅）',
+        'deinterlace_desc': '对隔行扫描视频（有些频道画面有横纹/梳齿）进行反交错处理。'
+                           '"自动" 使用 Yadif Bob 模式（mode=1），50i→50p 保持原始帧率，运动流畅不卡顿。'
+                           '需要 copy-back 硬解或软解。',
+        'cache_secs_override_label': '缓存秒数 (cache-secs):',
+        'cache_secs_override_placeholder': '0 = 自动（按流类型推导）',
+        'cache_secs_override_desc': '覆盖 demuxer 缓存时长（秒）。留 0 保持自动值'
+                                    '（如直播 3600s、蓝光 180s，按分辨率动态调整）。',
+        'demuxer_max_bytes_override_label': 'Demuxer 最大字节数 (MiB):',
+        'demuxer_max_bytes_override_placeholder': '0 = 自动（MiB，按 cache-secs 推导）',
+        'demuxer_max_bytes_override_desc': '覆盖 demuxer 前向缓存大小（MiB）。留 0 保持自动值'
+                                           '（按 cache-secs 缩放，上限 4096MiB）。',
+        'demuxer_readahead_secs_override_label': 'Demuxer 预读时长 (s):',
+        'demuxer_readahead_secs_override_placeholder': '0 = 自动（按流类型：HLS=120s, TS=300s 等）',
+        'demuxer_readahead_secs_override_desc': '覆盖 demuxer 预读秒数。留 0 保持自动值'
+        '（HLS/HTTP=120s, TS=300s, 网络挂载盘=30s 等）。',
+        'probesize_override_label': 'Probesize (字节):',
+        'probesize_override_placeholder': '0 = 自动（直播=5MB, FCC=2MB）',
+        'probesize_override_desc': '覆盖 demuxer 探测大小（字节）。留 0 保持自动值'
+        '（直播=5MB, FCC=2MB）。如果流加载失败并出现 “unspecified pixel format” '
+        '警告，请增大此值（如 10000000）。',
+        'analyzeduration_override_label': 'Analyzeduration (秒):',
+        'analyzeduration_override_placeholder': '0 = 自动（直播=5s, FCC=2s）',
+        'analyzeduration_override_desc': '覆盖 demuxer 分析时长（秒）。留 0 保持自动值'
+        '（直播=5s, FCC=2s）。如果流加载缓慢或出现损坏包警告，请增大此值。',
+        'screenshot_no_video': '当前频道无视频画面，无法截图',
+        'ctx_hdr_mode': 'HDR 模式',
+        'hdr_current_video': '当前视频',
+        'osd_hdr_mode': 'HDR 模式',
+        'auto_timeout': '自动',
+        'playlist_subscription': '列表订阅设置',
+        'subscription_url': '订阅地址',
+        'subscription_name': '订阅名称',
+        'update_interval': '更新间隔(分钟)',
+        'epg_subscription': '节目单订阅设置（所有源将自动整合）',
+        'playlist_sources': '直播源列表（点击切换启用）：',
+        'epg_sources': 'EPG源列表：',
+        'add_source': '+ 添加源',
+        'update_source': '✎ 更新',
+        'remove_source': '- 删除选中',
+        'enter_source_name': '源名称（可选）',
+        'epg_loaded': 'EPG数据加载成功',
+        'save_button': '保存',
+        'usage_instructions_title': '使用说明',
+        'ok_button': '确定',
+        'loading': '加载中...',
+        'current_program': '正在播放',
+        'upcoming_program': '即将播放',
+        'finished_program': '已结束',
+        'bitrate_unknown': '未知',
+        'codec_unknown': '未知',
+        'resolution_unknown': '未知',
+        'back_to_live': '返回直播',
+        'cannot_seek_live': '无法回退：直播流缓冲区不足（请稍后再试）',
+        'timeshift_beyond_cache': '超出缓冲范围，无法跳转到更早时间',
+        'timeshift_beyond_cache_no_epg': '超出缓冲范围，无节目信息，无法自动时移',
+        'timeshift_playing': '正在时移',
+        'ready': '就绪',
+        'catchup_not_supported': '该频道不支持回看',
+        'playlist_sub_updated': '列表订阅更新成功',
+        'playlist_sub_parse_failed': '列表订阅内容解析失败',
+        'playlist_sub_update_failed': '更新列表订阅失败',
+        'player_settings_saved': '播放器设置保存成功',
+        'player_settings_save_failed': '保存播放器设置失败',
+        'epg_settings_saved': 'EPG节目单设置已保存',
+        'file_opened': '成功打开文件',
+        'file_open_failed': '打开文件失败',
+        'file_not_found': '文件不存在，已从最近列表移除',
+        'download_failed': '下载失败',
+        'language_change_failed': '切换语言失败',
+        'theme_changed': '主题已切换为',
+        'theme_change_failed': '切换主题失败',
+        'epg_sub_updated': '节目单订阅更新成功',
+        'epg_sub_parse_failed': '节目单订阅内容解析失败',
+        'epg_sub_update_failed': '更新节目单订阅失败',
+        'epg_using_cache': '使用缓存的EPG数据',
+        'codec_label': '编码',
+        'resolution_label': '分辨率',
+        'bitrate_label': '码率',
+        'vbitrate_label': '视频码率',
+        'cache_speed_label': '缓存速度',
+        'channel_count_label': '声道',
+        'sample_rate_label': '采样率',
+        'format_label': '格式',
+        'protocol_label': '协议',
+        'frame_rate_label': '帧率',
+        'hwdec_label': '硬解',
+        'vcodec_label': '视频',
+        'acodec_label': '音频',
+        'hdr_label': '动态范围',
+        'no_video_info': '无视频信息',
+        'no_audio_info': '无音频信息',
+        'no_network_info': '无网络信息',
+        'pixel_format_label': '像素格式',
+        'hdr_type': '动态范围',
+        'hdr_sdr': 'SDR',
+        'hdr_hlg': 'HLG',
+        'hdr_hdr10': 'HDR10',
+        'hdr_hdr10_plus': 'HDR10+',
+        'hdr_dv': '杜比视界',
+        'player_settings_title': '播放器设置',
+        'update_interval_minutes': '更新间隔时间 (分钟)',
+        'enter_playlist_url': '请输入列表订阅地址',
+        'enter_subscription_name': '请输入订阅名称',
+        'enter_epg_url': '请输入节目单订阅地址',
+        'epg_settings_title': 'EPG节目单设置',
+        'epg_url_label': 'EPG节目单URL',
+        'epg_source_label': 'EPG节目单来源',
+        'app_description': 'IPTV 专业扫描编辑工具',
+        'system_info': '系统信息',
+        'copyright_text': '© 2025 ISEP 版权所有',
+        'github_repo': 'GitHub 仓库',
+        'request_timeout_text': '(请求超时)',
+        'fetch_failed_text': '(获取失败)',
+        'api_limit_text': '(API限制)',
+        'scan_settings_title': '扫描设置',
+        'channel_list_title': '频道列表',
+        'channel_edit_title': '频道编辑',
+        'scan_window_title': 'IPTV 扫描器',
+        'validate_button': '检测',
+        'hide_invalid_button': '隐藏无效',
+        'save_m3u': '保存M3U',
+        'save_txt': '保存TXT',
+        'save_m3u_tooltip': '保存频道列表为M3U格式',
+        'save_txt_tooltip': '保存频道列表为TXT格式',
+        'batch_ops': '批量操作',
+        'batch_ops_tooltip': '频道批量操作',
+        'auto_classify': '自动分组',
+        'clean_names': '清洗名称',
+        'assign_fields': '字段赋值',
+        'match_logo': '匹配Logo',
+        'clear_params': '清除参数',
+        'sort_by_group': '按分组排序',
+        'local_province': '本地省份:',
+        'overwrite_existing': '覆盖已有分组',
+        'merge_nonlocal': '非本地省份归入其他',
+        'preview_count': '预览:',
+        'channel_name': '频道名称',
+        'old_group': '原分组',
+        'new_group': '新分组',
+        'preview': '预览',
+        'apply': '应用',
+        'cancel': '取消',
+        'before': '修改前',
+        'after': '修改后',
+        'only_empty_fields': '仅对空字段赋值',
+        'target_channels': '目标:',
+        'overwrite_logo_confirm': '是否覆盖已有Logo?',
+        'move_to_group': '移至分组...',
+        'clean_selected_names': '清洗选中名称',
+        'match_selected_logo': '匹配选中Logo',
+        'select_valid': '选有效',
+        'select_invalid': '选无效',
+        'invert_selection': '反选',
+        'delete_selected_channels': '删除选中',
+        'confirm_delete_selected_message': '确定删除选中的{n}个频道？',
+        'channels_matched': '{n}个频道已匹配',
+        'assign_name2tvg_id': '频道名 -> TVG-ID',
+        'assign_tvg_id2name': 'TVG-ID -> 频道名',
+        'assign_tvg_name2name': 'TVG-Name(来自标签) -> 频道名',
+        'assign_tvg_id2tvg_chno': 'TVG-ID -> TVG频道号',
+        'target_group': '目标分组:',
+        'save_scan_result': '保存扫描结果',
+        'no_channels_to_save': '没有可保存的频道',
+        'append_scan': '追加扫描',
+        'address_format_hint': '格式: http://ip:port/rtp/10.10.[1-20].[1-20]:5002 ｜ 多处同步: [1-100:n]/{n} (两处 n 同步变化)',
+        'timeout_small': '超时',
+        'thread_small': '线程',
+        'scan_retry_options': '扫描重试选项',
+        'enable_smart_retry': '启用智能重试扫描',
+        'resume_from_checkpoint': '从断点继续扫描',
+        'resume_from_checkpoint_tooltip': '同一扫描范围存在上次中断时保存的断点时，跳过已探测的地址并恢复已发现的频道；不勾选则重新扫描并覆盖旧断点',
+        'mapping_options': '映射功能选项',
+        'enable_channel_mapping': '启用频道映射',
+        'scan_engine': '扫描引擎',
+        'scan_engine_tooltip': '选择扫描和检测使用的核心引擎。mpv：轻量高效，资源占用低；ffprobe：分析更详细，兼容性更广；asyncio：单线程事件循环承载大量并发探测，适合大范围扫描',
+        'scan_engine_mpv': 'mpv (轻量高效)',
+        'scan_engine_ffprobe': 'ffprobe (详细分析)',
+        'scan_engine_async': 'asyncio (高并发)',
+        'menu_server': 'Server',
+        'server_start': '启动Server',
+        'server_stop': '停止Server',
+        'server_started': 'Server已启动',
+        'server_stopped': 'Server已停止',
+        'server_running': 'Server运行中',
+        'server_not_running': 'Server未运行',
+        'server_open_api': '打开API',
+        'server_settings': 'Server设置',
+        'server_auto_start': '启动时自动运行Server',
+        'server_port': '端口:',
+        'server_host': '监听地址:',
+        'save_changes': '保存修改',
+        'copy_channel_name': '复制频道名',
+        'copy_url': '复制URL',
+        'copy_tvg_id': '复制TVG-ID',
+        'copy_group': '复制分组',
+        'delete_channel': '删除频道',
+        'confirm_delete': '确认删除',
+        'confirm_delete_mapping': '确认删除映射',
+        'confirm_delete_message': '确定要删除选中的频道吗？',
+        'select_mapping_to_edit': '请先选择要编辑的映射',
+        'select_mapping_to_delete': '请先选择要删除的映射',
+        'delete_mapping_confirm': "确定要删除映射 '{}' → '{}'？",
+        'scan_complete': '扫描完成',
+        'append_scan_tooltip': '不清空现有列表，扫描到的有效频道直接追加到列表末尾',
+        'smart_retry_tooltip': '基于失败原因智能重试：只重试超时、连接失败等临时错误，不重试TCP失败、404等永久错误。启用后会自动循环重试直到没有新的有效频道',
+        'mapping_tooltip': '启用后，扫描到的频道会根据映射文件自动匹配频道名称、Logo、分组等信息',
+        'set_scan_timeout': '设置扫描超时时间（秒）',
+        'set_scan_threads': '设置扫描使用的线程数量',
+        'validate_tooltip': '检测频道有效性',
+        'no_recent_files': '无最近打开的文件',
+        'select_channel_play': '请选择频道播放',
+        'open_playlist_success': '打开播放列表文件成功，点击频道开始播放',
+        'catchup_playing_label': '正在回看',
+        'unknown_channel': '未知频道',
+        'unnamed': '未命名',
+        'uncategorized': '未分类',
+        'all_channels': '全部频道',
+        'subscription_tab': '订阅',
+        'local_tab': '本地',
+        'media_info_label': '媒体信息',
+        'epg_url_colon': 'EPG节目单URL:',
+        'epg_source_colon': 'EPG节目单来源:',
+        'protocol_type_colon': '协议类型:',
+        'subscription_url_colon': '订阅地址:',
+        'subscription_name_colon': '订阅名称:',
+        'update_interval_colon': '更新间隔时间 (分钟):',
+        'optional_default_input': '可选，留空使用默认',
+        'optional_not_used_input': '可选，留空不使用',
+        'stop_validate': '停止检测',
+        'show_hidden': '恢复隐藏项',
+        'retry_nth': '第{n}次重试',
+        'generated_channel': '生成频道',
+        'generated_group': '生成频道',
+        'not_tested': '未检测',
+        'now_playing': '正在播放',
+        'no_program_desc': '暂无节目描述',
+        'timeshift_failed_back_to_live': '时移播放失败，退回直播',
+        'waiting_connect': '等待连接...',
+        'switching_channel': '切换频道中...',
+        'loading_program_info': '正在加载节目信息...',
+        'catchup_current_program': '正在回看当前节目',
+        'playing_current_channel': '正在播放当前频道',
+        'playing_label': '播放中...',
+        'unknown_program': '未知节目',
+        'new_version_available': '有新版本',
+        'new_version_found': '发现新版本',
+        'preparing_play': '准备播放...',
+        'no_current_program': '没有正在播放的节目',
+        'catchup_supported': '支持回看',
+        'catchup_available': '可回放',
+        'timeshift_available': '可时移',
+        'timeshift_watching': '正在时移观看',
+        'timeshift_label': '时移',
+        'catchup_label': '回看',
+        'loading_from_cache': '从缓存加载列表数据',
+        'dark_theme': '深色主题',
+        'light_theme': '浅色主题',
+        'scan': '扫描',
+        'scan_total': '本次总数',
+        'scan_progress': '扫描进度',
+        'scan_completed': '扫描完成',
+        'scan_stopped': '扫描已停止',
+        'scan_nth': '第{n}次扫描',
+        'validate': '检测',
+        'validate_progress': '检测进度',
+        'validate_completed': '检测完成',
+        'validate_stopped': '检测已停止',
+        'validate_nth': '第{n}次检测',
+        'all_channels_valid': '所有频道均有效',
+        'retry_completed': '智能重试完成',
+        'smart_retry': '智能重试',
+        'retry_scan': '重试扫描',
+        'mapping_manager': '频道映射管理器',
+        'mapping_tip_title': '频道名称映射',
+        'mapping_tip_desc': '远程映射会自动将扫描出的频道名称统一为标准名称。\n如果映射文件有更新，请点击下方按钮刷新。',
+        'refresh_remote_cache': '刷新远程映射缓存',
+        'refresh_remote_mapping': '刷新远程映射',
+        'manual_mapping_section': '手动映射（高级）',
+        'manual_mapping_hint': '仅当远程映射无法正确识别某个频道时才需要使用。',
+        'export_user_mappings': '导出用户映射',
+        'import_user_mappings': '导入用户映射',
+        'close': '关闭',
+        'search_channel_name': '搜索频道名...',
+        'search': '搜索',
+        'search_scope': '搜索范围',
+        'search_all_fields': '搜索全部字段',
+        'search_standard_name_only': '仅搜索标准名称',
+        'search_raw_name_only': '仅搜索原始名称',
+        'search_group_only': '仅搜索分组',
+        'standard_name': '标准名称',
+        'raw_name': '原始名称',
+        'group': '分组',
+        'logo_address': 'Logo地址',
+        'add_mapping': '添加映射',
+        'edit_mapping': '编辑映射',
+        'delete_mapping': '删除映射',
+        'fingerprint_id': '指纹ID',
+        'mapped_name': '映射名称',
+        'occurrence_count': '出现次数',
+        'last_seen': '最后出现',
+        'clear_fingerprint_data': '清空指纹数据',
+        'analyze_unstable_mappings': '分析不稳定映射',
+        'suggested_mapping': '建议映射',
+        'confidence': '置信度',
+        'operation': '操作',
+        'refresh_suggestions': '刷新建议',
+        'standard_name_placeholder': '输入标准频道名称',
+        'raw_name_placeholder': '输入原始频道名称',
+        'group_placeholder': '输入分组名称',
+        'logo_url_placeholder': '输入Logo图片URL地址',
+        'cache_refreshed': '远程映射缓存已刷新',
+        'update_available': '发现新版本！点击上方按钮刷新。',
+        'update_check_failed': '更新检查失败: {}',
+        'mapping_status_ok': '已是最新 | 已加载: {} 条映射 | 上次: {}',
+        'mapping_status_no_cache': '暂无缓存数据（已加载 {} 条映射）',
+        'export_mappings_title': '导出映射',
+        'exported_to': '已导出到',
+        'import_mappings_title': '导入映射',
+        'import_success': '用户映射已从CSV文件导入',
+        'export_failed': '导出失败',
+        'import_failed': '导入失败',
+        'retry_options': '扫描重试选项',
+        'enable_retry_scan': '启用重试扫描',
+        'retry_scan_tooltip': '首次扫描完成后，重试扫描失败的频道',
+        'dark': '深色',
+        'light': '浅色',
+        'dark_blue': '暗蓝',
+        'neumorphic_light': '拟态浅',
+        'github_dark': 'GitHub 暗',
+        'menu_color_mode': '颜色模式',
+        'menu_visual_style': '视觉风格',
+        'color_mode_auto': '自动',
+        'color_mode_dark': '暗黑',
+        'color_mode_light': '日间',
+        'visual_style_neumorphic': '拟态',
+        'visual_style_flat': '扁平化',
+        'visual_style_skeuomorphic': '拟物',
+        'visual_style_frosted': '毛玻璃',
+        'visual_style_win11': 'Win11',
+        'visual_style_mac': 'Mac',
+        'visual_style_ios': 'iOS',
+        'menu_hide_floating': '隐藏悬浮\tY',
+        'menu_osd_toggle': '遮罩显隐\tTab',
+        'tooltip_stay_on_top': '窗口置顶',
+        'menu_reload_subscription': '重载订阅',
+        'no_subscription_url': '未配置订阅地址',
+        'reloading_subscription': '正在重新加载订阅...',
+        'reload_subscription_failed': '重新加载订阅失败'
+    },
+    'en': {
+        'language_name': 'English',
+        'app_title': 'ISEP',
+        'app_title_zh': 'IPTV Professional Scanner & Editor',
+        'video_playback': 'Video Playback',
+        'play': 'Play',
+        'pause': 'Pause',
+        'stop': 'Stop',
+        'volume': 'Volume',
+        'scan_settings': 'Scan Settings',
+        'address_format': 'Address Format',
+        'address_example': 'Address Example',
+        'input_address': 'Input Address',
+        'timeout_description': 'Set scan timeout (seconds)',
+        'thread_count_description': 'Set number of scan threads',
+        'user_agent': 'User-Agent',
+        'referer': 'Referer',
+        'progress': 'Progress',
+        'timeout': 'Timeout',
+        'thread_count': 'Thread Count',
+        'scan_timeout': 'Timeout(s):',
+        'scan_threads': 'Threads:',
+        'full_scan': 'Full Scan',
+        'stop_scan': 'Stop Scan',
+        'generate_list': 'Generate List',
+        'total_channels': 'Total Channels',
+        'valid': 'Valid',
+        'invalid': 'Invalid',
+        'time_elapsed': 'Time Elapsed',
+        'channel_list': 'Channel List',
+        'validate_effectiveness': 'Validate Effectiveness',
+        'hide_invalid': 'Hide Invalid',
+        'smart_sort': 'Smart Sort',
+        'please_load_list': 'Please load list first',
+        'channel_edit': 'Channel Edit',
+        'channel_name': 'Channel Name',
+        'channel_group': 'Channel Group',
+        'logo_address': 'Logo Address',
+        'channel_url': 'Channel URL',
+        'edit_channel': 'Edit Channel',
+        'add_channel': 'Add Channel',
+        'operation': 'Operation',
+        'open_list': 'Open List',
+        'save_list': 'Save List',
+        'language': 'Language',
+        'about': 'About',
+        'required': 'Required',
+        'optional': 'Optional',
+        'optional_default': 'Optional, use default if empty',
+        'optional_not_used': 'Optional, not used if empty',
+        'serial_number': 'No.',
+        'resolution': 'Resolution',
+        'status': 'Status',
+        'latency_ms': 'Latency(ms)',
+        'tvg_id': 'TVG-ID',
+        'tvg_chno': 'TVG Channel No.',
+        'tvg_shift': 'TVG Shift',
+        'catchup': 'Catchup',
+        'catchup_days': 'Catchup Days',
+        'catchup_source': 'Catchup Source',
+        'catchup_correction': 'Catchup TZ Correction',
+        'about_dialog_title': 'About ISEP',
+        'current_version': 'Current Version',
+        'latest_version': 'Latest Version',
+        'build_date': 'Build Date',
+        'qt_version': 'QT Version',
+        'close_button': 'Close',
+        'checking_update': 'Checking...',
+        'update_timeout': 'Request Timeout',
+        'update_failed': 'Failed to Fetch',
+        'api_limit': 'API Limit',
+        'update_progress_title': 'Online Update',
+        'update_checking': 'Checking for updates...',
+        'update_downloading': 'Downloading update...',
+        'update_complete': 'Update downloaded, please restart the application',
+        'update_error': 'Update Failed',
+        'network_error': 'Network Error',
+        'feature_intro': 'Main Features',
+        'smart_scan': 'Smart Channel Scanning',
+        'advanced_validation': 'Advanced Stream Validation',
+        'intelligent_management': 'Intelligent Channel Management',
+        'integrated_playback': 'Integrated Video Playback',
+        'advanced_config': 'Advanced Configuration Management',
+        'professional_tools': 'Professional Tools Integration',
+        'usage_method': 'Usage Method',
+        'scan_usage': 'Enter address format in scan settings, click "Full Scan" to start',
+        'validation_usage': 'Open playlist and click "Validate Effectiveness" button',
+        'management_usage': 'Right-click channel list or drag to adjust order',
+        'playback_usage': 'Double-click any channel in the channel list',
+        'config_usage': 'All settings are automatically saved, no manual operation required',
+        'tools_usage': 'Access professional tools through the toolbar',
+        'cancel_button': 'Cancel',
+        'update_success': 'Update Complete',
+        'file': 'File',
+        'edit': 'Edit',
+        'view': 'View',
+        'tools': 'Tools',
+        'help': 'Help',
+        'new_playlist': 'New Playlist',
+        'open_playlist': 'Open Playlist',
+        'save_playlist': 'Save Playlist',
+        'save_as': 'Save As...',
+        'import_channels': 'Import Channels',
+        'export_channels': 'Export Channels',
+        'exit': 'Exit',
+        'undo': 'Undo',
+        'redo': 'Redo',
+        'select_all': 'Select All',
+        'delete_selected': 'Delete Selected',
+        'show_epg': 'Show EPG',
+        'show_playlist': 'Show Playlist',
+        'fullscreen': 'Fullscreen',
+        'refresh': 'Refresh',
+        'reset_layout': 'Reset Layout',
+        'scan_channels': 'Scan & Organize',
+        'verify_channels': 'Verify Channels',
+        'restore_hidden': 'Restore Hidden',
+        'channel_management': 'Channel Management',
+        'channel_mapping': 'Channel Mapping',
+        'favorite_management': 'Favorite Management',
+        'network_settings': 'Network Settings',
+        'player_settings': 'Player Settings',
+        'usage_instructions': 'Usage Instructions',
+        'chinese': '中文',
+        'english': 'English',
+        'loading_channels': 'Loading channels...',
+        'channels_loaded': 'Successfully loaded {count} channels',
+        'file_format_error': 'File format is incorrect or empty',
+        'open_file_error': 'Failed to open file: {error}',
+        'save_success': 'Save successful',
+        'save_error': 'Failed to save file: {error}',
+        'no_content': 'No content to save',
+        'file_selection_error': 'File selection failed: {error}',
+        'app_name': 'ISEP',
+        'version': 'Version 1.0.0',
+        'description': 'IPTV channel scanning and editing tool',
+        'usage_title': 'Usage Instructions',
+        'usage_content': '## Basic Operations\n\n### 1. Open Playlist\n- File menu → Open Playlist (Ctrl+O)\n- Supports M3U, M3U8, TXT formats\n- Or drag and drop files onto the main window\n\n### 2. Play Channel\n- **Double-click** a channel in the list to start playing\n- Bottom control panel: ▶ Play / ▮▮ Pause / ■ Stop\n- Volume slider to adjust, click icon to mute/unmute\n- Speed button to change playback speed, aspect button for ratio\n- Fullscreen button or F11\n- **↑ ↓** keys to switch channels, **← →** keys to adjust volume\n\n### 3. EPG Program Guide\n- Left panel shows current channel program schedule\n- Click ◀ / ▶ to navigate dates\n- Progress bar shows current program playback position\n- Supports EPG data source auto-subscription updates\n- EPG URLs in M3U file headers are loaded automatically\n\n### 4. Scan & Organize\n- Tools menu → Scan & Organize\n- Enter IP range or stream URL (e.g. `239.3.1.[1-100]:8000`)\n- Set timeout and thread count, supports append scan and retry\n- After scanning, use **Batch Operations**:\n  - **Auto Classify**: Automatically group channels by name rules\n  - **Clean Names**: Remove brackets, HD suffixes, etc.\n  - **Match Logo**: Batch match channel logo images\n  - **Assign Fields**: Batch set group, logo and other attributes\n  - **Sort by Group**: Auto-sort channels by group\n\n### 5. Verify Channels\n- Batch check channel validity, show latency, resolution, etc.\n- Smart retry for failed items\n\n### 6. Channel Management\n- **Drag & Drop Sort**: Drag to reorder channels\n- **Group Filter**: Dropdown to filter by group\n- **Right-click Menu**: Delete, copy, clean names, match logos, etc.\n- **Channel Classification**: Auto-classify by regex rules\n- **Name Cleaning**: Smart removal of redundant info\n- **Export**: Save as M3U / TXT / Excel format\n\n## Advanced Features\n\n### Subscription Settings\n- Tools menu → Subscription Settings\n- Configure multiple playlist and EPG sources, managed independently\n- Auto-refresh on expiry and incremental updates\n- RTSP transport: TCP/UDP/LAVF selectable\n\n### Channel Mapping\n- Tools menu → Channel Mapping Manager\n- Visual editing of name, LOGO, group mapping rules\n\n### File Association\n- Tools menu → File Association\n- Check formats to associate (M3U/M3U8/TXT/Video formats)\n- Right-click files in Explorer to open with this program\n\n### Interface Customization\n- **Theme Switching**: 5 themes available\n- **Language Switching**: Chinese / English\n- **Panel Control**: View menu or shortcuts\n  - **E** — EPG panel\n  - **L** — Channel list panel\n  - **M** — Control panel\n  - **Y** — Hide/restore all floating panels\n  - **Tab** — Toggle OSD info overlay\n- **F5** Refresh, **F11** Fullscreen, **Ctrl+Q** Exit\n\n### Timeshift / Catchup\n- Multiple catchup types: default / append / shift / flussonic / xc\n- Time variable replacement with custom format and timezone offset\n- M3U file headers can define global catchup parameters',
+        'about_title': 'About',
+        'about_content': 'ISEP\nVersion 1.0.0\n\nIPTV channel scanning and editing tool\n\n© 2026 ISEP',
+        'epg_title': 'Program Guide',
+        'playlist_title': 'Playlist',
+        'not_playing': 'Not playing',
+        'language_changed': 'Language changed',
+        'no_epg_data': 'No program information',
+        'no_channels': 'No channels',
+        'media_info': 'Media Info',
+        'menu_file': 'File',
+        'menu_open_playlist': 'Open Playlist\tCtrl+O',
+        'menu_open_stream': 'Open Stream\tCtrl+U',
+        'menu_open_video': 'Open Video\tCtrl+Shift+O',
+        'open_stream': 'Open Stream',
+        'open_stream_url': 'Enter stream URL:',
+        'open_video': 'Open Video',
+        'video_files': 'Video Files (*.mp4 *.mkv *.avi *.mov *.flv *.wmv *.ts *.webm);;All Files (*)',
+        'temp_stream': 'Temp Stream',
+        'stream_name_optional': 'Channel name (optional):',
+        'stream_name_hint': 'Leave empty for auto name',
+        'm3u_download_failed': 'M3U list download failed',
+        'm3u_loaded_n_channels': 'Loaded {n} channels',
+        'invalid_url_prompt': (
+            'The URL format is invalid. Please make sure it contains '
+            'a complete URL\n(e.g. http://example.com/playlist.m3u)'
+        ),
+        'cancel': 'Cancel',
+        'ok': 'OK',
+        'close_confirm_title': 'Close Confirmation',
+        'close_confirm_text': 'Closing will stop program reminders. Minimize to system tray to keep reminders running?',
+        'close_minimize_tray': 'Minimize to Tray',
+        'close_exit': 'Exit',
+        'close_remember_choice': 'Remember choice, don\'t ask again',
+        'close_behavior_settings': 'Close Behavior',
+        'close_behavior_ask': 'Ask every time',
+        'close_action_label': 'When closing window:',
+        'local_video': 'Local Video',
+        'local_video_file': 'Local Video File',
+        'bluray': 'Blu-ray Disc',
+        'open_bluray': 'Open Blu-ray Disc',
+        'open_bluray_ask': 'Select a Blu-ray disc directory?',
+        'select_bluray_dir': 'Select Blu-ray Disc Directory',
+        'not_bluray': 'Not a Blu-ray Disc',
+        'not_bluray_msg': 'Selected directory is not a valid Blu-ray disc structure (BDMV/STREAM not found)',
+        'select_folder': 'Select Folder',
+        'select_confirm': 'Select',
+        'select_current_folder': 'Select Current Folder',
+        'parent_folder': 'Parent Folder',
+        'video_files_only': 'Video Files Only',
+        'all_files': 'All Files',
+        'no_video_in_folder': 'No supported video files found in the selected folder',
+        'menu_recent_open': 'Recent',
+        'menu_save_as': 'Save As...\tCtrl+S',
+        'menu_exit': 'Exit\tCtrl+Q',
+        'menu_view': 'View',
+        'menu_epg_list': 'EPG List\tE',
+        'menu_playlist': 'Playlist\tL',
+        'menu_control_panel': 'Control Panel\tM',
+        'menu_fullscreen': 'Fullscreen\tF11',
+        'menu_pip': 'Picture-in-Picture\tP',
+        'menu_multi_screen': 'Multi Screen',
+        'menu_multi_2x2': '2×2 (4 Screens)',
+        'menu_multi_3x3': '3×3 (9 Screens)',
+        'menu_multi_exit': 'Exit Multi Screen',
+        'multi_screen_entered': 'Multi screen mode entered',
+        'multi_screen_exited': 'Multi screen mode exited',
+        'search_channel': 'Search channels...',
+        'epg_no_catchup': 'Catchup not supported',
+        'epg_upcoming': 'Program not started yet',
+        'epg_date_limit': 'Date range limit reached',
+        'exit_catchup': 'Exit Catchup',
+        'panel_prev_ch': 'Prev Channel',
+        'panel_next_ch': 'Next Channel',
+        'panel_pip': 'PiP',
+        'panel_favorite': 'Favorite',
+        'added_to_favorites': 'Added to favorites',
+        'removed_from_favorites': 'Removed from favorites',
+        'add_to_favorites': 'Add to Favorites',
+        'remove_from_favorites': 'Remove from Favorites',
+        'clear_history': 'Clear History',
+        'channel_deleted': 'Channel deleted',
+        'history_cleared': 'History cleared',
+        'add_to_local': 'Add to Local List',
+        'added_to_local': 'Added to local list',
+        'remove_from_history': 'Remove This History',
+        'history_removed': 'History record removed',
+        'copy_channel_url': 'Copy Channel URL',
+        'copied_to_clipboard': 'Copied to clipboard',
+        'ctx_play_now': 'Play',
+        'no_favorites': 'No favorites',
+        'no_history': 'No play history',
+        'favorites_tab': 'Favorites',
+        'history_tab': 'History',
+        'reminder_added': 'Reminder set',
+        'reminder_removed': 'Reminder cancelled',
+        'reminder_notify': 'Reminder: {channel} - {title} starting soon',
+        'reminder_auto_switch': 'Reminder: {title} starting, switched to {channel}',
+        'reminder_tray_title': 'EPG Program Reminder',
+        'reminder_tray_msg': '{channel}: {title} starting soon',
+        'reminder_popup_title': 'Program Reminder',
+        'reminder_popup_channel': 'Channel: {channel}',
+        'reminder_popup_program': 'Program: {title}',
+        'reminder_popup_time': 'Starts at: {time}',
+        'reminder_popup_switch': 'Switch Channel',
+        'reminder_popup_close': 'Close',
+        'epg_set_reminder': 'Set Reminder',
+        'epg_cancel_reminder': 'Cancel Reminder',
+        'menu_catchup': 'Catchup',
+        'epg_copy_title': 'Copy Program Title',
+        'epg_copy_info': 'Copy Program Info',
+        'epg_goto_channel': 'Locate Current Channel',
+        'reminder_manager': 'Reminder Manager',
+        'reminder_info': 'Reminders are based on specific channel+program+start time, triggered 60s before program starts',
+        'reminder_count_info': '{count} reminders | Based on channel+program+start time, triggered 60s before start',
+        'remove_selected': 'Remove Selected',
+        'clear_all': 'Clear All',
+
+        'global_search': 'Global Search',
+        'global_search_placeholder': 'Search channels/groups/programs...',
+        'search_no_results': 'No results',
+        'search_type_to_search': 'Type to search',
+        'searching': 'Searching...',
+        'search_results_count': '{count} results found',
+        'search_results_truncated': '{count}+ results found (truncated)',
+        'search_no_scope': 'Please select at least one search scope',
+        'search_scope_channel': 'Channels',
+        'search_scope_epg': 'EPG Programs',
+        'search_placeholder': 'Type to search...',
+        'search': 'Search',
+        'epg_program': 'Program',
+        'epg_search_result': 'EPG Search Result',
+        'epg_search': 'EPG Search',
+        'epg_search_placeholder': 'Search program name/description...',
+        'epg_timeline': 'EPG Timeline',
+        'epg_date': 'Date',
+        'epg_no_data': 'No EPG Data',
+        'epg_no_programs': 'No programs for this date',
+        'epg_channels_loaded': '{count} channels / {prog} programs',
+        'menu_epg_timeline': 'EPG Timeline',
+        'menu_epg_search': 'EPG Search',
+        'menu_search': 'Search',
+        'tooltip_minimize': 'Minimize',
+        'tooltip_maximize': 'Maximize',
+        'tooltip_restore': 'Restore',
+        'tooltip_close': 'Close',
+        'menu_refresh': 'Refresh\tF5',
+        'menu_reset_layout': 'Reset Layout',
+        'menu_log_level': 'Log Level',
+        'log_level_debug': 'Debug',
+        'log_level_info': 'Info',
+        'log_level_warning': 'Warning',
+        'log_level_error': 'Error',
+        'menu_edit': 'Edit',
+        'menu_undo': 'Undo\tCtrl+Z',
+        'menu_redo': 'Redo\tCtrl+Shift+Z',
+        'menu_clear_history': 'Clear History',
+        'menu_playback': 'Playback',
+        'menu_seek': 'Seek',
+        'menu_volume': 'Volume',
+        'menu_speed': 'Speed',
+        'menu_audio_subtitle': 'Audio & Subtitle',
+        'menu_video_image': 'Video & Image',
+        'menu_advanced_tools': 'Advanced Tools',
+        'menu_prev_channel': 'Previous Channel\t↑',
+        'menu_next_channel': 'Next Channel\t↓',
+        'menu_prev_channel2': 'Previous Channel (Alt)\tCtrl+Shift+↑',
+        'menu_next_channel2': 'Next Channel (Alt)\tCtrl+Shift+↓',
+        'menu_back_channel': 'Switch Back\tBackspace',
+        'menu_play_pause': 'Play/Pause\tSpace',
+        'menu_stop': 'Stop\tEsc',
+        'menu_seek_back': 'Seek Back\t←',
+        'menu_seek_forward': 'Seek Forward\t→',
+        'menu_vol_up': 'Volume Up\tScroll Up',
+        'menu_vol_down': 'Volume Down\tScroll Down',
+        'menu_mute': 'Mute\tCtrl+M',
+        'menu_speed_up': 'Speed Up\t.',
+        'menu_speed_down': 'Speed Down\t,',
+        'menu_screenshot': 'Screenshot\tS',
+        'osd_volume': 'Volume',
+        'osd_muted': 'Muted',
+        'osd_speed': 'Speed',
+        'osd_aspect_ratio': 'Aspect',
+        'osd_audio_track': 'Audio: {}',
+        'osd_audio_track_failed': 'Audio track switch failed',
+        'osd_audio_track_fallback': 'Audio track unavailable, switched to: {}',
+        'osd_subtitle_track': 'Subtitle: {}',
+        'osd_subtitle_track_failed': 'Subtitle track switch failed',
+        'osd_sub_track_fallback': 'Subtitle track unavailable, switched to: {}',
+        'osd_sub_visible': 'Subtitle: On',
+        'osd_sub_hidden': 'Subtitle: Off',
+        'osd_sub_delay': 'Subtitle Delay',
+        'osd_sub_scale': 'Subtitle Scale',
+        'osd_sub_pos': 'Subtitle Position',
+        'menu_subtitle_style': 'Subtitle Style...',
+        'menu_subtitle_download': 'Download Subtitle...',
+        'ctx_download_subtitle': 'Download Subtitle...',
+        'ctx_subtitle_style': 'Subtitle Style...',
+        'ctx_sub_visibility': 'Show Subtitle',
+        'ctx_sub_delay': 'Subtitle Delay',
+        'ctx_sub_scale': 'Subtitle Scale',
+        'ctx_sub_pos': 'Subtitle Position',
+        'ctx_sub_pos_up': 'Up',
+        'ctx_sub_pos_down': 'Down',
+        'ctx_sub_pos_reset': 'Reset',
+        'subtitle_style_title': 'Subtitle Style',
+        'subtitle_download_title': 'Download Subtitles',
+        'sub_style_group': 'Subtitle Style',
+        'sub_ctrl_group': 'Subtitle Controls',
+        'sub_preset_group': 'Quick Presets',
+        'sub_color': 'Subtitle Color',
+        'sub_border_color': 'Border Color',
+        'sub_shadow_color': 'Shadow Color',
+        'sub_font': 'Font',
+        'sub_font_size': 'Font Size',
+        'sub_border_size': 'Border Size',
+        'sub_shadow_offset': 'Shadow Offset',
+        'sub_font_style': 'Font Style',
+        'sub_bold': 'Bold',
+        'sub_italic': 'Italic',
+        'sub_margin': 'Margin',
+        'sub_align': 'Alignment',
+        'sub_delay': 'Subtitle Delay',
+        'sub_scale': 'Subtitle Scale',
+        'sub_pos': 'Subtitle Position',
+        'sub_visibility': 'Show Subtitle',
+        'sub_preset_default': 'Default',
+        'sub_preset_yellow': 'Yellow Outline',
+        'sub_preset_outline': 'Thick Outline',
+        'sub_preset_clean': 'No Shadow',
+        'sub_apply_now': 'Apply Now',
+        'sub_save': 'Save',
+        'sub_reset': 'Reset',
+        'sub_close': 'Close',
+        'sub_osd_applied': 'Subtitle style applied',
+        'sub_osd_saved': 'Subtitle style saved',
+        'sub_search_placeholder': 'Movie name / file name (empty for hash search)',
+        'sub_lang_eng': 'English',
+        'sub_lang_chi': 'Chinese',
+        'sub_lang_cjk': 'CJK',
+        'sub_lang_all': 'All',
+        'sub_search': 'Search',
+        'sub_searching': 'Searching...',
+        'sub_no_results': 'No subtitles found',
+        'sub_results_count': 'Found {} results',
+        'sub_rating': 'Rating',
+        'sub_downloads': 'Downloads',
+        'sub_bad': 'Bad',
+        'sub_auto_dl': 'Auto download',
+        'sub_browser_dl': 'Browser download',
+        'sub_open_browser_hint': 'Opened detail page in browser, please download subtitle manually',
+        'sub_download': 'Download & Load',
+        'sub_downloading': 'Downloading...',
+        'sub_dl_failed': 'Download failed',
+        'sub_dl_ok': 'Downloaded: {}',
+        'sub_loaded': 'Subtitle loaded',
+        'menu_video_eq': 'Video Equalizer...',
+        'ctx_video_eq': 'Video Equalizer...',
+        'video_eq_title': 'Video Equalizer',
+        'video_eq_group_image': 'Image',
+        'video_eq_group_transform': 'Transform',
+        'video_eq_brightness': 'Brightness',
+        'video_eq_contrast': 'Contrast',
+        'video_eq_saturation': 'Saturation',
+        'video_eq_hue': 'Hue',
+        'video_eq_gamma': 'Gamma',
+        'video_eq_sharpness': 'Sharpness',
+        'video_eq_rotate': 'Rotate',
+        'video_eq_flip': 'Flip',
+        'video_eq_flip_none': 'None',
+        'video_eq_flip_horizontal': 'Horizontal',
+        'video_eq_flip_vertical': 'Vertical',
+        'video_eq_flip_both': 'Both',
+        'video_eq_reset_on_new_file': 'Auto reset on file change',
+        'video_eq_reset': 'Reset All',
+        'video_eq_apply': 'Apply',
+        'video_eq_save': 'Save',
+        'video_eq_close': 'Close',
+        'video_eq_reset_done': 'Video EQ reset',
+        'video_eq_applied': 'Video EQ applied',
+        'video_eq_saved': 'Video EQ saved',
+        'osd_video_brightness': 'Brightness',
+        'osd_video_contrast': 'Contrast',
+        'osd_video_saturation': 'Saturation',
+        'osd_video_hue': 'Hue',
+        'osd_video_gamma': 'Gamma',
+        'osd_video_sharpness': 'Sharpness',
+        'osd_video_rotate': 'Rotate',
+        'osd_video_flip': 'Flip',
+        # ---------- Motion Compensation ----------
+        'video_eq_group_motion_comp': 'Motion Compensation',
+        'mc_strength_label': 'Strength',
+        'mc_off': 'Off',
+        'mc_low': 'Low (Frame Blend)',
+        'mc_medium': 'Medium (Motion Comp)',
+        'mc_high': 'High (Advanced)',
+        'mc_fps_label': 'Target FPS',
+        'mc_hint': 'Requires copy-back hwdec or software decoding. Medium+ may significantly increase CPU load.',
+        'osd_motion_comp': 'Motion Comp',
+        # ---------- Super Resolution ----------
+        'video_eq_group_super_res': 'Resolution Enhancement',
+        'sr_scale_label': 'Scale Algorithm',
+        'sr_detail_label': 'Detail Enhance',
+        'sr_off': 'Off',
+        'sr_bilinear': 'Bilinear',
+        'sr_bicubic': 'Bicubic',
+        'sr_lanczos': 'Lanczos',
+        'sr_spline': 'Spline',
+        'sr_ewa_lanczos': 'EWA Lanczos',
+        'sr_ewa_lanczossharp': 'EWA Lanczos Sharp',
+        'sr_detail': 'Detail',
+        'sr_hint': 'Scale algorithm applies globally; detail enhance requires copy-back hwdec or software decoding.',
+        'osd_super_res': 'Super Res',
+        # 用户着色器
+        'video_eq_group_enhance': 'Video Enhancement',
+        'video_eq_group_shader': 'AI Super Resolution Shader',
+        'shader_preset_label': 'Shader Preset',
+        'shader_off': 'Off',
+        'shader_not_found': 'File not found, place in shaders/ dir',
+        'shader_not_found': 'File not found, place in shaders/ dir',
+        'shader_ravu': 'RAVU Sharp Upscale',
+        'shader_fsrcnnx': 'FSRCNNX Super Resolution',
+        'shader_anime4k': 'Anime4K Enhancement',
+        'shader_krig': 'KrigBilateral Chroma Upscale',
+        'shader_ssim': 'SSim Downscaler',
+        'shader_esrgan': 'ESRGAN High Quality',
+        'shader_adaptive_sharpen': 'Adaptive Sharpen',
+        'shader_hint': 'GLSL shaders run on GPU, no CPU impact. Place .glsl/.hook files in shaders/ directory',
+        'osd_shader': 'Shader',
+        # Phase 3: Scene Detection
+        'group_scene_detect': 'Scene Detection',
+        'scene_detect_enable': 'Auto-detect content type',
+        'scene_detect_hint': 'Auto-detect content type (anime/sports/movie) based on\nresolution, fps, bitrate and dynamically adjust parameters',
+        'scene_detect_on': 'Scene detection enabled',
+        'scene_detect_off': 'Scene detection disabled',
+        'scene_detect_starting': 'Detecting...',
+        'scene_detect_label': 'Scene',
+        # Phase 3: Preset Management
+        'group_preset_manage': 'Preset Manager',
+        'btn_apply_preset': 'Apply',
+        'btn_save_preset': 'Save As...',
+        'btn_delete_preset': 'Delete',
+        'save_preset_title': 'Save Preset',
+        'save_preset_prompt': 'Preset name:',
+        'my_preset': 'My Preset',
+        'builtin': 'Built-in',
+        'preset_applied': 'Preset applied',
+        'presets_imported': 'Imported',
+        'presets_count': 'presets',
+        'confirm_delete': 'Confirm Delete',
+        'confirm_delete_preset': 'Delete preset "{name}"?',
+        # Phase 3: GPU API
+        'gpu_api_label': 'GPU Backend:',
+        'gpu_api_auto': 'Auto (D3D11)',
+        'gpu_api_d3d11': 'D3D11 (Default)',
+        'gpu_api_vulkan': 'Vulkan (Experimental)',
+        'gpu_api_hint': 'Vulkan may improve performance on some GPUs, requires restart',
+        # Movie preset
+        'preset_movie': 'Movie',
+        # 智能预设
+        'video_eq_group_smart_preset': 'Smart Presets',
+        'preset_auto': 'Auto Recommend',
+        'preset_performance': 'Performance',
+        'preset_quality': 'Quality',
+        'preset_anime': 'Anime',
+        'preset_sports': 'Sports',
+        'osd_smart_preset': 'Smart Preset',
+        # 硬件信息
+        'video_eq_group_hardware': 'Hardware Info',
+        'menu_audio_eq': 'Audio Equalizer...',
+        'ctx_audio_eq': 'Audio Equalizer...',
+        'audio_eq_title': 'Audio Equalizer',
+        'audio_eq_group_delay': 'Sync',
+        'audio_eq_group_channels': 'Channel Layout',
+        'audio_eq_group_device': 'Output Device',
+        'audio_eq_group_pitch': 'Pitch',
+        'audio_eq_group_equalizer': 'Equalizer',
+        'audio_eq_group_channel_vol': 'Channel Info',
+        'audio_eq_group_channel_info': 'Channel Info',
+        'audio_eq_channel_info': 'Detecting...',
+        'audio_eq_channel_refresh': 'Refresh',
+        'audio_eq_channel_reset_vol': 'Reset Vol',
+        'audio_eq_channel_no_playback': 'Not playing, cannot detect channels',
+        'audio_eq_channel_not_detected': 'Cannot detect channel layout',
+        'audio_eq_channel_layout': 'Layout',
+        'audio_eq_channel_reset_done': 'Channel volumes reset',
+        'audio_eq_delay': 'Audio Delay',
+        'audio_eq_channels': 'Channels',
+        'audio_eq_device': 'Device',
+        'audio_eq_pitch': 'Pitch',
+        'audio_eq_reset_on_new_file': 'Auto reset on file change',
+        'audio_eq_reset': 'Reset All',
+        'audio_eq_apply': 'Apply',
+        'audio_eq_save': 'Save',
+        'audio_eq_close': 'Close',
+        'audio_eq_reset_done': 'Audio EQ reset',
+        'osd_channel_vol': 'Channel Volume',
+        'audio_eq_applied': 'Audio EQ applied',
+        'audio_eq_saved': 'Audio EQ saved',
+        'audio_eq_preset': 'Quick Presets',
+        'audio_eq_preset_flat': 'Flat',
+        'audio_eq_preset_bass': 'Bass',
+        'audio_eq_preset_treble': 'Treble',
+        'audio_eq_preset_vocal': 'Vocal',
+        'audio_eq_preset_classical': 'Classical',
+        'audio_eq_preset_pop': 'Pop',
+        'audio_eq_preset_rock': 'Rock',
+        'audio_eq_preset_electronic': 'Electronic',
+        'osd_audio_delay': 'Audio Delay',
+        'osd_audio_channels': 'Channels',
+        'osd_audio_pitch': 'Pitch',
+        'osd_audio_eq_band': 'Band',
+        # ---------- Playback Queue & Playback Control ----------
+        'menu_playback_queue': 'Playback Queue & Control...',
+        'ctx_playback_queue': 'Playback Queue & Control...',
+        'playback_queue_title': 'Playback Queue & Control',
+        'playback_queue_group_queue': 'Queue',
+        'playback_queue_group_ab_loop': 'A-B Loop',
+        'playback_queue_group_frame': 'Frame Step',
+        'playback_queue_group_list': 'Current Queue',
+        'playback_queue_mode_none': 'No Loop',
+        'playback_queue_mode_single': 'Loop Single File',
+        'playback_queue_mode_all': 'Loop List',
+        'playback_queue_mode_shuffle': 'Shuffle',
+        'playback_queue_cycle_mode': 'Cycle Loop Mode',
+        'playback_queue_toggle_shuffle': 'Toggle Shuffle',
+        'playback_queue_play_next': 'Next File\tPgDown',
+        'playback_queue_play_prev': 'Previous File\tPgUp',
+        'playback_queue_ab_set_a': 'Set A Point\tA',
+        'playback_queue_ab_set_b': 'Set B Point\tB',
+        'playback_queue_ab_clear': 'Clear A-B\tC',
+        'playback_queue_ab_status': 'A-B Loop Status',
+        'playback_queue_ab_active': 'Active (A={a:.2f}s, B={b:.2f}s)',
+        'playback_queue_ab_inactive': 'Inactive',
+        'playback_queue_ab_only_a': 'A set ({a:.2f}s)',
+        'playback_queue_ab_only_b': 'B set ({b:.2f}s)',
+        'playback_queue_frame_forward': 'Frame Forward\t]',
+        'playback_queue_frame_back': 'Frame Back\t[',
+        'playback_queue_close': 'Close',
+        'playback_queue_empty': 'Queue is empty (open local video files to populate)',
+        'playback_queue_current': 'Current',
+        'osd_queue_mode': 'Queue Mode',
+        'osd_play_next': 'Next File',
+        'osd_play_prev': 'Previous File',
+        'osd_ab_loop_a': 'A Point',
+        'osd_ab_loop_b': 'B Point',
+        'osd_ab_loop_cleared': 'A-B Loop cleared',
+        'osd_ab_loop_inactive': 'A-B Loop inactive (set both A and B first)',
+        'osd_frame_step': 'Frame',
+        'osd_shuffle_on': 'Shuffle: On',
+        'osd_shuffle_off': 'Shuffle: Off',
+        # ---------- Resume Playback ----------
+        'menu_resume_list': 'Resume Positions...',
+        'ctx_resume_list': 'Resume Positions...',
+        'resume_list_title': 'Resume Positions',
+        'resume_list_info': 'Saved playback positions. Double-click to resume, or use the buttons below.',
+        'resume_list_group': 'Resume List',
+        'resume_list_resume': 'Resume Selected',
+        'resume_list_delete': 'Delete Selected',
+        'resume_list_clear_all': 'Clear All',
+        'resume_list_empty': 'No saved positions',
+        'osd_resume_restored': 'Resumed',
+        'osd_resume_cleared': 'Resume positions cleared',
+        'osd_resume_not_in_list': 'File not in current playlist',
+        # ---------- Network Stream Enhance ----------
+        'menu_network_enhance': 'Network Enhance...',
+        'ctx_network_enhance': 'Network Enhance...',
+        'network_enhance_title': 'Network Stream Enhance',
+        'network_enhance_group_referer': 'HTTP Referer',
+        'network_enhance_group_proxy': 'HTTP/HTTPS Proxy',
+        'network_enhance_group_headers': 'HTTP Headers',
+        'network_enhance_referer': 'Referer',
+        'network_enhance_referer_hint': 'Used to bypass hotlink protection. Leave empty to disable.',
+        'network_enhance_proxy': 'Proxy URL',
+        'network_enhance_proxy_hint': 'Supported formats:\n  http://host:port\n  https://host:port\n  socks5://host:port\n  socks5h://host:port (DNS via proxy)\nLeave empty to disable proxy.',
+        'network_enhance_headers_hint': 'One header per line, format: Key: Value',
+        'network_enhance_clear': 'Clear All',
+        'network_enhance_apply': 'Apply',
+        'network_enhance_applied': 'Network settings applied',
+        'network_enhance_saved': 'Network settings saved',
+        # Burst Screenshot
+        'menu_burst_screenshot': 'Burst Screenshot...',
+        'ctx_burst_screenshot': 'Burst Screenshot...',
+        'burst_screenshot_title': 'Burst Screenshot',
+        'burst_screenshot_group_params': 'Parameters',
+        'burst_screenshot_interval': 'Interval',
+        'burst_screenshot_total': 'Count',
+        'burst_screenshot_group_progress': 'Progress',
+        'burst_screenshot_start': 'Start',
+        'burst_screenshot_stop': 'Stop',
+        'burst_screenshot_status_idle': 'Idle',
+        'burst_screenshot_status_running': 'Running: {n}/{total}',
+        'burst_screenshot_status_done': 'Done: {n}/{total}',
+        'burst_screenshot_not_playing': 'No media playing',
+        'burst_screenshot_done': 'Burst complete: {n} screenshots',
+        # Clip Export / GIF
+        'menu_clip_export': 'Clip Export / GIF...',
+        'clip_export_title': 'Clip Export / GIF Maker',
+        'clip_export_group_time': 'Time Range',
+        'clip_export_start_time': 'Start Time',
+        'clip_export_duration': 'Duration',
+        'clip_export_use_current': 'Use Current Position',
+        'clip_export_group_output': 'Output Settings',
+        'clip_export_format': 'Output Format',
+        'clip_export_format_mp4': 'MP4 (Video)',
+        'clip_export_format_mkv': 'MKV (Video)',
+        'clip_export_format_webm': 'WebM (Video)',
+        'clip_export_format_gif': 'GIF (Animation)',
+        'clip_export_stream_copy': 'Stream Copy (fast, no re-encode)',
+        'clip_export_gif_width': 'GIF Width',
+        'clip_export_gif_fps': 'GIF FPS',
+        'clip_export_browse': 'Browse...',
+        'clip_export_output': 'Output Path',
+        'clip_export_start_btn': 'Start Export',
+        'clip_export_cancel': 'Cancel',
+        'clip_export_exporting': 'Exporting...',
+        'clip_export_select_output': 'Select Output Path',
+        'clip_export_tip': 'Tip',
+        'clip_export_no_playback': 'No playback content to export',
+        'clip_export_source_not_found': 'Source file not found: {path}',
+        'clip_export_no_output_path': 'Please select output path',
+        'clip_export_service_unavailable': 'Export service not initialized',
+        'clip_export_done': 'Done',
+        'clip_export_failed': 'Failed',
+        'clip_export_error': 'Error',
+        'clip_export_busy': 'Another export task is running',
+        'clip_export_ffmpeg_not_found_clip': 'ffmpeg not found. Place ffmpeg in ffmpeg/ directory or install to system PATH',
+        'clip_export_ffmpeg_not_found_gif': 'ffmpeg not found, cannot generate GIF',
+        'clip_export_pillow_not_found': 'Pillow not installed, cannot generate GIF (pip install Pillow)',
+        'clip_export_invalid_duration': 'Invalid duration (end <= start)',
+        'clip_export_invalid_duration_short': 'Invalid duration',
+        'clip_export_cancelled': 'Cancelled',
+        'clip_export_exported': 'Exported: {path}',
+        'clip_export_export_failed': 'Export failed: {err}',
+        'clip_export_exception': 'Error: {err}',
+        'clip_export_extract_failed': 'Frame extraction failed: {err}',
+        'clip_export_no_frames': 'No frames extracted',
+        'clip_export_read_frames_failed': 'Failed to read frames',
+        'clip_export_save_gif_failed': 'Failed to save GIF: {err}',
+        'clip_export_generated': 'Generated: {path}',
+        # Bookmarks & Chapters
+        'menu_bookmarks': 'Bookmarks & Chapters...',
+        'ctx_bookmarks': 'Bookmarks & Chapters...',
+        'bookmark_title': 'Bookmarks & Chapters',
+        'bookmark_info': 'Chapters are video built-in. Bookmarks are user-defined. Double-click to seek.',
+        'bookmark_tab_chapters': 'Chapters',
+        'bookmark_tab_bookmarks': 'Bookmarks',
+        'bookmark_chapter_prev': 'Previous Chapter',
+        'bookmark_chapter_next': 'Next Chapter',
+        'bookmark_chapters_empty': 'No chapters in this video',
+        'bookmark_chapter_n': 'Chapter {}',
+        'bookmark_view_label': 'View:',
+        'bookmark_view_current': 'Current File',
+        'bookmark_view_all': 'All Files',
+        'bookmark_empty': 'No bookmarks',
+        'bookmark_add': 'Add Bookmark',
+        'bookmark_delete': 'Delete Selected',
+        'bookmark_clear_url': 'Clear Current File',
+        'bookmark_clear_all': 'Clear All',
+        'bookmark_add_title': 'Add Bookmark',
+        'bookmark_add_prompt': 'Bookmark name (optional):',
+        'osd_bookmark_added': 'Bookmark added',
+        'osd_bookmark_seek': 'Bookmark',
+        'osd_bookmark_not_in_list': 'File not in current playlist',
+        'osd_bookmarks_cleared': 'All bookmarks cleared',
+        'osd_chapter_seek': 'Chapter',
+        'osd_chapter_next': 'Next Chapter',
+        'osd_chapter_prev': 'Previous Chapter',
+        # A/V Sync Monitor
+        'menu_av_sync': 'A/V Sync Monitor...',
+        'ctx_av_sync': 'A/V Sync Monitor...',
+        'av_sync_title': 'A/V Sync Monitor',
+        'av_sync_group_status': 'Real-time Status',
+        'av_sync_avdiff': 'A/V Diff:',
+        'av_sync_status_ok': 'OK',
+        'av_sync_status_minor': 'Minor Desync',
+        'av_sync_status_bad': 'Out of Sync',
+        'av_sync_audio_pts': 'Audio PTS:',
+        'av_sync_video_pts': 'Video PTS:',
+        'av_sync_current_delay': 'Current Audio Delay:',
+        'av_sync_group_wave': 'A/V Diff Trend',
+        'av_sync_group_adjust': 'Audio Delay Adjustment',
+        'av_sync_reset_delay': 'Reset',
+        # Stream Quality
+        'menu_stream_quality': 'Stream Quality...',
+        'ctx_stream_quality': 'Stream Quality...',
+        'stream_quality_title': 'Stream Quality',
+        'stream_quality_group_video': 'Video',
+        'stream_quality_group_audio': 'Audio',
+        'stream_quality_group_network': 'Network & Cache',
+        'stream_quality_group_drops': 'Frame Drops',
+        'stream_quality_group_hw': 'Hardware & Rendering',
+        'stream_quality_video_codec': 'Codec',
+        'stream_quality_resolution': 'Resolution',
+        'stream_quality_display_resolution': 'Display Resolution',
+        'stream_quality_fps': 'Frame Rate',
+        'stream_quality_video_bitrate': 'Video Bitrate',
+        'stream_quality_pixel_format': 'Pixel Format',
+        'stream_quality_colormatrix': 'Color Matrix',
+        'stream_quality_primaries': 'Color Primaries',
+        'stream_quality_gamma': 'Transfer Characteristics',
+        'stream_quality_hdr_type': 'HDR Type',
+        'stream_quality_video_depth': 'Video Bit Depth',
+        'stream_quality_aspect_ratio': 'Aspect Ratio',
+        'stream_quality_audio_codec': 'Codec',
+        'stream_quality_audio_channels': 'Channels',
+        'stream_quality_audio_layout': 'Channel Layout',
+        'stream_quality_sample_rate': 'Sample Rate',
+        'stream_quality_audio_bitrate': 'Audio Bitrate',
+        'stream_quality_audio_depth': 'Audio Bit Depth',
+        'stream_quality_container': 'Container',
+        'stream_quality_protocol': 'Protocol',
+        'stream_quality_demuxer': 'Demuxer',
+        'stream_quality_cache_duration': 'Cache Duration',
+        'stream_quality_cache_size': 'Cache Size',
+        'stream_quality_cache_speed': 'Cache Speed',
+        'stream_quality_buffering': 'Buffering',
+        'stream_quality_demuxer_bitrate': 'Demuxer Bitrate',
+        'stream_quality_vo_drop': 'VO Drops',
+        'stream_quality_decoder_drop': 'Decoder Drops',
+        'stream_quality_mistimed_frame': 'Mistimed Frames',
+        'stream_quality_vo_delay': 'VO Delayed Frames',
+        'stream_quality_hwdec': 'HW Decode',
+        'stream_quality_vo': 'Video Output',
+        'stream_quality_gpu_api': 'GPU API',
+        'stream_quality_gpu_context': 'GPU Context',
+        'stream_quality_no_buffer': 'No buffering',
+        # 3D / 360° Video
+        'menu_3d_video': '3D / 360° Video...',
+        'ctx_3d_video': '3D / 360° Video...',
+        'video_3d_title': '3D / 360° Video',
+        'video_3d_group_stereo': '3D Stereo Mode',
+        'video_3d_stereo_label': 'Mode:',
+        'video_3d_stereo_hint': 'Select the 3D format matching the source; choose "Normal 2D" for 2D videos',
+        'video_3d_stereo_mono': 'Normal 2D',
+        'video_3d_stereo_sbs_l': 'Side-by-Side - Left First',
+        'video_3d_stereo_sbs_r': 'Side-by-Side - Right First',
+        'video_3d_stereo_tb_f': 'Top-Bottom - Top First',
+        'video_3d_stereo_tb_s': 'Top-Bottom - Bottom First',
+        'video_3d_group_360': '360° View Control',
+        'video_3d_proj_label': 'Projection:',
+        'video_3d_proj_equirect': 'Equirectangular',
+        'video_3d_proj_cubemap': 'Cubemap',
+        'video_3d_proj_flat': 'Flat',
+        'video_3d_yaw': 'Yaw:',
+        'video_3d_pitch': 'Pitch:',
+        'video_3d_roll': 'Roll:',
+        'video_3d_360_hint': '360° view control requires the lavfi panorama filter, which may be unavailable on some builds',
+        'video_3d_reset': 'Reset All',
+        'video_3d_apply': 'Apply',
+        'video_3d_close': 'Close',
+        'osd_video_3d_mode': '3D Mode',
+        'osd_video_360_view': '360° View',
+        'osd_video_3d_reset': '3D/360 reset',
+        'osd_resolution': 'Resolution',
+        'osd_codec': 'Codec',
+        'osd_fps': 'FPS',
+        'osd_ar': 'AR',
+        'osd_hwdec': 'HWDec',
+        'osd_dynamic': 'Dynamic',
+        'osd_pixel': 'Pixel',
+        'osd_depth': 'Depth',
+        'osd_scan': 'Scan',
+        'osd_interlaced': 'Interlaced',
+        'osd_rotate': 'Rotate',
+        'osd_matrix': 'Matrix',
+        'osd_prim': 'Prim',
+        'osd_tf': 'TF',
+        'osd_range': 'Range',
+        'osd_peak': 'Peak',
+        'osd_avg': 'Avg',
+        'osd_channels': 'Channels',
+        'osd_mono': 'Mono',
+        'osd_stereo': 'Stereo',
+        'osd_ch_suffix': 'ch',
+        'osd_rate': 'Rate',
+        'osd_bitrate': 'Bitrate',
+        'osd_audio_depth': 'BitDepth',
+        'osd_total_br': 'Total',
+        'osd_video_br': 'Video',
+        'osd_cache': 'Cache',
+        'osd_cache_size': 'CacheSize',
+        'osd_buffer': 'Buffer',
+        'osd_dropped': 'Dropped',
+        'osd_container': 'Container',
+        'osd_protocol': 'Protocol',
+        'osd_demuxer': 'Demuxer',
+        'osd_vo': 'VO',
+        'osd_gpu_api': 'GPU-API',
+        'osd_gpu_ctx': 'Context',
+        'osd_url': 'URL',
+        'osd_live': '● LIVE',
+        'ctx_pause': 'Pause',
+        'ctx_play': 'Play',
+        'ctx_stop': 'Stop',
+        'ctx_prev_channel': 'Previous Channel',
+        'ctx_next_channel': 'Next Channel',
+        'ctx_speed': 'Speed',
+        'ctx_volume': 'Volume',
+        'ctx_mute': 'Mute',
+        'ctx_unmute': 'Unmute',
+        'ctx_aspect_ratio': 'Aspect Ratio',
+        'ctx_aspect_default': 'Default',
+        'ctx_aspect_stretch': 'Stretch',
+        'ctx_aspect_fill': 'Fill',
+        'ctx_screenshot': 'Screenshot\tS',
+        'ctx_fullscreen': 'Fullscreen\tF11',
+        'ctx_pip': 'Picture-in-Picture\tP',
+        'ctx_view': 'View',
+        'ctx_audio_subtitle': 'Audio & Subtitle',
+        'ctx_tools': 'Tools',
+        'ctx_epg': 'EPG List\tE',
+        'ctx_playlist': 'Playlist\tL',
+        'ctx_control_panel': 'Control Panel\tM',
+        'ctx_hide_panels': 'Hide Floating Panels\tY',
+        'ctx_reset_layout': 'Reset Layout',
+        'ctx_open_stream': 'Open Stream\tCtrl+U',
+        'ctx_open_video': 'Open Video\tCtrl+Shift+O',
+        'ctx_scan': 'Scan & Organize',
+        'ctx_audio_track': 'Audio Track',
+        'ctx_no_audio_track': 'No Audio Tracks',
+        'ctx_audio_track_n': 'Track {}',
+        'ctx_subtitle': 'Subtitle',
+        'ctx_no_subtitle': 'No Subtitle',
+        'ctx_subtitle_track_n': 'Sub {}',
+        'ctx_load_subtitle': 'Load Subtitle...',
+        'ctx_subtitle_files': 'Subtitle Files',
+        'ctx_all_files': 'All Files',
+        'panel_audio_track': 'Audio Track',
+        'panel_subtitle': 'Subtitle',
+        'menu_tools': 'Tools',
+        'menu_scan_channels': 'Scan & Organize',
+        'menu_mapping': 'Mapping',
+        'menu_subscription_settings': 'Subscription Settings',
+        'menu_file_association': 'File Association',
+        'file_assoc_title': 'Select file formats to associate',
+        'file_assoc_hint': 'After registration, right-click files to open with this program',
+        'file_association': 'File Association',
+        'menu_theme': 'Theme',
+        'menu_help': 'Help',
+        'menu_instructions': 'Instructions',
+        'menu_about': 'About',
+        'today': 'Today',
+        'yesterday': 'Yesterday',
+        'tomorrow': 'Tomorrow',
+        'no_channel_selected': 'No channel selected',
+        'select_channel_to_play': 'Select a channel to play',
+        'open_playlist_or_import': 'Open a playlist file or import channels to start watching',
+        'waiting_to_play': 'Waiting to play...',
+
+        'playing': 'Playing',
+        'paused': 'Paused',
+        'stopped': 'Stopped',
+        'play_error': 'Play Error',
+        'pip_mode': 'PiP Mode',
+        'to_exit': 'to exit',
+        'pip_exited': 'exited',
+        'playing_channel': 'Playing: {name}',
+        'paused_channel': 'Paused: {name}',
+        'stopped_play': 'Stopped',
+        'playback_stopped': 'Playback stopped',
+        'catchup_playing': 'Catchup: {name}',
+        'catchup_paused': 'Catchup Paused: {name}',
+        'subscription_settings_title': 'Subscription Settings',
+        'protocol_settings': 'Protocol Settings',
+        'protocol_type': 'Protocol Type',
+        'rtsp_transport_colon': 'RTSP Transport:',
+        'hwdec_label': 'Hardware Decoding',
+        'hwdec_auto_copy': 'HW Copy-back (filters)',
+        'hwdec_auto': 'HW Native (fastest)',
+        'hwdec_no': 'Software',
+        'tls_verify_label': 'TLS Verify',
+        'network_timeout_colon': 'Network Timeout:',
+        'audio_passthrough_colon': 'Audio Pass-through:',
+        'passthrough_never': 'Never (Decode)',
+        'passthrough_spdif': 'SPDIF (AC3/EAC3/DTS)',
+        'passthrough_hd': 'HD Codecs (DTS-HD/TrueHD)',
+        'passthrough_lossless': 'Lossless Only (FLAC/ALAC/TrueHD)',
+        'passthrough_all': 'All Codecs',
+        'hdr_output_mode_colon': 'HDR Output:',
+        'hdr_disable': 'Disable (Force SDR Output)',
+        'hdr_auto': 'Auto (scRGB for Windows HDR ON)',
+        'hdr_scrgb': 'scRGB (Windows HDR ON)',
+        'hdr_passthrough': 'PQ Passthrough (Windows HDR OFF)',
+        'hdr_tonemap': 'Tone Map to SDR',
+        # Advanced player params: VO / video-sync / framedrop / cache overrides
+        'vo_label': 'Video Output (vo):',
+        'vo_auto': 'Auto (Recommended - derive from HDR mode)',
+        'vo_gpu': 'gpu (Default cross-platform VO)',
+        'vo_gpu_next': 'gpu-next (Next-gen, HDR passthrough/scRGB)',
+        'vo_libmpv': 'libmpv (Render API, macOS default)',
+        'vo_direct3d': 'direct3d (Windows legacy VO)',
+        'vo_desc': 'Selects the video output. "Auto" derives vo from HDR mode (gpu/gpu-next). '
+                   'On macOS, vo is always forced to libmpv (mpv v0.41+ no longer supports wid embedding). '
+                   'gpu-next is required for HDR passthrough/scRGB on Windows.',
+        'video_sync_label': 'Video Sync (video-sync):',
+        'vsync_audio': 'audio (Default, sync to audio clock)',
+        'vsync_display_resample': 'display-resample (Resample audio to display)',
+        'vsync_display_tempo': 'display-tempo (Tempo-scale audio)',
+        'vsync_resample': 'resample (Resample audio, may cause drift)',
+        'vsync_display_desync': 'display-desync (No sync, may drop/dup)',
+        'vsync_desync': 'desync (Completely asynchronous)',
+        'video_sync_desc': 'A/V sync timing reference. "audio" is the safest default. '
+                           '"display-resample"/"display-tempo" sync to display refresh rate (smoother but may pitch-shift audio).',
+        'framedrop_label': 'Framedrop (framedrop):',
+        'framedrop_vo': 'vo (Default, drop when VO is slow)',
+        'framedrop_decoder': 'decoder (Drop at decoder, lower CPU)',
+        'framedrop_insert': 'insert (Insert 1:1 frame, may stutter)',
+        'framedrop_none': 'none (Never drop)',
+        'framedrop_never': 'never (Alias of none)',
+        'framedrop_desc': 'Frame dropping strategy when video output falls behind. '
+                          '"vo" drops only at output stage (keeps decode quality). '
+                          '"decoder" drops earlier (saves CPU on weak machines).',
+        'deinterlace_label': 'Deinterlace:',
+        'deinterlace_no': 'Off (No deinterlacing)',
+        'deinterlace_auto': 'Auto (Yadif Bob, keeps framerate smooth)',
+        'deinterlace_desc': 'Deinterlacing for interlaced video (channels with horizontal lines/comb artifacts). '
+                           "'Auto' uses Yadif Bob mode (mode=1), 50i→50p, maintains original framerate for smooth motion. "
+                           'Requires copy-back hwdec or software decoding.',
+        'cache_secs_override_label': 'Cache Seconds (cache-secs):',
+        'cache_secs_override_placeholder': '0 = auto (derived from stream type)',
+        'cache_secs_override_desc': 'Overrides the demuxer cache duration in seconds. Leave 0 to keep '
+                                    'the auto value (e.g. 3600s for live, 180s for Blu-ray, dynamically adjusted by resolution).',
+        'demuxer_max_bytes_override_label': 'Demuxer Max Bytes (MiB):',
+        'demuxer_max_bytes_override_placeholder': '0 = auto (MiB, derived from cache-secs)',
+        'demuxer_max_bytes_override_desc': 'Overrides the demuxer forward cache size in MiB. Leave 0 to keep '
+                                           'the auto value (scales with cache-secs, capped at 4096MiB).',
+        'demuxer_readahead_secs_override_label': 'Demuxer Readahead (s):',
+        'demuxer_readahead_secs_override_placeholder': '0 = auto (per stream type: HLS=120s, TS=300s, ...)',
+        'demuxer_readahead_secs_override_desc': 'Overrides the demuxer readahead in seconds. Leave 0 to keep '
+        'the auto value (120s for HLS/HTTP, 300s for TS, 30s for network drives, etc.).',
+        'probesize_override_label': 'Probesize (bytes):',
+        'probesize_override_placeholder': '0 = auto (5MB for live, 2MB for FCC)',
+        'probesize_override_desc': 'Overrides the demuxer probe size in bytes. Leave 0 for auto '
+        '(5MB for live streams, 2MB for FCC). Increase if streams '
+        'fail to load with unspecified pixel format warnings.',
+        'analyzeduration_override_label': 'Analyzeduration (seconds):',
+        'analyzeduration_override_placeholder': '0 = auto (5s for live, 2s for FCC)',
+        'analyzeduration_override_desc': 'Overrides the demuxer analysis duration in seconds. Leave 0 for auto '
+        '(5s for live, 2s for FCC). Increase if streams take too long '
+        'to load or fail with corrupt packet warnings.',
+        'screenshot_no_video': 'No video frame for current channel, cannot take screenshot',
+        'ctx_hdr_mode': 'HDR Mode',
+        'hdr_current_video': 'Current',
+        'osd_hdr_mode': 'HDR Mode',
+        'auto_timeout': 'Auto',
+        'playlist_subscription': 'Playlist Subscription',
+        'subscription_url': 'Subscription URL',
+        'subscription_name': 'Subscription Name',
+        'update_interval': 'Update Interval (min)',
+        'epg_subscription': 'EPG Subscription (all sources will be merged automatically)',
+        'playlist_sources': 'Playlist Sources (click to activate):',
+        'epg_sources': 'EPG Sources:',
+        'add_source': '+ Add Source',
+        'update_source': '✎ Update',
+        'remove_source': '- Remove Selected',
+        'enter_source_name': 'Source name (optional)',
+        'epg_loaded': 'EPG data loaded successfully',
+        'save_button': 'Save',
+        'usage_instructions_title': 'Usage Instructions',
+        'ok_button': 'OK',
+        'loading': 'Loading...',
+        'current_program': 'Now Playing',
+        'upcoming_program': 'Upcoming',
+        'finished_program': 'Ended',
+        'bitrate_unknown': 'Unknown',
+        'codec_unknown': 'Unknown',
+        'resolution_unknown': 'Unknown',
+        'back_to_live': 'Back to Live',
+        'cannot_seek_live': 'Cannot seek back: live stream buffer insufficient (try again later)',
+        'timeshift_beyond_cache': 'Beyond buffer range, cannot seek to earlier time',
+        'timeshift_beyond_cache_no_epg': 'Beyond buffer range, no EPG info, cannot auto-timeshift',
+        'timeshift_playing': 'Timeshifting',
+        'ready': 'Ready',
+        'catchup_not_supported': 'This channel does not support catchup',
+        'playlist_sub_updated': 'Playlist subscription updated',
+        'playlist_sub_parse_failed': 'Playlist subscription parse failed',
+        'playlist_sub_update_failed': 'Failed to update playlist subscription',
+        'player_settings_saved': 'Player settings saved',
+        'player_settings_save_failed': 'Failed to save player settings',
+        'epg_settings_saved': 'EPG settings saved',
+        'file_opened': 'File opened',
+        'file_open_failed': 'Failed to open file',
+        'file_not_found': 'File not found, removed from recent list',
+        'download_failed': 'Download failed',
+        'language_change_failed': 'Language change failed',
+        'theme_changed': 'Theme changed to',
+        'theme_change_failed': 'Theme change failed',
+        'epg_sub_updated': 'EPG subscription updated',
+        'epg_sub_parse_failed': 'EPG subscription parse failed',
+        'epg_sub_update_failed': 'Failed to update EPG subscription',
+        'epg_using_cache': 'Using cached EPG data',
+        'codec_label': 'Codec',
+        'resolution_label': 'Resolution',
+        'bitrate_label': 'Bitrate',
+        'vbitrate_label': 'V.Bitrate',
+        'cache_speed_label': 'Cache',
+        'channel_count_label': 'Channels',
+        'sample_rate_label': 'Sample Rate',
+        'format_label': 'Format',
+        'protocol_label': 'Protocol',
+        'frame_rate_label': 'FPS',
+        'hwdec_label': 'HW',
+        'vcodec_label': 'Video',
+        'acodec_label': 'Audio',
+        'hdr_label': 'Dynamic',
+        'no_video_info': 'No video info',
+        'no_audio_info': 'No audio info',
+        'no_network_info': 'No network info',
+        'pixel_format_label': 'Pixel Format',
+        'hdr_type': 'Dynamic Range',
+        'hdr_sdr': 'SDR',
+        'hdr_hlg': 'HLG',
+        'hdr_hdr10': 'HDR10',
+        'hdr_hdr10_plus': 'HDR10+',
+        'hdr_dv': 'Dolby Vision',
+        'player_settings_title': 'Player Settings',
+        'update_interval_minutes': 'Update interval (minutes)',
+        'enter_playlist_url': 'Enter playlist subscription URL',
+        'enter_subscription_name': 'Enter subscription name',
+        'enter_epg_url': 'Enter EPG subscription URL',
+        'epg_settings_title': 'EPG Settings',
+        'epg_url_label': 'EPG URL',
+        'epg_source_label': 'EPG Source',
+        'app_description': 'IPTV Professional Scanner & Editor',
+        'system_info': 'System Info',
+        'copyright_text': '© 2025 ISEP',
+        'github_repo': 'GitHub Repository',
+        'request_timeout_text': '(Request Timeout)',
+        'fetch_failed_text': '(Fetch Failed)',
+        'api_limit_text': '(API Limit)',
+        'scan_settings_title': 'Scan Settings',
+        'channel_list_title': 'Channel List',
+        'channel_edit_title': 'Channel Edit',
+        'scan_window_title': 'IPTV Scanner',
+        'validate_button': 'Validate',
+        'hide_invalid_button': 'Hide Invalid',
+        'save_m3u': 'Save M3U',
+        'save_txt': 'Save TXT',
+        'save_m3u_tooltip': 'Save channel list as M3U format',
+        'save_txt_tooltip': 'Save channel list as TXT format',
+        'batch_ops': 'Batch Ops',
+        'batch_ops_tooltip': 'Batch operations for channels',
+        'auto_classify': 'Auto Classify',
+        'clean_names': 'Clean Names',
+        'assign_fields': 'Assign Fields',
+        'match_logo': 'Match Logo',
+        'clear_params': 'Clear Params',
+        'sort_by_group': 'Sort by Group',
+        'local_province': 'Local Province:',
+        'overwrite_existing': 'Overwrite existing groups',
+        'merge_nonlocal': 'Merge non-local to Other',
+        'preview_count': 'Preview:',
+        'channel_name': 'Channel Name',
+        'old_group': 'Old Group',
+        'new_group': 'New Group',
+        'preview': 'Preview',
+        'apply': 'Apply',
+        'cancel': 'Cancel',
+        'before': 'Before',
+        'after': 'After',
+        'only_empty_fields': 'Only assign to empty fields',
+        'target_channels': 'Target:',
+        'overwrite_logo_confirm': 'Overwrite existing logos?',
+        'move_to_group': 'Move to Group...',
+        'clean_selected_names': 'Clean Selected Names',
+        'match_selected_logo': 'Match Selected Logo',
+        'select_valid': 'Select Valid',
+        'select_invalid': 'Select Invalid',
+        'invert_selection': 'Invert Selection',
+        'delete_selected_channels': 'Delete Selected',
+        'confirm_delete_selected_message': 'Delete selected {n} channels?',
+        'channels_matched': '{n} channels matched',
+        'assign_name2tvg_id': 'Channel Name -> TVG-ID',
+        'assign_tvg_id2name': 'TVG-ID -> Channel Name',
+        'assign_tvg_name2name': 'TVG-Name(from tags) -> Channel Name',
+        'assign_tvg_id2tvg_chno': 'TVG-ID -> TVG-CHNO',
+        'target_group': 'Target Group:',
+        'save_scan_result': 'Save Scan Result',
+        'no_channels_to_save': 'No channels to save',
+        'append_scan': 'Append Scan',
+        'address_format_hint': 'Format: http://ip:port/rtp/10.10.[1-20].[1-20]:5002 | Sync multi-place: [1-100:n]/{n} (n stays in sync)',
+        'timeout_small': 'Timeout',
+        'thread_small': 'Threads',
+        'scan_retry_options': 'Scan Retry Options',
+        'enable_smart_retry': 'Enable Smart Retry',
+        'resume_from_checkpoint': 'Resume From Checkpoint',
+        'resume_from_checkpoint_tooltip': 'If an interrupted scan of the same range left a checkpoint, skip addresses already probed and restore channels found; otherwise rescan and overwrite the old checkpoint',
+        'mapping_options': 'Mapping Options',
+        'enable_channel_mapping': 'Enable Channel Mapping',
+        'scan_engine': 'Scan Engine',
+        'scan_engine_tooltip': 'Select the core engine for scanning and validation. mpv: lightweight and efficient, low resource usage; ffprobe: more detailed analysis, broader compatibility; asyncio: one event loop runs thousands of concurrent probes, suited for large range sweeps',
+        'scan_engine_mpv': 'mpv (Lightweight)',
+        'scan_engine_ffprobe': 'ffprobe (Detailed)',
+        'scan_engine_async': 'asyncio (High Concurrency)',
+        'menu_server': 'Server',
+        'server_start': 'Start Server',
+        'server_stop': 'Stop Server',
+        'server_started': 'Server started',
+        'server_stopped': 'Server stopped',
+        'server_running': 'Server running',
+        'server_not_running': 'Server not running',
+        'server_open_api': 'Open API',
+        'server_settings': 'Server Settings',
+        'server_auto_start': 'Auto-start Server on launch',
+        'server_port': 'Port:',
+        'server_host': 'Listen address:',
+        'save_changes': 'Save Changes',
+        'copy_channel_name': 'Copy Channel Name',
+        'copy_url': 'Copy URL',
+        'copy_tvg_id': 'Copy TVG-ID',
+        'copy_group': 'Copy Group',
+        'delete_channel': 'Delete Channel',
+        'confirm_delete': 'Confirm Delete',
+        'confirm_delete_mapping': 'Confirm Delete Mapping',
+        'confirm_delete_message': 'Are you sure you want to delete the selected channel?',
+        'select_mapping_to_edit': 'Please select a mapping to edit',
+        'select_mapping_to_delete': 'Please select a mapping to delete',
+        'delete_mapping_confirm': "Delete mapping '{}' → '{}'?",
+        'scan_complete': 'Scan Complete',
+        'append_scan_tooltip': 'Append valid channels to existing list without clearing',
+        'smart_retry_tooltip': 'Smart retry based on failure reasons: only retry timeout and connection failures, not TCP failures or 404 errors. Automatically loops until no new valid channels found',
+        'mapping_tooltip': 'When enabled, scanned channels will auto-match name, logo, group from mapping file',
+        'set_scan_timeout': 'Set scan timeout (seconds)',
+        'set_scan_threads': 'Set number of scan threads',
+        'validate_tooltip': 'Validate channel effectiveness',
+        'no_recent_files': 'No recent files',
+        'select_channel_play': 'Select a channel to play',
+        'open_playlist_success': 'Playlist opened, click a channel to play',
+        'catchup_playing_label': 'Catching up',
+        'unknown_channel': 'Unknown Channel',
+        'unnamed': 'Unnamed',
+        'uncategorized': 'Uncategorized',
+        'all_channels': 'All Channels',
+        'subscription_tab': 'Subscription',
+        'local_tab': 'Local',
+        'media_info_label': 'Media Info',
+        'epg_url_colon': 'EPG URL:',
+        'epg_source_colon': 'EPG Source:',
+        'protocol_type_colon': 'Protocol Type:',
+        'subscription_url_colon': 'Subscription URL:',
+        'subscription_name_colon': 'Subscription Name:',
+        'update_interval_colon': 'Update interval (minutes):',
+        'optional_default_input': 'Optional, use default if empty',
+        'optional_not_used_input': 'Optional, not used if empty',
+        'stop_validate': 'Stop Validate',
+        'show_hidden': 'Show Hidden',
+        'retry_nth': 'Retry #{n}',
+        'generated_channel': 'Generated Channel',
+        'generated_group': 'Generated',
+        'not_tested': 'Not Tested',
+        'now_playing': 'Now Playing',
+        'no_program_desc': 'No program description',
+        'timeshift_failed_back_to_live': 'Timeshift failed, back to live',
+        'waiting_connect': 'Waiting to connect...',
+        'switching_channel': 'Switching channel...',
+        'loading_program_info': 'Loading program info...',
+        'catchup_current_program': 'Catching up current program',
+        'playing_current_channel': 'Playing current channel',
+        'playing_label': 'Playing...',
+        'unknown_program': 'Unknown Program',
+        'new_version_available': 'New Version Available',
+        'new_version_found': 'New version found',
+        'preparing_play': 'Preparing to play...',
+        'no_current_program': 'No current program',
+        'catchup_supported': 'Catchup supported',
+        'catchup_available': 'Catchup',
+        'timeshift_available': 'Timeshift',
+        'timeshift_watching': 'Timeshift watching',
+        'timeshift_label': 'Timeshift',
+        'catchup_label': 'Catchup',
+        'loading_from_cache': 'Loading from cache',
+        'dark_theme': 'Dark Theme',
+        'light_theme': 'Light Theme',
+        'scan': 'Scan',
+        'scan_total': 'Total This Scan',
+        'scan_progress': 'Scan Progress',
+        'scan_completed': 'Scan Completed',
+        'scan_stopped': 'Scan Stopped',
+        'scan_nth': 'Scan #{n}',
+        'validate': 'Validate',
+        'validate_progress': 'Validate Progress',
+        'validate_completed': 'Validate Completed',
+        'validate_stopped': 'Validate Stopped',
+        'validate_nth': 'Validate #{n}',
+        'all_channels_valid': 'All channels are valid',
+        'retry_completed': 'Smart retry completed',
+        'smart_retry': 'Smart Retry',
+        'retry_scan': 'Retry Scan',
+        'mapping_manager': 'Channel Mapping Manager',
+        'mapping_tip_title': 'Channel Name Mapping',
+        'mapping_tip_desc': 'Remote mapping automatically standardizes channel names.\nIf the mapping file is updated, click the button below to refresh.',
+        'refresh_remote_cache': 'Refresh Remote Cache',
+        'refresh_remote_mapping': 'Refresh Remote Mapping',
+        'manual_mapping_section': 'Manual Mapping (Advanced)',
+        'manual_mapping_hint': 'Only needed when remote mapping cannot correctly identify a channel.',
+        'export_user_mappings': 'Export User Mappings',
+        'import_user_mappings': 'Import User Mappings',
+        'close': 'Close',
+        'search_channel_name': 'Search channel name...',
+        'search': 'Search',
+        'search_scope': 'Search Scope',
+        'search_all_fields': 'Search All Fields',
+        'search_standard_name_only': 'Search Standard Name Only',
+        'search_raw_name_only': 'Search Raw Name Only',
+        'search_group_only': 'Search Group Only',
+        'standard_name': 'Standard Name',
+        'raw_name': 'Raw Name',
+        'group': 'Group',
+        'logo_address': 'Logo Address',
+        'add_mapping': 'Add Mapping',
+        'edit_mapping': 'Edit Mapping',
+        'delete_mapping': 'Delete Mapping',
+        'fingerprint_id': 'Fingerprint ID',
+        'mapped_name': 'Mapped Name',
+        'occurrence_count': 'Occurrence Count',
+        'last_seen': 'Last Seen',
+        'clear_fingerprint_data': 'Clear Fingerprint Data',
+        'analyze_unstable_mappings': 'Analyze Unstable Mappings',
+        'suggested_mapping': 'Suggested Mapping',
+        'confidence': 'Confidence',
+        'operation': 'Operation',
+        'refresh_suggestions': 'Refresh Suggestions',
+        'standard_name_placeholder': 'Enter standard channel name',
+        'raw_name_placeholder': 'Enter raw channel name',
+        'group_placeholder': 'Enter group name',
+        'logo_url_placeholder': 'Enter logo URL',
+        'cache_refreshed': 'Remote mapping cache refreshed',
+        'update_available': 'New version available! Click the button above to refresh.',
+        'update_check_failed': 'Update check failed: {}',
+        'mapping_status_ok': 'Up to date | Loaded: {} mappings | Last: {}',
+        'mapping_status_no_cache': 'No cached data yet ({} mappings loaded)',
+        'export_mappings_title': 'Export Mappings',
+        'exported_to': 'Exported to',
+        'import_mappings_title': 'Import Mappings',
+        'import_success': 'Mappings imported successfully',
+        'export_failed': 'Export failed',
+        'import_failed': 'Import failed',
+        'retry_options': 'Scan Retry Options',
+        'enable_retry_scan': 'Enable Retry Scan',
+        'retry_scan_tooltip': 'After the first scan completes, retry scanning failed channels',
+        'dark': 'Dark',
+        'light': 'Light',
+        'dark_blue': 'Dark Blue',
+        'neumorphic_light': 'Neumorphic Light',
+        'github_dark': 'GitHub Dark',
+        'menu_color_mode': 'Color Mode',
+        'menu_visual_style': 'Visual Style',
+        'color_mode_auto': 'Auto',
+        'color_mode_dark': 'Dark',
+        'color_mode_light': 'Light',
+        'visual_style_neumorphic': 'Neumorphic',
+        'visual_style_flat': 'Flat',
+        'visual_style_skeuomorphic': 'Skeuomorphic',
+        'visual_style_frosted': 'Frosted Glass',
+        'visual_style_win11': 'Win11',
+        'visual_style_mac': 'Mac',
+        'visual_style_ios': 'iOS',
+        'menu_hide_floating': 'Hide Floating Panels\tY',
+        'menu_osd_toggle': 'OSD Mask\tTab',
+        'tooltip_stay_on_top': 'Stay on Top',
+        'menu_reload_subscription': 'Reload Subscription',
+        'no_subscription_url': 'No subscription URL configured',
+        'reloading_subscription': 'Reloading subscription...',
+        'reload_subscription_failed': 'Failed to reload subscription'
+    }
+}
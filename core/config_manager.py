@@ -28,10 +28,10 @@ class ConfigManager(Singleton):
         self.config_file = os.path.join(config_dir, config_file)
         self.config = configparser.ConfigParser(interpolation=None)
         self._lock = threading.RLock()
+        # 旧版 JSON 存储，仅用于首次迁移到 user_data.db
         self._resume_file = os.path.join(config_dir, 'resume_positions.json')
-        self._resume_cache: dict | None = None
         self._bookmark_file = os.path.join(config_dir, 'bookmarks.json')
-        self._bookmark_cache: dict | None = None
+        self._user_data = None
         self.load_config()
         self._initialized = True
 
@@ -306,6 +306,27 @@ class ConfigManager(Singleton):
             except Exception as e:
                 logger.debug(f"配置管理-移除选项失败: {section}.{key}: {e}")
 
+    def remove_section(self, section):
+        with self._lock:
+            self.config.remove_section(section)
+
+    def get_user_data_store(self):
+        """收藏/历史/断点/书签所在的 SQLite 存储（首次调用时打开并迁移旧数据）"""
+        with self._lock:
+            if self._user_data is None:
+                from core.user_data_store import (
+                    BOOKMARKS, RESUME_POSITIONS, UserDataStore, migrate_legacy_user_data
+                )
+                store = UserDataStore(os.path.join(self.config_dir, 'user_data.db'))
+                store.set_limit(RESUME_POSITIONS, self._RESUME_MAX_ENTRIES)
+                store.set_limit(BOOKMARKS, self._BOOKMARK_MAX_URLS)
+                try:
+                    migrate_legacy_user_data(store, self, self._resume_file, self._bookmark_file)
+                except Exception as e:
+                    logger.error(f"配置管理-迁移用户数据失败: {e}", exc_info=True)
+                self._user_data = store
+            return self._user_data
+
     def save_ui_settings(self, settings: dict):
         """保存UI相关设置"""
         for key, value in settings.items():
@@ -372,15 +393,54 @@ class ConfigManager(Singleton):
             'validate_timeout': self._parse_int(self.get_value('Validation', 'validate_timeout', '10'), 10)
         }
 
-    def save_scan_engine_settings(self, engine: str):
-        """保存扫描引擎设置，engine: 'mpv' 或 'ffprobe'"""
+    def save_scan_engine_settings(self, engine: str, async_max_inflight: int | None = None):
+        """保存扫描引擎设置，engine: 'mpv'、'ffprobe' 或 'async'（asyncio 高并发）"""
         self.set_value('ScanEngine', 'engine', engine)
+        if async_max_inflight is not None:
+            self.set_value('ScanEngine', 'async_max_inflight', str(async_max_inflight))
         return self.save_config()
 
     def load_scan_engine_settings(self) -> dict:
         """加载扫描引擎设置"""
         return {
-            'engine': self.get_value('ScanEngine', 'engine', 'ffprobe')
+            'engine': self.get_value('ScanEngine', 'engine', 'ffprobe'),
+            'async_max_inflight': max(1, self._parse_int(
+                self.get_value('ScanEngine', 'async_max_inflight', '1000'), 1000
+            )),
+            # 第一阶段预筛选（TCP/HTTP Range/UDP 首包），淘汰死链后才启动 ffprobe/mpv
+            'prefilter': self._parse_bool(self.get_value('ScanEngine', 'prefilter', 'True'), True),
+            # 等待组播首包的时长（秒），0 表示与扫描超时相同
+            'prefilter_udp_dwell': max(0.0, self._parse_float(
+                self.get_value('ScanEngine', 'prefilter_udp_dwell', '0'), 0.0
+            )),
+            # 自适应并发：以界面设置的线程数为起点，按延迟/超时率/CPU 自动增减
+            'adaptive_concurrency': self._parse_bool(
+                self.get_value('ScanEngine', 'adaptive_concurrency', 'True'), True
+            ),
+            # 自适应并发上限，0 表示自动（线程数的 4 倍，最多 64）
+            'max_concurrency': max(0, self._parse_int(
+                self.get_value('ScanEngine', 'max_concurrency', '0'), 0
+            )),
+            # 单个主机同时进行的探测上限，0 表示不限制
+            'per_host_limit': max(0, self._parse_int(
+                self.get_value('ScanEngine', 'per_host_limit', '0'), 0
+            )),
+            # 范围扫描顺序：sequential 顺序 / strided 跨主机跳跃 / random 伪随机
+            'scan_order': (self.get_value('ScanEngine', 'scan_order', 'sequential') or 'sequential').lower(),
+            # 组播与 udpxy 代理使用内置 TS 探测（加入组播组解析 PAT/PMT/PCR/SPS），不启动 ffprobe
+            'native_ts_probe': self._parse_bool(
+                self.get_value('ScanEngine', 'native_ts_probe', 'True'), True
+            ),
+            # 内置 TS 探测在首包到达后继续收集编码/码率/分辨率信息的时长（秒）
+            'ts_probe_dwell': max(0.0, self._parse_float(
+                self.get_value('ScanEngine', 'ts_probe_dwell', '2'), 2.0
+            )),
+            # 多进程扫描：范围扫描在子进程中探测并处理结果，主进程只负责入列表
+            'scan_farm': self._parse_bool(self.get_value('ScanEngine', 'scan_farm', 'False'), False),
+            # 扫描子进程数，0 表示按 CPU 核数
+            'scan_processes': max(0, self._parse_int(
+                self.get_value('ScanEngine', 'scan_processes', '0'), 0
+            ))
         }
 
     def save_server_settings(self, enabled: bool = True, port: int = 8080,
@@ -835,49 +895,11 @@ class ConfigManager(Singleton):
             'index': self._parse_int(self.get_value('Player', 'last_channel_index', '-1'), -1),
         }
 
-    # ---------- 断点续播（JSON 文件存储）----------
+    # ---------- 断点续播（user_data.db）----------
     _RESUME_MAX_ENTRIES = 200  # 最多保存 200 条断点
     _RESUME_MIN_POSITION_SEC = 5.0  # 少于 5 秒不保存
     _RESUME_TOLERANCE_SEC = 3.0  # 距离结尾少于 3 秒视为已播完，删除断点
 
-    def _load_resume_cache(self) -> dict:
-        """懒加载断点缓存"""
-        if self._resume_cache is not None:
-            return self._resume_cache
-        cache = {}
-        try:
-            if os.path.exists(self._resume_file):
-                import json
-                with open(self._resume_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if isinstance(data, dict):
-                        cache = data
-        except Exception as e:
-            logger.debug(f"加载断点缓存失败: {e}")
-        self._resume_cache = cache
-        return cache
-
-    def _save_resume_cache(self):
-        """保存断点缓存到 JSON 文件"""
-        try:
-            import json
-            import tempfile
-            cache = self._resume_cache or {}
-            config_dir = os.path.dirname(self._resume_file)
-            fd, tmp_path = tempfile.mkstemp(dir=config_dir, suffix='.tmp', prefix='resume_')
-            try:
-                with os.fdopen(fd, 'w', encoding='utf-8') as f:
-                    json.dump(cache, f, ensure_ascii=False, indent=2)
-                os.replace(tmp_path, self._resume_file)
-            except Exception:
-                try:
-                    os.remove(tmp_path)
-                except OSError:
-                    pass
-                raise
-        except Exception as e:
-            logger.error(f"保存断点缓存失败: {e}")
-
     def save_resume_position(self, url: str, position: float, duration: float, name: str = ''):
         """保存播放位置
         - position < _RESUME_MIN_POSITION_SEC 时不保存（视为开头）
@@ -885,113 +907,69 @@ class ConfigManager(Singleton):
         """
         if not url or position < self._RESUME_MIN_POSITION_SEC:
             return
-        with self._lock:
-            cache = self._load_resume_cache()
-            # 判断是否已播完
-            if duration and duration > 0 and position + self._RESUME_TOLERANCE_SEC >= duration:
-                if url in cache:
-                    cache.pop(url, None)
-                    self._save_resume_cache()
-                return
-            entry = {
-                'url': url,
-                'position': float(position),
-                'duration': float(duration) if duration else 0.0,
-                'name': name or '',
-                'updated_at': int(time.time()),
-            }
-            cache[url] = entry
-            # 限制最大条数（按 updated_at 升序淘汰最旧的）
-            if len(cache) > self._RESUME_MAX_ENTRIES:
-                sorted_items = sorted(cache.items(), key=lambda kv: kv[1].get('updated_at', 0))
-                while len(cache) > self._RESUME_MAX_ENTRIES:
-                    k, _ = sorted_items.pop(0)
-                    cache.pop(k, None)
-            self._save_resume_cache()
+        from core.user_data_store import RESUME_POSITIONS
+        store = self.get_user_data_store()
+        # 判断是否已播完
+        if duration and duration > 0 and position + self._RESUME_TOLERANCE_SEC >= duration:
+            store.delete(RESUME_POSITIONS, url)
+            return
+        entry = {
+            'url': url,
+            'position': float(position),
+            'duration': float(duration) if duration else 0.0,
+            'name': name or '',
+            'updated_at': int(time.time()),
+        }
+        # 超过 _RESUME_MAX_ENTRIES 时由存储按 updated_at 淘汰最旧的
+        store.put(RESUME_POSITIONS, url, entry, time.time())
 
     def load_resume_position(self, url: str) -> dict | None:
         """加载指定 URL 的播放位置"""
         if not url:
             return None
-        with self._lock:
-            cache = self._load_resume_cache()
-            entry = cache.get(url)
-            if not entry:
-                return None
-            # 复制一份避免外部修改
-            return dict(entry)
+        from core.user_data_store import RESUME_POSITIONS
+        entry = self.get_user_data_store().get(RESUME_POSITIONS, url)
+        return entry if isinstance(entry, dict) else None
 
     def load_all_resume_positions(self) -> list:
         """加载所有断点（按 updated_at 降序）"""
-        with self._lock:
-            cache = self._load_resume_cache()
-            items = [dict(v) for v in cache.values()]
-        items.sort(key=lambda x: x.get('updated_at', 0), reverse=True)
-        return items
+        from core.user_data_store import RESUME_POSITIONS
+        return [entry for _, entry in self.get_user_data_store().items(RESUME_POSITIONS)
+                if isinstance(entry, dict)]
 
     def clear_resume_position(self, url: str):
         """清除指定 URL 的断点"""
         if not url:
             return
-        with self._lock:
-            cache = self._load_resume_cache()
-            if url in cache:
-                cache.pop(url, None)
-                self._save_resume_cache()
+        from core.user_data_store import RESUME_POSITIONS
+        self.get_user_data_store().delete(RESUME_POSITIONS, url)
 
     def clear_all_resume_positions(self):
         """清除所有断点"""
-        with self._lock:
-            self._resume_cache = {}
-            try:
-                if os.path.exists(self._resume_file):
-                    os.remove(self._resume_file)
-            except Exception as e:
-                logger.debug(f"清除断点文件失败: {e}")
+        from core.user_data_store import RESUME_POSITIONS
+        self.get_user_data_store().clear(RESUME_POSITIONS)
 
-    # ---------- 书签管理（JSON 文件存储）----------
+    # ---------- 书签管理（user_data.db）----------
     # 一个 URL 可对应多个书签，每个书签结构：{position, name, created_at}
     _BOOKMARK_MAX_URLS = 500  # 最多保存 500 个 URL 的书签
     _BOOKMARK_MAX_PER_URL = 100  # 每个 URL 最多保存 100 个书签
     _BOOKMARK_MATCH_TOLERANCE = 0.5  # 删除/查询时位置匹配容差（秒）
 
-    def _load_bookmark_cache(self) -> dict:
-        """懒加载书签缓存"""
-        if self._bookmark_cache is not None:
-            return self._bookmark_cache
-        cache = {}
-        try:
-            if os.path.exists(self._bookmark_file):
-                import json
-                with open(self._bookmark_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if isinstance(data, dict):
-                        cache = data
-        except Exception as e:
-            logger.debug(f"加载书签缓存失败: {e}")
-        self._bookmark_cache = cache
-        return cache
-
-    def _save_bookmark_cache(self):
-        """保存书签缓存到 JSON 文件"""
-        try:
-            import json
-            import tempfile
-            cache = self._bookmark_cache or {}
-            config_dir = os.path.dirname(self._bookmark_file)
-            fd, tmp_path = tempfile.mkstemp(dir=config_dir, suffix='.tmp', prefix='bm_')
-            try:
-                with os.fdopen(fd, 'w', encoding='utf-8') as f:
-                    json.dump(cache, f, ensure_ascii=False, indent=2)
-                os.replace(tmp_path, self._bookmark_file)
-            except Exception:
-                try:
-                    os.remove(tmp_path)
-                except OSError:
-                    pass
-                raise
-        except Exception as e:
-            logger.error(f"保存书签缓存失败: {e}")
+    def _load_url_bookmarks(self, url: str) -> list:
+        from core.user_data_store import BOOKMARKS
+        marks = self.get_user_data_store().get(BOOKMARKS, url)
+        if not isinstance(marks, list):
+            return []
+        return [m for m in marks if isinstance(m, dict)]
+
+    def _save_url_bookmarks(self, url: str, marks: list):
+        from core.user_data_store import BOOKMARKS
+        store = self.get_user_data_store()
+        if marks:
+            # URL 数超过 _BOOKMARK_MAX_URLS 时由存储按最新 created_at 淘汰最旧的
+            store.put(BOOKMARKS, url, marks, max(int(m.get('created_at', 0)) for m in marks))
+        else:
+            store.delete(BOOKMARKS, url)
 
     def save_bookmark(self, url: str, position: float, name: str = ''):
         """添加书签
@@ -1001,60 +979,32 @@ class ConfigManager(Singleton):
         if not url or position < 0:
             return
         with self._lock:
-            cache = self._load_bookmark_cache()
-            marks = cache.get(url)
-            if not isinstance(marks, list):
-                marks = []
+            marks = self._load_url_bookmarks(url)
+            entry = {
+                'position': float(position),
+                'name': name or '',
+                'created_at': int(time.time()),
+            }
             # 检查是否已存在相同位置的书签（覆盖 name 和 created_at）
             replaced = False
             for i, m in enumerate(marks):
                 if abs(float(m.get('position', 0)) - position) < self._BOOKMARK_MATCH_TOLERANCE:
-                    marks[i] = {
-                        'position': float(position),
-                        'name': name or '',
-                        'created_at': int(time.time()),
-                    }
+                    marks[i] = entry
                     replaced = True
                     break
             if not replaced:
-                marks.append({
-                    'position': float(position),
-                    'name': name or '',
-                    'created_at': int(time.time()),
-                })
+                marks.append(entry)
             # 限制每个 URL 的书签数量（按 created_at 升序淘汰最旧）
             if len(marks) > self._BOOKMARK_MAX_PER_URL:
                 marks.sort(key=lambda x: x.get('created_at', 0))
                 marks = marks[-self._BOOKMARK_MAX_PER_URL:]
-            cache[url] = marks
-            # 限制 URL 总数（按 created_at 升序淘汰最旧）
-            if len(cache) > self._BOOKMARK_MAX_URLS:
-                # 计算每个 URL 的最新 created_at
-                url_times = []
-                for k, v in cache.items():
-                    if isinstance(v, list) and v:
-                        latest = max(int(m.get('created_at', 0)) for m in v)
-                    else:
-                        latest = 0
-                    url_times.append((k, latest))
-                url_times.sort(key=lambda kv: kv[1])
-                while len(cache) > self._BOOKMARK_MAX_URLS:
-                    k, _ = url_times.pop(0)
-                    cache.pop(k, None)
-            self._bookmark_cache = cache
-            self._save_bookmark_cache()
+            self._save_url_bookmarks(url, marks)
 
     def load_bookmarks(self, url: str) -> list:
         """加载指定 URL 的所有书签（按 position 升序）"""
         if not url:
             return []
-        with self._lock:
-            cache = self._load_bookmark_cache()
-            marks = cache.get(url)
-            if not isinstance(marks, list):
-                return []
-            # 返回副本避免外部修改内部缓存
-            result = [dict(m) for m in marks if isinstance(m, dict)]
+        result = self._load_url_bookmarks(url)
         result.sort(key=lambda x: float(x.get('position', 0)))
         return result
 
@@ -1062,17 +1012,16 @@ class ConfigManager(Singleton):
         """加载所有书签（按 created_at 降序）
         返回 [{url, position, name, created_at}, ...]
         """
-        with self._lock:
-            cache = self._load_bookmark_cache()
-            items = []
-            for url, marks in cache.items():
-                if not isinstance(marks, list):
-                    continue
-                for m in marks:
-                    if isinstance(m, dict):
-                        item = dict(m)
-                        item['url'] = url
-                        items.append(item)
+        from core.user_data_store import BOOKMARKS
+        items = []
+        for url, marks in self.get_user_data_store().items(BOOKMARKS):
+            if not isinstance(marks, list):
+                continue
+            for m in marks:
+                if isinstance(m, dict):
+                    item = dict(m)
+                    item['url'] = url
+                    items.append(item)
         items.sort(key=lambda x: int(x.get('created_at', 0)), reverse=True)
         return items
 
@@ -1081,42 +1030,25 @@ class ConfigManager(Singleton):
         if not url:
             return False
         with self._lock:
-            cache = self._load_bookmark_cache()
-            marks = cache.get(url)
-            if not isinstance(marks, list) or not marks:
-                return False
+            marks = self._load_url_bookmarks(url)
             new_marks = [m for m in marks
                          if abs(float(m.get('position', 0)) - position) >= self._BOOKMARK_MATCH_TOLERANCE]
             if len(new_marks) == len(marks):
                 return False
-            if new_marks:
-                cache[url] = new_marks
-            else:
-                cache.pop(url, None)
-            self._bookmark_cache = cache
-            self._save_bookmark_cache()
+            self._save_url_bookmarks(url, new_marks)
             return True
 
     def clear_bookmarks(self, url: str):
         """清除指定 URL 的所有书签"""
         if not url:
             return
-        with self._lock:
-            cache = self._load_bookmark_cache()
-            if url in cache:
-                cache.pop(url, None)
-                self._bookmark_cache = cache
-                self._save_bookmark_cache()
+        from core.user_data_store import BOOKMARKS
+        self.get_user_data_store().delete(BOOKMARKS, url)
 
     def clear_all_bookmarks(self):
         """清除所有书签"""
-        with self._lock:
-            self._bookmark_cache = {}
-            try:
-                if os.path.exists(self._bookmark_file):
-                    os.remove(self._bookmark_file)
-            except Exception as e:
-                logger.debug(f"清除书签文件失败: {e}")
+        from core.user_data_store import BOOKMARKS
+        self.get_user_data_store().clear(BOOKMARKS)
 
     def save_timeshift_settings(self, settings):
         for key, value in settings.items():
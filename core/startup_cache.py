@@ -0,0 +1,72 @@
+"""
+启动缓存：把启动时要用到的大块静态数据编译为 marshal 文件
+
+内置翻译表等数据定义在数千行的 Python 字面量里，导入时逐条执行构建代码；
+marshal 反序列化同样的数据只需约 1ms。缓存以「版本号 + 源文件修改时间/大小」
+为校验戳，不匹配（升级、开发中修改了源文件）时调用 build() 重新生成并写回。
+"""
+
+import marshal
+import os
+import sys
+from typing import Any, Callable
+
+from core.log_manager import global_logger as logger
+from utils.platform_utils import get_android_data_dir
+
+_android_data = get_android_data_dir()
+if _android_data:
+    CACHE_DIR = os.path.join(_android_data, 'cache', 'startup')
+elif getattr(sys, 'frozen', False):
+    CACHE_DIR = os.path.join(os.path.dirname(sys.executable), 'cache', 'startup')
+else:
+    CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cache', 'startup')
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def source_stamp(relative_path: str, *extra: str) -> str:
+    """缓存校验戳：版本号 + 源文件修改时间与大小（打包后源文件不存在，只用版本号）"""
+    from core.version import CURRENT_VERSION
+    parts = [CURRENT_VERSION, *extra]
+    try:
+        st = os.stat(os.path.join(_PROJECT_ROOT, relative_path))
+        parts += [str(st.st_mtime_ns), str(st.st_size)]
+    except OSError:
+        pass
+    return ':'.join(parts)
+
+
+def load_compiled(name: str, stamp: str, build: Callable[[], Any]) -> Any:
+    """读取名为 name 的编译缓存，校验戳不符或读取失败时 build() 重新生成
+
+    Args:
+        name: 缓存名，对应 CACHE_DIR 下的 <name>.bin
+        stamp: 校验戳
+        build: 生成数据的函数，返回值必须可被 marshal 序列化（dict/list/str/数字等）
+    """
+    path = os.path.join(CACHE_DIR, f'{name}.bin')
+    try:
+        with open(path, 'rb') as f:
+            cached_stamp, data = marshal.load(f)
+        if cached_stamp == stamp:
+            return data
+    except FileNotFoundError:
+        pass
+    except (OSError, EOFError, ValueError, TypeError) as e:
+        logger.debug(f"读取启动缓存 {name} 失败: {e}")
+
+    data = build()
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            marshal.dump((stamp, data), f)
+        os.replace(tmp_path, path)
+    except (OSError, ValueError) as e:
+        logger.debug(f"写入启动缓存 {name} 失败: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    return data
@@ -6,6 +6,28 @@ from .config_manager import ConfigManager
 from utils.singleton import Singleton
 
 
+# EPG 流式下载/解压的读缓冲大小
+_EPG_STREAM_BUFFER_SIZE = 64 * 1024
+
+# 同时下载的EPG源数量上限
+_EPG_MAX_PARALLEL = 4
+
+# 不支持条件请求的源：内容先落地计算哈希，超过该大小转存到临时文件
+_EPG_SPOOL_MAX_MEMORY = 16 * 1024 * 1024
+
+_EPG_CACHE_FILE = 'epg_cache.bin'
+_EPG_SOURCE_CACHE_DIR = 'epg_sources'
+_EPG_VALIDATORS_FILE = 'epg_validators.json'
+_LEGACY_EPG_CACHE_FILE = 'epg_cache.json'
+
+
+def _count_programs(data) -> int:
+    program_count = getattr(data, 'program_count', None)
+    if program_count is not None:
+        return program_count()
+    return sum(len(progs) for progs in data.values())
+
+
 class SubscriptionManager(Singleton):
 
     def __init__(self):
@@ -15,6 +37,9 @@ class SubscriptionManager(Singleton):
         self._config = ConfigManager()
         self._epg_data = {}
         self._epg_channel_names = {}
+        self._epg_index = None
+        self._epg_store = None
+        self._epg_validators = None
         self._last_epg_update = None
         self._epg_lock = threading.RLock()
         self._update_callbacks = []
@@ -158,7 +183,7 @@ class SubscriptionManager(Singleton):
         """
         if not self._epg_data:
             return 0
-        return sum(len(progs) for progs in self._epg_data.values())
+        return _count_programs(self._epg_data)
 
     def has_epg_data(self) -> bool:
         """是否有EPG数据
@@ -235,7 +260,8 @@ class SubscriptionManager(Singleton):
     def load_all_epg_data(self, status_callback=None) -> bool:
         """加载所有EPG源的数据，多源依次替补
 
-        同一个频道只使用第一个有该频道数据的EPG源，不合并多个源的数据。
+        各源并行下载解析；同一个频道只使用配置顺序中第一个有该频道数据的EPG源，
+        不合并多个源的数据。
         """
         sources = self.get_epg_sources()
         
@@ -245,48 +271,133 @@ class SubscriptionManager(Singleton):
                 status_callback("没有配置任何EPG源")
             return False
         
-        merged_data = {}
         total_sources = len(sources)
+        results = [None] * total_sources
 
-        for i, source in enumerate(sources):
-            if status_callback:
-                status_callback(f"正在加载EPG源 {i+1}/{total_sources}: {source.get('name', '')}")
+        def _fetch(source):
+            channel_names = {}
+            data, unchanged = self._fetch_epg_source(source['url'], channel_names)
+            return data, channel_names, unchanged
 
+        if status_callback:
+            status_callback(f"正在并行加载 {total_sources} 个EPG源")
+
+        # 并行下载解析；合并仍按配置顺序进行，保证"先配置的源优先"与完成顺序无关
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        with ThreadPoolExecutor(max_workers=max(1, min(total_sources, _EPG_MAX_PARALLEL)),
+                                thread_name_prefix="epg-loader") as pool:
+            futures = {pool.submit(_fetch, source): i for i, source in enumerate(sources)}
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    logger.error(f"加载EPG源异常: {sources[i].get('name', '')} - {str(e)}")
+                if status_callback:
+                    status_callback(f"已加载EPG源 {done}/{total_sources}: {sources[i].get('name', '')}")
+
+        if self._epg_data and all(result and result[2] for result in results):
+            # 所有源均返回 304 或内容未变：沿用内存中的数据，只刷新缓存时间
+            for i in range(total_sources):
+                self.update_epg_source_last_update(i, datetime.now().isoformat())
+            with self._epg_lock:
+                self._last_epg_update = datetime.now()
             try:
-                data = self._load_single_epg(source['url'])
+                os.utime(self._epg_cache_file())
+            except OSError:
+                pass
+            logger.info(f"EPG源均未变化，跳过合并: 共 {total_sources} 个源")
+            if status_callback:
+                status_callback("EPG数据未变化")
+            return True
 
+        # 合并只按频道ID进行：各频道取配置顺序中第一个有该频道的源，节目记录在写入
+        # 合并缓存时才从各源的缓存中复制，不解码为节目字典
+        parts = []
+        adopted = set()
+        try:
+            for i, source in enumerate(sources):
+                data, channel_names, _ = results[i] or ({}, {}, False)
                 if data:
-                    new_channels = 0
-                    for channel_id, programs in data.items():
-                        if channel_id not in merged_data:
-                            merged_data[channel_id] = programs
-                            new_channels += 1
+                    channel_ids = [channel_id for channel_id in data if channel_id not in adopted]
+                    adopted.update(channel_ids)
+                    parts.append((data, channel_ids))
+                    with self._epg_lock:
+                        self._epg_channel_names.update(channel_names)
 
-                    logger.info(f"成功加载EPG源: {source.get('name', '')}, 包含 {len(data)} 个频道, 新增 {new_channels} 个频道")
+                    logger.info(f"成功加载EPG源: {source.get('name', '')}, 包含 {len(data)} 个频道, 新增 {len(channel_ids)} 个频道")
                     self.update_epg_source_last_update(i, datetime.now().isoformat())
                 else:
                     logger.warning(f"EPG源加载失败或无数据: {source.get('name', '')}")
+                results[i] = None
 
-            except Exception as e:
-                logger.error(f"加载EPG源异常: {source.get('name', '')} - {str(e)}")
-        
-        with self._epg_lock:
-            self._epg_data = merged_data
-            self._last_epg_update = datetime.now()
+            self._install_merged_epg(parts)
+        finally:
+            self._close_epg_sources(parts)
+        self._get_epg_index()
         
-        total_channels = len(merged_data)
-        total_programs = sum(len(progs) for progs in merged_data.values())
+        total_channels = len(adopted)
+        total_programs = self.get_epg_program_count()
         
         logger.info(f"EPG数据加载完成: 共 {total_sources} 个源, {total_channels} 个频道, {total_programs} 个节目")
         
         if status_callback:
             status_callback(f"EPG数据加载完成: {total_channels} 个频道, {total_programs} 个节目")
         
-        self._save_epg_cache(merged_data)
         self._notify_update_callbacks()
         
-        return len(merged_data) > 0
+        return total_channels > 0
     
+    def _install_merged_epg(self, parts: list):
+        """把各来源中被采用的频道写入合并缓存，并切换为映射该文件的 EpgStore
+
+        Args:
+            parts: [(来源数据, [频道ID, ...]), ...]，来源为 dict 或各源缓存的 EpgStore
+
+        写入失败时退回为内存中的合并字典，数据仍然可用。
+        """
+        from services.epg_store import EpgStore, write_epg_store
+
+        cache_file = self._epg_cache_file()
+        try:
+            with self._epg_lock:
+                channel_names = dict(self._epg_channel_names)
+            write_epg_store(cache_file, parts, channel_names, release=self._release_mapped_epg)
+            data = EpgStore(cache_file)
+            logger.info(f"EPG数据已保存到缓存: {cache_file}")
+        except Exception as e:
+            logger.error(f"保存EPG缓存失败: {e}")
+            data = {channel_id: source[channel_id] for source, channel_ids in parts for channel_id in channel_ids}
+        else:
+            self._remove_legacy_epg_cache()
+        with self._epg_lock:
+            if isinstance(data, EpgStore):
+                self._epg_store = data
+            self._epg_data = data
+            self._epg_index = None
+            self._last_epg_update = datetime.now()
+
+    def _merge_epg_source(self, data) -> int:
+        """把一个源中尚不存在的频道补充进当前EPG数据并重写合并缓存，返回新增频道数"""
+        with self._epg_lock:
+            current = self._epg_data
+            new_ids = [channel_id for channel_id in data if channel_id not in current]
+            if not new_ids:
+                self._last_epg_update = datetime.now()
+                return 0
+        try:
+            self._install_merged_epg([(current, list(current)), (data, new_ids)])
+        finally:
+            self._close_epg_sources([(data, new_ids)])
+        return len(new_ids)
+
+    def _close_epg_sources(self, parts: list):
+        """关闭合并完成后不再需要的单源缓存映射"""
+        from services.epg_store import EpgStore
+        for source, _ in parts:
+            if isinstance(source, EpgStore) and source is not self._epg_data:
+                source.close()
+
     def reload_single_epg_source(self, index: int, status_callback=None) -> bool:
         """增量重载单个EPG源，依次替补
 
@@ -317,17 +428,11 @@ class SubscriptionManager(Singleton):
                     status_callback(f"EPG源加载失败: {source.get('name', '')}")
                 return False
             
-            with self._epg_lock:
-                new_channels = 0
-                for channel_id, programs in data.items():
-                    if channel_id not in self._epg_data:
-                        self._epg_data[channel_id] = programs
-                        new_channels += 1
-                
-                self._last_epg_update = datetime.now()
+            new_channels = self._merge_epg_source(data)
+            self._get_epg_index()
             
             total_channels = len(self._epg_data)
-            total_programs = sum(len(progs) for progs in self._epg_data.values())
+            total_programs = _count_programs(self._epg_data)
             
             logger.info(f"EPG源增量更新成功: {source.get('name', '')}, 包含 {len(data)} 个频道, 新增 {new_channels} 个频道, 合计 {total_channels} 个频道, {total_programs} 个节目")
             self.update_epg_source_last_update(index, datetime.now().isoformat())
@@ -335,7 +440,6 @@ class SubscriptionManager(Singleton):
             if status_callback:
                 status_callback(f"EPG源更新完成: {total_channels} 个频道, {total_programs} 个节目")
             
-            self._save_epg_cache(self._epg_data)
             self._notify_update_callbacks()
             
             return True
@@ -369,23 +473,15 @@ class SubscriptionManager(Singleton):
             data = self._load_single_epg(epg_url)
 
             if data:
-                with self._epg_lock:
-                    new_channels = 0
-                    for channel_id, programs in data.items():
-                        if channel_id not in self._epg_data:
-                            self._epg_data[channel_id] = programs
-                            new_channels += 1
-                    self._last_epg_update = datetime.now()
-
                 total_channels = len(data)
-                total_programs = sum(len(progs) for progs in data.values())
+                total_programs = _count_programs(data)
+                new_channels = self._merge_epg_source(data)
 
                 logger.info(f"EPG补充源加载成功: {total_channels} 个频道, {total_programs} 个节目, 新增 {new_channels} 个频道")
 
                 if status_callback:
                     status_callback(f"EPG数据加载成功: {total_channels} 个频道")
 
-                self._save_epg_cache(self._epg_data)
                 if new_channels > 0:
                     self._notify_update_callbacks()
 
@@ -402,69 +498,250 @@ class SubscriptionManager(Singleton):
                 status_callback(f"加载失败: {e}")
             return False
     
-    def _load_single_epg(self, epg_url: str) -> dict:
+    def _load_single_epg(self, epg_url: str, channel_names: dict | None = None) -> dict:
         """加载单个EPG源的数据
 
         Args:
             epg_url: EPG源URL
+            channel_names: 频道显示名写入的字典，默认直接写入 self._epg_channel_names
 
         Returns:
             EPG数据字典
         """
+        return self._fetch_epg_source(epg_url, channel_names)[0]
+
+    def _fetch_epg_source(self, epg_url: str, channel_names: dict | None = None,
+                          conditional: bool = True) -> tuple:
+        """条件请求方式加载单个EPG源
+
+        有该源的本地缓存时携带 If-None-Match / If-Modified-Since；服务器返回 304，
+        或（不支持校验头时）下载内容的哈希与上次一致，则跳过解析，直接使用该源的
+        二进制缓存。返回 304 但本地缓存不可用时，关闭该响应后不带校验头重试一次。
+
+        Args:
+            conditional: False 时不发送校验头、不比对哈希（304 后的重试）
+
+        Returns:
+            (EPG数据字典, 内容是否未变化)
+        """
         if not epg_url:
-            return {}
+            return {}, False
         
+        import contextlib
         import requests
+        from services.conditional_fetch import HashingReader
+        from services.epg_store import EpgStore, EpgStoreWriter
+
+        if channel_names is None:
+            channel_names = self._epg_channel_names
+        validators = self._get_epg_validators()
+        have_cache = conditional and os.path.exists(self._epg_source_cache_file(epg_url))
 
         try:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
                 'Accept': '*/*'
             }
+            request_headers = dict(headers)
+            if have_cache:
+                request_headers.update(validators.request_headers(epg_url))
             
             logger.info(f"正在下载EPG数据: {epg_url}")
-            response = requests.get(epg_url, timeout=30, headers=headers, allow_redirects=True)
-            response.raise_for_status()
-            
-            content = response.content
-
-            # requests 在 Content-Encoding: gzip 时已自动解压，
-            # 仅对 URL 以 .gz 结尾且内容仍带有 gzip 魔术字节的情况手动解压
-            content_encoding = response.headers.get('Content-Encoding', '')
-            url_is_gz = epg_url.lower().endswith('.gz')
-            already_decompressed = 'gzip' in content_encoding.lower()
-            if url_is_gz and not already_decompressed and len(content) >= 2 and content[0] == 0x1f and content[1] == 0x8b:
-                import gzip
-                from io import BytesIO
-                with gzip.GzipFile(fileobj=BytesIO(content)) as f:
-                    content = f.read()
-            
-            try:
-                epg_content = content.decode('utf-8')
-            except UnicodeDecodeError:
+            source_names = {}
+            stale_304 = False
+            with requests.get(epg_url, timeout=30, headers=request_headers,
+                              allow_redirects=True, stream=True) as response:
+                if response.status_code == 304:
+                    cached = self._load_epg_source_cache(epg_url, channel_names)
+                    if cached is not None:
+                        logger.info(f"EPG源未变化(304)，跳过解析: {epg_url}")
+                        return cached, True
+                    stale_304 = True
+                else:
+                    response.raise_for_status()
+
+                    raw = HashingReader(self._response_raw(response))
+                    old_hash = validators.get_hash(epg_url) if have_cache else None
+                    with contextlib.ExitStack() as cleanup:
+                        if old_hash and not (response.headers.get('ETag') or response.headers.get('Last-Modified')):
+                            # 服务器不支持条件请求：先落地并计算哈希，内容未变则跳过解析
+                            import shutil
+                            import tempfile
+                            source = cleanup.enter_context(
+                                tempfile.SpooledTemporaryFile(max_size=_EPG_SPOOL_MAX_MEMORY))
+                            shutil.copyfileobj(raw, source, _EPG_STREAM_BUFFER_SIZE)
+                            if raw.hexdigest() == old_hash:
+                                cached = self._load_epg_source_cache(epg_url, channel_names)
+                                if cached is not None:
+                                    logger.info(f"EPG源内容未变化，跳过解析: {epg_url}")
+                                    return cached, True
+                            source.seek(0)
+                        else:
+                            source = raw
+                        # XMLTV 节目边解析边写入该源的缓存文件
+                        writer = EpgStoreWriter(self._epg_source_cache_file(epg_url))
+                        cleanup.callback(writer.close)
+                        result = self._parse_epg_stream(self._open_epg_stream(source), source_names, writer)
+                    if result is not None and source is raw:
+                        raw.drain()
+                    response_headers = response.headers
+
+            if stale_304:
+                # 本地缓存已丢失或损坏：先关闭该响应，再不带校验头重试一次
+                validators.forget(epg_url)
+                if not conditional:
+                    logger.error(f"EPG源未带校验头仍返回304: {epg_url}")
+                    return {}, False
+                return self._fetch_epg_source(epg_url, channel_names, conditional=False)
+
+            if result is None:
+                # 流式解析在产出任何数据前就失败（多为 expat 不支持的 GBK 等编码），
+                # 回退为整体下载后解码
+                logger.info(f"EPG流式解析失败，改为整体下载解析: {epg_url}")
+                return self._load_single_epg_buffered(epg_url, headers, channel_names), False
+
+            channel_names.update(source_names)
+            if isinstance(result, EpgStore):
+                # 缓存已在解析时写好，只需记录校验信息
                 try:
-                    epg_content = content.decode('gbk')
-                except UnicodeDecodeError:
-                    logger.error("无法解码EPG文件内容")
-                    return {}
-            
-            if not epg_content.strip():
-                return {}
-            
-            return self._parse_epg_content(epg_content)
+                    validators.update(epg_url, response_headers, raw.hexdigest())
+                except Exception as e:
+                    logger.debug(f"保存EPG源校验信息失败: {epg_url} - {e}")
+            else:
+                self._remember_epg_source(epg_url, response_headers, raw.hexdigest(), result, source_names)
+            return result, False
         
         except requests.exceptions.RequestException as e:
             logger.error(f"EPG数据下载失败: {e}")
-            return {}
+            return {}, False
         except Exception as e:
             logger.error(f"加载EPG数据失败: {e}")
+            return {}, False
+
+    def _get_epg_validators(self):
+        if self._epg_validators is None:
+            from services.conditional_fetch import SourceValidators
+            self._epg_validators = SourceValidators(
+                os.path.join(self._get_cache_dir(), _EPG_VALIDATORS_FILE)
+            )
+        return self._epg_validators
+
+    def _epg_source_cache_file(self, epg_url: str) -> str:
+        import hashlib
+        cache_dir = os.path.join(self._get_cache_dir(), _EPG_SOURCE_CACHE_DIR)
+        os.makedirs(cache_dir, exist_ok=True)
+        return os.path.join(cache_dir, hashlib.sha1(epg_url.encode('utf-8')).hexdigest() + '.bin')
+
+    def _load_epg_source_cache(self, epg_url: str, channel_names: dict):
+        """打开单个EPG源的二进制缓存；不存在或损坏时返回 None"""
+        from services.epg_store import EpgStore
+        try:
+            store = EpgStore(self._epg_source_cache_file(epg_url))
+        except Exception as e:
+            logger.debug(f"EPG源缓存不可用: {epg_url} - {e}")
+            return None
+        channel_names.update(store.channel_names())
+        return store
+
+    def _remember_epg_source(self, epg_url: str, response_headers, sha256: str,
+                             data: dict, source_names: dict):
+        """保存单个EPG源的解析结果与校验信息，供下次条件请求使用"""
+        if not data:
+            return
+        from services.epg_store import write_epg_store
+        try:
+            write_epg_store(self._epg_source_cache_file(epg_url), data, source_names)
+            self._get_epg_validators().update(epg_url, response_headers, sha256)
+        except Exception as e:
+            logger.debug(f"保存EPG源缓存失败: {epg_url} - {e}")
+
+    def _response_raw(self, response):
+        """取出 HTTP 响应的原始流，Content-Encoding: gzip 由 urllib3 边下载边解压"""
+        raw = response.raw
+        raw.decode_content = True
+        # 读到末尾时不要自动关闭，否则外层缓冲读取会抛出 "read of closed file"
+        raw.auto_close = False
+        return raw
+
+    def _open_epg_stream(self, raw):
+        """把原始字节流包装为带缓冲的流；内容本身是 gzip（如 .xml.gz 文件）时再套一层 GzipFile"""
+        import gzip
+        import io
+        stream = io.BufferedReader(raw, buffer_size=_EPG_STREAM_BUFFER_SIZE)
+        if stream.peek(2)[:2] == b'\x1f\x8b':
+            stream = io.BufferedReader(gzip.GzipFile(fileobj=stream), buffer_size=_EPG_STREAM_BUFFER_SIZE)
+        return stream
+
+    def _parse_epg_stream(self, stream, channel_names: dict, writer):
+        """从字节流解析EPG（JSON 或 XMLTV）
+
+        Args:
+            stream: 字节流
+            channel_names: 频道显示名写入的字典
+            writer: XMLTV 节目写入的 EpgStoreWriter（JSON 不使用）
+
+        Returns:
+            JSON 为解析后的字典，XMLTV 为映射该源缓存的 EpgStore；
+            流式解析无法进行时返回 None
+        """
+        head = stream.peek(64).lstrip(b'\xef\xbb\xbf \t\r\n')[:1]
+        if not head:
             return {}
+        if head in (b'{', b'['):
+            import json
+            try:
+                return json.loads(stream.read())
+            except ValueError:
+                return None
+        return self._parse_xml_epg_stream(stream, channel_names, writer)
+
+    def _load_single_epg_buffered(self, epg_url: str, headers: dict, channel_names: dict) -> dict:
+        """整体下载并解码后解析（兼容 GBK 等编码）"""
+        import requests
+
+        from services.conditional_fetch import content_hash
+
+        response = requests.get(epg_url, timeout=30, headers=headers, allow_redirects=True)
+        response.raise_for_status()
+        
+        content = response.content
+        sha256 = content_hash(content)
+
+        # requests 在 Content-Encoding: gzip 时已自动解压，
+        # 仅对 URL 以 .gz 结尾且内容仍带有 gzip 魔术字节的情况手动解压
+        content_encoding = response.headers.get('Content-Encoding', '')
+        url_is_gz = epg_url.lower().endswith('.gz')
+        already_decompressed = 'gzip' in content_encoding.lower()
+        if url_is_gz and not already_decompressed and len(content) >= 2 and content[0] == 0x1f and content[1] == 0x8b:
+            import gzip
+            from io import BytesIO
+            with gzip.GzipFile(fileobj=BytesIO(content)) as f:
+                content = f.read()
+        
+        try:
+            epg_content = content.decode('utf-8')
+        except UnicodeDecodeError:
+            try:
+                epg_content = content.decode('gbk')
+            except UnicodeDecodeError:
+                logger.error("无法解码EPG文件内容")
+                return {}
+        
+        if not epg_content.strip():
+            return {}
+        
+        source_names = {}
+        result = self._parse_epg_content(epg_content, source_names)
+        channel_names.update(source_names)
+        self._remember_epg_source(epg_url, response.headers, sha256, result, source_names)
+        return result
     
-    def _parse_epg_content(self, content: str) -> dict:
+    def _parse_epg_content(self, content: str, channel_names: dict | None = None) -> dict:
         """解析EPG内容
 
         Args:
             content: EPG内容字符串
+            channel_names: 频道显示名写入的字典，默认 self._epg_channel_names
 
         Returns:
             解析后的EPG数据字典
@@ -475,7 +752,7 @@ class SubscriptionManager(Singleton):
         except json.JSONDecodeError:
             pass
         
-        return self._parse_xml_epg(content)
+        return self._parse_xml_epg(content, channel_names)
 
 
     def _parse_xmltv_time(self, time_str):
@@ -499,7 +776,70 @@ class SubscriptionManager(Singleton):
             dt = dt_utc + local_offset
         return dt
 
-    def _parse_xml_epg(self, content: str) -> dict:
+    def _add_xmltv_channel(self, channel, result: dict, channel_names: dict):
+        channel_id = channel.get('id')
+        channel_name = None
+        for display_name in channel.findall('display-name'):
+            if display_name.text:
+                channel_name = display_name.text
+                break
+        if channel_id and channel_name:
+            result.setdefault(channel_id, [])
+            channel_names[channel_id] = channel_name
+
+    def _add_xmltv_programme(self, programme, result: dict):
+        parsed = self._parse_xmltv_programme(programme)
+        if parsed is not None:
+            channel_id, entry = parsed
+            if channel_id not in result:
+                result[channel_id] = []
+            result[channel_id].append(entry)
+
+    def _parse_xmltv_programme(self, programme):
+        """<programme> 元素 → (频道ID, 节目字典)；缺少频道/开始时间/标题时返回 None"""
+        channel_id = programme.get('channel')
+        start = programme.get('start')
+        end = programme.get('stop') or programme.get('end')
+        title = None
+        desc = None
+        
+        for title_elem in programme.findall('title'):
+            if title_elem.text:
+                title = title_elem.text
+                break
+        
+        for desc_elem in programme.findall('desc'):
+            if desc_elem.text:
+                desc = desc_elem.text
+                break
+        
+        if channel_id and start and title:
+            try:
+                try:
+                    start_time = self._parse_xmltv_time(start)
+                except ValueError:
+                    now = datetime.now()
+                    start_time = now.replace(minute=(now.minute // 30) * 30, second=0, microsecond=0)
+
+                if end:
+                    try:
+                        end_time = self._parse_xmltv_time(end)
+                    except ValueError:
+                        end_time = start_time + timedelta(minutes=30)
+                else:
+                    end_time = start_time + timedelta(minutes=30)
+                
+                return channel_id, {
+                    'title': title,
+                    'desc': desc or '',
+                    'start': start_time.isoformat(),
+                    'end': end_time.isoformat()
+                }
+            except Exception as e:
+                logger.debug(f"解析节目时间失败: {e}")
+        return None
+
+    def _parse_xml_epg(self, content: str, channel_names: dict | None = None) -> dict:
         """解析XML格式的EPG数据
 
         Args:
@@ -508,81 +848,94 @@ class SubscriptionManager(Singleton):
         Returns:
             解析后的EPG数据字典
         """
+        if channel_names is None:
+            channel_names = self._epg_channel_names
         result = {}
         try:
             import xml.etree.ElementTree as ET
             root = ET.fromstring(content)
             
-            channels = root.findall('.//channel')
-            if channels:
-                for channel in channels:
-                    channel_id = channel.get('id')
-                    channel_name = None
-                    for display_name in channel.findall('display-name'):
-                        if display_name.text:
-                            channel_name = display_name.text
-                            break
-                    if channel_id and channel_name:
-                        result[channel_id] = []
-                        self._epg_channel_names[channel_id] = channel_name
+            for channel in root.iter('channel'):
+                self._add_xmltv_channel(channel, result, channel_names)
             
-            programmes = list(root.iter('programme'))
-            
-            for programme in programmes:
-                channel_id = programme.get('channel')
-                start = programme.get('start')
-                end = programme.get('stop') or programme.get('end')
-                title = None
-                desc = None
-                
-                for title_elem in programme.findall('title'):
-                    if title_elem.text:
-                        title = title_elem.text
-                        break
-                
-                for desc_elem in programme.findall('desc'):
-                    if desc_elem.text:
-                        desc = desc_elem.text
-                        break
-                
-                if channel_id and start and title:
-                    try:
-                        try:
-                            start_time = self._parse_xmltv_time(start)
-                        except ValueError:
-                            now = datetime.now()
-                            start_time = now.replace(minute=(now.minute // 30) * 30, second=0, microsecond=0)
-
-                        if end:
-                            try:
-                                end_time = self._parse_xmltv_time(end)
-                            except ValueError:
-                                end_time = start_time + timedelta(minutes=30)
-                        else:
-                            end_time = start_time + timedelta(minutes=30)
-                        
-                        if channel_id not in result:
-                            result[channel_id] = []
-                        
-                        result[channel_id].append({
-                            'title': title,
-                            'desc': desc or '',
-                            'start': start_time.isoformat(),
-                            'end': end_time.isoformat()
-                        })
-                    except Exception as e:
-                        logger.debug(f"解析节目时间失败: {e}")
-                        pass
+            for programme in root.iter('programme'):
+                self._add_xmltv_programme(programme, result)
             
             return result
         except Exception as e:
             logger.error(f"XML格式EPG解析失败: {e}")
             return {}
+
+    def _parse_xml_epg_stream(self, stream, channel_names: dict, writer):
+        """流式解析XMLTV，节目边解析边写入该源的二进制缓存
+
+        iterparse 边读边解析，每个 <channel>/<programme> 处理完立即清除并交给
+        EpgStoreWriter 编码落盘，不在内存中累积节目字典；常驻的只有字符串表与
+        每个节目 4 字节的记录序号。
+
+        Args:
+            stream: XMLTV 字节流
+            channel_names: 频道显示名写入的字典
+            writer: 该源缓存文件的 EpgStoreWriter
+
+        Returns:
+            映射缓存文件的 EpgStore；没有任何频道时返回 {}；
+            尚未解析出任何元素就失败时返回 None
+        """
+        import xml.etree.ElementTree as ET
+        root = None
+        handled = 0
+        try:
+            for event, elem in ET.iterparse(stream, events=('start', 'end')):
+                if root is None:
+                    root = elem
+                    continue
+                if event != 'end':
+                    continue
+                if elem.tag == 'programme':
+                    parsed = self._parse_xmltv_programme(elem)
+                    if parsed is not None:
+                        writer.add(*parsed)
+                elif elem.tag == 'channel':
+                    channel = {}
+                    self._add_xmltv_channel(elem, channel, channel_names)
+                    for channel_id in channel:
+                        writer.add_channel(channel_id)
+                else:
+                    continue
+                handled += 1
+                elem.clear()
+                root.clear()
+        except (ET.ParseError, ValueError) as e:
+            # expat 不支持 GBK 等多字节编码时抛出 ValueError
+            if not handled:
+                logger.debug(f"XMLTV流式解析失败: {e}")
+                return None
+            logger.error(f"XML格式EPG解析失败: {e}")
+            return {}
+        if not len(writer):
+            return {}
+        return writer.finish(channel_names)
     
     def get_epg_data_copy(self) -> dict:
         """线程安全地获取EPG数据的浅拷贝"""
         with self._epg_lock:
-            return dict(self._epg_data)
+            return self._epg_data.copy()
+
+    def _get_epg_index(self):
+        """获取 EPG 匹配索引
+
+        索引仅在 EPG 数据被替换/合并后（_epg_index 置 None）重建一次，
+        之后的查询直接复用，不再每次按频道重新构建映射。
+        """
+        with self._epg_lock:
+            if self._epg_index is None:
+                from services.epg_matcher import EpgIndex
+                self._epg_index = EpgIndex({
+                    epg_id: self._epg_channel_names.get(epg_id, epg_id)
+                    for epg_id in self._epg_data.keys()
+                })
+            return self._epg_index
 
     def get_channel_epg(self, channel_name: str, tvg_id: str | None = None,
                         tvg_name: str | None = None, comma_name: str | None = None) -> list:
@@ -621,11 +974,8 @@ class SubscriptionManager(Singleton):
                     return list(self._epg_data[channel_name])
 
             try:
-                from services.epg_matcher import EpgMatcher
-                epg_channels = {epg_id: self._epg_channel_names.get(epg_id, epg_id) for epg_id in self._epg_data.keys()}
-                matched_id = EpgMatcher.match(
-                    channel_name, epg_channels,
-                    tvg_id=tvg_id, tvg_name=tvg_name, comma_name=comma_name
+                matched_id = self._get_epg_index().match(
+                    channel_name, tvg_id=tvg_id, tvg_name=tvg_name, comma_name=comma_name
                 )
                 if matched_id and matched_id in self._epg_data:
                     return list(self._epg_data[matched_id])
@@ -698,38 +1048,85 @@ class SubscriptionManager(Singleton):
             except Exception as e:
                 logger.error(f"执行EPG更新回调失败: {e}")
     
+    def _epg_cache_file(self) -> str:
+        return os.path.join(self._get_cache_dir(), _EPG_CACHE_FILE)
+
+    def _release_mapped_epg(self):
+        """关闭当前映射的二进制缓存，以便替换缓存文件"""
+        with self._epg_lock:
+            if self._epg_store is not None:
+                self._epg_store.close()
+                self._epg_store = None
+
     def _save_epg_cache(self, data: dict):
-        """保存EPG数据到缓存文件
+        """保存EPG数据到二进制缓存文件
+
+        保存后把内存中的EPG数据切换为映射该文件的 EpgStore，
+        释放解析时产生的大量节目字典。
 
         Args:
             data: EPG数据字典
         """
-        import json
-        
-        cache_dir = self._get_cache_dir()
+        from services.epg_store import EpgStore, write_epg_store
         
-        cache_file = os.path.join(cache_dir, 'epg_cache.json')
+        cache_file = self._epg_cache_file()
         try:
-            cache_payload = {
-                'epg_data': data,
-                'channel_names': self._epg_channel_names,
-            }
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_payload, f, ensure_ascii=False, separators=(',', ':'))
+            with self._epg_lock:
+                snapshot = data.copy()
+                channel_names = dict(self._epg_channel_names)
+            write_epg_store(cache_file, snapshot, channel_names, release=self._release_mapped_epg)
             logger.info(f"EPG数据已保存到缓存: {cache_file}")
+
+            store = EpgStore(cache_file)
+            with self._epg_lock:
+                self._epg_store = store
+                if self._epg_data is data and len(data) == len(snapshot):
+                    self._epg_data = store
+            self._remove_legacy_epg_cache()
         except Exception as e:
             logger.error(f"保存EPG缓存失败: {e}")
+
+    def _remove_legacy_epg_cache(self):
+        legacy_file = os.path.join(self._get_cache_dir(), _LEGACY_EPG_CACHE_FILE)
+        if os.path.exists(legacy_file):
+            try:
+                os.remove(legacy_file)
+            except OSError as e:
+                logger.debug(f"删除旧版EPG缓存失败: {e}")
     
     def load_cached_epg_data(self) -> bool:
         """从缓存加载EPG数据
 
+        二进制缓存以 mmap 方式打开，只读取频道表；旧版 epg_cache.json
+        读取后会转换为二进制缓存。
+
         Returns:
             是否成功加载
         """
+        from services.epg_store import EpgStore
+
+        cache_file = self._epg_cache_file()
+        if os.path.exists(cache_file):
+            try:
+                store = EpgStore(cache_file)
+                channel_names = store.channel_names()
+                with self._epg_lock:
+                    self._epg_store = store
+                    self._epg_data = store
+                    self._epg_channel_names = channel_names
+                    self._epg_index = None
+                    self._last_epg_update = datetime.now()
+                logger.debug(f"从缓存加载EPG数据成功: {len(store)} 个频道")
+                return True
+            except Exception as e:
+                logger.warning(f"加载EPG二进制缓存失败: {e}")
+
+        return self._load_legacy_epg_cache()
+
+    def _load_legacy_epg_cache(self) -> bool:
         import json
         
-        cache_dir = self._get_cache_dir()
-        cache_file = os.path.join(cache_dir, 'epg_cache.json')
+        cache_file = os.path.join(self._get_cache_dir(), _LEGACY_EPG_CACHE_FILE)
         
         if not os.path.exists(cache_file):
             return False
@@ -747,9 +1144,11 @@ class SubscriptionManager(Singleton):
                     self._epg_channel_names = {}
                     for channel_id in data.keys():
                         self._epg_channel_names[channel_id] = channel_id
+                self._epg_index = None
                 self._last_epg_update = datetime.now()
             
-            logger.debug(f"从缓存加载EPG数据成功: {len(data)} 个频道")
+            logger.debug(f"从旧版缓存加载EPG数据成功: {len(self._epg_data)} 个频道")
+            self._save_epg_cache(self._epg_data)
             return True
         except Exception as e:
             logger.error(f"加载EPG缓存失败: {e}")
@@ -762,11 +1161,11 @@ class SubscriptionManager(Singleton):
         Returns:
             是否有效
         """
-        cache_dir = self._get_cache_dir()
-        cache_file = os.path.join(cache_dir, 'epg_cache.json')
-
+        cache_file = self._epg_cache_file()
         if not os.path.exists(cache_file):
-            return False
+            cache_file = os.path.join(self._get_cache_dir(), _LEGACY_EPG_CACHE_FILE)
+            if not os.path.exists(cache_file):
+                return False
 
         try:
             file_mtime = datetime.fromtimestamp(os.path.getmtime(cache_file))
@@ -0,0 +1,288 @@
+"""
+用户数据存储（SQLite，WAL 模式）
+
+收藏、播放历史、断点续播与书签保存在同一个 user_data.db 中：
+- 每个集合一张表 (key 主键, sort_key 排序键, data JSON)，sort_key 建索引，
+  按时间/顺序读取与超出上限时的淘汰都走索引
+- 写入先进入内存中的待写队列，同一条记录的多次修改合并为最后一次；
+  后台线程稍后在一个事务中批量提交，调用方不再为每次修改重写整个文件
+- 读取单条记录时优先看待写队列，读取整个集合前先提交队列，读到的总是最新数据
+- 首次打开时从旧的 config.ini [Favorites]/[PlayHistory] 与
+  resume_positions.json / bookmarks.json 一次性迁移（见 migrate_legacy_user_data）
+
+同样结构的其他集合（如台标缓存元数据）可以指定自己的表名建立独立的存储。
+"""
+
+import atexit
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, List, Tuple
+from core.log_manager import global_logger as logger
+
+
+FAVORITES = 'favorites'
+PLAY_HISTORY = 'play_history'
+RESUME_POSITIONS = 'resume_positions'
+BOOKMARKS = 'bookmarks'
+TABLES = (FAVORITES, PLAY_HISTORY, RESUME_POSITIONS, BOOKMARKS)
+
+_SCHEMA_VERSION = 1
+# 首次写入后等待多久再提交（秒），期间的修改合并为一个事务
+_FLUSH_DELAY = 0.5
+# 待写记录达到该数量时立即提交
+_FLUSH_THRESHOLD = 512
+_MIGRATED_KEY = 'legacy_migrated'
+
+
+class UserDataStore:
+    """按集合保存 JSON 记录的 SQLite 存储，写入合并后由后台线程批量提交（线程安全）"""
+
+    def __init__(self, path: str, flush_delay: float = _FLUSH_DELAY, tables: Tuple[str, ...] = TABLES):
+        self.path = path
+        self._flush_delay = flush_delay
+        self._tables = tables
+        self._db_lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._init_schema()
+        # table -> {key: (sort_key, json) 或 None（删除）}
+        self._pending: Dict[str, Dict[str, Tuple[float, str] | None]] = {t: {} for t in tables}
+        self._cleared: set = set()
+        self._limits: Dict[str, int] = {}
+        self._pending_count = 0
+        self._cond = threading.Condition()
+        self._closed = False
+        self._writer = threading.Thread(target=self._write_loop, name="UserDataWriter", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _init_schema(self):
+        with self._db_lock:
+            conn = self._conn
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+            for table in self._tables:
+                conn.execute(
+                    f'CREATE TABLE IF NOT EXISTS {table} '
+                    f'(key TEXT PRIMARY KEY, sort_key REAL NOT NULL, data TEXT NOT NULL)'
+                )
+                conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{table}_sort ON {table} (sort_key)')
+            conn.execute(
+                'INSERT OR IGNORE INTO meta (key, value) VALUES (?, ?)',
+                ('schema_version', str(_SCHEMA_VERSION))
+            )
+
+    # ---------------- 元信息 ----------------
+
+    def get_meta(self, key: str, default: str | None = None) -> str | None:
+        with self._db_lock:
+            row = self._conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key: str, value: str):
+        with self._db_lock:
+            self._conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, value))
+
+    # ---------------- 读取 ----------------
+
+    def set_limit(self, table: str, max_entries: int):
+        """集合最多保留的记录数，提交时按 sort_key 淘汰最小的"""
+        self._limits[table] = max_entries
+
+    def get(self, table: str, key: str) -> Any:
+        with self._cond:
+            pending = self._pending[table]
+            if key in pending:
+                entry = pending[key]
+                return json.loads(entry[1]) if entry else None
+            if table in self._cleared:
+                return None
+        with self._db_lock:
+            row = self._conn.execute(f'SELECT data FROM {table} WHERE key = ?', (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def items(self, table: str, limit: int | None = None, descending: bool = True) -> List[Tuple[str, Any]]:
+        """按 sort_key 排序读取整个集合"""
+        self.flush()
+        order = 'DESC' if descending else 'ASC'
+        sql = f'SELECT key, data FROM {table} ORDER BY sort_key {order}'
+        params: tuple = ()
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params = (limit,)
+        with self._db_lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [(key, json.loads(data)) for key, data in rows]
+
+    def count(self, table: str) -> int:
+        self.flush()
+        with self._db_lock:
+            return self._conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+
+    # ---------------- 写入（合并后批量提交）----------------
+
+    def put(self, table: str, key: str, data: Any, sort_key: float):
+        self._enqueue(table, key, (float(sort_key), json.dumps(data, ensure_ascii=False)))
+
+    def delete(self, table: str, key: str):
+        self._enqueue(table, key, None)
+
+    def clear(self, table: str):
+        with self._cond:
+            self._pending_count -= len(self._pending[table])
+            self._pending[table].clear()
+            self._cleared.add(table)
+            self._pending_count += 1
+            self._cond.notify()
+
+    def _enqueue(self, table: str, key: str, entry):
+        with self._cond:
+            pending = self._pending[table]
+            if key not in pending:
+                self._pending_count += 1
+            pending[key] = entry
+            self._cond.notify()
+
+    def _take_pending(self):
+        with self._cond:
+            if not self._pending_count:
+                return None
+            batch = {table: pending for table, pending in self._pending.items() if pending}
+            cleared = self._cleared
+            self._pending = {t: {} for t in self._tables}
+            self._cleared = set()
+            self._pending_count = 0
+            return batch, cleared
+
+    def flush(self):
+        """立即提交所有待写记录"""
+        with self._db_lock:
+            taken = self._take_pending()
+            if taken is None:
+                return
+            batch, cleared = taken
+            try:
+                self._apply(batch, cleared)
+            except sqlite3.Error as e:
+                logger.error(f"写入用户数据失败: {e}")
+
+    def _apply(self, batch: Dict[str, Dict], cleared: set):
+        conn = self._conn
+        conn.execute('BEGIN')
+        try:
+            for table in cleared:
+                conn.execute(f'DELETE FROM {table}')
+            for table, pending in batch.items():
+                upserts = [(key, entry[0], entry[1]) for key, entry in pending.items() if entry]
+                deletes = [(key,) for key, entry in pending.items() if not entry]
+                if deletes:
+                    conn.executemany(f'DELETE FROM {table} WHERE key = ?', deletes)
+                if upserts:
+                    conn.executemany(
+                        f'INSERT OR REPLACE INTO {table} (key, sort_key, data) VALUES (?, ?, ?)', upserts
+                    )
+                    limit = self._limits.get(table)
+                    if limit is not None:
+                        conn.execute(
+                            f'DELETE FROM {table} WHERE key IN ('
+                            f'SELECT key FROM {table} ORDER BY sort_key DESC LIMIT -1 OFFSET ?)',
+                            (limit,)
+                        )
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+
+    def _write_loop(self):
+        while True:
+            with self._cond:
+                while not self._pending_count and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                # 等一小段时间，让连续的修改合并到同一个事务
+                if self._pending_count < _FLUSH_THRESHOLD:
+                    self._cond.wait(self._flush_delay)
+            self.flush()
+
+    def close(self):
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self.flush()
+        with self._db_lock:
+            self._conn.close()
+        atexit.unregister(self.close)
+
+
+def migrate_legacy_user_data(store: UserDataStore, config, resume_file: str, bookmark_file: str):
+    """把旧版 INI / JSON 中的收藏、历史、断点与书签导入 store（只执行一次）
+
+    导入成功后删除 INI 中的旧节，旧 JSON 文件改名为 *.migrated 保留备份。
+    """
+    if store.get_meta(_MIGRATED_KEY):
+        return
+    counts = {}
+    for section, table in (('Favorites', FAVORITES), ('PlayHistory', PLAY_HISTORY)):
+        count = config._parse_int(config.get_value(section, 'count', '0'), 0)
+        imported = 0
+        for i in range(count):
+            raw = config.get_value(section, f'ch_{i}', '')
+            if not raw:
+                continue
+            try:
+                channel = json.loads(raw)
+            except (json.JSONDecodeError, ValueError) as e:
+                logger.warning(f"迁移时跳过损坏的条目 [{section}] ch_{i}: {e}")
+                continue
+            url = channel.get('url', '') if isinstance(channel, dict) else ''
+            if url:
+                # 收藏按原顺序升序；历史原本最新在前，按序号倒序作为排序键
+                store.put(table, url, channel, i if table == FAVORITES else count - i)
+                imported += 1
+        counts[table] = imported
+
+    for path, table, sort_field in ((resume_file, RESUME_POSITIONS, 'updated_at'),
+                                    (bookmark_file, BOOKMARKS, 'created_at')):
+        data = _load_json_dict(path)
+        for url, value in data.items():
+            if table == RESUME_POSITIONS and isinstance(value, dict):
+                store.put(table, url, value, value.get(sort_field, 0))
+            elif table == BOOKMARKS and isinstance(value, list) and value:
+                marks = [m for m in value if isinstance(m, dict)]
+                store.put(table, url, marks, max((m.get(sort_field, 0) for m in marks), default=0))
+        counts[table] = len(data)
+
+    store.flush()
+    store.set_meta(_MIGRATED_KEY, '1')
+    config.remove_section('Favorites')
+    config.remove_section('PlayHistory')
+    if counts[FAVORITES] or counts[PLAY_HISTORY]:
+        config.save_config()
+    for path in (resume_file, bookmark_file):
+        if os.path.exists(path):
+            try:
+                os.replace(path, path + '.migrated')
+            except OSError as e:
+                logger.debug(f"重命名旧数据文件失败: {e}")
+    if any(counts.values()):
+        logger.info(
+            f"用户数据已迁移到 SQLite: 收藏 {counts[FAVORITES]}，历史 {counts[PLAY_HISTORY]}，"
+            f"断点 {counts[RESUME_POSITIONS]}，书签 {counts[BOOKMARKS]}"
+        )
+
+
+def _load_json_dict(path: str) -> Dict:
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"读取旧数据文件失败 {path}: {e}")
+        return {}
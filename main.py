@@ -33,6 +33,11 @@ def _suppress_qfont_pointsize_warning(msg_type, context, msg):
 
 
 def main():
+    # 启动分析需在导入 PySide6 与业务模块之前开启
+    from utils import startup_profiler
+    if startup_profiler.requested(sys.argv):
+        startup_profiler.enable()
+
     from PySide6.QtWidgets import QApplication, QSplashScreen
     from PySide6.QtGui import QIcon, QPixmap, QColor
     from PySide6.QtCore import Qt, qInstallMessageHandler
@@ -40,6 +45,7 @@ def main():
     qInstallMessageHandler(_suppress_qfont_pointsize_warning)
 
     app = QApplication(sys.argv)
+    startup_profiler.mark('QApplication')
 
     splash = None
     try:
@@ -73,8 +79,11 @@ def main():
         pass
 
     from pyqt_player import IPTVPlayer
+    startup_profiler.mark('导入主窗口模块')
 
     player = IPTVPlayer()
+    startup_profiler.mark('主窗口创建')
+    startup_profiler.watch_first_paint(player)
 
     if splash:
         splash.finish(player)
@@ -98,4 +107,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # 打包后的程序启动扫描子进程（spawn）时需要先进入 multiprocessing 的引导逻辑
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
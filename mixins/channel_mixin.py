@@ -6,6 +6,7 @@ from PySide6.QtWidgets import QListWidget
 
 from core.log_manager import global_logger as logger
 from core.application_state import app_state
+from utils.lazy_component import peek_component
 
 
 class ChannelMixin:
@@ -301,8 +302,9 @@ class ChannelMixin:
             channel = channels[idx]
         else:
             return
-        if hasattr(self, 'multi_screen_ctrl') and self.multi_screen_ctrl.is_active:
-            self.multi_screen_ctrl.play_in_empty_cell(channel)
+        multi_screen_ctrl = peek_component(self, 'multi_screen_ctrl')
+        if multi_screen_ctrl and multi_screen_ctrl.is_active:
+            multi_screen_ctrl.play_in_empty_cell(channel)
         else:
             self.select_channel(item, source_list=sender)
 
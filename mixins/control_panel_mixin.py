@@ -360,7 +360,7 @@ class ControlPanelMixin:
         self.pip_button.setIconSize(btn_icon_size)
         self.pip_button.setFixedSize(self.CTRL_BUTTON_WIDTH, self.CTRL_BUTTON_HEIGHT)
         self.pip_button.setStyleSheet(AppStyles.player_button_style())
-        self.pip_button.clicked.connect(self.pip_ctrl.toggle)
+        self.pip_button.clicked.connect(lambda checked=False: self.pip_ctrl.toggle(checked))
         self.pip_button.setToolTip(tr("panel_pip", "画中画"))
         self.control_row.addWidget(self.pip_button)
 
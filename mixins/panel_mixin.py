@@ -132,7 +132,7 @@ class PanelMixin:
             ('_floating_menu_action', self.floating_panel_visible),
             ('_osd_menu_action', self._osd_visible),
             ('_fullscreen_menu_action', getattr(self, 'is_fullscreen', False)),
-            ('_pip_menu_action', self.pip_ctrl.is_active if hasattr(self, 'pip_ctrl') else False),
+            ('_pip_menu_action', getattr(self, 'pip_mode', False)),
         ]:
             action = getattr(self, attr, None)
             if action:
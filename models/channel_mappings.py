@@ -7,6 +7,7 @@ import time
 import threading
 from typing import Dict, List, Optional
 import functools
+import importlib.util
 
 from core.log_manager import global_logger as logger
 from core.config_manager import ConfigManager
@@ -36,12 +37,9 @@ def get_app_data_dir() -> str:
         return os.path.dirname(current_dir)
 
 
-# 尝试导入requests，如果失败则提供备用方案
-try:
-    import requests
-    REQUESTS_AVAILABLE = True
-except ImportError:
-    REQUESTS_AVAILABLE = False
+# requests 导入较慢（urllib3/charset_normalizer 等），启动时只检查是否安装，用到时再导入
+REQUESTS_AVAILABLE = importlib.util.find_spec('requests') is not None
+if not REQUESTS_AVAILABLE:
     logger.warning("requests模块未安装，远程映射功能将不可用")
 
 # 默认远程URL - 优先使用CSV格式，如果不存在则尝试TXT格式
@@ -157,6 +155,7 @@ def load_remote_mappings() -> Dict[str, dict]:
         logger.warning("requests模块不可用，无法加载远程映射")
         return {}
 
+    import requests
     try:
         config = ConfigManager()
         try:
@@ -685,6 +684,7 @@ class ChannelMappingManager:
             if not REQUESTS_AVAILABLE:
                 result['error'] = 'requests模块不可用'
                 return result
+            import requests
 
             remote_url = DEFAULT_REMOTE_URL
             try:
@@ -747,6 +747,7 @@ class ChannelMappingManager:
         self.reverse_mappings = create_reverse_mappings(self.combined_mappings)
         try:
             if REQUESTS_AVAILABLE:
+                import requests
                 remote_url = DEFAULT_REMOTE_URL
                 try:
                     config = ConfigManager()
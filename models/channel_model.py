@@ -1,15 +1,64 @@
 import re
+import time
 from datetime import datetime
 from PySide6 import QtCore, QtGui
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable
 from core.log_manager import global_logger as logger
 from ui.styles import AppStyles
 from models.channel_mappings import extract_channel_name_from_url
+from models.channel_store import ChannelStore
 
 # 自定义数据角色：用于 delegate 从 QModelIndex 取评分（与 ui.quality_bar 中常量保持一致）
 QUALITY_SCORE_ROLE = 0x0100 + 100  # Qt.ItemDataRole.UserRole + 100
 QUALITY_GRADE_ROLE = 0x0100 + 101  # Qt.ItemDataRole.UserRole + 101
 
+# 行内容变化时通知视图刷新的角色
+_CHANGED_ROLES = [
+    QtCore.Qt.ItemDataRole.DisplayRole,
+    QtCore.Qt.ItemDataRole.DecorationRole,
+    QtCore.Qt.ItemDataRole.BackgroundRole,
+    QtCore.Qt.ItemDataRole.ForegroundRole,
+    QUALITY_SCORE_ROLE,
+    QUALITY_GRADE_ROLE,
+]
+
+# data() 按行缓存的角色；颜色角色缓存的是调色板槽位名。
+# 视图传入的角色是 int，预先转换，避免每次调用访问枚举
+_DISPLAY_ROLE = int(QtCore.Qt.ItemDataRole.DisplayRole)
+_BACKGROUND_ROLE = int(QtCore.Qt.ItemDataRole.BackgroundRole)
+_FOREGROUND_ROLE = int(QtCore.Qt.ItemDataRole.ForegroundRole)
+_TEXT_ALIGNMENT_ROLE = int(QtCore.Qt.ItemDataRole.TextAlignmentRole)
+_COLOR_ROLES_LIST = [QtCore.Qt.ItemDataRole.BackgroundRole, QtCore.Qt.ItemDataRole.ForegroundRole]
+_COLOR_ROLES = frozenset((_BACKGROUND_ROLE, _FOREGROUND_ROLE))
+_CACHED_ROLES = frozenset((_DISPLAY_ROLE, QUALITY_SCORE_ROLE, QUALITY_GRADE_ROLE, *_COLOR_ROLES))
+
+# 调色板槽位 → 主题缺少该颜色时的默认值（None 表示主题必有）
+_PALETTE_SLOTS = {
+    'error_background': '#ffdddd',
+    'table_alternate': None,
+    'error': '#ff6666',
+    'placeholder': '#999999',
+    'window_text': None,
+}
+
+_TEXT_ALIGNMENT = QtCore.Qt.AlignmentFlag.AlignVCenter | QtCore.Qt.AlignmentFlag.AlignLeft
+
+# 合并 dataChanged 的间隔（约一帧）
+_CHANGE_FLUSH_INTERVAL_MS = 16
+
+# 编辑/映射更新时原始数据随之更新的字段
+_SYNCED_ORIGINAL_FIELDS = ('name', 'group', 'logo', 'tvg_id', 'resolution',
+                           'tvg_chno', 'tvg_shift', 'catchup', 'catchup_days', 'catchup_source')
+
+# 自然排序：拆分出字符串中的数字段
+_DIGITS_RE = re.compile(r'(\d+)')
+
+# 排序状态下新增频道分散到的插入位置超过这个数时，改为一次性插入后整体重置视图
+_SORTED_INSERT_MAX_RUNS = 64
+
+# 流式加载时每次占用事件循环的最长时间（秒），超过后让出给界面绘制
+_STREAM_SLICE_SECONDS = 0.012
+
 
 class ChannelListModel(QtCore.QAbstractTableModel):
     """频道列表数据模型"""
@@ -45,6 +94,72 @@ class ChannelListModel(QtCore.QAbstractTableModel):
         COL_CATCHUP_SOURCE: 'catchup_source',
     }
 
+    # 字段 → 实际列（用于变化跟踪）
+    _FIELD_COLUMNS = {
+        **{field: col for col, field in COLUMN_FIELD_MAP.items()},
+        'logo_url': COL_LOGO,
+    }
+
+    # 影响整行显示（背景/前景色、延迟列、评分条）的字段
+    ROW_STYLE_FIELDS = frozenset({'valid', 'status', 'quality_score', 'quality_grade'})
+
+    # 智能排序：组名优先级（部分匹配）
+    _SMART_GROUP_PRIORITY = {
+        '央视频道': 0,
+        'CETV': 1,
+        'CGTN': 2,
+        '卫视': 3,
+        '国际频道': 4,
+        '特色频道': 5,
+        '山东频道': 6,
+        '市级频道': 7,
+        '滨州': 8,
+        '德州': 9,
+        '东营': 10,
+        '菏泽': 11,
+        '济南': 12,
+        '济宁': 13,
+        '聊城': 14,
+        '临沂': 15,
+        '青岛': 16,
+        '日照': 17,
+        '泰安': 18,
+        '威海': 19,
+        '潍坊': 20,
+        '烟台': 21,
+        '淄博': 22
+    }
+
+    # 智能排序：央视频道的精确顺序（部分匹配）
+    _CCTV_ORDER = (
+        'CCTV-1 综合',
+        'CCTV-2 财经',
+        'CCTV-3 综艺',
+        'CCTV-4 (亚洲)',
+        'CCTV-4 (欧洲)',
+        'CCTV-4 (美洲)',
+        'CCTV-5 体育',
+        'CCTV-5+ 体育赛事',
+        'CCTV-6 电影',
+        'CCTV-7 国防军事',
+        'CCTV-8 电视剧',
+        'CCTV-9 纪录',
+        'CCTV-10 科教',
+        'CCTV-11 戏曲',
+        'CCTV-12 社会与法',
+        'CCTV-13 新闻',
+        'CCTV-14 少儿',
+        'CCTV-15 音乐',
+        'CCTV-16 奥林匹克',
+        'CCTV-17 农业农村',
+        'CCTV-4K 超高清',
+        'CCTV-8K 超高清',
+        'CCTV-中视购物',
+        '央广购物'
+    )
+
+    _SMART_HD_THRESHOLD = 1920 * 1080
+
     COLUMN_DEFAULTS = {
             0: None,
             1: '未命名',
@@ -81,7 +196,8 @@ class ChannelListModel(QtCore.QAbstractTableModel):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.channels: List[Dict[str, Any]] = []
+        # 频道数据：列式存储，元素为 dict 兼容的 ChannelRecord 视图
+        self._channels = ChannelStore()
         self.headers = [
             "序号", "频道名称", "分辨率", "URL", "分组",
             "Logo地址", "状态", "延迟(ms)", "TVG-ID",
@@ -117,15 +233,55 @@ class ChannelListModel(QtCore.QAbstractTableModel):
         # 原始文件路径
         self._source_file_path = ""
 
+        # 流式加载代次：新的加载开始后，旧加载的后续批次自动作废
+        self._stream_load_id = 0
+
         # 是否处于隐藏无效项状态
         self._is_hiding_invalid = False
 
-        # 原始频道数据存储（用于非隐藏状态下的保存）
-        self._original_channel_data = {}
+        # 隐藏无效项前的行序（用于恢复显示）
+        self._hidden_order = None
 
         # 排序状态
         self._sort_column = -1  # 当前排序列
         self._sort_order = QtCore.Qt.SortOrder.AscendingOrder  # 排序顺序
+        # 当前行序所依据的排序：(行 → 排序键, 是否降序)；新增频道按它二分插入，行序被打乱后置为 None
+        self._active_sort = None
+
+        # URL → 行号索引：追加行时增量维护，重置/删除/移动后失效并在下次查找时重建
+        self._url_index: Dict[Any, int] | None = None
+        self._url_index_size = 0
+        self.modelReset.connect(self._invalidate_url_index)
+        self.rowsRemoved.connect(self._invalidate_url_index)
+        self.rowsMoved.connect(self._invalidate_url_index)
+
+        # 变化跟踪：行号 → 变化的实际列集合（None 表示整行），每帧合并发出一次 dataChanged
+        self._dirty_rows: Dict[int, set | None] = {}
+        self._change_timer = QtCore.QTimer(self)
+        self._change_timer.setSingleShot(True)
+        self._change_timer.setInterval(_CHANGE_FLUSH_INTERVAL_MS)
+        self._change_timer.timeout.connect(self.flush_changes)
+        # 行结构变化前先发出已登记的变化，保证行号仍然有效；重置/布局变化会整体刷新，直接丢弃
+        self.rowsAboutToBeInserted.connect(self.flush_changes)
+        self.rowsAboutToBeRemoved.connect(self.flush_changes)
+        self.rowsAboutToBeMoved.connect(self.flush_changes)
+        self.modelAboutToBeReset.connect(self._discard_changes)
+        self.layoutAboutToBeChanged.connect(self._discard_changes)
+
+        # data() 的行缓存：行号 → {角色/(角色, 列): 值}；行结构变化后整体失效
+        self._row_cache: Dict[int, Dict[Any, Any]] = {}
+        self._columns: List[int] | None = None
+        self._palette: Dict[str, QtGui.QColor] | None = None
+        self._palette_key = None
+        self.modelAboutToBeReset.connect(self._invalidate_row_cache)
+        self.layoutAboutToBeChanged.connect(self._invalidate_row_cache)
+        self.rowsRemoved.connect(self._invalidate_row_cache)
+        self.rowsMoved.connect(self._invalidate_row_cache)
+        self.rowsInserted.connect(self._shift_row_cache)
+        # 主题管理器由主窗口先行创建；这里不主动创建，避免单独使用模型时读取主题配置
+        from ui import theme_manager as theme_module
+        if theme_module.theme_manager is not None:
+            theme_module.theme_manager.theme_changed.connect(self._on_theme_changed)
 
     def set_language_manager(self, language_manager):
         """设置语言管理器"""
@@ -142,6 +298,136 @@ class ChannelListModel(QtCore.QAbstractTableModel):
         """返回行数(频道数量)"""
         return len(self.channels)
 
+    @property
+    def channels(self) -> ChannelStore:
+        return self._channels
+
+    @channels.setter
+    def channels(self, value: Iterable[Dict[str, Any]]):
+        # 整体替换时建立新的存储，已取出的行视图仍指向旧存储，不受影响
+        self._channels = value if isinstance(value, ChannelStore) else ChannelStore(value)
+        self._hidden_order = None
+        self._row_cache = {}
+        self._active_sort = None
+
+    def _invalidate_url_index(self, *args):
+        self._url_index = None
+
+    def _ensure_url_index(self) -> Dict[Any, int]:
+        # 行数变化说明有未经模型方法的增删，直接重建
+        if self._url_index is None or self._url_index_size != len(self.channels):
+            index = {}
+            for row, url in enumerate(self.channels.values('url')):
+                index.setdefault(url, row)
+            self._url_index = index
+            self._url_index_size = len(self.channels)
+        return self._url_index
+
+    def _index_appended_rows(self, first_row: int):
+        """把 first_row 之后追加的行加入 URL 索引"""
+        if self._url_index is None or self._url_index_size != first_row:
+            self._url_index = None
+            return
+        for row in range(first_row, len(self.channels)):
+            self._url_index.setdefault(self.channels[row].get('url'), row)
+        self._url_index_size = len(self.channels)
+
+    def find_row_by_url(self, url) -> int:
+        """按 URL 查找行号（首个匹配），不存在返回 -1"""
+        index = self._ensure_url_index()
+        row = index.get(url, -1)
+        if row >= 0 and self.channels[row].get('url') != url:
+            # 行被外部直接移动过，索引已过期
+            self._url_index = None
+            row = self._ensure_url_index().get(url, -1)
+        return row
+
+    def mark_row_changed(self, row: int, fields: Iterable[str] | None = None):
+        """登记行内容变化，合并后在下一帧统一发出 dataChanged
+
+        Args:
+            row: 行号
+            fields: 变化的字段名；为 None 或包含影响整行显示的字段时刷新整行
+        """
+        if not (0 <= row < len(self.channels)):
+            return
+        self._row_cache.pop(row, None)
+        columns = None
+        if fields is not None:
+            columns = set()
+            for field in fields:
+                if field in self.ROW_STYLE_FIELDS:
+                    columns = None
+                    break
+                col = self._FIELD_COLUMNS.get(field)
+                if col is not None:
+                    columns.add(col)
+            if columns is not None and not columns:
+                return
+        if row in self._dirty_rows:
+            pending = self._dirty_rows[row]
+            if pending is None or columns is None:
+                self._dirty_rows[row] = None
+            else:
+                pending.update(columns)
+        else:
+            self._dirty_rows[row] = columns
+        if not self._change_timer.isActive():
+            self._change_timer.start()
+
+    def flush_changes(self, *args):
+        """立即发出已登记的变化：相邻行合并为一个 dataChanged 区间"""
+        self._change_timer.stop()
+        if not self._dirty_rows:
+            return
+        dirty = self._dirty_rows
+        self._dirty_rows = {}
+        row_count = len(self.channels)
+        last_col = self.columnCount() - 1
+        if last_col < 0:
+            return
+
+        run_start = run_end = -1
+        run_cols = None
+        for row in sorted(dirty):
+            if row >= row_count:
+                break
+            span = self._logical_span(dirty[row], last_col)
+            if span is None:
+                continue
+            if run_start >= 0 and row == run_end + 1:
+                run_end = row
+                run_cols = (min(run_cols[0], span[0]), max(run_cols[1], span[1]))
+                continue
+            if run_start >= 0:
+                self._emit_data_changed(run_start, run_end, run_cols)
+            run_start = run_end = row
+            run_cols = span
+        if run_start >= 0:
+            self._emit_data_changed(run_start, run_end, run_cols)
+
+    def _discard_changes(self, *args):
+        self._change_timer.stop()
+        self._dirty_rows = {}
+
+    def _logical_span(self, columns, last_col):
+        """实际列集合 → 可见的逻辑列区间；全部隐藏时返回 None"""
+        if columns is None:
+            return 0, last_col
+        logical = [self._actual_to_logical_column(col) for col in columns
+                   if not self.hidden_columns.get(col, False)]
+        logical = [col for col in logical if col >= 0]
+        if not logical:
+            return None
+        return min(logical), max(logical)
+
+    def _emit_data_changed(self, first_row, last_row, columns):
+        self.dataChanged.emit(
+            self.index(first_row, columns[0]),
+            self.index(last_row, columns[1]),
+            _CHANGED_ROLES
+        )
+
     def clear(self):
         """清空频道列表"""
         self.beginResetModel()
@@ -153,18 +439,9 @@ class ChannelListModel(QtCore.QAbstractTableModel):
         if not row_order or not self.channels:
             return
 
-        max_idx = len(self.channels)
-        indexed = {i: self.channels[i] for i in range(max_idx)}
-        reordered = []
-        for idx in row_order:
-            if 0 <= idx < max_idx:
-                reordered.append(indexed[idx])
-
-        remaining = [indexed[i] for i in sorted(indexed.keys()) if i not in set(row_order)]
-        reordered.extend(remaining)
-
         self.beginResetModel()
-        self.channels = reordered
+        self.channels.reorder(row_order)
+        self._active_sort = None
         self.endResetModel()
 
     def columnCount(self, parent=QtCore.QModelIndex()) -> int:
@@ -206,6 +483,7 @@ class ChannelListModel(QtCore.QAbstractTableModel):
         """切换列的隐藏状态"""
         if actual_col in self.hidden_columns:
             self.hidden_columns[actual_col] = not self.hidden_columns[actual_col]
+            self._columns = None
             # 通知视图列数发生变化
             self.beginResetModel()
             self.endResetModel()
@@ -219,78 +497,121 @@ class ChannelListModel(QtCore.QAbstractTableModel):
         return self.hidden_columns.get(actual_col, False)
 
     def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole):
-        """返回单元格数据"""
-        if not index.isValid() or not (0 <= index.row() < len(self.channels)):
+        """返回单元格数据
+
+        显示文本、背景/前景色和评分按行缓存，视图滚动重绘时直接取用；
+        行内容变化（mark_row_changed）或行结构变化时失效，颜色另按主题缓存。
+        """
+        row = index.row()
+        if not (0 <= row < len(self._channels)) or not index.isValid():
+            return None
+        if role == _TEXT_ALIGNMENT_ROLE:
+            return _TEXT_ALIGNMENT
+        if role not in _CACHED_ROLES:
             return None
 
-        channel = self.channels[index.row()]
+        columns = self._column_map()
         logical_col = index.column()
-        actual_col = self._logical_to_actual_column(logical_col)
-
-        if actual_col == -1:
+        if not (0 <= logical_col < len(columns)):
             return None
+        actual_col = columns[logical_col]
 
-        if role == QtCore.Qt.ItemDataRole.DisplayRole:
-            return self._get_display_data(channel, actual_col, index.row())
-        elif role == QtCore.Qt.ItemDataRole.DecorationRole and actual_col == 0:
-            return None
-        elif role == QtCore.Qt.ItemDataRole.TextAlignmentRole:
-            return QtCore.Qt.AlignmentFlag.AlignVCenter | QtCore.Qt.AlignmentFlag.AlignLeft
-        elif role == QtCore.Qt.ItemDataRole.BackgroundRole:
-            from ui.styles import AppStyles, color_to_qcolor
-            colors = AppStyles._get_colors()
-            valid = channel.get('valid')
-            if valid is False:
-                return color_to_qcolor(colors.get('error_background', '#ffdddd'))
-            else:
-                return color_to_qcolor(colors['table_alternate'])
-        elif role == QtCore.Qt.ItemDataRole.ForegroundRole:
-            from ui.styles import AppStyles, color_to_qcolor
-            colors = AppStyles._get_colors()
+        cached = self._row_cache.get(row)
+        if cached is None:
+            cached = self._row_cache[row] = {}
+        key = (role, actual_col) if role == _DISPLAY_ROLE else role
+        try:
+            value = cached[key]
+        except KeyError:
+            value = cached[key] = self._compute_cell(cached, self._channels[row], role, actual_col, row)
+        if role in _COLOR_ROLES:
+            return self._palette_color(value)
+        return value
+
+    def _compute_cell(self, cached, channel, role, actual_col, row):
+        """计算单元格数据；颜色角色返回调色板槽位名，由 _palette_color 换成 QColor"""
+        if role == _DISPLAY_ROLE:
+            return self._get_display_data(channel, actual_col, row)
+        valid = channel.get('valid')
+        if role == _BACKGROUND_ROLE:
+            return 'error_background' if valid is False else 'table_alternate'
+        if role == _FOREGROUND_ROLE:
             status = channel.get('status', '待检测')
-            valid = channel.get('valid')
-
             if valid is False and status != '待检测':
-                return color_to_qcolor(colors.get('error', '#ff6666'))
+                return 'error'
             elif status == '待检测':
-                return color_to_qcolor(colors.get('placeholder', '#999999'))
-            else:
-                return color_to_qcolor(colors['window_text'])
-        elif role == QUALITY_SCORE_ROLE:
-            # 显示评分条的条件：
-            # - 频道已检测（valid 非 None），按数据计算/读取
-            # - 或频道从 M3U 加载且带有 quality_score 字段（持久化的扫描结果）
-            valid = channel.get('valid')
-            has_persisted_score = 'quality_score' in channel
-            if valid is None and not has_persisted_score:
-                return None
+                return 'placeholder'
+            return 'window_text'
+
+        # 显示评分条的条件：
+        # - 频道已检测（valid 非 None），按数据计算/读取
+        # - 或频道从 M3U 加载且带有 quality_score 字段（持久化的扫描结果）
+        if valid is None and 'quality_score' not in channel:
+            return None
+        if role == QUALITY_SCORE_ROLE:
             score = channel.get('quality_score', None)
             if score is None or score == '':
                 if valid is None:
                     return None
                 # 评分字段缺失但已检测，按现有数据动态计算（不写入）
-                from services.stream_quality_scorer import StreamQualityScorer
-                info = StreamQualityScorer.score_from_channel(channel)
-                return info.get('total')
+                return self._computed_quality(cached, channel).get('total')
             try:
                 return float(score)
             except (TypeError, ValueError):
                 return None
-        elif role == QUALITY_GRADE_ROLE:
-            valid = channel.get('valid')
-            has_persisted_score = 'quality_score' in channel
-            if valid is None and not has_persisted_score:
+        grade = channel.get('quality_grade', None)
+        if not grade:
+            if valid is None:
                 return None
-            grade = channel.get('quality_grade', None)
-            if not grade:
-                if valid is None:
-                    return None
-                from services.stream_quality_scorer import StreamQualityScorer
-                info = StreamQualityScorer.score_from_channel(channel)
-                return info.get('grade')
-            return grade
+            return self._computed_quality(cached, channel).get('grade')
+        return grade
 
-        return None
+    @staticmethod
+    def _computed_quality(cached, channel):
+        """动态计算的评分结果，评分与等级两个角色共用一次计算"""
+        info = cached.get('quality')
+        if info is None:
+            from services.stream_quality_scorer import StreamQualityScorer
+            info = cached['quality'] = StreamQualityScorer.score_from_channel(channel)
+        return info
+
+    def _palette_color(self, slot):
+        """调色板槽位 → QColor；主题切换后重建"""
+        theme_key = (AppStyles._color_mode, AppStyles._visual_style)
+        if self._palette is None or self._palette_key != theme_key:
+            from ui.styles import color_to_qcolor
+            colors = AppStyles._get_colors()
+            self._palette = {
+                name: color_to_qcolor(colors[name] if default is None else colors.get(name, default))
+                for name, default in _PALETTE_SLOTS.items()
+            }
+            self._palette_key = theme_key
+        return self._palette[slot]
+
+    def _on_theme_changed(self, *args):
+        # 跟随系统时颜色模式名不变，只能靠主题切换通知刷新
+        self._palette = None
+        if self.channels:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self.channels) - 1, self.columnCount() - 1),
+                _COLOR_ROLES_LIST
+            )
+
+    def _column_map(self):
+        """逻辑列 → 实际列的映射表，隐藏列变化时重建"""
+        if self._columns is None:
+            self._columns = [col for col in range(len(self.headers))
+                             if not self.hidden_columns.get(col, False)]
+        return self._columns
+
+    def _invalidate_row_cache(self, *args):
+        self._row_cache = {}
+
+    def _shift_row_cache(self, parent, first, last):
+        """插入行后，first 及之后的行号已改变，丢弃这些行的缓存（末尾追加时无需处理）"""
+        if any(row >= first for row in self._row_cache):
+            self._row_cache = {row: value for row, value in self._row_cache.items() if row < first}
 
     def _get_display_data(self, channel, actual_col, row):
         if actual_col == 0:
@@ -357,10 +678,11 @@ class ChannelListModel(QtCore.QAbstractTableModel):
             return True
 
         channel[field] = new_value
+        if field == 'url':
+            self._invalidate_url_index()
 
-        url = channel.get('url', '')
-        if url in self._original_channel_data:
-            self._original_channel_data[url][field] = new_value
+        # 手动编辑同时作为保存时的原始值
+        channel.sync_original((field,))
 
         if field == 'name':
             if old_value:
@@ -371,14 +693,8 @@ class ChannelListModel(QtCore.QAbstractTableModel):
                 self._group_cache.discard(old_value)
             self._group_cache.add(new_value)
 
-        self.dataChanged.emit(
-            self.index(index.row(), 0),
-            self.index(index.row(), self.columnCount() - 1),
-            [QtCore.Qt.ItemDataRole.DisplayRole,
-             QtCore.Qt.ItemDataRole.DecorationRole,
-             QtCore.Qt.ItemDataRole.BackgroundRole,
-             QtCore.Qt.ItemDataRole.ForegroundRole]
-        )
+        self.mark_row_changed(index.row(), (field,))
+        self._keep_row_sorted(index.row())
         return True
 
     def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlag:
@@ -441,6 +757,7 @@ class ChannelListModel(QtCore.QAbstractTableModel):
         if target_row > source_row:
             target_row -= 1
         self.channels.insert(target_row, channel)
+        self._active_sort = None
         self.endResetModel()
         return True
 
@@ -458,11 +775,7 @@ class ChannelListModel(QtCore.QAbstractTableModel):
             is_from_file: 是否从文件加载的频道（需要保存原始数据）
         """
         # 检查是否已存在相同URL的频道
-        existing_index = -1
-        for i, channel in enumerate(self.channels):
-            if channel.get('url') == channel_info.get('url'):
-                existing_index = i
-                break
+        existing_index = self.find_row_by_url(channel_info.get('url'))
 
         if existing_index >= 0:
             existing = self.channels[existing_index]
@@ -471,118 +784,135 @@ class ChannelListModel(QtCore.QAbstractTableModel):
             return
         else:
             # 添加新频道
-            self.beginInsertRows(QtCore.QModelIndex(), len(self.channels), len(self.channels))
-            self.channels.append(channel_info)
-            # 更新名称和分组缓存
-            if 'name' in channel_info:
-                self._name_cache.add(channel_info['name'])
-            for g in channel_info.get('_groups', [channel_info.get('group', '')]):
-                if g:
-                    self._group_cache.add(g)
-            self.endInsertRows()
+            self._insert_new_channels([channel_info], is_from_file)
 
-            # 如果是从文件加载的频道，保存原始数据
-            if is_from_file:
-                url = channel_info.get('url', '')
-                if url:
-                    # 保存原始数据副本，包含所有M3U属性
-                    original_channel = {
-                        'name': channel_info.get('name', ''),
-                        'group': channel_info.get('group', '未分类'),
-                        'tvg_id': channel_info.get('tvg_id', ''),
-                        'logo': channel_info.get('logo', ''),
-                        'resolution': channel_info.get('resolution', ''),
-                        'tvg_chno': channel_info.get('tvg_chno', ''),
-                        'tvg_shift': channel_info.get('tvg_shift', ''),
-                        'catchup': channel_info.get('catchup', ''),
-                        'catchup_days': channel_info.get('catchup_days', ''),
-                        'catchup_source': channel_info.get('catchup_source', ''),
-                        'url': url
-                    }
-                    self._original_channel_data[url] = original_channel
-
-    def add_channels(self, channels: List[Dict[str, Any]], is_from_file: bool = False, use_reset: bool = False):
+    def add_channels(self, channels: List[Dict[str, Any]], is_from_file: bool = False):
         """批量添加频道到模型
 
-        Args:
-            use_reset: 使用 beginResetModel/endResetModel 代替 beginInsertRows/endInsertRows。
-                       扫描期间建议 True，避免与 QSortFilterProxyModel 竞态导致 C++ 层崩溃。
+        新频道一次性追加到末尾（单个 beginInsertRows/endInsertRows），列表处于排序
+        状态时则二分插入到各自的有序位置；已有频道的更新登记到变化跟踪，视图的选中
+        与滚动位置不受影响。
         """
         if not channels:
             return
-        existing_urls = {ch.get('url') for ch in self.channels}
         new_channels = []
+        new_urls = set()
         updates = []
         for ch in channels:
             url = ch.get('url')
-            if url not in existing_urls:
-                new_channels.append(ch)
-                existing_urls.add(url)
-            elif ch.get('valid') is True:
-                for i, existing in enumerate(self.channels):
-                    if existing.get('url') == url and existing.get('valid') is not True:
-                        updates.append((i, ch))
-                        break
+            row = self.find_row_by_url(url)
+            if row < 0:
+                if url not in new_urls:
+                    new_channels.append(ch)
+                    new_urls.add(url)
+            elif ch.get('valid') is True and self.channels[row].get('valid') is not True:
+                updates.append((url, ch))
         if not new_channels and not updates:
             return
-        if use_reset:
+        # 先更新已有频道：排序状态下新频道插在中间，之后行号会变；
+        # 更新本身也可能把行移到新的有序位置，所以每次按 URL 重新定位
+        for url, ch in updates:
+            self.update_channel(self.find_row_by_url(url), ch)
+        if new_channels:
+            self._insert_new_channels(new_channels, is_from_file)
+
+    def _insert_new_channels(self, new_channels: List[Dict[str, Any]], is_from_file: bool):
+        """插入新频道：未排序时追加到末尾；处于排序状态时二分查找各自的位置插入，不重新排序"""
+        if self._active_sort is None:
+            first_row = len(self.channels)
+            self.beginInsertRows(QtCore.QModelIndex(), first_row, first_row + len(new_channels) - 1)
+            # 从文件加载的频道由存储记录原始数据
+            self.channels.extend(new_channels, from_file=is_from_file)
+            self._index_appended_rows(first_row)
+            self.endInsertRows()
+        else:
+            self._insert_sorted(new_channels, is_from_file)
+        # 更新名称和分组缓存
+        for ch in new_channels:
+            if 'name' in ch:
+                self._name_cache.add(ch['name'])
+            for g in ch.get('_groups', [ch.get('group', '')]):
+                if g:
+                    self._group_cache.add(g)
+
+    def _insert_sorted(self, new_channels: List[Dict[str, Any]], is_from_file: bool):
+        key_of, reverse = self._active_sort
+        store = self.channels
+        keyed = [(key_of(record), record) for record in store.detach_new(new_channels, is_from_file)]
+        keyed.sort(key=lambda item: item[0], reverse=reverse)
+
+        # 新行之间已有序，每次查找从上一个位置开始；位置相同的新行连成一段一起插入
+        runs = []
+        position = 0
+        for key, record in keyed:
+            position = store.insertion_point(key_of, key, reverse, position)
+            if runs and runs[-1][0] == position:
+                runs[-1][1].append(record)
+            else:
+                runs.append((position, [record]))
+
+        self._invalidate_url_index()
+        if len(runs) > _SORTED_INSERT_MAX_RUNS:
             self.beginResetModel()
-            self.channels.extend(new_channels)
-            for ch in new_channels:
-                if 'name' in ch:
-                    self._name_cache.add(ch['name'])
-                for g in ch.get('_groups', [ch.get('group', '')]):
-                    if g:
-                        self._group_cache.add(g)
-            for idx, ch in updates:
-                self.channels[idx].update(ch)
+            for position, records in reversed(runs):
+                for record in reversed(records):
+                    store.insert(position, record)
             self.endResetModel()
+            return
+        inserted = 0
+        for position, records in runs:
+            first_row = position + inserted
+            self.beginInsertRows(QtCore.QModelIndex(), first_row, first_row + len(records) - 1)
+            for offset, record in enumerate(records):
+                store.insert(first_row + offset, record)
+            self.endInsertRows()
+            inserted += len(records)
+
+    def _keep_row_sorted(self, row: int) -> int:
+        """行内容变化后维持排序状态，返回该行的新行号
+
+        键仍落在相邻两行之间时不动；否则二分查找新位置，用 beginMoveRows 移过去，
+        其余行序不变，后续新增频道仍可二分插入。
+        """
+        if self._active_sort is None or not (0 <= row < len(self.channels)):
+            return row
+        key_of, reverse = self._active_sort
+        store = self.channels
+        key = key_of(store[row])
+
+        def precedes(a, b):
+            return b < a if reverse else a < b
+
+        if row > 0 and precedes(key, key_of(store[row - 1])):
+            target = store.insertion_point(key_of, key, reverse, 0, row)
+            dest = target
+        elif row + 1 < len(store) and precedes(key_of(store[row + 1]), key):
+            target = store.insertion_point(key_of, key, reverse, row + 1) - 1
+            dest = target + 1
         else:
-            if new_channels:
-                self.beginInsertRows(QtCore.QModelIndex(), len(self.channels), len(self.channels) + len(new_channels) - 1)
-                self.channels.extend(new_channels)
-                for ch in new_channels:
-                    if 'name' in ch:
-                        self._name_cache.add(ch['name'])
-                    for g in ch.get('_groups', [ch.get('group', '')]):
-                        if g:
-                            self._group_cache.add(g)
-                self.endInsertRows()
-            for idx, ch in updates:
-                self.update_channel(idx, ch)
-        if is_from_file:
-            for ch in new_channels:
-                url = ch.get('url', '')
-                if url:
-                    self._original_channel_data[url] = {
-                        'name': ch.get('name', ''),
-                        'group': ch.get('group', '未分类'),
-                        'tvg_id': ch.get('tvg_id', ''),
-                        'logo': ch.get('logo', ''),
-                        'resolution': ch.get('resolution', ''),
-                        'tvg_chno': ch.get('tvg_chno', ''),
-                        'tvg_shift': ch.get('tvg_shift', ''),
-                        'catchup': ch.get('catchup', ''),
-                        'catchup_days': ch.get('catchup_days', ''),
-                        'catchup_source': ch.get('catchup_source', ''),
-                        'url': url,
-                    }
+            return row
+        self.beginMoveRows(QtCore.QModelIndex(), row, row, QtCore.QModelIndex(), dest)
+        store.insert(target, store.pop(row))
+        self.endMoveRows()
+        return target
 
     def hide_invalid(self):
         """隐藏无效频道"""
-        if not hasattr(self, '_original_channels'):
-            self._original_channels = self.channels.copy()
+        if self._hidden_order is None:
+            self._hidden_order = self.channels.order_snapshot()
         self.beginResetModel()
-        self.channels = [c for c in self.channels if c.get('valid') is not False]
+        self.channels.retain(lambda c: c.get('valid') is not False)
         self._is_hiding_invalid = True
         self.endResetModel()
 
     def show_all(self):
         """显示所有频道"""
         self.beginResetModel()
-        # 重新加载所有频道数据
-        if hasattr(self, '_original_channels'):
-            self.channels = self._original_channels.copy()
+        # 恢复隐藏前的行序（隐藏期间的修改保留）
+        if self._hidden_order is not None:
+            self.channels.restore_order(self._hidden_order)
+            self._hidden_order = None
+            self._active_sort = None
         self._is_hiding_invalid = False
         self.endResetModel()
 
@@ -666,7 +996,7 @@ class ChannelListModel(QtCore.QAbstractTableModel):
                 continue
 
             # 检查是否有原始数据可用
-            original_channel = self._original_channel_data.get(url)
+            original_channel = channel.original()
 
             if original_channel:
                 # 使用原始数据，但保留有效性检测结果
@@ -781,7 +1111,7 @@ class ChannelListModel(QtCore.QAbstractTableModel):
             if not url:
                 continue
 
-            original_channel = self._original_channel_data.get(url)
+            original_channel = channel.original()
 
             if original_channel:
                 channel_name = original_channel.get('name', channel.get('name', ''))
@@ -968,86 +1298,63 @@ class ChannelListModel(QtCore.QAbstractTableModel):
 
         self.beginRemoveRows(parent, row, row)
 
-        self.channels.pop(row)
-
         if 'name' in channel:
             self._name_cache.discard(channel['name'])
         for g in channel.get('_groups', [channel.get('group', '')]):
             if g:
                 self._group_cache.discard(g)
 
+        del self.channels[row]
+
         self.endRemoveRows()
         return True
 
     def set_channel_valid(self, url: str, valid: bool = True) -> bool:
         """设置频道的有效性状态"""
-        for i, channel in enumerate(self.channels):
-            if channel.get('url') == url:
-                self.channels[i]['valid'] = valid
-                self.channels[i]['status'] = '有效' if valid else '无效'
-
-                # 通知视图更新特定行
-                top_left = self.index(i, 0)
-                bottom_right = self.index(i, self.columnCount() - 1)
-                self.dataChanged.emit(
-                    top_left, bottom_right,
-                    [QtCore.Qt.ItemDataRole.DisplayRole,
-                     QtCore.Qt.ItemDataRole.BackgroundRole,
-                     QtCore.Qt.ItemDataRole.ForegroundRole]
-                )
-                return True
-        return False
+        i = self.find_row_by_url(url)
+        if i < 0:
+            return False
+        self.channels[i]['valid'] = valid
+        self.channels[i]['status'] = '有效' if valid else '无效'
+        self.mark_row_changed(i, ('valid', 'status'))
+        self._keep_row_sorted(i)
+        return True
 
     def update_channel_by_url(self, url: str, channel_info: Dict[str, Any]) -> bool:
         """根据URL更新频道信息"""
-        for i, channel in enumerate(self.channels):
-            if channel.get('url') == url:
-                # 记录原始数据用于调试
-                old_name = channel.get('name', '')
-                old_group = channel.get('group', '')
-                old_groups = channel.get('_groups', [])
-
-                # 更新频道数据
-                self.channels[i].update(channel_info)
-
-                # 同时更新原始数据存储（如果存在）
-                if url in self._original_channel_data:
-                    # 更新原始数据存储中的对应频道
-                    original_channel = self._original_channel_data[url]
-                    # 只更新原始数据中存在的字段
-                    for key in ['name', 'group', 'logo', 'tvg_id', 'resolution',
-                                'tvg_chno', 'tvg_shift', 'catchup', 'catchup_days', 'catchup_source']:
-                        if key in channel_info:
-                            original_channel[key] = channel_info[key]
-
-                # 更新名称和分组缓存
-                if 'name' in channel_info:
-                    self._name_cache.add(channel_info['name'])
-                    if old_name and old_name != channel_info['name']:
-                        self._name_cache.discard(old_name)
-                for g in channel_info.get('_groups', [channel_info.get('group', '')]):
-                    if g:
-                        self._group_cache.add(g)
-                for g in old_groups:
-                    if g:
-                        self._group_cache.discard(g)
-
-                # 发送数据变化信号，确保特定行更新 - 使用更全面的角色列表
-                top_left = self.index(i, 0)
-                # 使用实际列数而不是逻辑列数
-                bottom_right = self.index(i, len(self.headers) - 1)
-                self.dataChanged.emit(top_left, bottom_right, [
-                    QtCore.Qt.ItemDataRole.DisplayRole,
-                    QtCore.Qt.ItemDataRole.DecorationRole,
-                    QtCore.Qt.ItemDataRole.BackgroundRole,
-                    QtCore.Qt.ItemDataRole.ForegroundRole
-                ])
+        i = self.find_row_by_url(url)
+        if i < 0:
+            return False
+        channel = self.channels[i]
+        # 记录原始数据用于调试
+        old_name = channel.get('name', '')
+        old_group = channel.get('group', '')
+        old_groups = channel.get('_groups', [])
 
-                # 强制刷新整个视图以确保所有列都更新
-                self.layoutChanged.emit()
+        # 更新频道数据
+        self.channels[i].update(channel_info)
+        if channel_info.get('url', url) != url:
+            self._invalidate_url_index()
 
-                return True
-        return False
+        # 这些字段的原始数据同步为新值
+        channel.sync_original(key for key in _SYNCED_ORIGINAL_FIELDS if key in channel_info)
+
+        # 更新名称和分组缓存
+        if 'name' in channel_info:
+            self._name_cache.add(channel_info['name'])
+            if old_name and old_name != channel_info['name']:
+                self._name_cache.discard(old_name)
+        for g in channel_info.get('_groups', [channel_info.get('group', '')]):
+            if g:
+                self._group_cache.add(g)
+        for g in old_groups:
+            if g:
+                self._group_cache.discard(g)
+
+        # 登记变化，合并到下一帧的 dataChanged
+        self.mark_row_changed(i, channel_info.keys())
+        self._keep_row_sorted(i)
+        return True
 
     def update_channel(self, index: int, new_channel: Dict[str, Any]) -> bool:
         """更新指定索引的频道数据"""
@@ -1067,16 +1374,11 @@ class ChannelListModel(QtCore.QAbstractTableModel):
 
         # 更新频道数据
         self.channels[index].update(new_channel)
+        if new_channel.get('url', url) != url:
+            self._invalidate_url_index()
 
-        # 同时更新原始数据存储（如果存在）
-        if url in self._original_channel_data:
-            # 更新原始数据存储中的对应频道
-            original_channel = self._original_channel_data[url]
-            # 只更新原始数据中存在的字段
-            for key in ['name', 'group', 'logo', 'tvg_id', 'resolution',
-                        'tvg_chno', 'tvg_shift', 'catchup', 'catchup_days', 'catchup_source']:
-                if key in new_channel:
-                    original_channel[key] = new_channel[key]
+        # 这些字段的原始数据同步为新值
+        channel.sync_original(key for key in _SYNCED_ORIGINAL_FIELDS if key in new_channel)
 
         # 更新名称和分组缓存
         if 'name' in new_channel:
@@ -1090,34 +1392,17 @@ class ChannelListModel(QtCore.QAbstractTableModel):
             if g:
                 self._group_cache.discard(g)
 
-        # 发送数据变化信号，确保特定行更新
-        top_left = self.index(index, 0)
-        bottom_right = self.index(index, self.columnCount() - 1)
-        self.dataChanged.emit(
-            top_left, bottom_right,
-            [QtCore.Qt.ItemDataRole.DisplayRole,
-             QtCore.Qt.ItemDataRole.DecorationRole,
-             QtCore.Qt.ItemDataRole.BackgroundRole,
-             QtCore.Qt.ItemDataRole.ForegroundRole]
-            )
-
-        # 强制刷新整个视图以确保所有列都更新
-        self.layoutChanged.emit()
+        # 登记变化，合并到下一帧的 dataChanged
+        self.mark_row_changed(index, new_channel.keys())
+        self._keep_row_sorted(index)
         return True
 
     def update_view(self):
-        """批量更新视图"""
+        """批量更新视图：整表发出一次 dataChanged（不触发布局重建）"""
+        self._discard_changes()
+        self._row_cache = {}
         if self.channels:
-            top_left = self.index(0, 0)
-            bottom_right = self.index(len(self.channels)-1, len(self.headers)-1)
-            self.dataChanged.emit(
-                top_left, bottom_right,
-                [QtCore.Qt.ItemDataRole.DisplayRole,
-                 QtCore.Qt.ItemDataRole.DecorationRole,
-                 QtCore.Qt.ItemDataRole.BackgroundRole,
-                 QtCore.Qt.ItemDataRole.ForegroundRole]
-                )
-            self.layoutChanged.emit()
+            self._emit_data_changed(0, len(self.channels) - 1, (0, self.columnCount() - 1))
 
     def sort_channels(self, sort_config=None):
         """智能排序频道列表"""
@@ -1130,143 +1415,87 @@ class ChannelListModel(QtCore.QAbstractTableModel):
 
     def _smart_sort(self):
         """默认智能排序算法"""
-        # 定义组名优先级顺序
-        group_priority = {
-            '央视频道': 0,
-            'CETV': 1,
-            'CGTN': 2,
-            '卫视': 3,
-            '国际频道': 4,
-            '特色频道': 5,
-            '山东频道': 6,
-            '市级频道': 7,
-            '滨州': 8,
-            '德州': 9,
-            '东营': 10,
-            '菏泽': 11,
-            '济南': 12,
-            '济宁': 13,
-            '聊城': 14,
-            '临沂': 15,
-            '青岛': 16,
-            '日照': 17,
-            '泰安': 18,
-            '威海': 19,
-            '潍坊': 20,
-            '烟台': 21,
-            '淄博': 22
-        }
-
-        # 使用类方法解析分辨率（避免重复定义）
-
-        def get_cctv_number(name):
-            """解析CCTV频道编号"""
-            if not name:
-                return 999
-
-            # 定义精确的频道顺序
-            cctv_order = [
-                'CCTV-1 综合',
-                'CCTV-2 财经',
-                'CCTV-3 综艺',
-                'CCTV-4 (亚洲)',
-                'CCTV-4 (欧洲)',
-                'CCTV-4 (美洲)',
-                'CCTV-5 体育',
-                'CCTV-5+ 体育赛事',
-                'CCTV-6 电影',
-                'CCTV-7 国防军事',
-                'CCTV-8 电视剧',
-                'CCTV-9 纪录',
-                'CCTV-10 科教',
-                'CCTV-11 戏曲',
-                'CCTV-12 社会与法',
-                'CCTV-13 新闻',
-                'CCTV-14 少儿',
-                'CCTV-15 音乐',
-                'CCTV-16 奥林匹克',
-                'CCTV-17 农业农村',
-                'CCTV-4K 超高清',
-                'CCTV-8K 超高清',
-                'CCTV-中视购物',
-                '央广购物'
-            ]
-
-            # 查找频道在顺序列表中的位置
-            for i, channel_name in enumerate(cctv_order):
-                if channel_name in name:  # 部分匹配
-                    return i
-
-            # 非CCTV频道或未匹配的频道
-            return 999
-
-        def get_group_priority(group):
-            """获取组名优先级"""
-            if not group:
-                return len(group_priority) + 1  # 未分类的组放在最后
-            for key in group_priority:
-                if key in group:  # 部分匹配
-                    return group_priority[key]
-            return len(group_priority) + 1  # 未匹配的组放在最后
-
-        # 开始排序
+        # 先按分辨率分组(1920x1080及以上为一组)，再按组优先级、CCTV 频道顺序、频道名称
+        key_of = self.channels.cached_key('smart', self._smart_sort_key)
         self.beginResetModel()
+        self.channels.sort(key=key_of)
+        self._active_sort = (key_of, False)
+        self.endResetModel()
 
-        # 先按分辨率分组(1920x1080及以上为一组)
-        hd_threshold = 1920 * 1080
-        self.channels.sort(key=lambda x: (
-            self._get_resolution_value(x.get('resolution', '')) < hd_threshold,  # False(高分辨率)在前
-            get_group_priority(x.get('group', '')),  # 按组优先级
-            get_cctv_number(x.get('name', '')) if '央视频道' in x.get('group', '') else 0,  # CCTV频道特殊排序
-            x.get('name', '')  # 按频道名称字母顺序
-        ))
+    def _smart_sort_key(self, channel):
+        group = channel.get('group', '')
+        name = channel.get('name', '')
+        return (
+            self._get_resolution_value(channel.get('resolution', '')) < self._SMART_HD_THRESHOLD,  # False(高分辨率)在前
+            self._smart_group_priority(group),  # 按组优先级
+            self._cctv_number(name) if '央视频道' in group else 0,  # CCTV频道特殊排序
+            name  # 按频道名称字母顺序
+        )
 
-        self.endResetModel()
+    def _smart_group_priority(self, group):
+        """获取组名优先级（部分匹配），未分类/未匹配的组放在最后"""
+        if group:
+            for key, priority in self._SMART_GROUP_PRIORITY.items():
+                if key in group:
+                    return priority
+        return len(self._SMART_GROUP_PRIORITY) + 1
+
+    def _cctv_number(self, name):
+        """解析CCTV频道在固定顺序中的位置（部分匹配），非CCTV频道或未匹配的返回 999"""
+        if name:
+            for i, channel_name in enumerate(self._CCTV_ORDER):
+                if channel_name in name:
+                    return i
+        return 999
 
     def _multi_condition_sort(self, sort_config):
         """多条件排序算法"""
         self.beginResetModel()
+        self._active_sort = None
 
         # 检查是否是映射文件顺序排序
         if sort_config.get('primary', {}).get('field') == 'mapping_order':
             # 映射文件顺序排序
             self._sort_by_mapping_order()
         else:
-            # 构建排序键函数
+            # 处理三个优先级，每个条件的排序值各自缓存在行旁
+            getters = []
+            for priority in ['primary', 'secondary', 'tertiary']:
+                if priority in sort_config:
+                    field_config = sort_config[priority]
+                    getters.append(self._condition_sort_key(
+                        field_config['field'], field_config['method'], sort_config.get('group_priority', [])))
+
             def get_sort_key(channel):
-                key = []
-
-                # 处理三个优先级
-                for priority in ['primary', 'secondary', 'tertiary']:
-                    if priority in sort_config:
-                        field_config = sort_config[priority]
-                        field = field_config['field']
-                        method = field_config['method']
-
-                        # 根据字段和方法获取排序值
-                        if field == 'group':
-                            value = self._get_group_sort_value(channel.get('group', ''),
-                                                               method, sort_config.get('group_priority', []))
-                        elif field == 'name':
-                            value = self._get_name_sort_value(channel.get('name', ''), method)
-                        elif field == 'resolution':
-                            value = self._get_resolution_sort_value(channel.get('resolution', ''), method)
-                        elif field == 'latency':
-                            value = self._get_latency_sort_value(channel.get('latency', ''), method)
-                        elif field == 'status':
-                            value = self._get_status_sort_value(channel.get('status', ''), method)
-                        else:
-                            value = channel.get(field, '')
-
-                        key.append(value)
-
-                return tuple(key)
+                return tuple(getter(channel) for getter in getters)
 
             # 执行排序
             self.channels.sort(key=get_sort_key)
+            self._active_sort = (get_sort_key, False)
 
         self.endResetModel()
 
+    def _condition_sort_key(self, field, method, group_priority):
+        """多条件排序中单个条件的 行 → 排序值 函数"""
+        if field == 'group':
+            name = ('group', method, tuple(group_priority) if method == 'custom' else None)
+            compute = lambda ch: self._get_group_sort_value(ch.get('group', ''), method, group_priority)
+        elif field == 'name':
+            name = ('name', method)
+            compute = lambda ch: self._get_name_sort_value(ch.get('name', ''), method)
+        elif field == 'resolution':
+            name = ('resolution', method)
+            compute = lambda ch: self._get_resolution_sort_value(ch.get('resolution', ''), method)
+        elif field == 'latency':
+            name = ('latency', method)
+            compute = lambda ch: self._get_latency_sort_value(ch.get('latency', ''), method)
+        elif field == 'status':
+            name = ('status', method)
+            compute = lambda ch: self._get_status_sort_value(ch.get('status', ''), method)
+        else:
+            return lambda ch: ch.get(field, '')
+        return self.channels.cached_key(name, compute)
+
     def _sort_by_mapping_order(self):
         """按映射文件顺序排序"""
         try:
@@ -1299,6 +1528,7 @@ class ChannelListModel(QtCore.QAbstractTableModel):
 
             # 执行排序
             self.channels.sort(key=get_mapping_order)
+            self._active_sort = (get_mapping_order, False)
 
         except Exception as e:
             logger.error(f"按映射文件顺序排序失败: {str(e)}", exc_info=True)
@@ -1494,12 +1724,26 @@ class ChannelListModel(QtCore.QAbstractTableModel):
     def _natural_sort_key(self, s):
         """自然排序键函数，将字符串中的数字部分转换为整数用于排序"""
         if not s:
-            return []
+            return ()
 
-        import re
         # 将字符串分割为字母和数字部分
-        return [int(text) if text.isdigit() else text.lower()
-                for text in re.split(r'(\d+)', str(s))]
+        return tuple(int(text) if text.isdigit() else text.lower()
+                     for text in _DIGITS_RE.split(str(s)))
+
+    def _column_sort_key(self, column):
+        """按列排序的 行 → 排序键 函数，键缓存在行旁"""
+        if column == self.COL_RESOLUTION:
+            compute = lambda ch: self._get_resolution_value(ch.get('resolution', ''))
+        elif column == self.COL_STATUS:
+            compute = lambda ch: self._get_status_value(ch.get('status', ''))
+        elif column == self.COL_LATENCY:
+            compute = lambda ch: self._get_latency_value(ch.get('latency', ''))
+        elif column == self.COL_LOGO:
+            compute = lambda ch: self._natural_sort_key(ch.get('logo', ch.get('logo_url', '')))
+        else:
+            field = self.COLUMN_FIELD_MAP[column]
+            compute = lambda ch: self._natural_sort_key(ch.get(field, ''))
+        return self.channels.cached_key(('column', column), compute)
 
     def sort(self, column: int, order: QtCore.Qt.SortOrder = QtCore.Qt.SortOrder.AscendingOrder):
         """按列排序频道列表"""
@@ -1510,60 +1754,104 @@ class ChannelListModel(QtCore.QAbstractTableModel):
         self._sort_column = column
         self._sort_order = order
 
-        # 开始排序
         self.beginResetModel()
+        if column == 0:  # 序号列 - 不排序，保持原样
+            self._active_sort = None
+        else:
+            key_of = self._column_sort_key(column)
+            reverse = order == QtCore.Qt.SortOrder.DescendingOrder
+            self.channels.sort(key=key_of, reverse=reverse)
+            self._active_sort = (key_of, reverse)
+        self.endResetModel()
+
+    def load_from_path(self, file_path: str, on_finished=None) -> None:
+        """流式加载播放列表文件
 
-        # 根据列索引选择排序键函数
-        if column == 0:  # 序号列 - 按原始顺序
-            # 序号列不排序，保持原样
-            pass
-        elif column == 1:  # 频道名称
-            self.channels.sort(key=lambda x: self._natural_sort_key(x.get('name', '')),
-                               reverse=(order == QtCore.Qt.SortOrder.DescendingOrder))
-        elif column == 2:  # 分辨率
-            self.channels.sort(key=lambda x: self._get_resolution_value(x.get('resolution', '')),
-                               reverse=(order == QtCore.Qt.SortOrder.DescendingOrder))
-        elif column == 3:  # URL
-            self.channels.sort(key=lambda x: self._natural_sort_key(x.get('url', '')),
-                               reverse=(order == QtCore.Qt.SortOrder.DescendingOrder))
-        elif column == 4:  # 分组
-            self.channels.sort(key=lambda x: self._natural_sort_key(x.get('group', '')),
-                               reverse=(order == QtCore.Qt.SortOrder.DescendingOrder))
-        elif column == 5:  # Logo地址
-            self.channels.sort(key=lambda x: self._natural_sort_key(x.get('logo', x.get('logo_url', ''))),
-                               reverse=(order == QtCore.Qt.SortOrder.DescendingOrder))
-        elif column == 6:  # 状态
-            self.channels.sort(key=lambda x: self._get_status_value(x.get('status', '')),
-                               reverse=(order == QtCore.Qt.SortOrder.DescendingOrder))
-        elif column == 7:  # 延迟(ms)
-            self.channels.sort(key=lambda x: self._get_latency_value(x.get('latency', '')),
-                               reverse=(order == QtCore.Qt.SortOrder.DescendingOrder))
-        elif column == 8:  # TVG-ID
-            self.channels.sort(key=lambda x: self._natural_sort_key(x.get('tvg_id', '')),
-                               reverse=(order == QtCore.Qt.SortOrder.DescendingOrder))
-        elif column == 9:  # TVG频道号
-            # TVG频道号可能是数字，使用自然排序
-            self.channels.sort(key=lambda x: self._natural_sort_key(x.get('tvg_chno', '')),
-                               reverse=(order == QtCore.Qt.SortOrder.DescendingOrder))
-        elif column == 10:  # TVG时移
-            self.channels.sort(key=lambda x: self._natural_sort_key(x.get('tvg_shift', '')),
-                               reverse=(order == QtCore.Qt.SortOrder.DescendingOrder))
-        elif column == 11:  # 回看
-            self.channels.sort(key=lambda x: self._natural_sort_key(x.get('catchup', '')),
-                               reverse=(order == QtCore.Qt.SortOrder.DescendingOrder))
-        elif column == 12:  # 回看天数
-            # 回看天数可能是数字，使用自然排序
-            self.channels.sort(key=lambda x: self._natural_sort_key(x.get('catchup_days', '')),
-                               reverse=(order == QtCore.Qt.SortOrder.DescendingOrder))
-        elif column == 13:  # 回看源
-            self.channels.sort(key=lambda x: self._natural_sort_key(x.get('catchup_source', '')),
-                               reverse=(order == QtCore.Qt.SortOrder.DescendingOrder))
+        文件按块读取、边解码边解析，频道分批插入模型，第一批到达即可显示；
+        完成后调用 on_finished(成功与否)。文件不存在时抛出 FileNotFoundError。
+        """
+        from services.m3u_parser import M3UStreamParser, iter_m3u_file_lines
+        lines = iter_m3u_file_lines(file_path)
+        parser = M3UStreamParser()
+        self._source_file_path = file_path
+        self.load_from_stream(parser, parser.iter_batches(lines), on_finished)
 
+    def load_from_stream(self, parser, batches: Iterable[List[Dict[str, Any]]], on_finished=None) -> None:
+        """清空模型后分批插入解析出的频道
+
+        每个事件循环周期最多占用 _STREAM_SLICE_SECONDS，之后让出给界面绘制；
+        再次调用 load_from_stream/load_from_file 会中止尚未完成的加载。
+        """
+        self._stream_load_id += 1
+        load_id = self._stream_load_id
+        self.beginResetModel()
+        self.channels = []
+        self._name_cache = set()
+        self._group_cache = set()
+        self._original_file_content = ""
         self.endResetModel()
 
+        batches = iter(batches)
+        seen_urls = set()
+
+        def finish(success: bool):
+            self._last_header_attrs = parser.header_attrs
+            if success:
+                if self.update_status_label:
+                    self.update_status_label("请点击检测有效性按钮")
+                view = self.parent()
+                if view and hasattr(view, 'resizeColumnsToContents'):
+                    view.resizeColumnsToContents()
+                logger.info(f"频道模型-流式加载完成，共 {len(self.channels)} 个频道")
+            if on_finished:
+                on_finished(success)
+
+        def pump():
+            if load_id != self._stream_load_id:
+                return
+            deadline = time.perf_counter() + _STREAM_SLICE_SECONDS
+            try:
+                while time.perf_counter() < deadline:
+                    batch = next(batches, None)
+                    if batch is None:
+                        finish(True)
+                        return
+                    self._append_stream_batch(batch, seen_urls)
+            except Exception as e:
+                logger.error(f"频道模型-流式加载频道列表失败: {e}", exc_info=True)
+                finish(False)
+                return
+            QtCore.QTimer.singleShot(0, pump)
+
+        pump()
+
+    def _append_stream_batch(self, batch: List[Dict[str, Any]], seen_urls: set):
+        new_channels = []
+        for channel in batch:
+            url = channel.get('url')
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+            new_channels.append(channel)
+        if not new_channels:
+            return
+        first_row = len(self.channels)
+        self.beginInsertRows(QtCore.QModelIndex(), first_row, first_row + len(new_channels) - 1)
+        self.channels.extend(new_channels, from_file=True)
+        self._index_appended_rows(first_row)
+        for channel in new_channels:
+            if 'name' in channel:
+                self._name_cache.add(channel['name'])
+            for g in channel.get('_groups', [channel.get('group', '')]):
+                if g:
+                    self._group_cache.add(g)
+        self.endInsertRows()
+
     def load_from_file(self, content: str) -> bool:
         """从文件内容加载频道列表"""
         try:
+            # 中止尚未完成的流式加载
+            self._stream_load_id += 1
             # 保存原始文件内容
             self._original_file_content = content
 
@@ -1572,41 +1860,23 @@ class ChannelListModel(QtCore.QAbstractTableModel):
             self.channels = []
             self._name_cache = set()
             self._group_cache = set()
-            # 清空原始数据存储
-            self._original_channel_data = {}
 
             channels = self.parse_file_content(content)
             if channels is None:
                 self.endResetModel()
                 return False
 
+            seen_urls = set()
             for channel in channels:
-                existing_index = -1
-                for i, ch in enumerate(self.channels):
-                    if ch.get('url') == channel.get('url'):
-                        existing_index = i
-                        break
-                if existing_index >= 0:
+                if channel.get('url') in seen_urls:
                     continue
-                self.channels.append(channel)
+                seen_urls.add(channel.get('url'))
+                self.channels.append(channel, from_file=True)
                 if 'name' in channel:
                     self._name_cache.add(channel['name'])
                 for g in channel.get('_groups', [channel.get('group', '')]):
                     if g:
                         self._group_cache.add(g)
-                url = channel.get('url', '')
-                if url:
-                    original_channel = {
-                        'name': channel.get('name', ''),
-                        'group': channel.get('group', ''),
-                        'tvg_id': channel.get('tvg_id', ''),
-                        'logo': channel.get('logo', ''),
-                        'resolution': channel.get('resolution', ''),
-                        'url': url,
-                        '_raw_extinf': channel.get('_raw_extinf', ''),
-                        '_all_tags': channel.get('_all_tags', {}),
-                    }
-                    self._original_channel_data[url] = original_channel
 
             # 通知UI更新状态标签 - 使用QTimer确保在主线程执行
             if hasattr(self, 'update_status_label') and self.update_status_label:
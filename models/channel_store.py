@@ -0,0 +1,562 @@
+"""
+列式频道存储
+
+频道原本是每行一个 dict（15~30 个字符串键），20 万行时仅键表和重复的分组/分辨率/
+状态字符串就要占用数百 MB。ChannelStore 按列保存：
+- 常用字段各占一列（list，每行一个引用），分组/编码/分辨率/状态等低基数字段驻留（intern）
+- _all_tags 与 _raw_extinf 可相互推导时只保存 _raw_extinf，读取时再解析
+- 不常见的字段放在按行稀疏的 dict 中，只有出现时才分配
+- 从文件加载的行，其原始字段在被直接改写时才另存一份（写时复制），
+  取代过去每个 URL 一份的原始数据副本
+
+对外仍是“频道 dict 的列表”：ChannelStore 实现可变序列协议，元素是 ChannelRecord
+视图（实现可变映射协议，只持有存储与槽位号），现有的 ch.get()/ch[...] = ... 代码不需要改动。
+需要真正的 dict（JSON 序列化、交给主窗口）时用 to_dict()/to_dicts()。
+
+行序由独立的槽位数组维护，排序/移动只重排该数组。del 删除的槽位清空后进入空闲表，
+之后新增的行优先复用，反复删除、添加不会让各列无限增长；pop 取出的行与 list.pop
+一样可以再插回（保留原始字段等全部状态），没有插回就被丢弃时其槽位同样释放。
+槽位每次释放代次加一，视图记下创建时的代次，行被删除后再通过旧视图读写会抛出
+RuntimeError，不会读到或改写复用该槽位的另一个频道。
+
+_groups 与 _all_tags 在存储中是元组/可推导的标记，读取时每次得到新的 list/dict；
+通过 ChannelRecord 取到的这两个值被原地修改（append、tags[k] = v 等）时会写回该行，
+与普通 dict 行的行为一致。
+
+排序键（自然排序键、智能排序键等）按名称各占一列缓存在行旁，该行任一字段被写入或
+删除时失效，反复排序和有序插入时不必重新计算。
+"""
+
+import sys
+from array import array
+from collections.abc import Mapping, MutableMapping, MutableSequence
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from services.m3u_parser import extinf_tags
+
+
+# 列值：该行没有这个键
+_MISSING = object()
+# _all_tags 列的值：可由 _raw_extinf 解析得到，不单独保存
+_DERIVED = object()
+
+# 槽位状态
+_SLOT_FREED = 0
+_SLOT_IN_USE = 1
+_SLOT_DETACHED = 2
+
+COLUMNS = (
+    'id', 'name', 'url', 'logo', 'group', '_groups', 'tvg_id', 'tvg_chno', 'tvg_shift',
+    'catchup', 'catchup_days', 'catchup_source', 'catchup_correction', 'fcc',
+    'resolution', 'codec', 'bitrate', 'valid', 'status', 'latency',
+    'quality_score', 'quality_grade', 'raw_name', 'needs_details', 'source',
+    '_raw_extinf', '_all_tags',
+)
+_COLUMN_INDEX = {name: i for i, name in enumerate(COLUMNS)}
+_GROUPS_COL = _COLUMN_INDEX['_groups']
+_RAW_EXTINF_COL = _COLUMN_INDEX['_raw_extinf']
+_ALL_TAGS_COL = _COLUMN_INDEX['_all_tags']
+
+# 取值种类很少的列，字符串驻留后所有行共享同一个对象
+_INTERNED = frozenset(_COLUMN_INDEX[name] for name in (
+    'group', 'tvg_shift', 'catchup', 'catchup_days', 'catchup_correction',
+    'resolution', 'codec', 'status', 'quality_grade', 'source',
+))
+
+# 导出时使用的文件原始字段
+ORIGINAL_FIELDS = (
+    'name', 'group', 'tvg_id', 'logo', 'resolution', 'tvg_chno', 'tvg_shift',
+    'catchup', 'catchup_days', 'catchup_source', 'url', '_raw_extinf', '_all_tags',
+)
+_ORIGINAL_FIELD_SET = frozenset(ORIGINAL_FIELDS)
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+def _write_back(base: type, mutators: Iterable[str]) -> type:
+    """生成 base 的子类：调用 mutators 中的方法原地修改后，把新值写回所在的行"""
+    def wrap(name):
+        method = getattr(base, name)
+
+        def mutate(self, *args, **kwargs):
+            self._store._check(self._slot, self._gen)
+            result = method(self, *args, **kwargs)
+            self._store._write(self._slot, self._key, base(self))
+            return result
+        mutate.__name__ = name
+        return mutate
+
+    namespace = {name: wrap(name) for name in mutators}
+    namespace['__slots__'] = ('_store', '_slot', '_gen', '_key')
+    # 拷贝、序列化时退化为普通 list/dict，不带上所在的存储
+    namespace['__reduce__'] = lambda self: (base, (base(self),))
+    return type(f'_Row{base.__name__.capitalize()}', (base,), namespace)
+
+
+_RowList = _write_back(list, (
+    'append', 'extend', 'insert', 'remove', 'pop', 'clear', 'sort', 'reverse',
+    '__setitem__', '__delitem__', '__iadd__', '__imul__',
+))
+_RowDict = _write_back(dict, (
+    '__setitem__', '__delitem__', 'pop', 'popitem', 'clear', 'update', 'setdefault', '__ior__',
+))
+
+
+class ChannelRecord(MutableMapping):
+    """ChannelStore 中一行的映射视图
+
+    持有存储、槽位号与创建时该槽位的代次；行被删除（槽位释放）后再访问抛出 RuntimeError。
+    """
+
+    __slots__ = ('_store', '_slot', '_gen')
+
+    def __init__(self, store: 'ChannelStore', slot: int):
+        self._store = store
+        self._slot = slot
+        self._gen = store._generation[slot]
+
+    def _live_slot(self) -> int:
+        self._store._check(self._slot, self._gen)
+        return self._slot
+
+    def __getitem__(self, key):
+        value = self._store._read(self._live_slot(), key, live=True)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        value = self._store._read(self._live_slot(), key, live=True)
+        return default if value is _MISSING else value
+
+    def __contains__(self, key) -> bool:
+        return self._store._read(self._live_slot(), key, derive=False) is not _MISSING
+
+    def __setitem__(self, key, value):
+        self._store._write(self._live_slot(), key, value)
+
+    def __delitem__(self, key):
+        if not self._store._delete(self._live_slot(), key):
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store._keys(self._live_slot()))
+
+    def __len__(self) -> int:
+        return len(self._store._keys(self._live_slot()))
+
+    def __repr__(self) -> str:
+        return f"ChannelRecord({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        store, slot = self._store, self._live_slot()
+        return {key: store._read(slot, key) for key in store._keys(slot)}
+
+    def copy(self) -> Dict[str, Any]:
+        return self.to_dict()
+
+    def __copy__(self) -> Dict[str, Any]:
+        return self.to_dict()
+
+    def __deepcopy__(self, memo) -> Dict[str, Any]:
+        import copy
+        return copy.deepcopy(self.to_dict(), memo)
+
+    def __reduce__(self):
+        return dict, (self.to_dict(),)
+
+    def original(self) -> Optional[Dict[str, Any]]:
+        """从文件加载时的原始字段（未从文件加载的行返回 None）"""
+        return self._store._original(self._live_slot())
+
+    def sync_original(self, keys: Iterable[str]):
+        """让这些字段的原始值跟随当前值（编辑/映射更新时调用）"""
+        shadow = self._store._shadow.get(self._live_slot())
+        if not shadow:
+            return
+        for key in keys:
+            shadow.pop(key, None)
+        if not shadow:
+            del self._store._shadow[self._slot]
+
+
+class _DetachedRecord(ChannelRecord):
+    """pop/detach_new 返回的行：没有插回存储就被丢弃时释放其槽位"""
+
+    __slots__ = ()
+
+    def __del__(self):
+        # 同一槽位之后又被 pop 时由最近一次返回的行负责
+        store = self._store
+        if store._detached.get(self._slot) == id(self):
+            store._free(self._slot)
+
+
+class ChannelStore(MutableSequence):
+    """按列保存的频道序列，元素为 ChannelRecord"""
+
+    def __init__(self, channels: Iterable[Mapping] = (), from_file: bool = False):
+        self._columns: List[list] = [[] for _ in COLUMNS]
+        self._extra: Dict[int, Dict[str, Any]] = {}
+        self._shadow: Dict[int, Dict[str, Any]] = {}
+        self._from_file = bytearray()
+        self._live = bytearray()
+        # 已释放、可复用的槽位；槽位每释放一次代次加一，行序快照据此识别被复用的槽位
+        self._free_slots: List[int] = []
+        self._generation = array('I')
+        # 已取出、尚未插回的槽位 → 负责释放它的 _DetachedRecord（id）
+        self._detached: Dict[int, int] = {}
+        self._order = array('q')
+        # 排序键缓存：键名 → 按槽位的值列（_MISSING 表示未计算或已失效）
+        self._sort_keys: Dict[Any, list] = {}
+        if channels:
+            self.extend(channels, from_file=from_file)
+
+    # ---------------- 序列协议 ----------------
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [ChannelRecord(self, slot) for slot in self._order[index]]
+        return ChannelRecord(self, self._order[index])
+
+    def __iter__(self) -> Iterator[ChannelRecord]:
+        for slot in self._order:
+            yield ChannelRecord(self, slot)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            old_slots = self._order[index]
+            self._order[index] = array('q', (self._allocate(item) for item in value))
+            for slot in old_slots:
+                self._free(slot)
+            return
+        slot = self._order[index]
+        if isinstance(value, ChannelRecord) and value._store is self and value._slot == slot \
+                and value._gen == self._generation[slot]:
+            return
+        new_values = value.to_dict() if isinstance(value, ChannelRecord) else dict(value)
+        for key in self._keys(slot):
+            if key not in new_values:
+                self._delete(slot, key)
+        self._fill(slot, new_values)
+
+    def __delitem__(self, index):
+        slots = self._order[index] if isinstance(index, slice) else (self._order[index],)
+        del self._order[index]
+        for slot in slots:
+            self._free(slot)
+
+    def __add__(self, other) -> list:
+        return list(self) + list(other)
+
+    def __radd__(self, other) -> list:
+        return list(other) + list(self)
+
+    def __repr__(self) -> str:
+        return f"ChannelStore({len(self)} channels)"
+
+    def insert(self, index: int, value: Mapping):
+        self._order.insert(index, self._allocate(value))
+
+    def append(self, value: Mapping, from_file: bool = False):
+        self._order.append(self._allocate(value, from_file))
+
+    def extend(self, values: Iterable[Mapping], from_file: bool = False):
+        allocate = self._allocate
+        self._order.extend(allocate(value, from_file) for value in values)
+
+    def pop(self, index: int = -1) -> ChannelRecord:
+        """移除并返回该行；返回的行插回本存储时沿用原槽位，未插回就被丢弃时释放槽位"""
+        slot = self._order.pop(index)
+        self._live[slot] = _SLOT_DETACHED
+        record = _DetachedRecord(self, slot)
+        self._detached[slot] = id(record)
+        return record
+
+    def clear(self):
+        # 代次跨 clear 保留并加一，此前的视图、快照不会对上之后新建的行
+        generation = self._generation
+        self.__init__()
+        self._generation = array('I', ((gen + 1) & 0x7FFFFFFF for gen in generation))
+
+    def detach_new(self, values: Iterable[Mapping], from_file: bool = False) -> List[ChannelRecord]:
+        """分配新行但不放入行序（与 pop 取出的行相同），之后用 insert 放到指定位置"""
+        records = []
+        for value in values:
+            slot = self._allocate(value, from_file)
+            self._live[slot] = _SLOT_DETACHED
+            record = _DetachedRecord(self, slot)
+            self._detached[slot] = id(record)
+            records.append(record)
+        return records
+
+    def sort(self, key: Callable | None = None, reverse: bool = False):
+        records = list(self)
+        records.sort(key=key, reverse=reverse)
+        self._order = array('q', (record._slot for record in records))
+
+    def reverse(self):
+        self._order.reverse()
+
+    def copy(self) -> List[ChannelRecord]:
+        """当前行的浅拷贝列表（与 list.copy 一样共享行数据）"""
+        return list(self)
+
+    # ---------------- 排序键 ----------------
+
+    def cached_key(self, name: Any, compute: Callable[[ChannelRecord], Any]) -> Callable[[ChannelRecord], Any]:
+        """返回 行 → 排序键 的函数：compute 的结果按 name 缓存，该行内容变化后重新计算"""
+        def key_of(record: ChannelRecord):
+            # 每次都从存储取列：clear() 之后旧列作废
+            column = self._sort_keys.setdefault(name, [])
+            slot = record._slot
+            if slot >= len(column):
+                column.extend([_MISSING] * (len(self._live) - len(column)))
+            value = column[slot]
+            if value is _MISSING:
+                value = column[slot] = compute(record)
+            return value
+        return key_of
+
+    def insertion_point(self, key_of: Callable[[ChannelRecord], Any], key, reverse: bool = False,
+                        lo: int = 0, hi: int | None = None) -> int:
+        """行序按 key_of 有序（reverse 为降序）时 key 在 [lo, hi) 中的插入位置
+
+        与已有行的键相等时排在它们之后，结果和把新行追加到末尾再稳定排序一致。
+        """
+        order = self._order
+        if hi is None:
+            hi = len(order)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            current = key_of(ChannelRecord(self, order[mid]))
+            if (current < key) if reverse else (key < current):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def _drop_sort_keys(self, slot: int):
+        for column in self._sort_keys.values():
+            if slot < len(column):
+                column[slot] = _MISSING
+
+    # ---------------- 批量读取 ----------------
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        return [ChannelRecord(self, slot).to_dict() for slot in self._order]
+
+    def values(self, key: str, default=None) -> Iterator[Any]:
+        """按行序逐行读取一个字段，不创建行视图"""
+        col = _COLUMN_INDEX.get(key)
+        if col is None or col in (_GROUPS_COL, _ALL_TAGS_COL):
+            for slot in self._order:
+                value = self._read(slot, key, live=True)
+                yield default if value is _MISSING else value
+            return
+        column = self._columns[col]
+        for slot in self._order:
+            value = column[slot]
+            yield default if value is _MISSING else value
+
+    # ---------------- 行序 ----------------
+
+    def order_snapshot(self) -> array:
+        """当前行序的快照：每项为 槽位 | 代次 << 32"""
+        generation = self._generation
+        return array('q', (slot | generation[slot] << 32 for slot in self._order))
+
+    def retain(self, predicate: Callable[[ChannelRecord], bool]):
+        """只保留满足条件的行；移出的行数据保留，可用 restore_order 恢复"""
+        self._order = array('q', (slot for slot in self._order if predicate(ChannelRecord(self, slot))))
+
+    def restore_order(self, snapshot: Iterable[int]):
+        """恢复到 order_snapshot 时的行序；之后删除的行跳过，之后新增的行排在末尾"""
+        seen = set()
+        order = array('q')
+        generation = self._generation
+        for entry in snapshot:
+            slot, gen = entry & 0xFFFFFFFF, entry >> 32
+            # 槽位在快照之后被释放并复用时代次不同，复用它的新行按新增行处理
+            if slot < len(self._live) and self._live[slot] == _SLOT_IN_USE \
+                    and generation[slot] == gen and slot not in seen:
+                seen.add(slot)
+                order.append(slot)
+        order.extend(slot for slot in self._order if slot not in seen)
+        self._order = order
+
+    def reorder(self, rows: Iterable[int]):
+        """按给定的行号顺序重排，未列出的行按原顺序排在后面"""
+        old = self._order
+        taken = set()
+        order = array('q')
+        for row in rows:
+            if 0 <= row < len(old) and row not in taken:
+                taken.add(row)
+                order.append(old[row])
+        order.extend(slot for row, slot in enumerate(old) if row not in taken)
+        self._order = order
+
+    # ---------------- 槽位读写 ----------------
+
+    def _allocate(self, value: Mapping, from_file: bool = False) -> int:
+        if isinstance(value, ChannelRecord) and value._store is self \
+                and self._live[value._live_slot()] == _SLOT_DETACHED:
+            self._live[value._slot] = _SLOT_IN_USE
+            self._detached.pop(value._slot, None)
+            return value._slot
+        if self._free_slots:
+            # 释放时各列已清空
+            slot = self._free_slots.pop()
+            self._live[slot] = _SLOT_IN_USE
+        else:
+            slot = len(self._live)
+            for column in self._columns:
+                column.append(_MISSING)
+            self._live.append(_SLOT_IN_USE)
+            self._from_file.append(0)
+            if slot == len(self._generation):
+                self._generation.append(0)
+        if isinstance(value, ChannelRecord):
+            self._copy_slot(slot, value._store, value._live_slot())
+        else:
+            self._fill(slot, value)
+        # 写入完成后再标记，初始值就是原始值，不产生写时副本
+        if from_file:
+            self._from_file[slot] = 1
+        return slot
+
+    def _copy_slot(self, slot: int, source: 'ChannelStore', source_slot: int):
+        for column, source_column in zip(self._columns, source._columns):
+            column[slot] = source_column[source_slot]
+        extra = source._extra.get(source_slot)
+        if extra:
+            self._extra[slot] = dict(extra)
+        shadow = source._shadow.get(source_slot)
+        if shadow:
+            self._shadow[slot] = dict(shadow)
+        self._from_file[slot] = source._from_file[source_slot]
+
+    def _fill(self, slot: int, values: Mapping):
+        # _raw_extinf 先于 _all_tags 写入，才能判断后者能否由前者推导
+        tags = _MISSING
+        for key, value in values.items():
+            if key == '_all_tags':
+                tags = value
+            else:
+                self._write(slot, key, value)
+        if tags is not _MISSING:
+            self._write(slot, '_all_tags', tags)
+
+    def _free(self, slot: int):
+        for column in self._columns:
+            column[slot] = _MISSING
+        self._drop_sort_keys(slot)
+        self._extra.pop(slot, None)
+        self._shadow.pop(slot, None)
+        self._live[slot] = _SLOT_FREED
+        self._detached.pop(slot, None)
+        self._from_file[slot] = 0
+        self._generation[slot] = (self._generation[slot] + 1) & 0x7FFFFFFF
+        self._free_slots.append(slot)
+
+    def _check(self, slot: int, gen: int):
+        if self._generation[slot] != gen:
+            raise RuntimeError('频道行已从存储中删除，视图不再可用')
+
+    def _keys(self, slot: int) -> List[str]:
+        keys = [name for name, column in zip(COLUMNS, self._columns) if column[slot] is not _MISSING]
+        extra = self._extra.get(slot)
+        if extra:
+            keys.extend(extra)
+        return keys
+
+    def _read(self, slot: int, key: str, derive: bool = True, live: bool = False):
+        """读取一个字段；_groups/_all_tags 每次返回新的 list/dict
+
+        live 为 True 时这两个值原地修改后会写回该行（交给调用方的行视图使用）。
+        """
+        col = _COLUMN_INDEX.get(key)
+        if col is None:
+            extra = self._extra.get(slot)
+            return extra.get(key, _MISSING) if extra else _MISSING
+        value = self._columns[col][slot]
+        if value is _MISSING or not derive:
+            return value
+        if col == _GROUPS_COL:
+            if type(value) is not tuple:
+                return value
+            value = _RowList(value) if live else list(value)
+        elif col == _ALL_TAGS_COL:
+            if value is _DERIVED:
+                raw = self._columns[_RAW_EXTINF_COL][slot]
+                value = extinf_tags(raw if isinstance(raw, str) else '')
+            elif not isinstance(value, dict):
+                return value
+            value = _RowDict(value) if live else dict(value)
+        else:
+            return value
+        if live:
+            value._store, value._slot, value._gen, value._key = self, slot, self._generation[slot], key
+        return value
+
+    def _write(self, slot: int, key: str, value):
+        if self._sort_keys:
+            self._drop_sort_keys(slot)
+        if self._from_file[slot] and key in _ORIGINAL_FIELD_SET:
+            shadow = self._shadow.setdefault(slot, {})
+            if key not in shadow:
+                shadow[key] = self._read(slot, key)
+        col = _COLUMN_INDEX.get(key)
+        if col is None:
+            self._extra.setdefault(slot, {})[key] = value
+            return
+        if col in _INTERNED:
+            value = _intern(value)
+        elif col == _GROUPS_COL:
+            if isinstance(value, (list, tuple)):
+                value = tuple(_intern(g) for g in value)
+        elif col == _ALL_TAGS_COL:
+            raw = self._columns[_RAW_EXTINF_COL][slot]
+            if isinstance(value, dict):
+                # 存一份自己的副本，调用方之后改动传入的 dict 不会绕过写入
+                value = _DERIVED if value == extinf_tags(raw if isinstance(raw, str) else '') else dict(value)
+        elif col == _RAW_EXTINF_COL and self._columns[_ALL_TAGS_COL][slot] is _DERIVED:
+            # 推导来源要变了，先把当前的标签落实
+            self._columns[_ALL_TAGS_COL][slot] = self._read(slot, '_all_tags')
+        self._columns[col][slot] = value
+
+    def _delete(self, slot: int, key: str) -> bool:
+        col = _COLUMN_INDEX.get(key)
+        if col is None:
+            extra = self._extra.get(slot)
+            if not extra or key not in extra:
+                return False
+            self._drop_sort_keys(slot)
+            del extra[key]
+            if not extra:
+                del self._extra[slot]
+            return True
+        if self._columns[col][slot] is _MISSING:
+            return False
+        self._drop_sort_keys(slot)
+        if col == _RAW_EXTINF_COL and self._columns[_ALL_TAGS_COL][slot] is _DERIVED:
+            self._columns[_ALL_TAGS_COL][slot] = self._read(slot, '_all_tags')
+        self._columns[col][slot] = _MISSING
+        return True
+
+    def _original(self, slot: int) -> Optional[Dict[str, Any]]:
+        if not self._from_file[slot]:
+            return None
+        shadow = self._shadow.get(slot) or {}
+        original = {}
+        for key in ORIGINAL_FIELDS:
+            value = shadow[key] if key in shadow else self._read(slot, key)
+            if value is not _MISSING:
+                original[key] = value
+        return original
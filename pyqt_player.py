@@ -61,7 +61,6 @@ from controllers import (  # noqa: E402
     SubscriptionController,
     SubscriptionUIController,
     CatchupController,
-    PipController,
     MediaController,
     UpdateController,
     FavoritesController,
@@ -69,6 +68,7 @@ from controllers import (  # noqa: E402
 )
 
 from utils.general_utils import calculate_adaptive_delay  # noqa: E402
+from utils.lazy_component import LazyComponent, peek_component  # noqa: E402
 from mixins.server_mixin import ServerMixin  # noqa: E402
 from mixins.tray_mixin import TrayMixin  # noqa: E402
 from mixins.update_mixin import UpdateMixin  # noqa: E402
@@ -283,16 +283,19 @@ class IPTVPlayer(
     subscription_ctrl = None
     subscription_ui_ctrl = None
     catchup_ctrl = None
-    pip_ctrl = None
     media_ctrl = None
     update_ctrl = None
-    multi_screen_ctrl = None
     favorites_ctrl = None
     epg_reminder_ctrl = None
     progress_ctrl = None
     play_state = None
     panel_vis = None
 
+    # 较少使用的功能在首次访问时才导入并创建
+    pip_ctrl = LazyComponent('controllers.pip_controller', 'PipController', '画中画控制器')
+    multi_screen_ctrl = LazyComponent('controllers.multi_screen_controller', 'MultiScreenController', '多画面控制器')
+    clip_export_service = LazyComponent('services.clip_export_service', 'ClipExportService', '切片导出服务')
+
     video_frame = None
     video_widget = None
     video_placeholder = None
@@ -584,16 +587,8 @@ class IPTVPlayer(
         _safe_init('subscription_ctrl', SubscriptionController)
         _safe_init('subscription_ui_ctrl', SubscriptionUIController)
         _safe_init('catchup_ctrl', CatchupController)
-        _safe_init('pip_ctrl', PipController)
         _safe_init('media_ctrl', MediaController)
         _safe_init('update_ctrl', UpdateController)
-        try:
-            from controllers.multi_screen_controller import MultiScreenController
-            self.multi_screen_ctrl = MultiScreenController(self)
-        except Exception as e:
-            logger.error(f"初始化多画面控制器失败: {e}")
-            self.multi_screen_ctrl = None
-            _init_errors.append("多画面")
         _safe_init('favorites_ctrl', FavoritesController)
         _safe_init('epg_reminder_ctrl', EpgReminderController)
 
@@ -632,7 +627,8 @@ class IPTVPlayer(
 
     @property
     def pip_mode(self):
-        return self.pip_ctrl.is_active
+        pip_ctrl = peek_component(self, 'pip_ctrl')
+        return bool(pip_ctrl and pip_ctrl.is_active)
 
     def _create_custom_title_bar(self):
         """创建自定义标题栏（委托给WindowController）"""
@@ -913,15 +909,6 @@ class IPTVPlayer(
             self.undo_stack = None
             _init_errors.append("撤销/重做")
 
-        # 初始化切片导出 + GIF 制作服务
-        try:
-            from services.clip_export_service import ClipExportService
-            self.clip_export_service = ClipExportService(self)
-        except Exception as e:
-            logger.error(f"初始化切片导出服务失败: {e}")
-            self.clip_export_service = None
-            _init_errors.append("切片导出")
-
         # 初始化书签与章节控制器（在 player_controller 创建后）
         try:
             from controllers.bookmark_controller import BookmarkController
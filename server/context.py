@@ -6,6 +6,7 @@ import logging
 from typing import Optional, List, Dict
 
 from core.config_manager import ConfigManager
+from models.channel_store import ChannelStore
 from services.m3u_parser import load_m3u_from_url_data, parse_m3u_content, extract_tvg_url_from_header
 
 logger = logging.getLogger('server.context')
@@ -401,14 +402,16 @@ class StandaloneScanner:
     def _validate_worker(self, timeout: int, threads: int):
         """频道验证工作线程"""
         try:
-            channels = list(self._ctx._channels)
+            # 只取 URL 快照：订阅源重新加载会原地替换有变化的源，行视图可能随之失效
+            with self._ctx._channels_lock:
+                urls = list(self._ctx._channels.values('url', ''))
             with self._lock:
-                self.stats['total'] = len(channels)
-            if not channels:
+                self.stats['total'] = len(urls)
+            if not urls:
                 self.last_message = '无频道可验证'
                 return
-            self.last_message = f'开始验证 {len(channels)} 个频道'
-            logger.info(f"频道验证：共 {len(channels)} 个频道")
+            self.last_message = f'开始验证 {len(urls)} 个频道'
+            logger.info(f"频道验证：共 {len(urls)} 个频道")
 
             from concurrent.futures import ThreadPoolExecutor, as_completed
             import requests as _requests
@@ -487,7 +490,7 @@ class StandaloneScanner:
                 return (idx, None, '跳过')
 
             with ThreadPoolExecutor(max_workers=max(1, min(threads, 32))) as pool:
-                futures = {pool.submit(_validate_one, i, ch.get('url', '')): i for i, ch in enumerate(channels)}
+                futures = {pool.submit(_validate_one, i, url): i for i, url in enumerate(urls)}
                 for fut in as_completed(futures):
                     if self._stop_event.is_set():
                         break
@@ -514,7 +517,7 @@ class StandaloneScanner:
                         self.stats['valid'] = valid_count
                         self.stats['invalid'] = invalid_count
                     if scanned_count % 20 == 0:
-                        self.last_message = f'已验证 {scanned_count}/{len(channels)}（有效 {valid_count}）'
+                        self.last_message = f'已验证 {scanned_count}/{len(urls)}（有效 {valid_count}）'
 
             # 持久化验证结果
             self._ctx._save_channels_to_cache()
@@ -638,7 +641,7 @@ class ServerContext:
         import threading as _threading
         self._main_window = main_window
         self._config: Optional[ConfigManager] = None
-        self._channels: List[Dict] = []
+        self._channel_store = ChannelStore()
         self._channels_lock = _threading.Lock()
         self._sources: List[Dict] = []
         self._sources_lock = _threading.Lock()
@@ -651,6 +654,8 @@ class ServerContext:
         self._source_loading = False
         self._source_load_status: Dict = {'loading': False, 'total': 0, 'loaded': 0, 'channels': 0, 'message': '空闲'}
         self._source_load_lock = _threading.Lock()
+        self._playlist_validators = None
+        self._playlist_loader = None
 
         if self._standalone:
             self._config = ConfigManager()
@@ -661,6 +666,16 @@ class ServerContext:
             # 异步初始化 EPG 解析器（不依赖 PySide6）
             _threading.Thread(target=self._init_epg_parser, daemon=True).start()
 
+    @property
+    def _channels(self) -> ChannelStore:
+        """频道列表（列式存储，元素为 dict 兼容的行视图）"""
+        return self._channel_store
+
+    @_channels.setter
+    def _channels(self, value):
+        # 整体替换时建立新的存储，其他线程已取到的行视图仍指向旧存储
+        self._channel_store = value if isinstance(value, ChannelStore) else ChannelStore(value)
+
     @classmethod
     def get_instance(cls, main_window=None):
         if cls._instance is None:
@@ -704,7 +719,7 @@ class ServerContext:
         try:
             cache_path = self._get_channels_cache_path()
             with self._channels_lock:
-                channels_snapshot = list(self._channels)
+                channels_snapshot = self._channels.to_dicts()
             data = {'channels': channels_snapshot, 'saved_at': time.time()}
             # 原子写入：先写临时文件，再 rename 覆盖目标文件
             tmp_path = cache_path + '.tmp'
@@ -722,29 +737,34 @@ class ServerContext:
             sources = self._config.load_playlist_sources()
             with self._sources_lock:
                 self._sources = sources
+            existing_by_source = self._channels_by_source()
+            with self._channels_lock:
+                cold_start = not self._channels
+            # 冷启动（无缓存）时解析出一批就放入频道列表，接口无需等待全部订阅源加载完
+            on_batch = self._append_loading_channels if cold_start else None
+            loader = self._get_playlist_loader()
+            results = loader.load_all(sources, existing_by_source, on_batch=on_batch)
             all_channels = []
-            for source in sources:
-                if not source.get('enabled', True):
-                    continue
-                url = source.get('url', '')
-                if not url:
+            for result in results:
+                if result is None:
                     continue
-                try:
-                    import requests
-                    resp = requests.get(url, timeout=15)
-                    content = load_m3u_from_url_data(resp.content)
-                    channels, _ = parse_m3u_content(content)
-                    if channels:
-                        # 标记频道来源（订阅源 URL），用于 Android 端区分 SUB/LOCAL tab
-                        # 若不设置 source，Android 端 LOCAL tab 的 source.isEmpty() 过滤条件
-                        # 会将所有订阅频道误判为本地频道显示
-                        for c in channels:
-                            c['source'] = url
-                        all_channels.extend(channels)
-                except Exception as e:
-                    logger.warning(f"加载源 {url} 失败: {e}")
+                if result['channels']:
+                    all_channels.extend(result['channels'])
+                elif result['error']:
+                    logger.warning(f"加载源 {result['url']} 失败: {result['error']}")
+            loader.prune(s.get('url', '') for s in sources if s.get('enabled', True))
             # 网络加载到频道时更新内存+缓存；加载为空时保留已有频道（不覆盖）
-            if all_channels:
+            changed = cold_start or self._subscription_changed(results, existing_by_source)
+            spliced = None
+            if all_channels and changed and not cold_start:
+                # 拉取失败或已不在配置中的源保留原有频道，与下面的整体合并一致
+                spliced = self._splice_subscription_channels(results, existing_by_source, remove_stale=False)
+            if all_channels and not changed:
+                logger.info(f"订阅源均未变化，保留现有 {len(all_channels)} 个订阅频道")
+            elif spliced is not None:
+                logger.info(f"独立模式替换了有变化的订阅源，共 {spliced} 个频道")
+                self._save_channels_to_cache()
+            elif all_channels:
                 # 合并而非覆盖：保留不在订阅源中的手动添加/本地频道（按 URL 去重）
                 # 根因：之前 self._channels = all_channels 完全覆盖，导致手动添加的本地频道丢失
                 # （与 _reload_sources_worker 的合并逻辑对齐）
@@ -774,6 +794,54 @@ class ServerContext:
         except Exception as e:
             logger.error(f"加载频道数据失败: {e}")
 
+    def _append_loading_channels(self, batch: List[Dict]):
+        with self._channels_lock:
+            self._channels.extend(batch)
+
+    def _get_playlist_validators(self):
+        if self._playlist_validators is None:
+            from services.conditional_fetch import SourceValidators
+            self._playlist_validators = SourceValidators(
+                os.path.join(self._config.config_dir, 'playlist_validators.json')
+            )
+        return self._playlist_validators
+
+    def _get_playlist_loader(self):
+        if self._playlist_loader is None:
+            from services.playlist_loader import PlaylistSourceLoader
+            self._playlist_loader = PlaylistSourceLoader(self._get_playlist_validators())
+        return self._playlist_loader
+
+    def _channels_by_source(self) -> Dict[str, List[Dict]]:
+        """按订阅源 URL 分组当前内存中的频道"""
+        grouped: Dict[str, List[Dict]] = {}
+        with self._channels_lock:
+            for c in self._channels:
+                source = c.get('source', '')
+                if source:
+                    grouped.setdefault(source, []).append(c)
+        return grouped
+
+    @staticmethod
+    def _subscription_changed(results: List[Optional[Dict]], existing_by_source: Dict[str, List[Dict]]) -> bool:
+        """本次加载结果与内存中的订阅频道是否不同
+
+        所有源都沿用了内存中的频道，且内存中没有其他源（已禁用/删除）的频道时无需重新合并。
+        """
+        loaded = set()
+        for result in results:
+            if result is None:
+                continue
+            if result['channels'] is None:
+                # 拉取失败的源：内存中有它的频道时合并会将其移除
+                if result['url'] in existing_by_source:
+                    return True
+                continue
+            if not result['unchanged']:
+                return True
+            loaded.add(result['url'])
+        return any(url not in loaded for url in existing_by_source)
+
     def reload_if_needed(self, max_age=300):
         if not self._standalone:
             return
@@ -831,73 +899,61 @@ class ServerContext:
 
             all_channels: List[Dict] = []
             errors: List[str] = []  # 记录每个源的加载失败原因
-            for idx, source in enumerate(sources):
-                src_url = source.get('url', '')
-                if not src_url or not source.get('enabled', True):
-                    continue
-                with self._source_load_lock:
-                    self._source_load_status['loaded'] = idx + 1
-                    self._source_load_status['message'] = f'加载中 {idx+1}/{len(sources)}'
-                try:
-                    import requests
-                    resp = requests.get(src_url, timeout=15, headers={'User-Agent': 'IPTV-Scanner/1.0'})
-                    if resp.status_code != 200:
-                        err = f'HTTP {resp.status_code}'
-                        errors.append(err)
-                        logger.warning(f"加载源 {src_url} 失败: {err}")
-                        continue
-                    content = load_m3u_from_url_data(resp.content)
-                    channels, header_attrs = parse_m3u_content(content)
-                    # 提取 M3U 头部 x-tvg-url 定义的 EPG 地址并自动加载
-                    epg_url_from_m3u = header_attrs.get('epg_url', '') if header_attrs else ''
-                    if epg_url_from_m3u:
-                        logger.info(f"M3U 源 {src_url} 包含 EPG 地址: {epg_url_from_m3u}")
-                        try:
-                            self.load_single_epg(epg_url_from_m3u)
-                        except Exception as epg_e:
-                            logger.warning(f"加载 M3U 内嵌 EPG 失败: {epg_e}")
-                    # 更新该源的 last_update 时间戳（无论是否解析到频道，HTTP 拉取已成功）
-                    from datetime import datetime
-                    config.update_playlist_source_last_update(idx, datetime.now().isoformat())
-                    if channels:
-                        # 标记频道来源（订阅源 URL），用于 Android 端区分 SUB/LOCAL tab
-                        for c in channels:
-                            c['source'] = src_url
-                        all_channels.extend(channels)
-                    else:
-                        err = 'M3U 解析为空'
-                        errors.append(err)
-                        logger.warning(f"加载源 {src_url} M3U 解析为空（内容长度 {len(content)}）")
-                except Exception as e:
-                    err = str(e)[:60]
-                    errors.append(err)
-                    logger.warning(f"加载源 {src_url} 异常: {e}")
+            existing_by_source = self._channels_by_source()
 
-            # 更新频道列表
-            # 合并策略：保留本地频道（扫描/导入，无 source 字段），
-            # 替换所有订阅频道（有 source 字段）为本次加载的结果。
-            # 这样禁用/删除源后，其频道会被正确移除。
-            with self._channels_lock:
-                local_channels = [
-                    c for c in self._channels
-                    if not c.get('source', '')
-                ]
-                if all_channels:
-                    # 去重：本地频道中 URL 与订阅频道重复的移除
-                    sub_urls = {c.get('url', '') for c in all_channels if c.get('url', '')}
-                    local_channels = [
-                        c for c in local_channels
-                        if not c.get('url', '') or c.get('url', '') not in sub_urls
-                    ]
-                    self._channels = all_channels + local_channels
-                    ch_count = len(self._channels)
-                    logger.info(f"订阅源 {len(all_channels)} 个 + 本地保留 {len(local_channels)} 个（扫描/导入）")
+            def on_source_done(done: int, total: int, result: Dict):
+                with self._source_load_lock:
+                    self._source_load_status['loaded'] = done
+                    self._source_load_status['message'] = f'加载中 {done}/{total}'
+
+            # 各源并行拉取；合并仍按配置顺序进行
+            loader = self._get_playlist_loader()
+            results = loader.load_all(sources, existing_by_source,
+                                      headers={'User-Agent': 'IPTV-Scanner/1.0'},
+                                      on_source_done=on_source_done)
+            from datetime import datetime
+            for idx, result in enumerate(results):
+                if result is None:
+                    continue
+                src_url = result['url']
+                channels = result['channels']
+                if channels is None:
+                    errors.append(result['error'])
+                    logger.warning(f"加载源 {src_url} 失败: {result['error']}")
+                    continue
+                # 更新该源的 last_update 时间戳（无论是否解析到频道，HTTP 拉取已成功）
+                config.update_playlist_source_last_update(idx, datetime.now().isoformat())
+                if result['unchanged']:
+                    # 内容未变化：沿用内存中的频道（保留验证状态），跳过解析
+                    all_channels.extend(channels)
+                    continue
+                # 提取 M3U 头部 x-tvg-url 定义的 EPG 地址并自动加载
+                epg_url_from_m3u = result['header_attrs'].get('epg_url', '')
+                if epg_url_from_m3u:
+                    logger.info(f"M3U 源 {src_url} 包含 EPG 地址: {epg_url_from_m3u}")
+                    try:
+                        self.load_single_epg(epg_url_from_m3u)
+                    except Exception as epg_e:
+                        logger.warning(f"加载 M3U 内嵌 EPG 失败: {epg_e}")
+                if channels:
+                    all_channels.extend(channels)
                 else:
-                    # 所有源都禁用/删除/加载失败时，只保留本地频道
-                    self._channels = local_channels
+                    err = 'M3U 解析为空'
+                    errors.append(err)
+                    logger.warning(f"加载源 {src_url} M3U 解析为空")
+            if not url:
+                loader.prune(s.get('url', '') for s in sources if s.get('enabled', True))
+
+            # 所有源都沿用了内存中的频道时不需要重新合并，也不重写缓存
+            if self._subscription_changed(results, existing_by_source):
+                ch_count = self._splice_subscription_channels(results, existing_by_source)
+                if ch_count is None:
+                    ch_count = self._merge_subscription_channels(all_channels)
+                self._save_channels_to_cache()
+            else:
+                with self._channels_lock:
                     ch_count = len(self._channels)
-                    logger.info(f"订阅源无频道，保留本地 {len(local_channels)} 个")
-            self._save_channels_to_cache()
+                logger.info(f"订阅源均未变化，保留现有 {ch_count} 个频道")
             self._last_load_time = time.time()
             with self._source_load_lock:
                 self._source_loading = False
@@ -914,6 +970,84 @@ class ServerContext:
                     'loading': False, 'total': 0, 'loaded': 0,
                     'channels': 0, 'message': f'异常: {e}'}
 
+    def _splice_subscription_channels(self, results: List[Optional[Dict]],
+                                      existing_by_source: Dict[str, List[Dict]],
+                                      remove_stale: bool = True) -> Optional[int]:
+        """只替换内容有变化的订阅源在 _channels 中所占的区间，返回替换后的频道数
+
+        remove_stale 为 True 时，拉取失败或已不在本次加载中的源的频道一并移除
+        （与 _merge_subscription_channels 一致）。本地频道中 URL 与新订阅频道重复的移除。
+        有新增的源，或某个源的频道在列表中不连续（如冷启动时分批追加）时无法原地替换，
+        返回 None，由调用方整体合并。
+        """
+        replacements: Dict[str, List[Dict]] = {}
+        loaded = set()
+        for result in results:
+            if result is None:
+                continue
+            loaded.add(result['url'])
+            if result['channels'] is None:
+                if remove_stale and result['url'] in existing_by_source:
+                    replacements[result['url']] = []
+            elif not result['unchanged']:
+                replacements[result['url']] = result['channels']
+        if remove_stale:
+            for url in existing_by_source:
+                if url not in loaded:
+                    replacements[url] = []
+        new_urls = {c.get('url', '') for channels in replacements.values() for c in channels}
+        new_urls.discard('')
+
+        with self._channels_lock:
+            store = self._channels
+            # 源 → (首行, 末行, 行数)
+            ranges: Dict[str, tuple] = {}
+            duplicates = []
+            for row, (source, url) in enumerate(zip(store.values('source', ''), store.values('url', ''))):
+                if source in replacements:
+                    first, _, count = ranges.get(source, (row, row, 0))
+                    ranges[source] = (first, row, count + 1)
+                elif not source and url in new_urls:
+                    duplicates.append(row)
+            if any(channels and url not in ranges for url, channels in replacements.items()):
+                return None
+            if any(last - first + 1 != count for first, last, count in ranges.values()):
+                return None
+            edits = [(first, last + 1, replacements[url]) for url, (first, last, _) in ranges.items()]
+            edits.extend((row, row + 1, []) for row in duplicates)
+            # 从后往前替换，前面区间的行号不受影响
+            for start, stop, channels in sorted(edits, key=lambda edit: edit[0], reverse=True):
+                store[start:stop] = channels
+            logger.info(f"原地替换 {len(ranges)} 个订阅源的频道，移除 {len(duplicates)} 个重复的本地频道")
+            return len(store)
+
+    def _merge_subscription_channels(self, all_channels: List[Dict]) -> int:
+        """用本次加载的订阅频道替换内存中的订阅频道，返回合并后的频道数
+
+        合并策略：保留本地频道（扫描/导入，无 source 字段），
+        替换所有订阅频道（有 source 字段）为本次加载的结果。
+        这样禁用/删除源后，其频道会被正确移除。
+        """
+        with self._channels_lock:
+            local_channels = [
+                c for c in self._channels
+                if not c.get('source', '')
+            ]
+            if all_channels:
+                # 去重：本地频道中 URL 与订阅频道重复的移除
+                sub_urls = {c.get('url', '') for c in all_channels if c.get('url', '')}
+                local_channels = [
+                    c for c in local_channels
+                    if not c.get('url', '') or c.get('url', '') not in sub_urls
+                ]
+                self._channels = all_channels + local_channels
+                logger.info(f"订阅源 {len(all_channels)} 个 + 本地保留 {len(local_channels)} 个（扫描/导入）")
+            else:
+                # 所有源都禁用/删除/加载失败时，只保留本地频道
+                self._channels = local_channels
+                logger.info(f"订阅源无频道，保留本地 {len(local_channels)} 个")
+            return len(self._channels)
+
     def get_source_load_status(self) -> Dict:
         """获取订阅源加载状态"""
         with self._source_load_lock:
@@ -967,7 +1101,7 @@ class ServerContext:
         """
         with self._channels_lock:
             if 0 <= idx < len(self._channels):
-                self._channels.pop(idx)
+                del self._channels[idx]
                 return True
             return False
 
@@ -829,7 +829,7 @@ async def handle_channels_list(request):
         source_filter = request.rel_url.query.get('source', '').strip()
         page = max(1, int(request.rel_url.query.get('page', '1')))
         page_size = min(500, max(1, int(request.rel_url.query.get('size', '100'))))
-        channels = []
+        matched = []
         for i, ch in enumerate(all_channels):
             if valid_only == '1' and ch.get('valid') is not True:
                 continue
@@ -843,11 +843,12 @@ async def handle_channels_list(request):
                 continue
             if source_filter == 'sub' and not ch.get('source', ''):
                 continue
-            channels.append({**ch, '_index': i})
-        total_filtered = len(channels)
+            matched.append(i)
+        total_filtered = len(matched)
         start = (page - 1) * page_size
         end = start + page_size
-        page_items = channels[start:end]
+        # 只为当前页的频道生成 dict
+        page_items = [{**all_channels[i], '_index': i} for i in matched[start:end]]
         # 分组按 M3U 文件中的首次出现顺序（保持原序，去重），与 PC 端 _update_groups_for 逻辑一致
         groups = list(dict.fromkeys(ch.get('group', '') for ch in all_channels if ch.get('group')))
         return _json_success(
@@ -932,7 +933,7 @@ async def handle_channel_delete(request):
         model.remove_channel(idx)
     elif ctx and hasattr(ctx, '_channels') and 0 <= idx < len(ctx._channels):
         # standalone 模式（Android）：直接从内存列表删除并持久化
-        ctx._channels.pop(idx)
+        del ctx._channels[idx]
         ctx._save_channels_to_cache()
     return _json_success()
 
@@ -1764,19 +1765,22 @@ async def handle_stream_proxy(request):
     if not is_safe:
         logger.warning(f'Stream proxy blocked: {stream_url} - {reject_reason}')
         return _json_error(f'不允许的流地址: {reject_reason}', 403)
-    session = _get_stream_session()
+    # 同一上游地址的多个客户端共享一个上游连接
+    from server.stream_relay import get_stream_relay_hub
+    subscriber = None
     try:
-        async with session.get(stream_url) as resp:
-            content_type = resp.headers.get('Content-Type', 'video/mp2t')
-            response = web_response.StreamResponse(
-                status=resp.status,
-                headers={'Content-Type': content_type}
-            )
-            await response.prepare(request)
-            async for chunk in resp.content.iter_chunked(8192):
-                await response.write(chunk)
+        relay, subscriber = get_stream_relay_hub().subscribe(stream_url, _get_stream_session())
+        status, content_type = await relay.wait_ready()
+        response = web_response.StreamResponse(
+            status=status,
+            headers={'Content-Type': content_type}
+        )
+        await response.prepare(request)
+        async for chunk in subscriber:
+            await response.write(chunk)
+        if not subscriber.dropped:
             await response.write_eof()
-            return response
+        return response
     except asyncio.CancelledError:
         raise
     except ConnectionResetError:
@@ -1785,6 +1789,9 @@ async def handle_stream_proxy(request):
     except Exception as e:
         logger.error(f"流代理失败: {stream_url} - {e}")
         return _json_error(f'流代理失败: {e}', 502)
+    finally:
+        if subscriber is not None:
+            subscriber.close()
 
 
 # ===================== 播放器远程控制 =====================
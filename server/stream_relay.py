@@ -0,0 +1,312 @@
+"""
+/stream/{id} 流代理的共享上游分发
+
+同一个上游地址只保持一个上游连接，所有观看该频道的客户端共享：
+- 上游读取协程把数据按 TS 包对齐后写入环形缓冲，并逐个推送给订阅者
+- 缓冲块在 PAT 包处切分，并标记含关键帧（adaptation field 的 random_access_indicator）的块；
+  后加入的客户端从最近关键帧之前的 PAT 开始接收，播放器无需等待下一个 GOP
+- 订阅者积压超过上限（客户端读取太慢）时断开该客户端，不拖慢其他人
+- 最后一个订阅者离开后保留片刻再关闭上游，便于换台回切
+- 上游不是 TS（如 HLS 播放列表）时不共享，后来的客户端各自建立连接
+
+上游带宽与观看人数无关。所有对象只在 aiohttp 所在的事件循环中使用。
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from services.stream_prefilter import TS_PACKET_SIZE, TS_SYNC_BYTE
+
+logger = logging.getLogger('server.stream_relay')
+
+# 环形缓冲保留的最大字节数（约数秒高码率直播，足以覆盖一个 GOP）
+_BUFFER_MAX_BYTES = 8 * 1024 * 1024
+# 单个订阅者允许积压的最大字节数，超过即断开
+_SUBSCRIBER_MAX_PENDING = 16 * 1024 * 1024
+# 最后一个订阅者离开后上游保留的秒数
+_IDLE_LINGER = 5.0
+_READ_CHUNK = 64 * 1024
+# PAT 包头：同步字节 + payload_unit_start_indicator + PID 0
+_PAT_HEADER = bytes((TS_SYNC_BYTE, 0x40, 0x00))
+
+
+def _find_sync(data) -> int:
+    """查找连续两个包都以同步字节开头的位置，找不到返回 -1"""
+    limit = len(data) - TS_PACKET_SIZE
+    offset = data.find(TS_SYNC_BYTE)
+    while 0 <= offset < limit:
+        if data[offset + TS_PACKET_SIZE] == TS_SYNC_BYTE:
+            return offset
+        offset = data.find(TS_SYNC_BYTE, offset + 1)
+    return -1
+
+
+def _has_keyframe(block: bytes) -> bool:
+    """块内是否有设置了 random_access_indicator 的包"""
+    for offset in range(0, len(block), TS_PACKET_SIZE):
+        # adaptation_field_control 含 adaptation field、长度非 0、random_access_indicator
+        if block[offset + 3] & 0x20 and block[offset + 4] and block[offset + 5] & 0x40:
+            return True
+    return False
+
+
+def split_ts_blocks(data: bytes) -> List[Tuple[bytes, bool, bool]]:
+    """把按包对齐的 TS 数据在 PAT 包处切分
+
+    Returns:
+        [(块数据, 是否以 PAT 开头, 是否含关键帧)]
+    """
+    cuts = [0]
+    offset = data.find(_PAT_HEADER, 1)
+    while offset != -1:
+        if offset % TS_PACKET_SIZE == 0:
+            cuts.append(offset)
+        offset = data.find(_PAT_HEADER, offset + 1)
+    cuts.append(len(data))
+    blocks = []
+    for start, end in zip(cuts, cuts[1:]):
+        if end > start:
+            block = data[start:end]
+            blocks.append((block, block.startswith(_PAT_HEADER), _has_keyframe(block)))
+    return blocks
+
+
+class RelaySubscriber:
+    """一个下游客户端：异步迭代得到要写出的数据块"""
+
+    def __init__(self, relay: 'StreamRelay'):
+        self._relay = relay
+        self._chunks: Deque[bytes] = deque()
+        self._pending = 0
+        self._wakeup = asyncio.Event()
+        self.closed = False
+        self.dropped = False
+
+    def push(self, chunk: bytes):
+        if self.closed:
+            return
+        self._pending += len(chunk)
+        if self._pending > _SUBSCRIBER_MAX_PENDING:
+            logger.info(f"客户端读取过慢，断开流代理: {self._relay.url}")
+            self.dropped = True
+            self._chunks.clear()
+            self.close()
+            return
+        self._chunks.append(chunk)
+        self._wakeup.set()
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self._wakeup.set()
+            self._relay._unsubscribe(self)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> bytes:
+        while not self._chunks:
+            if self.closed:
+                raise StopAsyncIteration
+            self._wakeup.clear()
+            await self._wakeup.wait()
+        chunk = self._chunks.popleft()
+        self._pending -= len(chunk)
+        return chunk
+
+
+class StreamRelay:
+    """单个上游地址的读取与分发"""
+
+    def __init__(self, hub: 'StreamRelayHub', url: str, session):
+        self.hub = hub
+        self.url = url
+        self._session = session
+        self._subscribers: List[RelaySubscriber] = []
+        # 环形缓冲：(块数据, 是否以 PAT 开头, 是否含关键帧)
+        self._buffer: Deque[Tuple[bytes, bool, bool]] = deque()
+        self._buffered = 0
+        self._ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._task: Optional[asyncio.Task] = None
+        self._linger: Optional[asyncio.TimerHandle] = None
+        self.shareable = True
+        self.bytes_in = 0
+        self._closed = False
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def start(self):
+        self._task = asyncio.ensure_future(self._run())
+
+    async def wait_ready(self) -> Tuple[int, str]:
+        """等待上游响应头，返回 (HTTP 状态码, Content-Type)；连接失败时抛出异常"""
+        return await asyncio.shield(self._ready)
+
+    def subscribe(self) -> RelaySubscriber:
+        if self._linger is not None:
+            self._linger.cancel()
+            self._linger = None
+        subscriber = RelaySubscriber(self)
+        for chunk in self._backlog():
+            subscriber.push(chunk)
+        self._subscribers.append(subscriber)
+        return subscriber
+
+    def _backlog(self) -> List[bytes]:
+        """后加入的客户端从最近关键帧之前的 PAT 开始；没有关键帧标记时从最近的 PAT 开始"""
+        blocks = self._buffer
+        start = None
+        for i in range(len(blocks) - 1, -1, -1):
+            if blocks[i][2]:
+                for j in range(i, -1, -1):
+                    if blocks[j][1]:
+                        start = j
+                        break
+                break
+        if start is None:
+            for i in range(len(blocks) - 1, -1, -1):
+                if blocks[i][1]:
+                    start = i
+                    break
+        if start is None:
+            return []
+        return [blocks[i][0] for i in range(start, len(blocks))]
+
+    def _unsubscribe(self, subscriber: RelaySubscriber):
+        try:
+            self._subscribers.remove(subscriber)
+        except ValueError:
+            return
+        if not self._subscribers and not self._closed:
+            self._linger = asyncio.get_running_loop().call_later(_IDLE_LINGER, self.close)
+
+    def close(self):
+        """关闭上游并结束所有订阅者"""
+        self._closed = True
+        if self._linger is not None:
+            self._linger.cancel()
+            self._linger = None
+        self.hub._discard(self)
+        if self._task is not None and not self._task.done() and self._task is not asyncio.current_task():
+            self._task.cancel()
+        for subscriber in list(self._subscribers):
+            subscriber.close()
+        self._buffer.clear()
+        self._buffered = 0
+
+    def _publish(self, block: bytes, starts_with_pat: bool, keyframe: bool):
+        self.bytes_in += len(block)
+        if self.shareable:
+            self._buffer.append((block, starts_with_pat, keyframe))
+            self._buffered += len(block)
+            while self._buffered > _BUFFER_MAX_BYTES and len(self._buffer) > 1:
+                self._buffered -= len(self._buffer.popleft()[0])
+        for subscriber in list(self._subscribers):
+            subscriber.push(block)
+
+    async def _run(self):
+        import aiohttp
+        try:
+            # 直播流是长连接，只限制连接与单次读取的超时
+            timeout = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=30)
+            async with self._session.get(self.url, timeout=timeout) as resp:
+                content_type = resp.headers.get('Content-Type', 'video/mp2t')
+                if not self._ready.done():
+                    self._ready.set_result((resp.status, content_type))
+                if resp.status != 200 or 'mpegurl' in content_type.lower():
+                    self.shareable = False
+                    self.hub._discard(self)
+                await self._relay(resp.content)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            if not self._ready.done():
+                self._ready.set_exception(e)
+            else:
+                logger.warning(f"流代理上游中断: {self.url} - {e}")
+        finally:
+            if not self._ready.done():
+                self._ready.set_exception(ConnectionError('上游已关闭'))
+            self.shareable = False
+            self.close()
+
+    async def _relay(self, content):
+        pending = b''
+        aligned = False
+        async for data in content.iter_chunked(_READ_CHUNK):
+            if not self.shareable:
+                # 非 TS 内容原样转发给已有的订阅者
+                self._publish(data, False, False)
+                continue
+            pending += data
+            if not aligned:
+                offset = _find_sync(pending)
+                if offset < 0:
+                    if len(pending) >= 2 * TS_PACKET_SIZE * 8:
+                        # 不是 TS 流：不共享，已缓冲的数据原样转发
+                        self.shareable = False
+                        self.hub._discard(self)
+                        self._publish(pending, False, False)
+                        pending = b''
+                    continue
+                pending = pending[offset:]
+                aligned = True
+            usable = len(pending) - len(pending) % TS_PACKET_SIZE
+            if not usable:
+                continue
+            data, pending = pending[:usable], pending[usable:]
+            if data[0] != TS_SYNC_BYTE:
+                # 丢失同步：重新对齐
+                aligned = False
+                pending = data + pending
+                continue
+            for block in split_ts_blocks(data):
+                self._publish(*block)
+        if pending:
+            self._publish(pending, False, False)
+
+
+class StreamRelayHub:
+    """按上游地址复用 StreamRelay"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self._relays: Dict[str, StreamRelay] = {}
+
+    def subscribe(self, url: str, session) -> Tuple[StreamRelay, RelaySubscriber]:
+        relay = self._relays.get(url)
+        if relay is None:
+            relay = StreamRelay(self, url, session)
+            self._relays[url] = relay
+            relay.start()
+        return relay, relay.subscribe()
+
+    def _discard(self, relay: StreamRelay):
+        if self._relays.get(relay.url) is relay:
+            del self._relays[relay.url]
+
+    def stats(self) -> List[Dict]:
+        return [
+            {'url': url, 'subscribers': relay.subscriber_count, 'bytes_in': relay.bytes_in}
+            for url, relay in self._relays.items()
+        ]
+
+    def close_all(self):
+        for relay in list(self._relays.values()):
+            relay.close()
+
+
+_hub: Optional[StreamRelayHub] = None
+
+
+def get_stream_relay_hub() -> StreamRelayHub:
+    """当前事件循环的分发器（服务重启后事件循环改变，重新创建）"""
+    global _hub
+    loop = asyncio.get_running_loop()
+    if _hub is None or _hub.loop is not loop:
+        _hub = StreamRelayHub(loop)
+    return _hub
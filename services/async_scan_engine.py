@@ -0,0 +1,292 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, Tuple
+from core.log_manager import global_logger
+from services.concurrency_controller import AdaptiveConcurrencyController, url_host
+from services.multicast_probe import probe_ts_stream
+from services.stream_prefilter import StreamPrefilter, make_rejected_result
+from utils.platform_utils import get_subprocess_creation_flags
+
+
+DEFAULT_MAX_INFLIGHT = 1000
+
+
+class AsyncScanEngine:
+    """基于 asyncio 的扫描引擎
+
+    所有探测以协程形式运行在同一个事件循环线程中：
+    - 第一阶段预筛选（StreamPrefilter.check_async）使用原生 asyncio socket
+    - 媒体探测使用 asyncio.create_subprocess_exec 启动 ffprobe
+    - 组播与 udpxy 代理使用内置 TS 探测（services.multicast_probe），同样在本事件循环中完成
+    - in-flight 窗口限制同时进行的探测数，ffprobe 进程数由并发控制器限制
+      （自适应上限与按主机限制，等待名额的探测按先后顺序分配，被主机限制挡住的不阻塞其他主机）
+
+    停止时直接取消事件循环中的任务，无需等待队列超时。
+    """
+
+    def __init__(self, validator, timeout: int = 10,
+                 max_inflight: int = DEFAULT_MAX_INFLIGHT, max_processes: int = 10,
+                 concurrency: AdaptiveConcurrencyController | None = None,
+                 on_result: Callable[[str, Any, Dict], None] | None = None,
+                 on_finished: Callable[[], None] | None = None,
+                 stop_event: threading.Event | None = None,
+                 prefilter: StreamPrefilter | None = None):
+        """
+        Args:
+            validator: FfprobeStreamValidator 实例，复用其命令构建与结果解析
+            timeout: 单个探测超时（秒）
+            max_inflight: 同时进行的探测协程上限
+            max_processes: 同时运行的 ffprobe 进程上限（未提供 concurrency 时使用固定上限）
+            concurrency: ffprobe 进程的并发控制器，与线程模型的验证器共用
+            on_result: 结果回调 (url, context, result)，在事件循环线程中调用
+            on_finished: 所有探测结束（或被取消）后的回调
+            stop_event: 外部停止事件，置位后立即取消所有探测
+            prefilter: 第一阶段预筛选器，为 None 时所有 URL 直接进入 ffprobe
+        """
+        self.logger = global_logger
+        self.validator = validator
+        self.timeout = timeout
+        self.max_inflight = max(1, max_inflight)
+        self.max_processes = max(1, max_processes)
+        self.concurrency = concurrency or AdaptiveConcurrencyController(
+            self.max_processes, adaptive=False, cpu_sampler=lambda: None
+        )
+        self._slot_waiters: deque = deque()
+        self.on_result = on_result
+        self.on_finished = on_finished
+        self.stop_event = stop_event
+        self.prefilter = prefilter
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._main_task: asyncio.Task | None = None
+        self._thread: threading.Thread | None = None
+        self._stopping = False
+
+    def start(self, items: Iterable[Tuple[str, Any]], name: str = "AsyncScanEngine") -> threading.Thread:
+        """在独立线程中启动事件循环
+
+        Args:
+            items: (url, context) 可迭代对象，可以是惰性生成器
+
+        Returns:
+            threading.Thread: 事件循环所在线程
+        """
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._thread_main,
+            args=(items,),
+            name=name,
+            daemon=True
+        )
+        self._thread.start()
+        return self._thread
+
+    def stop(self):
+        """立即取消所有进行中的探测（线程安全）"""
+        self._stopping = True
+        loop = self._loop
+        task = self._main_task
+        if loop is not None and task is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                pass
+
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def join(self, timeout: float | None = None):
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+
+    def _thread_main(self, items):
+        try:
+            asyncio.run(self._run(items))
+        except Exception as e:
+            self.logger.error(f"异步扫描引擎异常: {e}", exc_info=True)
+        finally:
+            self._loop = None
+            self._main_task = None
+            if self.on_finished:
+                try:
+                    self.on_finished()
+                except Exception as e:
+                    self.logger.debug(f"异步扫描结束回调失败: {e}")
+
+    async def _run(self, items):
+        self._loop = asyncio.get_running_loop()
+        self._main_task = asyncio.current_task()
+        watcher = asyncio.create_task(self._watch_stop())
+        try:
+            await self._dispatch(items)
+        except asyncio.CancelledError:
+            self.logger.debug("异步扫描引擎已取消")
+        finally:
+            watcher.cancel()
+
+    async def _dispatch(self, items):
+        window = asyncio.Semaphore(self.max_inflight)
+        tasks: set = set()
+
+        def _on_done(task):
+            tasks.discard(task)
+            window.release()
+
+        try:
+            for count, (url, context) in enumerate(items, 1):
+                if self._stopping:
+                    break
+                await window.acquire()
+                task = asyncio.create_task(self._probe_and_report(url, context))
+                tasks.add(task)
+                task.add_done_callback(_on_done)
+                # 惰性生成器可能连续产出大量被跳过的 URL，定期让出事件循环
+                if count % 256 == 0:
+                    await asyncio.sleep(0)
+            while tasks:
+                await asyncio.wait(list(tasks))
+        finally:
+            pending = list(tasks)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _watch_stop(self):
+        """轮询外部停止事件与验证器终止标志"""
+        validator_cls = type(self.validator)
+        while not self._stopping:
+            if ((self.stop_event is not None and self.stop_event.is_set())
+                    or getattr(validator_cls, '_terminating', False)):
+                self._stopping = True
+                if self._main_task is not None:
+                    self._main_task.cancel()
+                return
+            await asyncio.sleep(0.05)
+
+    async def _probe_and_report(self, url: str, context):
+        result = await self._probe(url)
+        if self._stopping or self.on_result is None:
+            return
+        try:
+            self.on_result(url, context, result)
+        except Exception as e:
+            self.logger.warning(f"处理异步扫描结果异常: {url} - {e}")
+
+    async def _acquire_slot(self, host: str | None):
+        """等待 ffprobe 名额；已有等待者时排队，保证先到先得"""
+        if not self._slot_waiters and self.concurrency.try_acquire(host):
+            return
+        future = asyncio.get_running_loop().create_future()
+        waiter = (host, future)
+        self._slot_waiters.append(waiter)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if waiter in self._slot_waiters:
+                self._slot_waiters.remove(waiter)
+            elif future.done() and not future.cancelled():
+                # 名额已分配但任务被取消，归还名额
+                self.concurrency.release(host)
+            raise
+
+    def _release_slot(self, host: str | None, result: Dict | None):
+        self.concurrency.release(host, result)
+        self._grant_slots()
+
+    def _grant_slots(self):
+        """按排队顺序分配空出的名额，被主机限制挡住的等待者让给后面的主机"""
+        blocked = set()
+        for waiter in list(self._slot_waiters):
+            if not self.concurrency.has_capacity():
+                break
+            host, future = waiter
+            if future.done():
+                self._slot_waiters.remove(waiter)
+                continue
+            if host in blocked:
+                continue
+            if self.concurrency.try_acquire(host):
+                self._slot_waiters.remove(waiter)
+                future.set_result(None)
+            else:
+                blocked.add(host)
+
+    async def _probe(self, url: str) -> Dict:
+        result = self.validator._empty_result(url)
+        start_time = time.time()
+        try:
+            if self.prefilter is not None:
+                rejection = await self.prefilter.check_async(url)
+                if rejection is not None:
+                    return make_rejected_result(
+                        url, rejection, int((time.time() - start_time) * 1000)
+                    )
+
+            if self.validator.uses_native_probe(url):
+                # 组播/udpxy 直接在本事件循环中收包解析，不启动 ffprobe
+                return await probe_ts_stream(
+                    url, self.timeout, self.validator._native_probe_dwell,
+                    self.validator.get_headers()
+                )
+
+            ffprobe_path = self.validator._get_ffprobe_path()
+            if not ffprobe_path:
+                result['error'] = 'ffprobe不可用'
+                result['error_type'] = 'ffprobe_unavailable'
+                return result
+
+            cmd = self.validator._build_ffprobe_command(ffprobe_path, url, self.timeout)
+            host = url_host(url)
+            await self._acquire_slot(host)
+            probe_start = time.time()
+            sample = None
+            try:
+                returncode, stdout_data, stderr_data = await self._run_ffprobe(cmd)
+                result['latency'] = int((time.time() - start_time) * 1000)
+                if returncode is None:
+                    result['error'] = f'超时({self.timeout}秒)'
+                    result['error_type'] = 'timeout'
+                else:
+                    self.validator._fill_result_from_probe(result, url, returncode, stdout_data, stderr_data)
+                # 控制器按进程本身的耗时评估（不含排队与预筛选）
+                sample = dict(result, latency=int((time.time() - probe_start) * 1000))
+            finally:
+                self._release_slot(host, sample)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            result['error'] = str(e)
+            result['error_type'] = 'unknown_error'
+        return result
+
+    async def _run_ffprobe(self, cmd: list) -> Tuple[int | None, bytes, bytes]:
+        """运行 ffprobe；communicate() 同时读取 stdout/stderr，不会因管道写满而卡死
+
+        Returns:
+            (returncode, stdout, stderr)；超时返回 (None, b'', b'')
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            creationflags=get_subprocess_creation_flags()
+        )
+        try:
+            stdout_data, stderr_data = await asyncio.wait_for(
+                proc.communicate(), timeout=self.timeout + 10
+            )
+            return proc.returncode, stdout_data, stderr_data
+        except asyncio.TimeoutError:
+            return None, b'', b''
+        finally:
+            if proc.returncode is None:
+                try:
+                    proc.kill()
+                except ProcessLookupError:
+                    pass
+                try:
+                    await asyncio.wait_for(proc.wait(), timeout=1)
+                except (asyncio.TimeoutError, asyncio.CancelledError):
+                    pass
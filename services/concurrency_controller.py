@@ -0,0 +1,245 @@
+"""
+自适应并发控制
+
+按 AIMD（加性增、乘性减）调整同时进行的探测数，取代固定大小的信号量：
+- 每个评估窗口统计成功探测的延迟中位数、超时率、过载类错误与 CPU 占用
+- 窗口内并发已用满且各项指标健康时上限 +1
+- 延迟明显高于基线、超时率高于已观测到的底线（死链本身造成的超时）、
+  出现 mpv_create_failed 等过载错误或 CPU 过载时上限乘以回退系数
+- 探测因等不到名额而返回 concurrency_limit 时视为需求超过上限（按已用满处理）
+- 可选按主机限制同时进行的探测数，避免单个上游服务器被打满
+
+同一个控制器可同时用于线程模型（acquire 阻塞等待）与 asyncio 引擎（try_acquire +
+由调用方在 release 后重新分配等待者）。
+"""
+
+import statistics
+import threading
+import time
+from typing import Dict, List
+from urllib.parse import urlparse
+from core.log_manager import global_logger
+
+
+# 视为资源过载、需要立即降低并发的错误类型
+OVERLOAD_ERROR_TYPES = frozenset({'mpv_create_failed'})
+# 不参与统计的错误类型（主动停止、环境缺失）
+IGNORED_ERROR_TYPES = frozenset({'terminating', 'ffprobe_unavailable', 'mpv_unavailable'})
+# 样本不足一个窗口时，最长等待多久（秒）也进行评估
+_WINDOW_MAX_SECONDS = 5.0
+
+
+def url_host(url: str) -> str | None:
+    """提取用于按主机限流的 host:port"""
+    try:
+        parsed = urlparse(url)
+        if not parsed.hostname:
+            return None
+        return f"{parsed.hostname}:{parsed.port}" if parsed.port else parsed.hostname
+    except ValueError:
+        return None
+
+
+def _default_cpu_sampler():
+    try:
+        import psutil
+    except ImportError:
+        return None
+    psutil.cpu_percent(interval=None)
+    return lambda: psutil.cpu_percent(interval=None)
+
+
+class AdaptiveConcurrencyController:
+    """AIMD 并发上限控制器（线程安全）"""
+
+    def __init__(self, initial: int, min_limit: int = 1, max_limit: int | None = None,
+                 per_host_limit: int = 0, adaptive: bool = True,
+                 backoff: float = 0.75, latency_tolerance: float = 2.0,
+                 timeout_margin: float = 0.15, cpu_high: float = 90.0,
+                 adjust_interval: float = 1.0, cpu_sampler=None):
+        """
+        Args:
+            initial: 初始并发上限
+            min_limit/max_limit: 上限的调整范围，max_limit 为 None 时等于 initial
+            per_host_limit: 单个主机同时进行的探测上限，0 表示不限制
+            adaptive: False 时上限固定为 initial（与原固定信号量一致）
+            backoff: 拥塞时上限的乘性回退系数
+            latency_tolerance: 延迟中位数超过基线多少倍视为拥塞
+            timeout_margin: 超时率高于已观测底线多少视为拥塞
+            cpu_high: CPU 占用超过该百分比视为过载
+            adjust_interval: 两次调整之间的最短间隔（秒）
+            cpu_sampler: 返回 CPU 占用百分比的函数，默认使用 psutil（不可用时忽略 CPU）
+        """
+        self._cond = threading.Condition()
+        self._inflight = 0
+        self._host_inflight: Dict[str, int] = {}
+        self._cpu_sampler = cpu_sampler if cpu_sampler is not None else _default_cpu_sampler()
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.timeout_margin = timeout_margin
+        self.cpu_high = cpu_high
+        self.adjust_interval = adjust_interval
+        self.per_host_limit = 0
+        self.adaptive = True
+        self.configure(initial, min_limit, max_limit, per_host_limit, adaptive)
+
+    def configure(self, initial: int, min_limit: int = 1, max_limit: int | None = None,
+                  per_host_limit: int | None = None, adaptive: bool | None = None):
+        """重新设定上限与调整范围（新一轮扫描开始时调用），统计数据一并清空"""
+        with self._cond:
+            initial = max(1, int(initial))
+            self.min_limit = max(1, min(int(min_limit), initial))
+            self.max_limit = max(initial, int(max_limit) if max_limit else initial)
+            if per_host_limit is not None:
+                self.per_host_limit = max(0, int(per_host_limit))
+            if adaptive is not None:
+                self.adaptive = adaptive
+            self._limit = initial
+            self._reset_window()
+            self._baseline_latency: float | None = None
+            self._timeout_floor: float | None = None
+            self._last_adjust = time.monotonic()
+            self._cond.notify_all()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def inflight(self) -> int:
+        return self._inflight
+
+    def try_acquire(self, host: str | None = None) -> bool:
+        """不阻塞地占用一个探测名额"""
+        with self._cond:
+            return self._try_acquire_locked(host)
+
+    def acquire(self, host: str | None = None, timeout: float | None = None) -> bool:
+        """阻塞直到获得探测名额；超时返回 False"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while not self._try_acquire_locked(host):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def has_capacity(self) -> bool:
+        """全局上限是否还有空余（不考虑主机限制）"""
+        return self._inflight < self._limit
+
+    def note_saturated(self):
+        """调用方等不到名额（concurrency_limit）：本窗口按并发已用满处理"""
+        with self._cond:
+            self._peak_inflight = max(self._peak_inflight, self._limit)
+
+    def release(self, host: str | None = None, result: Dict | None = None):
+        """归还名额并记录本次探测结果（验证器返回的结果字典）"""
+        with self._cond:
+            self._inflight = max(0, self._inflight - 1)
+            if host is not None and self.per_host_limit:
+                count = self._host_inflight.get(host, 0) - 1
+                if count > 0:
+                    self._host_inflight[host] = count
+                else:
+                    self._host_inflight.pop(host, None)
+            if result is not None:
+                self._record_locked(result)
+            self._cond.notify_all()
+
+    def snapshot(self) -> Dict:
+        with self._cond:
+            return {
+                'limit': self._limit,
+                'inflight': self._inflight,
+                'min_limit': self.min_limit,
+                'max_limit': self.max_limit,
+                'baseline_latency': self._baseline_latency,
+                'timeout_floor': self._timeout_floor,
+            }
+
+    def _try_acquire_locked(self, host) -> bool:
+        if self._inflight >= self._limit:
+            return False
+        if host is not None and self.per_host_limit:
+            if self._host_inflight.get(host, 0) >= self.per_host_limit:
+                return False
+            self._host_inflight[host] = self._host_inflight.get(host, 0) + 1
+        self._inflight += 1
+        self._peak_inflight = max(self._peak_inflight, self._inflight)
+        return True
+
+    def _reset_window(self):
+        self._latencies: List[float] = []
+        self._samples = 0
+        self._timeouts = 0
+        self._overloads = 0
+        self._peak_inflight = self._inflight
+        self._window_start = time.monotonic()
+
+    def _record_locked(self, result: Dict):
+        error_type = result.get('error_type')
+        if not self.adaptive or error_type in IGNORED_ERROR_TYPES:
+            return
+        self._samples += 1
+        if error_type == 'timeout':
+            self._timeouts += 1
+        elif error_type in OVERLOAD_ERROR_TYPES:
+            self._overloads += 1
+        elif result.get('valid') and result.get('latency') is not None:
+            self._latencies.append(float(result['latency']))
+
+        now = time.monotonic()
+        if self._overloads and now - self._last_adjust >= self.adjust_interval:
+            # 过载错误说明本机资源已经不够，不等窗口结束
+            self._decrease_locked('过载错误')
+            return
+        window_full = self._samples >= max(8, self._limit)
+        if window_full or (self._samples >= 3 and now - self._window_start >= _WINDOW_MAX_SECONDS):
+            if now - self._last_adjust >= self.adjust_interval:
+                self._evaluate_locked()
+
+    def _evaluate_locked(self):
+        timeout_rate = self._timeouts / self._samples if self._samples else 0.0
+        if self._timeout_floor is None or timeout_rate < self._timeout_floor:
+            self._timeout_floor = timeout_rate
+
+        median = statistics.median(self._latencies) if self._latencies else None
+        if median is not None:
+            if self._baseline_latency is None or median < self._baseline_latency:
+                self._baseline_latency = median
+            else:
+                # 基线缓慢上浮，网络状况整体变化后不会一直以旧的最小值为准
+                self._baseline_latency *= 1.02
+
+        cpu = None
+        if self._cpu_sampler is not None:
+            try:
+                cpu = self._cpu_sampler()
+            except Exception:
+                cpu = None
+
+        if cpu is not None and cpu >= self.cpu_high:
+            self._decrease_locked(f'CPU {cpu:.0f}%')
+        elif timeout_rate > self._timeout_floor + self.timeout_margin:
+            self._decrease_locked(f'超时率 {timeout_rate:.0%}')
+        elif (median is not None and self._baseline_latency
+              and median > self._baseline_latency * self.latency_tolerance):
+            self._decrease_locked(f'延迟 {median:.0f}ms')
+        elif self._peak_inflight >= self._limit and self._limit < self.max_limit:
+            self._set_limit_locked(self._limit + 1, '指标正常')
+        else:
+            self._reset_window()
+
+    def _decrease_locked(self, reason: str):
+        self._set_limit_locked(int(self._limit * self.backoff), reason)
+
+    def _set_limit_locked(self, new_limit: int, reason: str):
+        new_limit = max(self.min_limit, min(self.max_limit, new_limit))
+        if new_limit != self._limit:
+            global_logger.debug(f"自适应并发: {self._limit} → {new_limit}（{reason}）")
+            self._limit = new_limit
+            self._cond.notify_all()
+        self._last_adjust = time.monotonic()
+        self._reset_window()
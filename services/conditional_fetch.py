@@ -0,0 +1,120 @@
+"""
+订阅源条件请求
+
+为每个订阅源（直播源 / EPG 源）持久化校验信息：
+- ETag → If-None-Match
+- Last-Modified → If-Modified-Since
+- 内容 SHA-256（服务器不支持上述校验头时用于判断内容是否变化）
+
+服务器返回 304，或下载内容的哈希与上次一致时，调用方可跳过解析、
+直接沿用已有数据。
+"""
+
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from typing import Dict
+from core.log_manager import global_logger
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class HashingReader(io.RawIOBase):
+    """边读边计算 SHA-256 的原始流包装，用于流式解析时同步得到内容哈希"""
+
+    def __init__(self, raw):
+        self._raw = raw
+        self._hash = hashlib.sha256()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._raw.read(len(buffer))
+        if not data:
+            return 0
+        n = len(data)
+        buffer[:n] = data
+        self._hash.update(data)
+        return n
+
+    def drain(self, chunk_size: int = 64 * 1024):
+        """读完剩余内容（解析器提前结束时保证哈希覆盖全文）"""
+        while self._raw.read(chunk_size):
+            pass
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+class SourceValidators:
+    """订阅源校验信息的持久化存储（JSON 文件，按 URL 索引）"""
+
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict] = {}
+        try:
+            if os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    self._entries = data
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def get(self, url: str) -> Dict:
+        with self._lock:
+            return dict(self._entries.get(url, {}))
+
+    def request_headers(self, url: str) -> Dict[str, str]:
+        """构造条件请求头；没有记录时返回空字典"""
+        entry = self.get(url)
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def get_hash(self, url: str) -> str | None:
+        return self.get(url).get('sha256')
+
+    def has_http_validators(self, url: str) -> bool:
+        entry = self.get(url)
+        return bool(entry.get('etag') or entry.get('last_modified'))
+
+    def update(self, url: str, response_headers, sha256: str | None, **extra):
+        """记录一次成功下载的校验信息并落盘"""
+        entry = {
+            'etag': response_headers.get('ETag', '') if response_headers else '',
+            'last_modified': response_headers.get('Last-Modified', '') if response_headers else '',
+            'sha256': sha256 or '',
+            'checked_at': time.time(),
+        }
+        entry.update(extra)
+        with self._lock:
+            self._entries[url] = entry
+        self.save()
+
+    def forget(self, url: str):
+        with self._lock:
+            removed = self._entries.pop(url, None)
+        if removed is not None:
+            self.save()
+
+    def save(self):
+        # 并行加载的多个源可能同时保存，整个写入过程持锁，避免共用临时文件冲突
+        with self._lock:
+            tmp_path = self._path + '.tmp'
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._entries, f, ensure_ascii=False)
+                os.replace(tmp_path, self._path)
+            except OSError as e:
+                global_logger.debug(f"保存订阅源校验信息失败: {e}")
@@ -1,7 +1,7 @@
 import re
 import threading
 import unicodedata
-from collections import OrderedDict
+from collections import Counter, OrderedDict
 from core.log_manager import global_logger
 
 _MAX_CACHE_SIZE = 5000
@@ -168,8 +168,114 @@ class EpgMatcher:
                 cls._smart_cache.move_to_end(cache_key)
                 return cls._smart_cache[cache_key]
 
-        by_id, by_name, by_norm_name = cls._build_index(epg_channels)
+        # 一次性调用：临时构建索引（常驻场景应持有 EpgIndex 复用）
+        result = EpgIndex(epg_channels).match(
+            channel_name, tvg_id=tvg_id, tvg_name=tvg_name, comma_name=comma_name
+        )
 
+        with cls._cache_lock:
+            if len(cls._smart_cache) >= _MAX_CACHE_SIZE:
+                cls._smart_cache.popitem(last=False)
+            cls._smart_cache[cache_key] = result
+
+        return result
+
+    @classmethod
+    def clear_cache(cls):
+        with cls._cache_lock:
+            cls._smart_cache.clear()
+
+
+def _bigrams(norm):
+    return Counter(norm[i:i + 2] for i in range(len(norm) - 1))
+
+
+class EpgIndex:
+    """EPG 频道匹配索引
+
+    每次 EPG 数据加载后构建一次，持有 by-id / by-name / by-normalized-name 映射，
+    以及规范化名称的二元组倒排索引，用于相似度匹配的候选筛选。
+    匹配结果与 EpgMatcher 的线性扫描完全一致，缓存随索引一起失效。
+    """
+
+    def __init__(self, epg_channels):
+        self.by_id, self.by_name, self.by_norm_name = EpgMatcher._build_index(epg_channels)
+        # 规范化名称按插入顺序编号，平分时与线性扫描一样取先出现者
+        self._norms = list(self.by_norm_name.keys())
+        self._norm_ids = list(self.by_norm_name.values())
+        self._gram_index = {}
+        self._short_norms = []
+        for idx, norm in enumerate(self._norms):
+            grams = _bigrams(norm)
+            if not grams:
+                self._short_norms.append(idx)
+            for gram, count in grams.items():
+                self._gram_index.setdefault(gram, []).append((idx, count))
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def _candidates(self, norm, threshold):
+        """用 q-gram 引理筛选可能达到阈值的候选
+
+        编辑距离为 d 的两个串（较长者长度 L）至少共享 L - 1 - 2d 个二元组；
+        达到阈值要求 d <= (1 - threshold) * L，据此淘汰共享二元组不足的候选。
+        """
+        query_grams = _bigrams(norm)
+        if not query_grams:
+            # 单字符查询：仅可能与极短名称相似，直接线性比较
+            return [idx for idx, n in enumerate(self._norms) if len(n) <= 2]
+
+        common = {}
+        for gram, q_count in query_grams.items():
+            for idx, count in self._gram_index.get(gram, ()):
+                common[idx] = common.get(idx, 0) + min(q_count, count)
+
+        candidates = []
+        for idx, shared in common.items():
+            longest = max(len(norm), len(self._norms[idx]))
+            max_dist = int((1.0 - threshold) * longest)
+            if shared >= longest - 1 - 2 * max_dist:
+                candidates.append(idx)
+        if len(norm) <= 2:
+            candidates.extend(self._short_norms)
+        return candidates
+
+    def similar(self, name, threshold=0.7):
+        """相似度匹配，语义同 EpgMatcher._fuzzy_match_by_similarity"""
+        if not name:
+            return None
+        norm = _normalize(name)
+        if not norm:
+            return None
+        best_score = 0.0
+        best_idx = None
+        for idx in sorted(set(self._candidates(norm, threshold))):
+            epg_norm = self._norms[idx]
+            if abs(len(epg_norm) - len(norm)) > max(len(norm), len(epg_norm)) * 0.4:
+                continue
+            score = _similarity(norm, epg_norm)
+            if score > best_score:
+                best_score = score
+                best_idx = idx
+        if best_idx is not None and best_score >= threshold:
+            return self._norm_ids[best_idx]
+        return None
+
+    def match(self, channel_name, tvg_id=None, tvg_name=None, comma_name=None):
+        """按 EpgMatcher.match 的优先级匹配 EPG 频道 ID"""
+        if not channel_name and not tvg_id and not tvg_name and not comma_name:
+            return None
+
+        cache_key = (channel_name, tvg_id, tvg_name, comma_name)
+        with self._cache_lock:
+            if cache_key in self._cache:
+                self._cache.move_to_end(cache_key)
+                return self._cache[cache_key]
+
+        by_id, by_name, by_norm_name = self.by_id, self.by_name, self.by_norm_name
         result = None
 
         if tvg_name:
@@ -185,28 +291,23 @@ class EpgMatcher:
             result = by_name.get(channel_name) or by_id.get(channel_name)
 
         if result is None and tvg_name:
-            result = cls._fuzzy_match_by_normalize(tvg_name, by_norm_name)
+            result = EpgMatcher._fuzzy_match_by_normalize(tvg_name, by_norm_name)
 
         if result is None and comma_name:
-            result = cls._fuzzy_match_by_normalize(comma_name, by_norm_name)
+            result = EpgMatcher._fuzzy_match_by_normalize(comma_name, by_norm_name)
 
         if result is None and channel_name:
-            result = cls._fuzzy_match_by_normalize(channel_name, by_norm_name)
+            result = EpgMatcher._fuzzy_match_by_normalize(channel_name, by_norm_name)
 
         if result is None and channel_name:
-            result = cls._fuzzy_match_by_similarity(channel_name, by_norm_name)
+            result = self.similar(channel_name)
 
         if result is None and tvg_name:
-            result = cls._fuzzy_match_by_similarity(tvg_name, by_norm_name)
+            result = self.similar(tvg_name)
 
-        with cls._cache_lock:
-            if len(cls._smart_cache) >= _MAX_CACHE_SIZE:
-                cls._smart_cache.popitem(last=False)
-            cls._smart_cache[cache_key] = result
+        with self._cache_lock:
+            if len(self._cache) >= _MAX_CACHE_SIZE:
+                self._cache.popitem(last=False)
+            self._cache[cache_key] = result
 
         return result
-
-    @classmethod
-    def clear_cache(cls):
-        with cls._cache_lock:
-            cls._smart_cache.clear()
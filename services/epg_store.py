@@ -0,0 +1,427 @@
+"""
+二进制 EPG 缓存
+
+替代 epg_cache.json 的紧凑磁盘格式，按 mmap 只读打开：
+- 节目起止时间存为 int64 epoch 秒
+- 标题、简介、频道 ID/名称全部去重后存入字符串表
+- 每个频道在频道表中记录节目区间（起始下标 + 数量）
+
+打开时只读取文件头与频道表（与频道数成正比），节目记录在访问某个频道时
+才从映射区解码，冷启动耗时与节目总量无关，常驻内存也只剩几张表。
+解析 XMLTV 时由 EpgStoreWriter 边解析边写入，不必先构造完整的节目字典。
+
+文件布局（小端）：
+    header      : magic, version, 各区计数与偏移
+    programmes  : (start:int64, end:int64, title:u32, desc:u32, raw:u32) * N
+    channels    : (id:u32, first:u32, count:u32) * C
+    names       : (id:u32, name:u32) * M
+    str_offsets : u64 * (S + 1)
+    str_data    : UTF-8 字节
+
+无法按标准格式表示的节目（时间不是本地 ISO 格式、含额外字段等）
+整体序列化为 JSON 存入字符串表，raw 字段记录其下标 + 1。
+"""
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from array import array
+from collections.abc import MutableMapping
+from datetime import datetime
+from functools import partial
+from typing import Callable, Dict, Iterator, List, Tuple
+
+
+_MAGIC = b'IEPG'
+_VERSION = 1
+_HEADER = struct.Struct('<4sIIIIQQQQQ')
+_PROGRAMME = struct.Struct('<qqIII')
+_CHANNEL = struct.Struct('<III')
+_NAME = struct.Struct('<II')
+_STR_OFFSET = struct.Struct('<QQ')
+_STANDARD_KEYS = ('title', 'desc', 'start', 'end')
+
+
+def _to_epoch(value) -> int | None:
+    """本地时间 ISO 字符串 → epoch 秒；无法无损往返时返回 None"""
+    if not isinstance(value, str) or len(value) != 19 or value[10] != 'T':
+        return None
+    try:
+        epoch = int(datetime.fromisoformat(value).timestamp())
+        # 夏令时跳过的本地时间换算回来是另一个时刻，这类节目按原样序列化
+        return epoch if _to_iso(epoch) == value else None
+    except (ValueError, OverflowError, OSError):
+        return None
+
+
+def _to_iso(epoch: int) -> str:
+    return datetime.fromtimestamp(epoch).isoformat()
+
+
+class _StringTable:
+    def __init__(self):
+        self._index: Dict[str, int] = {}
+        self.encoded: List[bytes] = []
+
+    def add(self, value: str) -> int:
+        idx = self._index.get(value)
+        if idx is None:
+            idx = len(self.encoded)
+            self._index[value] = idx
+            self.encoded.append(value.encode('utf-8', errors='surrogatepass'))
+        return idx
+
+
+def _encode_programme(prog, strings: _StringTable) -> bytes:
+    if isinstance(prog, dict) and tuple(prog.keys()) == _STANDARD_KEYS:
+        title, desc = prog['title'], prog['desc']
+        start, end = _to_epoch(prog['start']), _to_epoch(prog['end'])
+        if (start is not None and end is not None
+                and isinstance(title, str) and isinstance(desc, str)):
+            return _PROGRAMME.pack(start, end, strings.add(title), strings.add(desc), 0)
+    raw = strings.add(json.dumps(prog, ensure_ascii=False, separators=(',', ':')))
+    return _PROGRAMME.pack(0, 0, 0, 0, raw + 1)
+
+
+def write_epg_store(path: str, data, channel_names: Dict[str, str] | None = None,
+                    release: Callable[[], None] | None = None):
+    """把 EPG 数据写成二进制缓存
+
+    先写入临时文件再替换，写入过程中崩溃不会留下损坏的缓存。来源是 EpgStore 时
+    节目记录直接从映射区复制（只重映射字符串下标），不解码为节目字典。
+
+    Args:
+        path: 缓存文件路径
+        data: {channel_id: [programme, ...]}（dict 或 EpgStore），或
+              [(来源, [channel_id, ...]), ...]：按顺序写入各来源中列出的频道
+        channel_names: {channel_id: display_name}
+        release: 替换失败时调用后重试，用于关闭仍映射旧缓存的 EpgStore
+                 （Windows 上被映射的文件无法被替换）
+    """
+    parts = data if isinstance(data, list) else [(data, None)]
+    strings = _StringTable()
+    channels: List[Tuple[int, int, int]] = []
+    tmp_path = path + '.tmp'
+
+    with open(tmp_path, 'wb') as f:
+        f.write(b'\0' * _HEADER.size)
+        prog_off = f.tell()
+        total = 0
+        for source, channel_ids in parts:
+            if channel_ids is None:
+                channel_ids = list(source)
+            if isinstance(source, EpgStore):
+                write_channel = source._channel_writer(f, strings)
+            else:
+                write_channel = partial(_encode_channel, source, f, strings)
+            for channel_id in channel_ids:
+                count = write_channel(channel_id)
+                channels.append((strings.add(channel_id), total, count))
+                total += count
+        _write_tables(f, prog_off, strings, channels, channel_names)
+
+    _replace_cache(tmp_path, path, release)
+
+
+def _encode_channel(data, f, strings: _StringTable, channel_id: str) -> int:
+    programs = data[channel_id]
+    if not isinstance(programs, list):
+        return 0
+    for prog in programs:
+        f.write(_encode_programme(prog, strings))
+    return len(programs)
+
+
+def _write_tables(f, prog_off: int, strings: _StringTable, channels: List[Tuple[int, int, int]],
+                  channel_names: Dict[str, str] | None):
+    """节目记录之后依次写入频道表、名称表、字符串表，最后回填文件头"""
+    chan_off = f.tell()
+    for entry in channels:
+        f.write(_CHANNEL.pack(*entry))
+
+    names = [(strings.add(cid), strings.add(name))
+             for cid, name in (channel_names or {}).items()
+             if isinstance(cid, str) and isinstance(name, str)]
+    names_off = f.tell()
+    for entry in names:
+        f.write(_NAME.pack(*entry))
+
+    stroff_off = f.tell()
+    offset = 0
+    offsets = bytearray()
+    for encoded in strings.encoded:
+        offsets += struct.pack('<Q', offset)
+        offset += len(encoded)
+    offsets += struct.pack('<Q', offset)
+    f.write(offsets)
+
+    strdata_off = f.tell()
+    for encoded in strings.encoded:
+        f.write(encoded)
+
+    f.seek(0)
+    f.write(_HEADER.pack(
+        _MAGIC, _VERSION, len(channels), len(names), len(strings.encoded),
+        prog_off, chan_off, names_off, stroff_off, strdata_off
+    ))
+
+
+def _replace_cache(tmp_path: str, path: str, release: Callable[[], None] | None):
+    try:
+        os.replace(tmp_path, path)
+    except PermissionError:
+        if release is None:
+            raise
+        release()
+        os.replace(tmp_path, path)
+
+
+class EpgStoreWriter:
+    """边解析边写入的 EPG 缓存
+
+    节目到达时立即编码为定长记录追加到临时文件，内存中只保留每个节目 4 字节的
+    记录序号与去重后的字符串表，不保留节目对象；finish() 按频道把记录重排，
+    写成与 write_epg_store 相同格式的缓存文件。节目不必按频道分组出现。
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._strings = _StringTable()
+        # 频道 ID → 该频道节目在临时文件中的记录序号，按出现顺序
+        self._channels: Dict[str, array] = {}
+        self._spill = tempfile.TemporaryFile()
+        self._count = 0
+
+    def __len__(self) -> int:
+        return len(self._channels)
+
+    def add_channel(self, channel_id: str):
+        """登记频道（没有节目的频道也写入频道表）"""
+        if channel_id not in self._channels:
+            self._channels[channel_id] = array('I')
+
+    def add(self, channel_id: str, programme: dict):
+        self._spill.write(_encode_programme(programme, self._strings))
+        records = self._channels.get(channel_id)
+        if records is None:
+            records = self._channels[channel_id] = array('I')
+        records.append(self._count)
+        self._count += 1
+
+    def finish(self, channel_names: Dict[str, str] | None = None,
+               release: Callable[[], None] | None = None) -> 'EpgStore':
+        """写出缓存文件并以 EpgStore 打开"""
+        size = _PROGRAMME.size
+        channels: List[Tuple[int, int, int]] = []
+        tmp_path = self.path + '.tmp'
+        self._spill.flush()
+        spill = mmap.mmap(self._spill.fileno(), 0, access=mmap.ACCESS_READ) if self._count else b''
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(b'\0' * _HEADER.size)
+                prog_off = f.tell()
+                total = 0
+                for channel_id, records in self._channels.items():
+                    for record in records:
+                        f.write(spill[record * size:(record + 1) * size])
+                    channels.append((self._strings.add(channel_id), total, len(records)))
+                    total += len(records)
+                _write_tables(f, prog_off, self._strings, channels, channel_names)
+        finally:
+            if self._count:
+                spill.close()
+        self.close()
+        _replace_cache(tmp_path, self.path, release)
+        return EpgStore(self.path)
+
+    def close(self):
+        """丢弃临时文件（finish 之后调用无副作用）"""
+        self._spill.close()
+
+
+class _MappedFile:
+    """被多个 EpgStore 视图共享的映射文件"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError("EPG缓存文件不完整")
+            self.mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        (magic, version, self.channel_count, self.name_count, self.string_count,
+         self.prog_off, self.chan_off, self.names_off, self.stroff_off,
+         self.strdata_off) = _HEADER.unpack_from(self.mm, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError("EPG缓存文件格式不匹配")
+        self.closed = False
+        self.lock = threading.Lock()
+
+    def string(self, idx: int) -> str:
+        start, end = _STR_OFFSET.unpack_from(self.mm, self.stroff_off + idx * 8)
+        return self.mm[self.strdata_off + start:self.strdata_off + end].decode('utf-8', errors='surrogatepass')
+
+    def programmes(self, first: int, count: int) -> List[dict]:
+        result = []
+        unpack = _PROGRAMME.unpack_from
+        string = self.string
+        base = self.prog_off + first * _PROGRAMME.size
+        for i in range(count):
+            start, end, title, desc, raw = unpack(self.mm, base + i * _PROGRAMME.size)
+            if raw:
+                result.append(json.loads(string(raw - 1)))
+            else:
+                result.append({
+                    'title': string(title),
+                    'desc': string(desc),
+                    'start': _to_iso(start),
+                    'end': _to_iso(end)
+                })
+        return result
+
+    def copy_programmes(self, first: int, count: int, f, remap: Callable[[int], int]):
+        """把节目记录原样写入 f，字符串下标经 remap 换成目标文件的下标"""
+        unpack = _PROGRAMME.unpack_from
+        pack = _PROGRAMME.pack
+        base = self.prog_off + first * _PROGRAMME.size
+        for i in range(count):
+            start, end, title, desc, raw = unpack(self.mm, base + i * _PROGRAMME.size)
+            if raw:
+                f.write(pack(0, 0, 0, 0, remap(raw - 1) + 1))
+            else:
+                f.write(pack(start, end, remap(title), remap(desc), 0))
+
+    def close(self):
+        self.closed = True
+        try:
+            self.mm.close()
+        finally:
+            self._file.close()
+
+
+class EpgStore(MutableMapping):
+    """以 mmap 方式读取的 EPG 数据，接口与 {channel_id: [programme, ...]} 字典一致
+
+    每次取值都从映射区解码出新的节目列表，不在内存中常驻节目对象。
+    写入（如增量合并新的 EPG 源）只进入内存中的覆盖层，下次保存缓存时一并落盘。
+    """
+
+    def __init__(self, path: str | None = None, _mapped: _MappedFile | None = None,
+                 _ranges: Dict[str, Tuple[int, int]] | None = None):
+        if _mapped is None:
+            _mapped = _MappedFile(path)
+            _ranges = {}
+            for i in range(_mapped.channel_count):
+                id_idx, first, count = _CHANNEL.unpack_from(_mapped.mm, _mapped.chan_off + i * _CHANNEL.size)
+                _ranges[_mapped.string(id_idx)] = (first, count)
+        self._mapped = _mapped
+        self._ranges = _ranges
+        self._overlay: Dict[str, list] = {}
+
+    @property
+    def path(self) -> str:
+        return self._mapped.path
+
+    def channel_names(self) -> Dict[str, str]:
+        mapped = self._mapped
+        names = {}
+        with mapped.lock:
+            if mapped.closed:
+                return names
+            for i in range(mapped.name_count):
+                id_idx, name_idx = _NAME.unpack_from(mapped.mm, mapped.names_off + i * _NAME.size)
+                names[mapped.string(id_idx)] = mapped.string(name_idx)
+        return names
+
+    def _channel_writer(self, f, strings: _StringTable) -> Callable[[str], int]:
+        """供 write_epg_store 使用：返回 频道ID → 写入 f 的节目数 的函数"""
+        mapped = self._mapped
+        # 本文件字符串下标 → 目标文件字符串下标
+        mapping: Dict[int, int] = {}
+
+        def remap(idx: int) -> int:
+            target = mapping.get(idx)
+            if target is None:
+                target = mapping[idx] = strings.add(mapped.string(idx))
+            return target
+
+        def write_channel(channel_id: str) -> int:
+            if channel_id in self._overlay:
+                return _encode_channel(self._overlay, f, strings, channel_id)
+            first, count = self._ranges[channel_id]
+            with mapped.lock:
+                if mapped.closed:
+                    return 0
+                mapped.copy_programmes(first, count, f, remap)
+            return count
+        return write_channel
+
+    def program_count(self) -> int:
+        """节目总数（不解码节目记录）"""
+        return (sum(count for _, count in self._ranges.values())
+                + sum(len(progs) for progs in self._overlay.values()))
+
+    def __getitem__(self, channel_id: str) -> list:
+        if channel_id in self._overlay:
+            return self._overlay[channel_id]
+        first, count = self._ranges[channel_id]
+        mapped = self._mapped
+        with mapped.lock:
+            if mapped.closed:
+                return []
+            return mapped.programmes(first, count)
+
+    def __setitem__(self, channel_id: str, programs: list):
+        self._ranges.pop(channel_id, None)
+        self._overlay[channel_id] = programs
+
+    def __delitem__(self, channel_id: str):
+        if channel_id in self._overlay:
+            del self._overlay[channel_id]
+        else:
+            del self._ranges[channel_id]
+
+    def __contains__(self, channel_id) -> bool:
+        return channel_id in self._overlay or channel_id in self._ranges
+
+    def __iter__(self) -> Iterator[str]:
+        yield from list(self._ranges)
+        yield from list(self._overlay)
+
+    def __len__(self) -> int:
+        return len(self._ranges) + len(self._overlay)
+
+    def clear(self):
+        self._ranges = {}
+        self._overlay = {}
+
+    def copy(self) -> 'EpgStore':
+        """共享映射文件的浅拷贝视图"""
+        view = EpgStore(_mapped=self._mapped, _ranges=dict(self._ranges))
+        view._overlay = dict(self._overlay)
+        return view
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        # 映射区只读，深拷贝只需复制覆盖层
+        import copy
+        view = EpgStore(_mapped=self._mapped, _ranges=dict(self._ranges))
+        view._overlay = copy.deepcopy(self._overlay, memo)
+        return view
+
+    def close(self):
+        """关闭映射文件；共享同一文件的视图随后读取任何频道都得到空列表"""
+        mapped = self._mapped
+        with mapped.lock:
+            if not mapped.closed:
+                mapped.close()
@@ -1,9 +1,9 @@
-import json
 import os
 import threading
+import time
 from datetime import datetime
 from typing import Dict, Any, List, Optional
-from core.log_manager import global_logger as logger
+from core.user_data_store import FAVORITES, PLAY_HISTORY
 from utils.platform_utils import get_android_data_dir
 
 
@@ -18,6 +18,8 @@ class FavoritesService:
         self._favorites: List[Dict[str, Any]] = []
         self._play_history: List[Dict[str, Any]] = []
         self._favorites_url_set: set = set()
+        # 收藏与历史保存在 user_data.db（写入合并后批量提交）
+        self._store = None
         self._data_dir = self._get_data_dir()
         self._load_from_config()
 
@@ -36,56 +38,25 @@ class FavoritesService:
         with self._lock:
             if not self._config:
                 return
-            fav_count = int(self._config.get_value('Favorites', 'count', '0') or '0')
-            for i in range(fav_count):
-                raw = self._config.get_value('Favorites', f'ch_{i}', '')
-                if raw:
-                    try:
-                        ch = json.loads(raw)
-                        self._favorites.append(ch)
-                        self._favorites_url_set.add(ch.get('url', ''))
-                    except (json.JSONDecodeError, ValueError) as e:
-                        logger.warning(f"跳过损坏的收藏条目#{i}: {e}")
-
-            hist_count = int(self._config.get_value('PlayHistory', 'count', '0') or '0')
-            for i in range(hist_count):
-                raw = self._config.get_value('PlayHistory', f'ch_{i}', '')
-                if raw:
-                    try:
-                        ch = json.loads(raw)
-                        self._play_history.append(ch)
-                    except (json.JSONDecodeError, ValueError) as e:
-                        logger.warning(f"跳过损坏的历史条目#{i}: {e}")
-
-    def _save_favorites_to_config(self):
-        if not self._config:
-            return
-        with self._lock:
-            try:
-                old_count = int(self._config.get_value('Favorites', 'count', '0') or '0')
-                self._config.set_value('Favorites', 'count', str(len(self._favorites)))
-                for i, ch in enumerate(self._favorites):
-                    self._config.set_value('Favorites', f'ch_{i}', json.dumps(ch, ensure_ascii=False))
-                for i in range(len(self._favorites), old_count + 1):
-                    self._config.remove_option('Favorites', f'ch_{i}')
-                self._config.save_config()
-            except Exception as e:
-                logger.error(f"保存收藏失败: {e}")
-
-    def _save_history_to_config(self):
-        if not self._config:
-            return
-        with self._lock:
-            try:
-                old_count = int(self._config.get_value('PlayHistory', 'count', '0') or '0')
-                self._config.set_value('PlayHistory', 'count', str(len(self._play_history)))
-                for i, ch in enumerate(self._play_history):
-                    self._config.set_value('PlayHistory', f'ch_{i}', json.dumps(ch, ensure_ascii=False))
-                for i in range(len(self._play_history), old_count + 1):
-                    self._config.remove_option('PlayHistory', f'ch_{i}')
-                self._config.save_config()
-            except Exception as e:
-                logger.error(f"保存历史失败: {e}")
+            self._store = self._config.get_user_data_store()
+            self._store.set_limit(PLAY_HISTORY, self.MAX_HISTORY)
+            for _, ch in self._store.items(FAVORITES, descending=False):
+                if isinstance(ch, dict):
+                    self._favorites.append(ch)
+                    self._favorites_url_set.add(ch.get('url', ''))
+            self._play_history = [
+                ch for _, ch in self._store.items(PLAY_HISTORY, limit=self.MAX_HISTORY)
+                if isinstance(ch, dict)
+            ]
+
+    def _save_favorite(self, entry: Dict[str, Any]):
+        if self._store is not None:
+            # 收藏按加入时间排序
+            self._store.put(FAVORITES, entry['url'], entry, time.time())
+
+    def _delete_favorite(self, key: str):
+        if self._store is not None:
+            self._store.delete(FAVORITES, key)
 
     @staticmethod
     def _channel_key(channel: Dict[str, Any]) -> str:
@@ -101,7 +72,7 @@ class FavoritesService:
             if key in self._favorites_url_set:
                 self._favorites = [f for f in self._favorites if f.get('url', '') != key]
                 self._favorites_url_set.discard(key)
-                self._save_favorites_to_config()
+                self._delete_favorite(key)
                 return False
             else:
                 entry = {
@@ -113,7 +84,7 @@ class FavoritesService:
                 }
                 self._favorites.append(entry)
                 self._favorites_url_set.add(key)
-                self._save_favorites_to_config()
+                self._save_favorite(entry)
                 return True
 
     def add_to_favorites(self, channel: Dict[str, Any]):
@@ -129,7 +100,7 @@ class FavoritesService:
                 }
                 self._favorites.append(entry)
                 self._favorites_url_set.add(key)
-                self._save_favorites_to_config()
+                self._save_favorite(entry)
 
     def remove_from_favorites(self, channel: Dict[str, Any]):
         with self._lock:
@@ -137,7 +108,7 @@ class FavoritesService:
             if key in self._favorites_url_set:
                 self._favorites = [f for f in self._favorites if f.get('url', '') != key]
                 self._favorites_url_set.discard(key)
-                self._save_favorites_to_config()
+                self._delete_favorite(key)
 
     def get_favorites(self) -> List[Dict[str, Any]]:
         with self._lock:
@@ -160,7 +131,9 @@ class FavoritesService:
             self._play_history.insert(0, entry)
             if len(self._play_history) > self.MAX_HISTORY:
                 self._play_history = self._play_history[:self.MAX_HISTORY]
-            self._save_history_to_config()
+            if self._store is not None:
+                # 超过 MAX_HISTORY 的旧记录由存储按播放时间淘汰
+                self._store.put(PLAY_HISTORY, key, entry, time.time())
 
     def get_play_history(self) -> List[Dict[str, Any]]:
         with self._lock:
@@ -169,15 +142,18 @@ class FavoritesService:
     def clear_play_history(self):
         with self._lock:
             self._play_history.clear()
-            self._save_history_to_config()
+            if self._store is not None:
+                self._store.clear(PLAY_HISTORY)
 
     def remove_from_history(self, url: str):
         with self._lock:
             self._play_history = [h for h in self._play_history if h.get('url', '') != url]
-            self._save_history_to_config()
+            if self._store is not None:
+                self._store.delete(PLAY_HISTORY, url)
 
     def clear_favorites(self):
         with self._lock:
             self._favorites.clear()
             self._favorites_url_set.clear()
-            self._save_favorites_to_config()
\ No newline at end of file
+            if self._store is not None:
+                self._store.clear(FAVORITES)
@@ -1,11 +1,13 @@
 import json
 import os
-import subprocess
 import sys
 import threading
 import time
 from typing import Dict
 from core.log_manager import global_logger
+from services.concurrency_controller import AdaptiveConcurrencyController, url_host
+from services.multicast_probe import DEFAULT_DWELL, get_multicast_probe, is_native_probe_target
+from services.process_supervisor import SupervisedProcess, get_process_supervisor
 from utils.platform_utils import get_ffprobe_path as _find_ffprobe_path, get_subprocess_creation_flags
 
 
@@ -22,14 +24,18 @@ def get_optimal_thread_count():
 
 
 class FfprobeStreamValidator:
-    _semaphore: threading.Semaphore = threading.Semaphore(get_optimal_thread_count())
+    _controller = AdaptiveConcurrencyController(get_optimal_thread_count())
     _user_agent: str | None = None
     _referer: str | None = None
     _headers_lock = threading.Lock()
     _terminating = False
     _ffprobe_path: str | None = None
     _ffprobe_checked = False
-    _active_processes: Dict[int, subprocess.Popen] = {}
+    # 组播与 udpxy 代理使用内置的 TS 探测，不启动 ffprobe
+    _native_probe = True
+    _native_probe_dwell = DEFAULT_DWELL
+    # pid -> SupervisedProcess（Popen 风格句柄：poll/kill/wait）
+    _active_processes: Dict[int, SupervisedProcess] = {}
     _process_lock = threading.Lock()
 
     @classmethod
@@ -40,16 +46,16 @@ class FfprobeStreamValidator:
         return cls._ffprobe_path
 
     @classmethod
-    def _get_semaphore(cls) -> threading.Semaphore:
-
-        return cls._semaphore
+    def _get_controller(cls) -> AdaptiveConcurrencyController:
+        return cls._controller
 
     def __init__(self, main_window=None):
         self.logger = global_logger
         self.main_window = main_window
 
-    def validate_stream(self, url: str, raw_channel_name: str | None = None, timeout: int = 3) -> Dict:
-        result = {
+    @staticmethod
+    def _empty_result(url: str) -> Dict:
+        return {
             'url': url,
             'valid': False,
             'latency': None,
@@ -62,6 +68,12 @@ class FfprobeStreamValidator:
             'hdr_type': None,
         }
 
+    def validate_stream(self, url: str, raw_channel_name: str | None = None, timeout: int = 3) -> Dict:
+        if self.uses_native_probe(url):
+            return self._validate_native(url, timeout)
+
+        result = self._empty_result(url)
+
         ffprobe_path = self._get_ffprobe_path()
         if not ffprobe_path:
             result['error'] = 'ffprobe不可用'
@@ -73,18 +85,20 @@ class FfprobeStreamValidator:
             result['error_type'] = 'terminating'
             return result
 
-        sem = self._get_semaphore()
+        controller = self._get_controller()
+        host = url_host(url)
         acquired = False
         for _ in range(60):
             if self._terminating:
                 result['error'] = '验证器正在关闭'
                 result['error_type'] = 'terminating'
                 return result
-            acquired = sem.acquire(timeout=0.5)
+            acquired = controller.acquire(host, timeout=0.5)
             if acquired:
                 break
 
         if not acquired:
+            controller.note_saturated()
             result['error'] = '并发数超限'
             result['error_type'] = 'concurrency_limit'
             return result
@@ -93,137 +107,42 @@ class FfprobeStreamValidator:
             cmd = self._build_ffprobe_command(ffprobe_path, url, timeout)
             start_time = time.time()
 
-            creation_flags = get_subprocess_creation_flags()
-            proc = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                creationflags=creation_flags
+            # 子进程由监管线程等待退出、并发读取输出并执行截止时间，工作线程只阻塞在完成事件上
+            proc = get_process_supervisor().spawn(
+                cmd, deadline=timeout + 10, creationflags=get_subprocess_creation_flags()
             )
 
             with self._process_lock:
                 self._active_processes[proc.pid] = proc
+            if self._terminating:
+                proc.kill()
 
             try:
-                while proc.poll() is None:
-                    if self._terminating:
-                        try:
-                            proc.kill()
-                            proc.wait(timeout=1)
-                        except Exception:
-                            pass
-                        result['error'] = '验证器正在关闭'
-                        result['error_type'] = 'terminating'
-                        return result
-                    elapsed = time.time() - start_time
-                    if elapsed > timeout + 10:
-                        try:
-                            proc.kill()
-                            proc.wait(timeout=1)
-                        except Exception:
-                            pass
-                        latency = int(elapsed * 1000)
-                        result['latency'] = latency
-                        result['error'] = f'超时({timeout}秒)'
-                        result['error_type'] = 'timeout'
-                        return result
-                    time.sleep(0.2)
-
-                if proc.returncode is None:
-                    latency = int((time.time() - start_time) * 1000)
-                    result['latency'] = latency
-                    result['error'] = f'超时({timeout}秒)'
-                    result['error_type'] = 'timeout'
-                    return result
+                returncode, stdout_data, stderr_data, timed_out = proc.result()
             finally:
                 with self._process_lock:
                     self._active_processes.pop(proc.pid, None)
 
-
             latency = int((time.time() - start_time) * 1000)
             result['latency'] = latency
 
-            stdout_data = proc.stdout.read() if proc.stdout else b''
-            stderr_data = proc.stderr.read() if proc.stderr else b''
-            
-            try:
-                proc.stdout.close()
-                proc.stderr.close()
-            except Exception:
-                pass
-
-            stderr_output = stderr_data.decode('utf-8', errors='ignore').strip()
-
-            probe_data = self._parse_probe_output(stdout_data)
-            if probe_data is not None:
-                streams = probe_data.get('streams', [])
-                if streams:
-                    result['valid'] = True
-
-                    video_stream = None
-                    audio_stream = None
-                    for s in streams:
-                        if s.get('codec_type') == 'video' and video_stream is None:
-                            video_stream = s
-                        elif s.get('codec_type') == 'audio' and audio_stream is None:
-                            audio_stream = s
-
-                    if video_stream:
-                        width = video_stream.get('width')
-                        height = video_stream.get('height')
-                        if width and height:
-                            result['resolution'] = f"{width}x{height}"
-                        codec_name = video_stream.get('codec_name')
-                        if codec_name:
-                            result['codec'] = codec_name
-                        # HDR 元数据提取（与 detect_hdr_type 统一逻辑）
-                        result['hdr_type'] = self._extract_hdr_type(
-                            video_stream, probe_data.get('frames', [])
-                        )
-
-                    format_info = probe_data.get('format', {})
-                    bitrate = format_info.get('bit_rate')
-                    if bitrate:
-                        try:
-                            bitrate_kbps = int(int(bitrate) / 1000)
-                            result['bitrate'] = f"{bitrate_kbps}kbps"
-                        except (ValueError, TypeError):
-                            pass
+            if self._terminating:
+                result['error'] = '验证器正在关闭'
+                result['error_type'] = 'terminating'
+                return result
 
-                    try:
-                        from models.channel_mappings import extract_channel_name_from_url
-                        result['service_name'] = extract_channel_name_from_url(url)
-                    except Exception:
-                        result['service_name'] = ''
-
-                    return result
-
-            if proc.returncode != 0:
-                if 'Server returned 404' in stderr_output or '404 Not Found' in stderr_output:
-                    result['error'] = '服务器返回404'
-                    result['error_type'] = 'http_404'
-                elif 'Connection refused' in stderr_output:
-                    result['error'] = '连接被拒绝'
-                    result['error_type'] = 'connection_refused'
-                elif 'Connection timed out' in stderr_output or 'timed out' in stderr_output.lower():
-                    result['error'] = '连接超时'
-                    result['error_type'] = 'timeout'
-                elif 'No such file' in stderr_output or 'not found' in stderr_output.lower():
-                    result['error'] = '资源未找到'
-                    result['error_type'] = 'not_found'
-                else:
-                    result['error'] = f'探测失败(返回码:{proc.returncode})'
-                    result['error_type'] = 'probe_failed'
+            if timed_out or returncode is None:
+                result['error'] = f'超时({timeout}秒)'
+                result['error_type'] = 'timeout'
                 return result
 
-            result['error'] = '无媒体流'
-            result['error_type'] = 'no_streams'
+            self._fill_result_from_probe(result, url, returncode, stdout_data, stderr_data)
 
         except Exception as e:
             result['error'] = str(e)
             result['error_type'] = 'unknown_error'
         finally:
-            sem.release()
+            controller.release(host, result)
 
         if not result.get('valid', False):
             global_logger.debug(
@@ -235,6 +154,77 @@ class FfprobeStreamValidator:
 
         return result
 
+    def _fill_result_from_probe(self, result: Dict, url: str, returncode: int | None,
+                                stdout_data: bytes, stderr_data: bytes) -> Dict:
+        """根据 ffprobe 的返回码与输出填充验证结果（同步/异步引擎共用）"""
+        stderr_output = stderr_data.decode('utf-8', errors='ignore').strip()
+
+        probe_data = self._parse_probe_output(stdout_data)
+        if probe_data is not None:
+            streams = probe_data.get('streams', [])
+            if streams:
+                result['valid'] = True
+
+                video_stream = None
+                audio_stream = None
+                for s in streams:
+                    if s.get('codec_type') == 'video' and video_stream is None:
+                        video_stream = s
+                    elif s.get('codec_type') == 'audio' and audio_stream is None:
+                        audio_stream = s
+
+                if video_stream:
+                    width = video_stream.get('width')
+                    height = video_stream.get('height')
+                    if width and height:
+                        result['resolution'] = f"{width}x{height}"
+                    codec_name = video_stream.get('codec_name')
+                    if codec_name:
+                        result['codec'] = codec_name
+                    # HDR 元数据提取（与 detect_hdr_type 统一逻辑）
+                    result['hdr_type'] = self._extract_hdr_type(
+                        video_stream, probe_data.get('frames', [])
+                    )
+
+                format_info = probe_data.get('format', {})
+                bitrate = format_info.get('bit_rate')
+                if bitrate:
+                    try:
+                        bitrate_kbps = int(int(bitrate) / 1000)
+                        result['bitrate'] = f"{bitrate_kbps}kbps"
+                    except (ValueError, TypeError):
+                        pass
+
+                try:
+                    from models.channel_mappings import extract_channel_name_from_url
+                    result['service_name'] = extract_channel_name_from_url(url)
+                except Exception:
+                    result['service_name'] = ''
+
+                return result
+
+        if returncode != 0:
+            if 'Server returned 404' in stderr_output or '404 Not Found' in stderr_output:
+                result['error'] = '服务器返回404'
+                result['error_type'] = 'http_404'
+            elif 'Connection refused' in stderr_output:
+                result['error'] = '连接被拒绝'
+                result['error_type'] = 'connection_refused'
+            elif 'Connection timed out' in stderr_output or 'timed out' in stderr_output.lower():
+                result['error'] = '连接超时'
+                result['error_type'] = 'timeout'
+            elif 'No such file' in stderr_output or 'not found' in stderr_output.lower():
+                result['error'] = '资源未找到'
+                result['error_type'] = 'not_found'
+            else:
+                result['error'] = f'探测失败(返回码:{returncode})'
+                result['error_type'] = 'probe_failed'
+            return result
+
+        result['error'] = '无媒体流'
+        result['error_type'] = 'no_streams'
+        return result
+
     def _build_ffprobe_command(self, ffprobe_path: str, url: str, timeout: int) -> list:
         cmd = [
             ffprobe_path,
@@ -367,8 +357,34 @@ class FfprobeStreamValidator:
             return None
 
     @classmethod
-    def set_max_concurrent(cls, max_count):
-        cls._semaphore = threading.Semaphore(max(1, max_count))
+    def set_max_concurrent(cls, max_count, max_limit: int | None = None,
+                           per_host_limit: int | None = None, adaptive: bool | None = None):
+        """设定初始并发上限；max_limit 大于 max_count 时由控制器在该范围内自动调整"""
+        cls._controller.configure(max_count, max_limit=max_limit,
+                                  per_host_limit=per_host_limit, adaptive=adaptive)
+
+    @classmethod
+    def set_native_probe(cls, enabled: bool, dwell: float | None = None):
+        """设置组播/udpxy 是否使用内置 TS 探测，以及首包后继续收集信息的时长（秒）"""
+        cls._native_probe = enabled
+        if dwell is not None:
+            cls._native_probe_dwell = max(0.0, dwell)
+
+    @classmethod
+    def uses_native_probe(cls, url: str) -> bool:
+        return cls._native_probe and is_native_probe_target(url)
+
+    def _validate_native(self, url: str, timeout: int) -> Dict:
+        """组播/udpxy 探测：在组播探测线程中收包解析，不占用 ffprobe 并发名额"""
+        if self._terminating:
+            result = self._empty_result(url)
+            result['error'] = '验证器正在关闭'
+            result['error_type'] = 'terminating'
+            return result
+        return get_multicast_probe().probe(
+            url, timeout=timeout, dwell=self._native_probe_dwell,
+            headers=self.get_headers(), cancelled=lambda: self._terminating
+        )
 
     @classmethod
     def set_user_agent(cls, user_agent: str):
@@ -403,6 +419,7 @@ class FfprobeStreamValidator:
     @classmethod
     def terminate_all(cls):
         cls._terminating = True
+        get_multicast_probe().cancel_all()
         with cls._process_lock:
             for pid, proc in list(cls._active_processes.items()):
                 if proc.poll() is None:
@@ -415,7 +432,17 @@ class FfprobeStreamValidator:
 
     @classmethod
     def set_terminating(cls):
+        """设置终止标志并结束进行中的探测进程（不等待），工作线程随即返回 terminating"""
         cls._terminating = True
+        get_multicast_probe().cancel_all()
+        with cls._process_lock:
+            procs = list(cls._active_processes.values())
+        for proc in procs:
+            if proc.poll() is None:
+                try:
+                    proc.kill()
+                except Exception:
+                    pass
 
     @classmethod
     def destroy_all_handles(cls):
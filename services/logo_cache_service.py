@@ -1,26 +1,41 @@
 import os
 import hashlib
+import heapq
+import itertools
 import time
 import json
 import threading
 from collections import OrderedDict
-from PySide6.QtCore import QObject, Signal, QUrl, QTimer, Qt, QBuffer, QIODevice, QThread
+from urllib.parse import urlsplit
+from PySide6.QtCore import QObject, Signal, QUrl, Qt, QBuffer, QIODevice, QThread
 from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 from PySide6.QtGui import QPixmap, QImage
 from utils.thread_safety import ThreadSafeQObject
 from core.log_manager import global_logger as logger
+from core.user_data_store import UserDataStore
+
+
+# 台标下载优先级：可见行 > 收藏 > 其余
+WARMUP_VISIBLE = 0
+WARMUP_FAVORITE = 1
+WARMUP_BACKGROUND = 2
+
+_META_TABLE = 'logo_meta'
 
 
 class LogoCacheService(ThreadSafeQObject):
     logo_loaded = Signal(str, QPixmap)
 
     CACHE_DIR_NAME = 'logo_cache'
-    META_FILE = 'meta.json'
+    META_FILE = 'meta.db'
+    LEGACY_META_FILE = 'meta.json'
     DEFAULT_TTL = 7 * 24 * 3600
     MAX_CACHE_SIZE = 500
     NEGATIVE_CACHE_TTL = 3600
     MIN_IMAGE_DATA_SIZE = 100
     SUPPORTED_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.webp', '.bmp', '.svg', '.ico')
+    MAX_CONCURRENT_DOWNLOADS = 16
+    MAX_DOWNLOADS_PER_HOST = 4
 
     @staticmethod
     def scale_logo_pixmap(pixmap, size=60):
@@ -69,34 +84,45 @@ class LogoCacheService(ThreadSafeQObject):
         app_dir = get_app_data_dir()
         self._cache_dir = os.path.join(app_dir, self.CACHE_DIR_NAME)
         os.makedirs(self._cache_dir, exist_ok=True)
-        self._meta_path = os.path.join(self._cache_dir, self.META_FILE)
+        # 元数据保存在 SQLite 中，逐条写入、合并后由后台线程批量提交；内存中保留一份供查询
+        self._meta_store = UserDataStore(os.path.join(self._cache_dir, self.META_FILE), tables=(_META_TABLE,))
         self._meta = self._load_meta()
         self._image_cache = OrderedDict()
         self._negative_cache = {}
         self._lock = threading.Lock()
         self._network_manager = QNetworkAccessManager(self)
         self._pending_replies = {}
-        self._warmup_queue = []
-        self._warmup_timer = QTimer(self)
-        self._warmup_timer.setInterval(100)
-        self._warmup_timer.timeout.connect(self._process_warmup_queue)
+        # 下载调度：每个主机一个 (优先级, 序号, url) 小顶堆，_queued 记录 url 当前的最高优先级
+        self._host_queues = {}
+        self._host_inflight = {}
+        self._queued = {}
+        self._queue_seq = itertools.count()
         self._migrate_old_cache()
 
     def _load_meta(self):
-        try:
-            if os.path.exists(self._meta_path):
-                with open(self._meta_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-        except Exception as e:
-            logger.debug(f"加载台标元数据失败: {e}")
-        return {}
-
-    def _save_meta(self):
-        try:
-            with open(self._meta_path, 'w', encoding='utf-8') as f:
-                json.dump(self._meta, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            logger.debug(f"保存台标元数据失败: {e}")
+        meta = {key: entry for key, entry in self._meta_store.items(_META_TABLE) if isinstance(entry, dict)}
+        legacy_path = os.path.join(self._cache_dir, self.LEGACY_META_FILE)
+        if os.path.exists(legacy_path):
+            try:
+                with open(legacy_path, 'r', encoding='utf-8') as f:
+                    legacy = json.load(f)
+                for key, entry in legacy.items():
+                    if key not in meta and isinstance(entry, dict):
+                        meta[key] = entry
+                        self._meta_store.put(_META_TABLE, key, entry, entry.get('time', 0))
+                os.replace(legacy_path, legacy_path + '.migrated')
+                logger.info(f"台标元数据已迁移到 SQLite: {len(legacy)} 条")
+            except Exception as e:
+                logger.debug(f"迁移台标元数据失败: {e}")
+        return meta
+
+    def _set_meta(self, key, entry):
+        self._meta[key] = entry
+        self._meta_store.put(_META_TABLE, key, entry, entry.get('time', 0))
+
+    def _drop_meta(self, key):
+        if self._meta.pop(key, None) is not None:
+            self._meta_store.delete(_META_TABLE, key)
 
     def _url_to_key(self, url):
         return hashlib.sha1(url.encode('utf-8')).hexdigest()
@@ -149,7 +175,6 @@ class LogoCacheService(ThreadSafeQObject):
 
     def _migrate_old_cache(self):
         try:
-            migrated = False
             for key, meta in list(self._meta.items()):
                 if 'ext' not in meta:
                     old_path = self._disk_path(key, '')
@@ -158,19 +183,15 @@ class LogoCacheService(ThreadSafeQObject):
                         new_path = self._disk_path(key, ext)
                         os.rename(old_path, new_path)
                         meta['ext'] = ext
-                        migrated = True
                     else:
                         found = self._find_disk_path(key)
                         if found:
                             ext = os.path.splitext(found)[1]
                             meta['ext'] = ext if ext else '.png'
-                            migrated = True
                         else:
                             ext = self._guess_ext_from_url(meta.get('url', ''))
                             meta['ext'] = ext
-                            migrated = True
-            if migrated:
-                self._save_meta()
+                    self._set_meta(key, meta)
         except Exception as e:
             logger.debug(f"迁移台标缓存失败: {e}")
 
@@ -202,8 +223,7 @@ class LogoCacheService(ThreadSafeQObject):
             if time.time() - cached_at > self.DEFAULT_TTL:
                 try:
                     os.remove(disk_path)
-                    self._meta.pop(key, None)
-                    self._save_meta()
+                    self._drop_meta(key)
                 except Exception as e:
                     logger.debug(f"淘汰过期台标失败: {e}")
                 return None
@@ -289,8 +309,7 @@ class LogoCacheService(ThreadSafeQObject):
             }
             if content_hash:
                 meta_entry['content_hash'] = content_hash
-            self._meta[key] = meta_entry
-            self._save_meta()
+            self._set_meta(key, meta_entry)
         except Exception as e:
             logger.debug(f"缓存台标元数据失败: {e}")
 
@@ -300,10 +319,11 @@ class LogoCacheService(ThreadSafeQObject):
         if reason:
             logger.debug(f"台标标记为无效: {reason} | {url[:80]}")
 
-    def fetch_async(self, url, force=False):
+    def fetch_async(self, url, force=False, priority=WARMUP_VISIBLE):
+        """异步下载台标；下载由调度队列按优先级与主机并发上限发起"""
         if not url:
             return
-        if not self._ensure_main_thread(self.fetch_async, url, force):
+        if not self._ensure_main_thread(self.fetch_async, url, force, priority):
             return
         with self._lock:
             if url in self._negative_cache:
@@ -321,9 +341,59 @@ class LogoCacheService(ThreadSafeQObject):
             if url in self._pending_replies:
                 return
 
-        self._start_download(url)
+        self._enqueue_download(url, priority)
+
+    @staticmethod
+    def _host_of(url):
+        try:
+            return urlsplit(url).netloc.lower()
+        except ValueError:
+            return ''
+
+    def _enqueue_download(self, url, priority):
+        """按 url 去重入队；已在队列中时只会提升优先级"""
+        queued = self._queued.get(url)
+        if queued is not None and queued <= priority:
+            return
+        self._queued[url] = priority
+        # 提升优先级时旧条目留在堆中，出队时按 _queued 识别后丢弃
+        heapq.heappush(self._host_queues.setdefault(self._host_of(url), []),
+                       (priority, next(self._queue_seq), url))
+        self._pump_downloads()
+
+    def _pop_next_download(self):
+        """在未达到并发上限的主机中取优先级最高（同级最早入队）的 url"""
+        best = None
+        for host, queue in list(self._host_queues.items()):
+            # 丢弃过期的条目
+            while queue and self._queued.get(queue[0][2]) != queue[0][0]:
+                heapq.heappop(queue)
+            if not queue:
+                del self._host_queues[host]
+                continue
+            if self._host_inflight.get(host, 0) >= self.MAX_DOWNLOADS_PER_HOST:
+                continue
+            if best is None or queue[0][:2] < best[0][:2]:
+                best = (queue[0], host)
+        if best is None:
+            return None
+        _, host = best
+        url = heapq.heappop(self._host_queues[host])[2]
+        del self._queued[url]
+        return url
+
+    def _pump_downloads(self):
+        while len(self._pending_replies) < self.MAX_CONCURRENT_DOWNLOADS:
+            url = self._pop_next_download()
+            if url is None:
+                return
+            if url in self._pending_replies:
+                continue
+            self._start_download(url)
 
     def _start_download(self, url):
+        host = self._host_of(url)
+        self._host_inflight[host] = self._host_inflight.get(host, 0) + 1
         try:
             request = QNetworkRequest(QUrl(url))
             request.setHeader(QNetworkRequest.KnownHeaders.UserAgentHeader,
@@ -333,11 +403,24 @@ class LogoCacheService(ThreadSafeQObject):
                 self._pending_replies[url] = reply
             reply.finished.connect(lambda: self._on_download_finished(url, reply))
         except Exception as ex:
+            self._release_host(host)
             self.mark_negative(url, f"创建请求异常: {ex}")
 
+    def _release_host(self, host):
+        count = self._host_inflight.get(host, 0) - 1
+        if count > 0:
+            self._host_inflight[host] = count
+        else:
+            self._host_inflight.pop(host, None)
+
     def _on_download_finished(self, url, reply):
         with self._lock:
-            self._pending_replies.pop(url, None)
+            if self._pending_replies.get(url) is not reply:
+                # 已被 shutdown 取消
+                reply.deleteLater()
+                return
+            del self._pending_replies[url]
+        self._release_host(self._host_of(url))
         try:
             if reply.error() != QNetworkReply.NetworkError.NoError:
                 err = reply.error()
@@ -370,8 +453,7 @@ class LogoCacheService(ThreadSafeQObject):
             if old_hash and old_hash == content_hash:
                 meta_entry['time'] = time.time()
                 meta_entry['ext'] = ext
-                self._meta[key] = meta_entry
-                self._save_meta()
+                self._set_meta(key, meta_entry)
                 return
 
             image = QImage()
@@ -385,29 +467,41 @@ class LogoCacheService(ThreadSafeQObject):
             self.mark_negative(url, f"下载回调异常: {e}")
         finally:
             reply.deleteLater()
+            self._pump_downloads()
 
-    def warmup(self, urls):
+    def warmup(self, urls, priority=WARMUP_BACKGROUND):
+        """预热台标：跳过已缓存（未过期）的，其余按优先级进入下载队列"""
         if not urls:
             return
-        if not self._ensure_main_thread(self.warmup, urls):
+        if not self._ensure_main_thread(self.warmup, urls, priority):
             return
-        self._warmup_queue.extend(urls)
-        if not self._warmup_timer.isActive():
-            self._warmup_timer.start()
-
-    def _process_warmup_queue(self):
-        if not self._warmup_queue:
-            self._warmup_timer.stop()
-            return
-        batch = 5
-        for _ in range(batch):
-            if not self._warmup_queue:
-                break
-            url = self._warmup_queue.pop(0)
-            if url and url not in self._image_cache and url not in self._negative_cache:
-                cached = self.get(url)
-                if not cached:
-                    self.fetch_async(url)
+        now = time.time()
+        with self._lock:
+            skip = set(self._image_cache) | set(self._pending_replies)
+            skip.update(url for url, t in self._negative_cache.items() if now - t < self.NEGATIVE_CACHE_TTL)
+        for url in urls:
+            if not url or url in skip:
+                continue
+            meta_entry = self._meta.get(self._url_to_key(url))
+            if meta_entry and now - meta_entry.get('time', 0) <= self.DEFAULT_TTL:
+                continue
+            skip.add(url)
+            self._enqueue_download(url, priority)
+
+    def shutdown(self):
+        """清空下载队列、取消进行中的请求并提交元数据"""
+        self._host_queues.clear()
+        self._queued.clear()
+        with self._lock:
+            replies = list(self._pending_replies.values())
+            self._pending_replies.clear()
+        self._host_inflight.clear()
+        for reply in replies:
+            try:
+                reply.abort()
+            except RuntimeError:
+                pass
+        self._meta_store.close()
 
     def clear(self):
         with self._lock:
@@ -416,10 +510,11 @@ class LogoCacheService(ThreadSafeQObject):
         try:
             for f in os.listdir(self._cache_dir):
                 fp = os.path.join(self._cache_dir, f)
-                if os.path.isfile(fp):
+                # meta.db 及其 WAL 文件由元数据存储自己清空
+                if os.path.isfile(fp) and not f.startswith('meta.'):
                     os.remove(fp)
             self._meta.clear()
-            self._save_meta()
+            self._meta_store.clear(_META_TABLE)
         except Exception as e:
             logger.debug(f"清空台标缓存失败: {e}")
 
@@ -436,6 +531,4 @@ class LogoCacheService(ThreadSafeQObject):
                     os.remove(disk_path)
             except Exception:
                 pass
-            self._meta.pop(key, None)
-        if expired_keys:
-            self._save_meta()
+            self._drop_meta(key)
@@ -1,35 +1,164 @@
-import gzip
+import codecs
 import os
 import re
-from typing import Any, Dict, List, Optional, Tuple, Union
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urlparse, urljoin
 
 from core.log_manager import global_logger as logger
 
 
-def detect_and_decode_text(raw_bytes: Union[bytes, None]) -> str:
-    if not raw_bytes:
-        return ''
-    for enc in ('utf-8-sig', 'utf-8'):
-        try:
-            return raw_bytes.decode(enc)
-        except (UnicodeDecodeError, ValueError):
-            continue
-    for enc in ('gb18030', 'gbk', 'gb2312'):
-        try:
-            return raw_bytes.decode(enc)
-        except (UnicodeDecodeError, ValueError):
-            continue
-    for enc in ('big5', 'shift_jis', 'euc-kr', 'euc-jp'):
+# 分块读取/解码的块大小（字节）
+_CHUNK_SIZE = 64 * 1024
+# 编码探测窗口：从第一个非 ASCII 字节起最多收集这么多字节再判断编码
+_PREFIX_SIZE = 64 * 1024
+# 流式解析每批交付的频道数
+BATCH_SIZE = 500
+_CANDIDATE_ENCODINGS = ('utf-8', 'gb18030', 'big5', 'shift_jis', 'euc-kr', 'euc-jp')
+# 与 str.splitlines() 相同的换行符集合
+_LINE_BREAK = re.compile('[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
+
+
+def detect_encoding(prefix: bytes, final: bool = False) -> str:
+    """由开头的一段字节判断编码
+
+    前缀可能截断在多字节字符中间，用增量解码器（final=False）容忍末尾不完整的字符。
+    """
+    if prefix.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    for enc in _CANDIDATE_ENCODINGS:
         try:
-            return raw_bytes.decode(enc)
+            codecs.getincrementaldecoder(enc)().decode(prefix, final=final)
+            return enc
         except (UnicodeDecodeError, ValueError):
             continue
     try:
         import locale
-        return raw_bytes.decode(locale.getpreferredencoding(), errors='replace')
+        enc = locale.getpreferredencoding()
+        codecs.lookup(enc)
+        return enc
     except Exception:
-        return raw_bytes.decode('utf-8', errors='replace')
+        return 'utf-8'
+
+
+def _iter_gunzip(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """首块是 gzip 魔数时边读边解压，否则原样透传"""
+    chunks = iter(chunks)
+    first = next(chunks, b'')
+    if not is_gzip(first):
+        if first:
+            yield first
+        yield from chunks
+        return
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    try:
+        data = decompressor.decompress(first)
+    except zlib.error as e:
+        logger.debug(f"gzip解压数据失败: {e}")
+        yield first
+        yield from chunks
+        return
+    if data:
+        yield data
+    try:
+        for chunk in chunks:
+            data = decompressor.decompress(chunk)
+            if data:
+                yield data
+        data = decompressor.flush()
+        if data:
+            yield data
+    except zlib.error as e:
+        logger.debug(f"gzip解压数据失败: {e}")
+
+
+def iter_decoded_text(chunks: Iterable[bytes]) -> Iterator[str]:
+    """把字节块流解码为文本块流
+
+    纯 ASCII 的部分对所有候选编码解码结果相同，直接透传；遇到第一个非 ASCII 字节后
+    收集一个前缀窗口判断编码，之后用增量解码器处理剩余内容，不需要整个文件在内存中。
+    """
+    decoder = None
+    pending = bytearray()
+    for chunk in _iter_gunzip(chunks):
+        if decoder is not None:
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+            continue
+        pending += chunk
+        if pending.isascii():
+            yield pending.decode('ascii')
+            pending.clear()
+            continue
+        if len(pending) < _PREFIX_SIZE:
+            continue
+        decoder = codecs.getincrementaldecoder(detect_encoding(bytes(pending)))(errors='replace')
+        yield decoder.decode(bytes(pending))
+        pending.clear()
+    if decoder is None:
+        if not pending:
+            return
+        decoder = codecs.getincrementaldecoder(detect_encoding(bytes(pending), final=True))(errors='replace')
+        pending = bytes(pending)
+    else:
+        pending = b''
+    tail = decoder.decode(pending, final=True)
+    if tail:
+        yield tail
+
+
+def iter_text_lines(text_chunks: Iterable[str]) -> Iterator[str]:
+    """把文本块流切分为行（跨块的行会被拼接）"""
+    tail = ''
+    for text in text_chunks:
+        lines = _LINE_BREAK.split(tail + text if tail else text)
+        tail = lines.pop()
+        yield from lines
+    if tail:
+        yield tail
+
+
+def _iter_file_chunks(filepath: str, chunk_size: int) -> Iterator[bytes]:
+    with open(filepath, 'rb') as f:
+        yield from _iter_stream_chunks(f, chunk_size)
+
+
+def _iter_stream_chunks(stream, chunk_size: int) -> Iterator[bytes]:
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _iter_data_chunks(data: bytes, chunk_size: int) -> Iterator[bytes]:
+    view = memoryview(data)
+    for i in range(0, len(view), chunk_size):
+        yield view[i:i + chunk_size].tobytes()
+
+
+def iter_m3u_file_lines(filepath: str, chunk_size: int = _CHUNK_SIZE) -> Iterator[str]:
+    """分块读取播放列表文件并逐行产出（支持 gzip）"""
+    if not os.path.isfile(filepath):
+        raise FileNotFoundError(f"文件不存在: {filepath}")
+    return iter_text_lines(iter_decoded_text(_iter_file_chunks(filepath, chunk_size)))
+
+
+def iter_m3u_stream_lines(stream, chunk_size: int = _CHUNK_SIZE) -> Iterator[str]:
+    """逐行产出二进制流（如 HTTP 响应体）中的播放列表（支持 gzip），边读边解码"""
+    return iter_text_lines(iter_decoded_text(_iter_stream_chunks(stream, chunk_size)))
+
+
+def iter_m3u_data_lines(data: bytes, chunk_size: int = _CHUNK_SIZE) -> Iterator[str]:
+    """逐行产出下载得到的播放列表数据（支持 gzip），不生成整个解码后的字符串"""
+    return iter_text_lines(iter_decoded_text(_iter_data_chunks(data or b'', chunk_size)))
+
+
+def detect_and_decode_text(raw_bytes: Union[bytes, None]) -> str:
+    if not raw_bytes:
+        return ''
+    return ''.join(iter_decoded_text(_iter_data_chunks(raw_bytes, _CHUNK_SIZE)))
 
 
 def is_gzip(data: bytes) -> bool:
@@ -39,23 +168,11 @@ def is_gzip(data: bytes) -> bool:
 def load_m3u_file(filepath: str) -> str:
     if not os.path.isfile(filepath):
         raise FileNotFoundError(f"文件不存在: {filepath}")
-    with open(filepath, 'rb') as f:
-        raw = f.read()
-    if is_gzip(raw):
-        try:
-            raw = gzip.decompress(raw)
-        except Exception as e:
-            logger.debug(f"gzip解压raw数据失败: {e}")
-    return detect_and_decode_text(raw)
+    return ''.join(iter_decoded_text(_iter_file_chunks(filepath, _CHUNK_SIZE)))
 
 
 def load_m3u_from_url_data(data: bytes) -> str:
-    if is_gzip(data):
-        try:
-            data = gzip.decompress(data)
-        except Exception as e:
-            logger.debug(f"gzip解压data失败: {e}")
-    return detect_and_decode_text(data)
+    return ''.join(iter_decoded_text(_iter_data_chunks(data or b'', _CHUNK_SIZE)))
 
 
 def parse_attributes(attr_string: str) -> Dict[str, str]:
@@ -363,6 +480,16 @@ def _make_empty_channel(group: str = '未分类', groups: Optional[List[str]] =
     }
 
 
+_EXTINF_ATTR_PATTERN = re.compile(r'([\w-]+)=["\']([^"\']*)["\']')
+
+
+def extinf_tags(extinf_content: str) -> Dict[str, str]:
+    """#EXTINF 内容（不含前缀）属性部分的全部标签，与解析时得到的 _all_tags 一致"""
+    last_comma = extinf_content.rfind(',')
+    attrs_part = extinf_content[:last_comma].strip() if last_comma > 0 else ''
+    return dict(_EXTINF_ATTR_PATTERN.findall(attrs_part))
+
+
 def _parse_extinf_line(extinf_content: str, current_group: Union[str, List[str]], genre_group_active: bool) -> Tuple[Optional[Dict[str, Any]], Union[str, List[str]], bool]:
     genre_match = re.search(r',\s*#genre#\s*', extinf_content)
     if genre_match:
@@ -392,8 +519,7 @@ def _parse_extinf_line(extinf_content: str, current_group: Union[str, List[str]]
         extinf=extinf_content,
     )
 
-    attr_pattern = r'([\w-]+)=["\']([^"\']*)["\']'
-    matches = re.findall(attr_pattern, attrs_part)
+    matches = _EXTINF_ATTR_PATTERN.findall(attrs_part)
 
     all_tags = {}
     groups = []
@@ -448,113 +574,153 @@ def _inherit_header_attrs(channel: Dict[str, Any], header_attrs: Dict[str, str])
                 channel['_all_tags'][k] = v
 
 
-def parse_m3u_content(content: str) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
-    channels: List[Dict[str, Any]] = []
-    if not content:
-        return channels, {}
-    lines = content.splitlines()
-    current_channel: Optional[Dict[str, Any]] = None
-    current_group: Union[str, List[str]] = '未分类'
-    genre_group_active = False
-    header_attrs = {}
-
-    for line in lines:
-        line = line.strip()
+def _groups_of(current_group: Union[str, List[str]]) -> List[str]:
+    if isinstance(current_group, str):
+        return [g.strip() for g in current_group.split(';') if g.strip()]
+    if isinstance(current_group, list):
+        return current_group
+    return ['未分类']
+
+
+class M3UStreamParser:
+    """逐行的 M3U/TXT 播放列表解析器
+
+    每喂入一行最多产出一个频道，解析状态（当前分组、未配对的 #EXTINF、文件头属性）
+    保存在实例上，因此可以边读边解析、分批交付频道，不必先得到完整的内容和频道列表。
+    """
+
+    def __init__(self):
+        self.header_attrs: Dict[str, str] = {}
+        self.count = 0
+        self._current_channel: Optional[Dict[str, Any]] = None
+        self._current_group: Union[str, List[str]] = '未分类'
+        self._genre_group_active = False
+
+    def feed(self, line: str) -> Optional[Dict[str, Any]]:
+        """解析一行，该行完成了一个频道时返回它（已分配 id）"""
+        channel = self._parse_line(line.strip())
+        if channel is not None:
+            self.count += 1
+            channel['id'] = self.count
+        return channel
+
+    def iter_channels(self, lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        for line in lines:
+            channel = self.feed(line)
+            if channel is not None:
+                yield channel
+
+    def iter_batches(self, lines: Iterable[str], batch_size: int = BATCH_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """按批产出频道；header_attrs 在读到 #EXTM3U 行后即可用"""
+        batch: List[Dict[str, Any]] = []
+        for channel in self.iter_channels(lines):
+            batch.append(channel)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _parse_line(self, line: str) -> Optional[Dict[str, Any]]:
         if not line:
-            continue
+            return None
 
         if line.startswith('#EXTM3U'):
-            header_attrs = extract_header_attributes(line)
-            continue
+            self.header_attrs = extract_header_attributes(line)
+            return None
 
         if line.startswith('#EXTGRP:'):
             current_group = line[8:].strip()
             if current_group.startswith('"') and current_group.endswith('"'):
                 current_group = current_group[1:-1]
-            continue
+            self._current_group = current_group
+            return None
 
         if line.startswith('#EXTINF:'):
             extinf_content = line[8:].strip()
-            current_channel, current_group, genre_group_active = _parse_extinf_line(
-                extinf_content, current_group, genre_group_active
+            self._current_channel, self._current_group, self._genre_group_active = _parse_extinf_line(
+                extinf_content, self._current_group, self._genre_group_active
             )
-            if current_channel:
-                _inherit_header_attrs(current_channel, header_attrs)
-            continue
+            if self._current_channel:
+                _inherit_header_attrs(self._current_channel, self.header_attrs)
+            return None
 
-        if line.startswith('#EXTVLCOPT:video-resolution=') and current_channel:
+        if line.startswith('#EXTVLCOPT:video-resolution=') and self._current_channel:
             resolution = line.split('=', 1)[1].strip()
-            current_channel['resolution'] = resolution
-            continue
+            self._current_channel['resolution'] = resolution
+            return None
 
         if line.startswith('#'):
-            continue
+            return None
+
+        if ',' in line and not self._current_channel:
+            channel = self._parse_txt_line(line)
+            if channel is not None:
+                return channel
+
+        url = line.strip()
+        valid, reason = is_valid_channel_url(url)
+        if self._current_channel:
+            channel, self._current_channel = self._current_channel, None
+            if not valid:
+                ch_name = channel.get('name', '?')
+                logger.debug(f"M3U解析跳过: 频道'{ch_name}' URL无效({reason}): {url}")
+                return None
+            channel['url'] = url
+            _extract_fcc_to_channel(url, channel)
+            _auto_detect_catchup_from_url(url, channel)
+            return channel
+
+        if not valid:
+            logger.debug(f"M3U解析跳过: 裸URL无效({reason}): {url}")
+            return None
+        try:
+            from models.channel_mappings import extract_channel_name_from_url
+            ch_name = extract_channel_name_from_url(url)
+        except Exception:
+            ch_name = ''
+        channel = self._make_grouped_channel(ch_name, url)
+        _auto_detect_catchup_from_url(url, channel)
+        _inherit_header_attrs(channel, self.header_attrs)
+        return channel
+
+    def _parse_txt_line(self, line: str) -> Optional[Dict[str, Any]]:
+        """TXT 格式的“名称,URL”行"""
+        parts = line.split(',', 1)
+        if len(parts) != 2:
+            return None
+        maybe_name = parts[0].strip()
+        maybe_url = parts[1].strip()
+        valid, _ = is_valid_channel_url(maybe_url)
+        if valid:
+            channel = self._make_grouped_channel(maybe_name, maybe_url)
+            _extract_fcc_to_channel(maybe_url, channel)
+        else:
+            valid, _ = is_valid_channel_url(line.strip())
+            if not valid:
+                return None
+            channel = self._make_grouped_channel(maybe_name, line.strip())
+        _auto_detect_catchup_from_url(channel['url'], channel)
+        _inherit_header_attrs(channel, self.header_attrs)
+        return channel
+
+    def _make_grouped_channel(self, name: str, url: str) -> Dict[str, Any]:
+        groups_list = _groups_of(self._current_group)
+        primary_group = groups_list[0] if groups_list else '未分类'
+        channel = _make_empty_channel(group=primary_group, groups=groups_list)
+        channel['name'] = name if name else '未命名'
+        channel['url'] = url
+        return channel
+
 
-        txt_parsed = False
-        if ',' in line and not current_channel:
-            parts = line.split(',', 1)
-            if len(parts) == 2:
-                maybe_name = parts[0].strip()
-                maybe_url = parts[1].strip()
-                valid, reason = is_valid_channel_url(maybe_url)
-                if valid:
-                    groups_list = [g.strip() for g in current_group.split(';') if g.strip()] if isinstance(current_group, str) else (current_group if isinstance(current_group, list) else ['未分类'])
-                    primary_group = groups_list[0] if groups_list else '未分类'
-                    ch = _make_empty_channel(group=primary_group, groups=groups_list)
-                    ch['name'] = maybe_name if maybe_name else '未命名'
-                    ch['url'] = maybe_url
-                    _extract_fcc_to_channel(maybe_url, ch)
-                    _auto_detect_catchup_from_url(maybe_url, ch)
-                    _inherit_header_attrs(ch, header_attrs)
-                    channels.append(ch)
-                    txt_parsed = True
-                else:
-                    valid2, reason2 = is_valid_channel_url(line.strip())
-                    if valid2:
-                        groups_list = [g.strip() for g in current_group.split(';') if g.strip()] if isinstance(current_group, str) else (current_group if isinstance(current_group, list) else ['未分类'])
-                        primary_group = groups_list[0] if groups_list else '未分类'
-                        ch = _make_empty_channel(group=primary_group, groups=groups_list)
-                        ch['name'] = maybe_name if maybe_name else '未命名'
-                        ch['url'] = line.strip()
-                        _auto_detect_catchup_from_url(line.strip(), ch)
-                        _inherit_header_attrs(ch, header_attrs)
-                        channels.append(ch)
-                        txt_parsed = True
-
-        if not txt_parsed:
-            if current_channel:
-                url = line.strip()
-                valid, reason = is_valid_channel_url(url)
-                if valid:
-                    current_channel['url'] = url
-                    _extract_fcc_to_channel(url, current_channel)
-                    _auto_detect_catchup_from_url(url, current_channel)
-                    channels.append(current_channel)
-                else:
-                    ch_name = current_channel.get('name', '?')
-                    logger.debug(f"M3U解析跳过: 频道'{ch_name}' URL无效({reason}): {url}")
-                current_channel = None
-            else:
-                url = line.strip()
-                valid, reason = is_valid_channel_url(url)
-                if valid:
-                    try:
-                        from models.channel_mappings import extract_channel_name_from_url
-                        ch_name = extract_channel_name_from_url(url)
-                    except Exception:
-                        ch_name = ''
-                    groups_list = [g.strip() for g in current_group.split(';') if g.strip()] if isinstance(current_group, str) else (current_group if isinstance(current_group, list) else ['未分类'])
-                    primary_group = groups_list[0] if groups_list else '未分类'
-                    ch = _make_empty_channel(group=primary_group, groups=groups_list)
-                    ch['name'] = ch_name if ch_name else '未命名'
-                    ch['url'] = url
-                    _auto_detect_catchup_from_url(url, ch)
-                    _inherit_header_attrs(ch, header_attrs)
-                    channels.append(ch)
-                else:
-                    logger.debug(f"M3U解析跳过: 裸URL无效({reason}): {url}")
-
-    for i, ch in enumerate(channels):
-        ch['id'] = i + 1
-
-    return channels, header_attrs
+def _iter_content_chunks(content: str) -> Iterator[str]:
+    for i in range(0, len(content), _CHUNK_SIZE):
+        yield content[i:i + _CHUNK_SIZE]
+
+
+def parse_m3u_content(content: str) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+    if not content:
+        return [], {}
+    parser = M3UStreamParser()
+    channels = list(parser.iter_channels(iter_text_lines(_iter_content_chunks(content))))
+    return channels, parser.header_attrs
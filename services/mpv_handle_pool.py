@@ -0,0 +1,168 @@
+"""
+mpv 句柄池
+
+探测类任务（流验证、缩略图截取）不再为每个 URL 创建、初始化并销毁 mpv 实例：
+- 句柄按固定配置创建并初始化一次，用完后 stop 回到空闲状态放回池中
+- 每次探测临时修改的属性（demuxer、rtsp-transport 等）记录原值，归还时恢复
+- 借出前做健康检查（丢弃残留事件、确认处于空闲状态），失效句柄直接销毁
+- 配置变化（User-Agent、Referer 等）后递增代号，旧代句柄不再复用
+- 句柄的创建与初始化串行进行，避免高并发下 mpv_create/mpv_initialize 失败
+"""
+
+import threading
+import time
+from typing import Any, Callable, List
+from core.log_manager import global_logger
+from services.mpv_common import (
+    MPV_EVENT_NONE,
+    MPV_EVENT_SHUTDOWN,
+    create_mpv_handle,
+    initialize_mpv,
+    destroy_mpv,
+    get_property_string,
+    set_property_string,
+    send_command,
+    wait_for_event,
+    _is_mpv_available,
+)
+
+# 归还时等待 stop 生效的最长时间（秒）
+_STOP_TIMEOUT = 1.0
+# 借出前最多丢弃的残留事件数
+_MAX_DRAIN_EVENTS = 256
+
+
+class PooledMpvHandle:
+    """从池中借出的 mpv 句柄"""
+
+    def __init__(self, handle, generation: int):
+        self.handle = handle
+        self.generation = generation
+        self._overrides = {}
+
+    def set_override(self, name: str, value: str) -> int:
+        """设置仅对本次探测生效的属性，归还时恢复原值"""
+        if name not in self._overrides:
+            self._overrides[name] = get_property_string(self.handle, name) or ''
+        return set_property_string(self.handle, name, value)
+
+    def _restore_overrides(self):
+        for name, original in self._overrides.items():
+            set_property_string(self.handle, name, original)
+        self._overrides.clear()
+
+
+class MpvHandlePool:
+    """预先初始化的空闲 mpv 句柄池（线程安全）"""
+
+    def __init__(self, name: str, configure: Callable[[Any], None], max_idle: int = 8):
+        """
+        Args:
+            name: 池名称（用于日志）
+            configure: 在 initialize 之前为新句柄设置选项的回调
+            max_idle: 最多保留的空闲句柄数，超出的句柄归还时直接销毁
+        """
+        self._name = name
+        self._configure = configure
+        self._max_idle = max(1, max_idle)
+        self._idle: List[PooledMpvHandle] = []
+        self._lock = threading.Lock()
+        self._create_lock = threading.Lock()
+        self._generation = 0
+
+    @property
+    def idle_count(self) -> int:
+        with self._lock:
+            return len(self._idle)
+
+    def set_max_idle(self, max_idle: int):
+        with self._lock:
+            self._max_idle = max(1, max_idle)
+            surplus = self._idle[self._max_idle:]
+            del self._idle[self._max_idle:]
+        for lease in surplus:
+            destroy_mpv(lease.handle)
+
+    def acquire(self) -> PooledMpvHandle | None:
+        """借出一个空闲句柄，池为空时新建；mpv 不可用或创建失败返回 None"""
+        while True:
+            with self._lock:
+                lease = self._idle.pop() if self._idle else None
+                generation = self._generation
+            if lease is None:
+                break
+            if lease.generation == generation and self._is_healthy(lease.handle):
+                return lease
+            destroy_mpv(lease.handle)
+        return self._create(generation)
+
+    def release(self, lease: PooledMpvHandle, reusable: bool = True):
+        """归还句柄：停止播放并恢复临时属性后放回池中，无法复用时销毁"""
+        if lease is None:
+            return
+        if reusable:
+            reusable = self._reset(lease)
+        if reusable:
+            with self._lock:
+                if lease.generation == self._generation and len(self._idle) < self._max_idle:
+                    self._idle.append(lease)
+                    return
+        destroy_mpv(lease.handle)
+
+    def invalidate(self):
+        """配置已变化：销毁空闲句柄，借出中的旧句柄归还时销毁"""
+        with self._lock:
+            self._generation += 1
+            idle = self._idle
+            self._idle = []
+        for lease in idle:
+            destroy_mpv(lease.handle)
+
+    def clear(self):
+        """销毁所有空闲句柄"""
+        self.invalidate()
+
+    def _create(self, generation: int) -> PooledMpvHandle | None:
+        if not _is_mpv_available():
+            return None
+        with self._create_lock:
+            handle = create_mpv_handle()
+            if not handle:
+                return None
+            try:
+                self._configure(handle)
+                if initialize_mpv(handle):
+                    return PooledMpvHandle(handle, generation)
+            except Exception as e:
+                global_logger.debug(f"mpv句柄池[{self._name}]初始化句柄失败: {e}")
+            destroy_mpv(handle)
+            return None
+
+    @staticmethod
+    def _is_healthy(handle) -> bool:
+        # 丢弃上次探测残留的事件，收到 SHUTDOWN 说明内核已退出
+        for _ in range(_MAX_DRAIN_EVENTS):
+            evt = wait_for_event(handle, 0)
+            if evt is None or evt.event_id == MPV_EVENT_NONE:
+                break
+            if evt.event_id == MPV_EVENT_SHUTDOWN:
+                return False
+        return get_property_string(handle, 'idle-active') == 'yes'
+
+    @staticmethod
+    def _reset(lease: PooledMpvHandle) -> bool:
+        handle = lease.handle
+        try:
+            if send_command(handle, ['stop']) < 0:
+                return False
+            deadline = time.time() + _STOP_TIMEOUT
+            while get_property_string(handle, 'idle-active') != 'yes':
+                if time.time() >= deadline:
+                    return False
+                evt = wait_for_event(handle, 0.02)
+                if evt is not None and evt.event_id == MPV_EVENT_SHUTDOWN:
+                    return False
+            lease._restore_overrides()
+            return True
+        except Exception:
+            return False
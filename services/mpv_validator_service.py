@@ -14,10 +14,7 @@ from services.mpv_common import (
     MPV_END_FILE_REASON_STOP,
     MPV_END_FILE_REASON_ERROR,
     mpv_event_end_file,
-    create_mpv_handle,
-    initialize_mpv,
     destroy_mpv,
-    set_property_string as _mpv_set_property_string,
     set_option_string as _mpv_set_option_string,
     send_command as _mpv_send_command,
     wait_for_specific_event,
@@ -26,6 +23,8 @@ from services.mpv_common import (
     get_property_int as _mpv_get_property_int,
     _is_mpv_available,
 )
+from services.concurrency_controller import AdaptiveConcurrencyController, url_host
+from services.mpv_handle_pool import MpvHandlePool
 
 
 def get_optimal_thread_count():
@@ -33,65 +32,49 @@ def get_optimal_thread_count():
     return min(max(cpu, 4), 32)
 
 
-def _create_lightweight_mpv():
-    if not _is_mpv_available():
-        return None
-    try:
-        handle = create_mpv_handle()
-        if not handle:
-            return None
-        _mpv_set_option_string(handle, 'vo', 'null')
-        _mpv_set_option_string(handle, 'ao', 'null')
-        _mpv_set_option_string(handle, 'hwdec', 'no')
-        _mpv_set_option_string(handle, 'osc', 'no')
-        _mpv_set_option_string(handle, 'osd-bar', 'no')
-        _mpv_set_option_string(handle, 'idle', 'yes')
-        _mpv_set_option_string(handle, 'ytdl', 'no')
-        _mpv_set_option_string(handle, 'keep-open', 'yes')
-        _mpv_set_option_string(handle, 'log-level', 'fatal')
-        _mpv_set_option_string(handle, 'config', 'no')
-        _mpv_set_option_string(handle, 'demuxer-lavf-probesize', '1048576')
-        _mpv_set_option_string(handle, 'demuxer-lavf-analyzeduration', '5')
-        _mpv_set_option_string(handle, 'cache', 'yes')
-        _mpv_set_option_string(handle, 'cache-secs', '10')
-        _mpv_set_option_string(handle, 'demuxer-max-bytes', '16MiB')
-        _mpv_set_option_string(handle, 'demuxer-max-back-bytes', '8MiB')
-        _mpv_set_option_string(handle, 'tls-verify', 'no')
-
-        try:
-            from core.config_manager import ConfigManager
-            playback = ConfigManager().load_playback_settings()
-        except Exception:
-            playback = {}
-
-        net_timeout = playback.get('network_timeout_sec', 0)
-        if net_timeout > 0:
-            _mpv_set_option_string(handle, 'network-timeout', str(net_timeout))
-        else:
-            _mpv_set_option_string(handle, 'network-timeout', '10')
-
-        user_agent = MpvStreamValidator.get_user_agent()
-        if not user_agent:
-            user_agent = playback.get('user_agent', '')
-        if user_agent:
-            _mpv_set_option_string(handle, 'user-agent', user_agent)
-
-        http_headers = playback.get('http_headers', '')
-        referer = MpvStreamValidator.get_referer()
-        if http_headers:
-            header_val = http_headers.replace('\r\n', '\n').replace('\n', '\\n')
-            if referer and 'eferer' not in header_val:
-                header_val += f'\\nReferer: {referer}'
-            _mpv_set_option_string(handle, 'http-header-fields', header_val)
-        elif referer:
-            _mpv_set_option_string(handle, 'http-header-fields', f'Referer: {referer}')
-
-        if not initialize_mpv(handle):
-            destroy_mpv(handle)
-            return None
-        return handle
-    except Exception:
-        return None
+def _configure_lightweight_mpv(handle):
+    """为验证用句柄设置选项（initialize 之前调用，每个池化句柄只执行一次）"""
+    _mpv_set_option_string(handle, 'vo', 'null')
+    _mpv_set_option_string(handle, 'ao', 'null')
+    _mpv_set_option_string(handle, 'hwdec', 'no')
+    _mpv_set_option_string(handle, 'osc', 'no')
+    _mpv_set_option_string(handle, 'osd-bar', 'no')
+    _mpv_set_option_string(handle, 'idle', 'yes')
+    _mpv_set_option_string(handle, 'ytdl', 'no')
+    _mpv_set_option_string(handle, 'keep-open', 'yes')
+    _mpv_set_option_string(handle, 'log-level', 'fatal')
+    _mpv_set_option_string(handle, 'config', 'no')
+    _mpv_set_option_string(handle, 'demuxer-lavf-probesize', '1048576')
+    _mpv_set_option_string(handle, 'demuxer-lavf-analyzeduration', '5')
+    _mpv_set_option_string(handle, 'cache', 'yes')
+    _mpv_set_option_string(handle, 'cache-secs', '10')
+    _mpv_set_option_string(handle, 'demuxer-max-bytes', '16MiB')
+    _mpv_set_option_string(handle, 'demuxer-max-back-bytes', '8MiB')
+    _mpv_set_option_string(handle, 'tls-verify', 'no')
+
+    playback = MpvStreamValidator._get_playback_settings()
+
+    net_timeout = playback.get('network_timeout_sec', 0)
+    if net_timeout > 0:
+        _mpv_set_option_string(handle, 'network-timeout', str(net_timeout))
+    else:
+        _mpv_set_option_string(handle, 'network-timeout', '10')
+
+    user_agent = MpvStreamValidator.get_user_agent()
+    if not user_agent:
+        user_agent = playback.get('user_agent', '')
+    if user_agent:
+        _mpv_set_option_string(handle, 'user-agent', user_agent)
+
+    http_headers = playback.get('http_headers', '')
+    referer = MpvStreamValidator.get_referer()
+    if http_headers:
+        header_val = http_headers.replace('\r\n', '\n').replace('\n', '\\n')
+        if referer and 'eferer' not in header_val:
+            header_val += f'\\nReferer: {referer}'
+        _mpv_set_option_string(handle, 'http-header-fields', header_val)
+    elif referer:
+        _mpv_set_option_string(handle, 'http-header-fields', f'Referer: {referer}')
 
 
 def _try_get_resolution_and_codec(handle, retries=3, interval=0.3):
@@ -132,18 +115,19 @@ def _try_get_hdr_type(handle, retries=3, interval=0.3):
 
 
 class MpvStreamValidator:
-    _semaphore: threading.Semaphore = threading.Semaphore(get_optimal_thread_count())
+    _controller = AdaptiveConcurrencyController(get_optimal_thread_count())
     _user_agent: str | None = None
     _referer: str | None = None
     _headers_lock = threading.Lock()
     _active_handles: list = []
     _handles_lock = threading.Lock()
     _terminating = False
+    _pool = MpvHandlePool('validator', _configure_lightweight_mpv, max_idle=get_optimal_thread_count())
+    _playback_settings: dict | None = None
 
     @classmethod
-    def _get_semaphore(cls) -> threading.Semaphore:
-
-        return cls._semaphore
+    def _get_controller(cls) -> AdaptiveConcurrencyController:
+        return cls._controller
 
     def __init__(self, main_window=None):
         self.logger = global_logger
@@ -173,58 +157,56 @@ class MpvStreamValidator:
             result['error_type'] = 'terminating'
             return result
 
-        sem = self._get_semaphore()
+        controller = self._get_controller()
+        host = url_host(url)
         acquired = False
         for _ in range(60):
             if self._terminating:
                 result['error'] = '验证器正在关闭'
                 result['error_type'] = 'terminating'
                 return result
-            acquired = sem.acquire(timeout=0.5)
+            acquired = controller.acquire(host, timeout=0.5)
             if acquired:
                 break
 
         if not acquired:
+            controller.note_saturated()
             result['error'] = '并发数超限'
             result['error_type'] = 'concurrency_limit'
             return result
 
         handle = None
+        lease = None
+        reusable = False
         try:
-            handle = _create_lightweight_mpv()
-            if not handle:
+            lease = self._pool.acquire()
+            if not lease:
                 result['error'] = '创建mpv实例失败'
                 result['error_type'] = 'mpv_create_failed'
                 return result
+            handle = lease.handle
+            with self._handles_lock:
+                self._active_handles.append(handle)
 
+            # 按 URL 设置的属性只对本次探测生效，句柄归还时恢复
             u = url.lower()
             looks_ts = '/rtp/' in u or u.endswith('.ts') or 'proto=http' in u or u.startswith('udp://')
             if u.startswith('rtsp://'):
-                rtsp_transport = 'tcp'
-                try:
-                    from core.config_manager import ConfigManager
-                    cfg = ConfigManager()
-                    playback = cfg.load_playback_settings()
-                    rtsp_transport = playback.get('rtsp_transport', 'tcp')
-                except Exception:
-                    pass
-                _mpv_set_property_string(handle, 'rtsp-transport', rtsp_transport)
-                _mpv_set_property_string(handle, 'demuxer', 'lavf')
-                _mpv_set_property_string(handle, 'force-seekable', 'yes')
+                rtsp_transport = self._get_playback_settings().get('rtsp_transport', 'tcp')
+                lease.set_override('rtsp-transport', rtsp_transport)
+                lease.set_override('demuxer', 'lavf')
+                lease.set_override('force-seekable', 'yes')
             elif looks_ts:
-                _mpv_set_property_string(handle, 'demuxer', 'lavf')
-                _mpv_set_property_string(handle, 'demuxer-lavf-format', 'mpegts')
-                _mpv_set_property_string(handle, 'force-seekable', 'yes')
+                lease.set_override('demuxer', 'lavf')
+                lease.set_override('demuxer-lavf-format', 'mpegts')
+                lease.set_override('force-seekable', 'yes')
             elif u.startswith('http://') or u.startswith('https://'):
-                _mpv_set_property_string(handle, 'force-seekable', 'yes')
+                lease.set_override('force-seekable', 'yes')
 
             start_time = time.time()
 
             _mpv_send_command(handle, ['loadfile', url])
 
-            with self._handles_lock:
-                self._active_handles.append(handle)
-
             found_tracks = False
             found_tracks_time = 0.0
             event_id = 0
@@ -369,6 +351,8 @@ class MpvStreamValidator:
                 result['error'] = f'超时({timeout}秒)'
                 result['error_type'] = 'timeout'
 
+            reusable = event_id != MPV_EVENT_SHUTDOWN and not self._terminating
+
         except Exception as e:
             result['error'] = str(e)
             result['error_type'] = 'unknown_error'
@@ -379,11 +363,9 @@ class MpvStreamValidator:
                     if was_active:
                         self._active_handles.remove(handle)
                 if was_active:
-                    try:
-                        destroy_mpv(handle)
-                    except Exception:
-                        pass
-            sem.release()
+                    # 正常结束的句柄 stop 后放回池中复用，被 terminate_all 销毁的不再处理
+                    self._pool.release(lease, reusable=reusable)
+            controller.release(host, result)
 
         if not result.get('valid', False):
             global_logger.debug(
@@ -396,18 +378,46 @@ class MpvStreamValidator:
         return result
 
     @classmethod
-    def set_max_concurrent(cls, max_count):
-        cls._semaphore = threading.Semaphore(max(1, max_count))
+    def set_max_concurrent(cls, max_count, max_limit: int | None = None,
+                           per_host_limit: int | None = None, adaptive: bool | None = None):
+        """设定初始并发上限；max_limit 大于 max_count 时由控制器在该范围内自动调整"""
+        cls._controller.configure(max_count, max_limit=max_limit,
+                                  per_host_limit=per_host_limit, adaptive=adaptive)
+        cls._pool.set_max_idle(cls._controller.max_limit)
 
     @classmethod
     def set_user_agent(cls, user_agent: str):
         with cls._headers_lock:
+            changed = cls._user_agent != (user_agent if user_agent else None)
             cls._user_agent = user_agent if user_agent else None
+        if changed:
+            cls._pool.invalidate()
 
     @classmethod
     def set_referer(cls, referer: str):
         with cls._headers_lock:
+            changed = cls._referer != (referer if referer else None)
             cls._referer = referer if referer else None
+        if changed:
+            cls._pool.invalidate()
+
+    @classmethod
+    def _get_playback_settings(cls) -> dict:
+        """播放设置快照，句柄池清空时重新读取"""
+        playback = cls._playback_settings
+        if playback is None:
+            try:
+                from core.config_manager import ConfigManager
+                playback = ConfigManager().load_playback_settings()
+            except Exception:
+                playback = {}
+            cls._playback_settings = playback
+        return playback
+
+    @classmethod
+    def _clear_pool(cls):
+        cls._playback_settings = None
+        cls._pool.clear()
 
     @classmethod
     def get_headers(cls) -> dict:
@@ -440,6 +450,7 @@ class MpvStreamValidator:
                 destroy_mpv(handle)
             except Exception:
                 pass
+        cls._clear_pool()
 
     @classmethod
     def set_terminating(cls):
@@ -457,6 +468,7 @@ class MpvStreamValidator:
                 destroy_mpv(handle)
             except Exception:
                 pass
+        cls._clear_pool()
 
     @classmethod
     def reset_terminating(cls):
@@ -0,0 +1,683 @@
+"""
+组播 TS 原生探测
+
+udp:// / rtp:// 组播地址与 udpxy 的 /rtp/、/udp/ 代理不再为每个 URL 启动 ffprobe：
+- 直接加入 IGMP 组（或向 udpxy 发起 HTTP 请求），等待首批 TS 包
+- 解析 PAT/PMT 得到各基本流类型，按 PCR 计算码率，从 SPS / 序列头读取分辨率
+- 首包到达后最多再收集 dwell 秒，信息齐全即提前结束
+- 所有探测是同一个事件循环中的协程：同步调用方经单例的事件循环线程执行，
+  AsyncScanEngine 直接在自己的事件循环中 await，批量扫描组播不产生任何子进程
+
+结果字典与验证器格式一致，可直接替代 ffprobe 的探测结果。
+"""
+
+import asyncio
+import socket
+import threading
+import time
+from concurrent.futures import CancelledError
+from typing import Dict, List, Tuple
+from urllib.parse import urlsplit
+from core.log_manager import global_logger
+from services.stream_prefilter import (
+    TS_PACKET_SIZE,
+    TS_SYNC_BYTE,
+    classify_http_status,
+    open_udp_socket,
+    parse_udp_target,
+)
+from utils.singleton import Singleton
+
+
+DEFAULT_DWELL = 2.0
+# PCR 跨度达到该值（秒）后码率视为可信
+_MIN_PCR_SPAN = 0.5
+# 视频基本流最多缓存多少字节用于查找 SPS / 序列头
+_MAX_ES_BUFFER = 256 * 1024
+_PCR_HZ = 27_000_000
+_PCR_WRAP = (1 << 33) * 300
+
+# PMT stream_type → (codec_type, codec_name)，codec_name 与 ffprobe 一致
+STREAM_TYPES = {
+    0x01: ('video', 'mpeg1video'),
+    0x02: ('video', 'mpeg2video'),
+    0x10: ('video', 'mpeg4'),
+    0x1B: ('video', 'h264'),
+    0x24: ('video', 'hevc'),
+    0x42: ('video', 'cavs'),
+    0xD2: ('video', 'avs2'),
+    0x03: ('audio', 'mp2'),
+    0x04: ('audio', 'mp2'),
+    0x0F: ('audio', 'aac'),
+    0x11: ('audio', 'aac_latm'),
+    0x81: ('audio', 'ac3'),
+    0x87: ('audio', 'eac3'),
+}
+
+
+def is_native_probe_target(url: str) -> bool:
+    """是否可由原生探测处理：组播/单播 UDP、RTP，以及 udpxy 的 /rtp/、/udp/ 代理"""
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return False
+    scheme = parts.scheme.lower()
+    if scheme in ('udp', 'rtp'):
+        return parse_udp_target(parts) is not None
+    if scheme == 'http':
+        path = parts.path.lower()
+        return '/rtp/' in path or '/udp/' in path
+    return False
+
+
+def strip_rtp_header(data: bytes) -> bytes:
+    """去掉 RTP 头，返回其中的 TS 数据；裸 TS 原样返回"""
+    if not data or data[0] == TS_SYNC_BYTE:
+        return data
+    if len(data) > 12 and (data[0] >> 6) == 2:
+        offset = 12 + (data[0] & 0x0F) * 4
+        if data[0] & 0x10 and len(data) >= offset + 4:
+            offset += 4 + int.from_bytes(data[offset + 2:offset + 4], 'big') * 4
+        return data[offset:]
+    return b''
+
+
+class _BitReader:
+    """按位读取（去除防竞争字节后的 RBSP）"""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.pos = 0
+
+    def u(self, n: int) -> int:
+        value = 0
+        for _ in range(n):
+            byte = self.data[self.pos >> 3]
+            value = (value << 1) | ((byte >> (7 - (self.pos & 7))) & 1)
+            self.pos += 1
+        return value
+
+    def skip(self, n: int):
+        self.pos += n
+
+    def ue(self) -> int:
+        zeros = 0
+        while self.u(1) == 0:
+            zeros += 1
+            if zeros > 31:
+                raise ValueError('Exp-Golomb 码过长')
+        return (1 << zeros) - 1 + self.u(zeros)
+
+    def se(self) -> int:
+        value = self.ue()
+        return (value + 1) // 2 if value & 1 else -(value // 2)
+
+
+def _unescape_rbsp(nal: bytes) -> bytes:
+    return nal.replace(b'\x00\x00\x03', b'\x00\x00')
+
+
+_H264_HIGH_PROFILES = {100, 110, 122, 244, 44, 83, 86, 118, 128, 138, 139, 134, 135}
+
+
+def parse_h264_sps(nal: bytes) -> Tuple[int, int] | None:
+    """解析 H.264 SPS（含 1 字节 NAL 头），返回 (宽, 高)"""
+    r = _BitReader(_unescape_rbsp(nal[1:]))
+    profile_idc = r.u(8)
+    r.skip(16)  # constraint flags + level_idc
+    r.ue()      # seq_parameter_set_id
+    chroma_format_idc = 1
+    separate_colour_plane = 0
+    if profile_idc in _H264_HIGH_PROFILES:
+        chroma_format_idc = r.ue()
+        if chroma_format_idc == 3:
+            separate_colour_plane = r.u(1)
+        r.ue()
+        r.ue()
+        r.skip(1)
+        if r.u(1):  # seq_scaling_matrix_present_flag
+            for i in range(8 if chroma_format_idc != 3 else 12):
+                if r.u(1):
+                    size = 16 if i < 6 else 64
+                    last = nxt = 8
+                    for _ in range(size):
+                        if nxt:
+                            nxt = (last + r.se()) % 256
+                        last = nxt or last
+    r.ue()  # log2_max_frame_num_minus4
+    poc_type = r.ue()
+    if poc_type == 0:
+        r.ue()
+    elif poc_type == 1:
+        r.skip(1)
+        r.se()
+        r.se()
+        for _ in range(r.ue()):
+            r.se()
+    r.ue()      # max_num_ref_frames
+    r.skip(1)   # gaps_in_frame_num_value_allowed_flag
+    width_mbs = r.ue() + 1
+    height_units = r.ue() + 1
+    frame_mbs_only = r.u(1)
+    if not frame_mbs_only:
+        r.skip(1)
+    r.skip(1)   # direct_8x8_inference_flag
+    width = width_mbs * 16
+    height = (2 - frame_mbs_only) * height_units * 16
+    if r.u(1):  # frame_cropping_flag
+        left, right, top, bottom = r.ue(), r.ue(), r.ue(), r.ue()
+        if chroma_format_idc == 0 or separate_colour_plane:
+            crop_x, crop_y = 1, 2 - frame_mbs_only
+        else:
+            sub_w = 1 if chroma_format_idc == 3 else 2
+            sub_h = 2 if chroma_format_idc == 1 else 1
+            crop_x, crop_y = sub_w, sub_h * (2 - frame_mbs_only)
+        width -= crop_x * (left + right)
+        height -= crop_y * (top + bottom)
+    return width, height
+
+
+def parse_hevc_sps(nal: bytes) -> Tuple[int, int] | None:
+    """解析 HEVC SPS（含 2 字节 NAL 头），返回 (宽, 高)"""
+    r = _BitReader(_unescape_rbsp(nal[2:]))
+    r.skip(4)   # sps_video_parameter_set_id
+    max_sub_layers_minus1 = r.u(3)
+    r.skip(1)
+    r.skip(96)  # general profile_tier_level
+    sub_profile, sub_level = [], []
+    for _ in range(max_sub_layers_minus1):
+        sub_profile.append(r.u(1))
+        sub_level.append(r.u(1))
+    if max_sub_layers_minus1 > 0:
+        r.skip(2 * (8 - max_sub_layers_minus1))
+    for i in range(max_sub_layers_minus1):
+        if sub_profile[i]:
+            r.skip(88)
+        if sub_level[i]:
+            r.skip(8)
+    r.ue()      # sps_seq_parameter_set_id
+    chroma_format_idc = r.ue()
+    if chroma_format_idc == 3:
+        r.skip(1)
+    width = r.ue()
+    height = r.ue()
+    if r.u(1):  # conformance_window_flag
+        left, right, top, bottom = r.ue(), r.ue(), r.ue(), r.ue()
+        sub_w = 2 if chroma_format_idc in (1, 2) else 1
+        sub_h = 2 if chroma_format_idc == 1 else 1
+        width -= sub_w * (left + right)
+        height -= sub_h * (top + bottom)
+    return width, height
+
+
+def parse_mpeg2_sequence_header(data: bytes) -> Tuple[int, int] | None:
+    """MPEG-1/2 序列头（00 00 01 B3 之后）：宽高各 12 位"""
+    if len(data) < 3:
+        return None
+    return (data[0] << 4) | (data[1] >> 4), ((data[1] & 0x0F) << 8) | data[2]
+
+
+def _iter_nal_units(data: bytes):
+    """按起始码 00 00 01 拆分 NAL（最后一个可能不完整，不返回）"""
+    start = data.find(b'\x00\x00\x01')
+    while start >= 0:
+        nxt = data.find(b'\x00\x00\x01', start + 3)
+        if nxt < 0:
+            return
+        yield data[start + 3:nxt].rstrip(b'\x00')
+        start = nxt
+
+
+class TsAnalyzer:
+    """增量解析 TS 包：PAT/PMT、PCR 码率与视频分辨率"""
+
+    def __init__(self):
+        self.packets = 0
+        self.program_pmts: Dict[int, int] = {}
+        self.streams: Dict[int, int] = {}   # pid -> stream_type
+        self.pmt_parsed = False
+        self.pcr_pid: int | None = None
+        self.video_pid: int | None = None
+        self.resolution: Tuple[int, int] | None = None
+        self._sections: Dict[int, bytearray] = {}
+        self._es = bytearray()
+        self._es_started = False
+        self._first_pcr: Tuple[int, int] | None = None   # (pcr, 当时已收到的包数)
+        self._last_pcr: Tuple[int, int] | None = None
+        self._pcr_offset = 0
+
+    # ---------- 输入 ----------
+
+    def feed(self, data: bytes):
+        """输入任意长度的 TS 数据（可含多个 188 字节包，需按包对齐）"""
+        end = len(data) - TS_PACKET_SIZE + 1
+        for offset in range(0, max(end, 0), TS_PACKET_SIZE):
+            if data[offset] == TS_SYNC_BYTE:
+                self._packet(data[offset:offset + TS_PACKET_SIZE])
+
+    def _packet(self, pkt: bytes):
+        self.packets += 1
+        pusi = pkt[1] & 0x40
+        pid = ((pkt[1] & 0x1F) << 8) | pkt[2]
+        afc = (pkt[3] >> 4) & 0x03
+        offset = 4
+        if afc & 0x02:
+            af_len = pkt[4]
+            if af_len and pid == self.pcr_pid and pkt[5] & 0x10 and af_len >= 7:
+                self._on_pcr(pkt[6:12])
+            offset = 5 + af_len
+        if not afc & 0x01 or offset >= TS_PACKET_SIZE:
+            return
+        payload = pkt[offset:]
+        if pid == 0 or pid in self.program_pmts.values():
+            self._on_psi(pid, payload, pusi)
+        elif pid == self.video_pid and self.resolution is None:
+            self._on_video(payload, pusi)
+
+    # ---------- PSI ----------
+
+    def _on_psi(self, pid: int, payload: bytes, pusi: int):
+        if pusi:
+            pointer = payload[0]
+            self._sections[pid] = bytearray(payload[1 + pointer:])
+        elif pid in self._sections:
+            self._sections[pid].extend(payload)
+        else:
+            return
+        section = self._sections[pid]
+        if len(section) < 3:
+            return
+        length = ((section[1] & 0x0F) << 8) | section[2]
+        if len(section) < 3 + length:
+            return
+        del self._sections[pid]
+        body = bytes(section[:3 + length - 4])   # 去掉 CRC32
+        if pid == 0 and section[0] == 0x00:
+            self._parse_pat(body)
+        elif section[0] == 0x02:
+            self._parse_pmt(body)
+
+    def _parse_pat(self, body: bytes):
+        for i in range(8, len(body) - 3, 4):
+            program = (body[i] << 8) | body[i + 1]
+            if program:
+                self.program_pmts[program] = ((body[i + 2] & 0x1F) << 8) | body[i + 3]
+
+    def _parse_pmt(self, body: bytes):
+        if self.pmt_parsed or len(body) < 12:
+            return
+        self.pcr_pid = ((body[8] & 0x1F) << 8) | body[9]
+        i = 12 + (((body[10] & 0x0F) << 8) | body[11])
+        while i + 5 <= len(body):
+            stream_type = body[i]
+            es_pid = ((body[i + 1] & 0x1F) << 8) | body[i + 2]
+            self.streams[es_pid] = stream_type
+            if self.video_pid is None and STREAM_TYPES.get(stream_type, ('',))[0] == 'video':
+                self.video_pid = es_pid
+            i += 5 + (((body[i + 3] & 0x0F) << 8) | body[i + 4])
+        self.pmt_parsed = True
+
+    # ---------- PCR ----------
+
+    def _on_pcr(self, field: bytes):
+        base = (field[0] << 25) | (field[1] << 17) | (field[2] << 9) | (field[3] << 1) | (field[4] >> 7)
+        pcr = base * 300 + (((field[4] & 0x01) << 8) | field[5])
+        if self._last_pcr is not None and pcr + self._pcr_offset < self._last_pcr[0]:
+            self._pcr_offset += _PCR_WRAP
+        sample = (pcr + self._pcr_offset, self.packets)
+        if self._first_pcr is None:
+            self._first_pcr = sample
+        self._last_pcr = sample
+
+    @property
+    def pcr_span(self) -> float:
+        if self._first_pcr is None or self._last_pcr is None:
+            return 0.0
+        return (self._last_pcr[0] - self._first_pcr[0]) / _PCR_HZ
+
+    @property
+    def bitrate(self) -> int | None:
+        """两个 PCR 之间的 TS 字节数折算的码率（bit/s）"""
+        span = self.pcr_span
+        if span <= 0:
+            return None
+        packets = self._last_pcr[1] - self._first_pcr[1]
+        return int(packets * TS_PACKET_SIZE * 8 / span)
+
+    # ---------- 视频 ----------
+
+    def _on_video(self, payload: bytes, pusi: int):
+        if pusi:
+            # PES 头：00 00 01 stream_id len(2) flags(2) header_data_length
+            if len(payload) < 9 or payload[:3] != b'\x00\x00\x01':
+                return
+            payload = payload[9 + payload[8]:]
+            self._es_started = True
+        elif not self._es_started:
+            return
+        self._es.extend(payload)
+        self._find_resolution()
+        if len(self._es) > _MAX_ES_BUFFER:
+            del self._es[:-TS_PACKET_SIZE]
+
+    def _find_resolution(self):
+        stream_type = self.streams.get(self.video_pid)
+        data = bytes(self._es)
+        try:
+            if stream_type in (0x01, 0x02):
+                pos = data.find(b'\x00\x00\x01\xb3')
+                if pos >= 0 and len(data) >= pos + 7:
+                    self.resolution = parse_mpeg2_sequence_header(data[pos + 4:pos + 7])
+                return
+            for nal in _iter_nal_units(data):
+                if not nal:
+                    continue
+                if stream_type == 0x1B and nal[0] & 0x1F == 7:
+                    self.resolution = parse_h264_sps(nal)
+                    return
+                if stream_type == 0x24 and (nal[0] >> 1) & 0x3F == 33:
+                    self.resolution = parse_hevc_sps(nal)
+                    return
+        except (IndexError, ValueError):
+            # SPS 不完整或格式异常：丢弃已缓存的数据，等待下一个
+            self._es.clear()
+            self._es_started = False
+
+    # ---------- 汇总 ----------
+
+    @property
+    def complete(self) -> bool:
+        if not self.pmt_parsed or self.pcr_span < _MIN_PCR_SPAN:
+            return False
+        return self.video_pid is None or self.resolution is not None \
+            or self.streams.get(self.video_pid) not in (0x01, 0x02, 0x1B, 0x24)
+
+    def codecs(self) -> List[Tuple[str, str]]:
+        return [STREAM_TYPES[t] for t in self.streams.values() if t in STREAM_TYPES]
+
+    def fill_result(self, result: Dict):
+        """把分析结果写入验证器格式的结果字典"""
+        codecs = self.codecs()
+        video = next((name for kind, name in codecs if kind == 'video'), None)
+        audio = next((name for kind, name in codecs if kind == 'audio'), None)
+        result['codec'] = video or audio
+        if self.resolution and all(self.resolution):
+            result['resolution'] = f"{self.resolution[0]}x{self.resolution[1]}"
+        bitrate = self.bitrate
+        if bitrate and self.pcr_span >= _MIN_PCR_SPAN:
+            result['bitrate'] = f"{bitrate // 1000}kbps"
+        result['streams'] = [
+            {'pid': pid, 'stream_type': stream_type,
+             'codec_type': STREAM_TYPES.get(stream_type, ('data', ''))[0],
+             'codec_name': STREAM_TYPES.get(stream_type, ('', ''))[1]}
+            for pid, stream_type in self.streams.items()
+        ]
+
+
+def _empty_result(url: str) -> Dict:
+    return {
+        'url': url,
+        'valid': False,
+        'latency': None,
+        'error': None,
+        'error_type': None,
+        'service_name': None,
+        'resolution': None,
+        'codec': None,
+        'bitrate': None,
+        'hdr_type': None,
+        'native_probe': True,
+    }
+
+
+async def probe_ts_stream(url: str, timeout: float = 3, dwell: float = DEFAULT_DWELL,
+                          headers: Dict[str, str] | None = None) -> Dict:
+    """在当前事件循环中探测一个组播/udpxy 地址
+
+    Args:
+        timeout: 等待首个 TS 包（以及 udpxy 连接）的时长（秒）
+        dwell: 首包到达后继续收集 PAT/PMT、PCR、SPS 的最长时长（秒）
+        headers: udpxy 请求附加的 user-agent/referer
+    """
+    result = _empty_result(url)
+    analyzer = TsAnalyzer()
+    start = time.monotonic()
+    try:
+        parts = urlsplit(url)
+        if parts.scheme.lower() in ('udp', 'rtp'):
+            await _receive_udp(parts, analyzer, timeout, dwell, start, result)
+        else:
+            await _receive_http(parts, analyzer, timeout, dwell, start, result, headers or {})
+    except asyncio.CancelledError:
+        raise
+    except OSError as e:
+        result['error'] = f'连接失败: {e}'
+        result['error_type'] = 'connection_failed'
+        return result
+
+    if result['error_type'] is not None:
+        return result
+    if analyzer.packets == 0:
+        result['error'] = f'{timeout:g}秒内未收到TS数据'
+        result['error_type'] = 'timeout'
+        return result
+    # 收到 TS 包即视为有效；PMT 缺失时编码信息留空
+    result['valid'] = True
+    analyzer.fill_result(result)
+    try:
+        from models.channel_mappings import extract_channel_name_from_url
+        result['service_name'] = extract_channel_name_from_url(url)
+    except Exception:
+        result['service_name'] = ''
+    return result
+
+
+class _Collector:
+    """把到达的数据交给分析器，首包到达后按 dwell 收尾"""
+
+    def __init__(self, analyzer: TsAnalyzer, dwell: float, start: float, result: Dict):
+        self.analyzer = analyzer
+        self.dwell = dwell
+        self.start = start
+        self.result = result
+        self.first_packet = asyncio.get_running_loop().create_future()
+        self.finished = asyncio.get_running_loop().create_future()
+        self._pending = b''
+
+    def feed(self, data: bytes, aligned: bool):
+        if self.finished.done():
+            return
+        if aligned:
+            data = strip_rtp_header(data)
+        else:
+            # TCP 字节流：拼接后按包对齐
+            data = self._pending + data
+            sync = data.find(bytes([TS_SYNC_BYTE]))
+            if sync < 0:
+                self._pending = b''
+                return
+            usable = sync + (len(data) - sync) // TS_PACKET_SIZE * TS_PACKET_SIZE
+            self._pending = data[usable:]
+            data = data[sync:usable]
+        before = self.analyzer.packets
+        self.analyzer.feed(data)
+        if self.analyzer.packets > before and not self.first_packet.done():
+            self.result['latency'] = int((time.monotonic() - self.start) * 1000)
+            self.first_packet.set_result(True)
+        if self.analyzer.complete:
+            self.finished.set_result(True)
+
+    async def wait(self, timeout: float):
+        try:
+            await asyncio.wait_for(asyncio.shield(self.first_packet), timeout=timeout)
+        except asyncio.TimeoutError:
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(self.finished), timeout=self.dwell)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def _receive_udp(parts, analyzer, timeout, dwell, start, result):
+    host, port = parse_udp_target(parts)
+    loop = asyncio.get_running_loop()
+    collector = _Collector(analyzer, dwell, start, result)
+
+    class _Protocol(asyncio.DatagramProtocol):
+        def datagram_received(self, data, addr):
+            collector.feed(data, aligned=True)
+
+    sock = open_udp_socket(host, port)
+    sock.setblocking(False)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+    except OSError:
+        pass
+    transport, _ = await loop.create_datagram_endpoint(_Protocol, sock=sock)
+    try:
+        await collector.wait(timeout)
+    finally:
+        transport.close()
+
+
+async def _receive_http(parts, analyzer, timeout, dwell, start, result, headers):
+    host = parts.hostname
+    port = parts.port or 80
+    try:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=timeout)
+    except asyncio.TimeoutError:
+        result['error'], result['error_type'] = '连接超时', 'timeout'
+        return
+    except ConnectionRefusedError:
+        result['error'], result['error_type'] = '连接被拒绝', 'connection_refused'
+        return
+    collector = _Collector(analyzer, dwell, start, result)
+    try:
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        lines = [f'GET {path} HTTP/1.1', f'Host: {parts.netloc.rsplit("@", 1)[-1]}',
+                 'Connection: close', 'Accept: */*']
+        if headers.get('user-agent'):
+            lines.append(f"User-Agent: {headers['user-agent']}")
+        if headers.get('referer'):
+            lines.append(f"Referer: {headers['referer']}")
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1', errors='ignore'))
+        await writer.drain()
+        try:
+            status_line = await asyncio.wait_for(reader.readline(), timeout=timeout)
+            fields = status_line.split(None, 2)
+            status = int(fields[1]) if len(fields) >= 2 and fields[0].startswith(b'HTTP/') else None
+            if status is None or status >= 400:
+                rejection = classify_http_status(status) if status is not None else None
+                result['error_type'], result['error'] = rejection or ('probe_failed', f'HTTP {status}')
+                return
+            while (await asyncio.wait_for(reader.readline(), timeout=timeout)).strip():
+                pass
+        except (asyncio.TimeoutError, ValueError):
+            result['error'], result['error_type'] = '响应超时', 'timeout'
+            return
+
+        async def pump():
+            while not collector.finished.done():
+                chunk = await reader.read(64 * 1024)
+                if not chunk:
+                    return
+                collector.feed(chunk, aligned=False)
+
+        task = asyncio.ensure_future(pump())
+        try:
+            await collector.wait(timeout)
+        finally:
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:
+            pass
+
+
+class MulticastProbe(Singleton):
+    """供同步调用方使用的探测器：所有探测在同一个事件循环线程中并发进行"""
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        # probe() 中等待的探测，cancel_all() 取消它们
+        self._pending = set()
+        self._pending_lock = threading.Lock()
+        self._initialized = True
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is None or self._thread is None or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def _run():
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=_run, name="MulticastProbe", daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+                global_logger.debug("组播探测线程已启动")
+            return self._loop
+
+    def submit(self, url: str, timeout: float = 3, dwell: float = DEFAULT_DWELL,
+               headers: Dict[str, str] | None = None):
+        """提交探测，返回 concurrent.futures.Future"""
+        return asyncio.run_coroutine_threadsafe(
+            probe_ts_stream(url, timeout, dwell, headers), self._ensure_loop()
+        )
+
+    def probe(self, url: str, timeout: float = 3, dwell: float = DEFAULT_DWELL,
+              headers: Dict[str, str] | None = None, cancelled=None) -> Dict:
+        """阻塞探测，最多等待 timeout + dwell + 5 秒；cancel_all() 取消时立即返回
+
+        cancelled 只在登记后检查一次：调用方先置终止标志再 cancel_all()，
+        两者之间提交的探测由这次检查取消。
+        """
+        future = self.submit(url, timeout, dwell, headers)
+        with self._pending_lock:
+            self._pending.add(future)
+        future.add_done_callback(self._discard)
+        if cancelled is not None and cancelled():
+            future.cancel()
+        try:
+            return future.result(timeout=timeout + dwell + 5)
+        except CancelledError:
+            error_type = 'terminating'
+        except TimeoutError:
+            future.cancel()
+            error_type = 'timeout'
+        result = _empty_result(url)
+        result['error'] = '探测已取消'
+        result['error_type'] = error_type
+        return result
+
+    def cancel_all(self):
+        """取消 probe() 中所有进行中的探测（验证器终止时调用）"""
+        with self._pending_lock:
+            pending = list(self._pending)
+        for future in pending:
+            future.cancel()
+
+    def _discard(self, future):
+        with self._pending_lock:
+            self._pending.discard(future)
+
+
+def get_multicast_probe() -> MulticastProbe:
+    """获取全局组播探测器"""
+    return MulticastProbe()
@@ -0,0 +1,207 @@
+"""
+订阅源（直播源）并行加载
+
+- 所有启用的源通过共享连接池的 requests.Session 并行拉取，总耗时取决于最慢的单个源
+- 条件请求（ETag / Last-Modified）与内容哈希校验沿用 conditional_fetch.SourceValidators
+- 响应体边下载边计算哈希：没有可复用的频道时直接流式解析；有可复用的频道时先落地到
+  临时文件（小于阈值时在内存中），哈希不变则不解析
+- 每个源解析出的频道按内容哈希缓存在内存中，内容未变化的源不再重新解析
+- 结果按配置顺序返回，调用方只需替换内容有变化的源
+"""
+
+import contextlib
+import shutil
+import tempfile
+import threading
+from typing import Callable, Dict, List, Optional
+from core.log_manager import global_logger
+from models.channel_store import ChannelStore
+from services.conditional_fetch import HashingReader, SourceValidators
+from services.m3u_parser import M3UStreamParser, iter_m3u_stream_lines
+
+
+# 同时拉取的订阅源数量上限（也是连接池大小）
+MAX_PARALLEL = 8
+_REQUEST_TIMEOUT = 15
+# 比对哈希时响应体落地的内存上限，超过后写入临时文件
+_SPOOL_MAX_MEMORY = 4 * 1024 * 1024
+_READ_SIZE = 64 * 1024
+
+
+def _make_result(url: str, status_code: Optional[int] = None, channels=None,
+                 header_attrs: Optional[Dict] = None, unchanged: bool = False, error: str = '') -> Dict:
+    return {
+        'url': url,
+        'status_code': status_code,
+        # 拉取失败时为 None；unchanged 为 True 时是内存中已有（或缓存中）的频道
+        'channels': channels,
+        'header_attrs': header_attrs or {},
+        'unchanged': unchanged,
+        'error': error,
+    }
+
+
+def _response_raw(resp):
+    """HTTP 响应的原始流，Content-Encoding: gzip 由 urllib3 边下载边解压"""
+    raw = resp.raw
+    raw.decode_content = True
+    return raw
+
+
+class PlaylistSourceLoader:
+    """并行拉取并解析订阅源，按源缓存解析结果"""
+
+    def __init__(self, validators: SourceValidators, max_parallel: int = MAX_PARALLEL,
+                 timeout: float = _REQUEST_TIMEOUT):
+        self.logger = global_logger
+        self._validators = validators
+        self._max_parallel = max(1, max_parallel)
+        self._timeout = timeout
+        self._session = None
+        self._session_lock = threading.Lock()
+        # url -> {'sha256', 'channels': ChannelStore, 'header_attrs'}
+        self._cache: Dict[str, Dict] = {}
+        self._cache_lock = threading.Lock()
+
+    def _get_session(self):
+        with self._session_lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=self._max_parallel, pool_maxsize=self._max_parallel)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._session = session
+            return self._session
+
+    def close(self):
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _cached(self, url: str) -> Optional[Dict]:
+        with self._cache_lock:
+            return self._cache.get(url)
+
+    def prune(self, urls):
+        """丢弃不在给定订阅源列表中的缓存"""
+        keep = set(urls)
+        with self._cache_lock:
+            for url in [url for url in self._cache if url not in keep]:
+                del self._cache[url]
+
+    def fetch(self, url: str, existing: Optional[List[Dict]] = None,
+              headers: Optional[Dict] = None,
+              on_batch: Optional[Callable[[List[Dict]], None]] = None) -> Dict:
+        """拉取单个订阅源
+
+        内存中已有该源的频道（existing）或有解析缓存时携带条件请求头；
+        服务器返回 304 或内容哈希与上次相同时不再解析，优先沿用 existing（保留验证状态），
+        其次使用缓存。需要解析时频道分批产出，每批解析完成即调用 on_batch。
+        响应体以流的方式读取，哈希在读取时同步计算，不在内存中保留整个响应。
+        """
+        cached = self._cached(url)
+        previous = existing or (cached['channels'] if cached else None)
+        request_headers = dict(headers or {})
+        if previous:
+            request_headers.update(self._validators.request_headers(url))
+        with self._get_session().get(url, timeout=self._timeout, headers=request_headers,
+                                     stream=True) as resp:
+            if resp.status_code == 304 and previous:
+                self.logger.info(f"订阅源未变化(304)，沿用 {len(previous)} 个频道: {url}")
+                return self._reuse(url, existing, cached, resp.status_code, on_batch)
+            if resp.status_code != 200:
+                return _make_result(url, resp.status_code, error=f'HTTP {resp.status_code}')
+
+            raw = HashingReader(_response_raw(resp))
+            with contextlib.ExitStack() as cleanup:
+                if previous:
+                    # 有可复用的频道：先读完并算出哈希，内容未变化时不解析
+                    body = cleanup.enter_context(tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_MEMORY))
+                    shutil.copyfileobj(raw, body, _READ_SIZE)
+                    sha256 = raw.hexdigest()
+                    if sha256 == self._validators.get_hash(url):
+                        self.logger.info(f"订阅源内容未变化，沿用 {len(previous)} 个频道: {url}")
+                        return self._reuse(url, existing, cached, resp.status_code, on_batch)
+                    if cached and sha256 == cached['sha256']:
+                        # 校验信息丢失或内存中没有该源的频道，但内容与缓存一致
+                        self.logger.info(f"订阅源命中解析缓存，沿用 {len(cached['channels'])} 个频道: {url}")
+                        self._validators.update(url, resp.headers, sha256)
+                        return self._reuse(url, existing, cached, resp.status_code, on_batch)
+                    body.seek(0)
+                else:
+                    body = raw
+
+                # 分块解码、逐行解析，不生成整个解码后的字符串
+                parser = M3UStreamParser()
+                channels: List[Dict] = []
+                for batch in parser.iter_batches(iter_m3u_stream_lines(body, _READ_SIZE)):
+                    # 标记频道来源（订阅源 URL），用于 Android 端区分 SUB/LOCAL tab
+                    # 若不设置 source，Android 端 LOCAL tab 的 source.isEmpty() 过滤条件
+                    # 会将所有订阅频道误判为本地频道显示
+                    for c in batch:
+                        c['source'] = url
+                    channels.extend(batch)
+                    if on_batch:
+                        on_batch(batch)
+            if body is raw:
+                raw.drain(_READ_SIZE)
+                sha256 = raw.hexdigest()
+        if channels:
+            self._validators.update(url, resp.headers, sha256)
+            with self._cache_lock:
+                self._cache[url] = {
+                    'sha256': sha256,
+                    'channels': ChannelStore(channels),
+                    'header_attrs': dict(parser.header_attrs),
+                }
+        return _make_result(url, resp.status_code, channels, parser.header_attrs)
+
+    def _reuse(self, url: str, existing, cached, status_code: int, on_batch) -> Dict:
+        if existing:
+            return _make_result(url, status_code, existing, unchanged=True)
+        channels = list(cached['channels']) if cached else []
+        if on_batch and channels:
+            on_batch(channels)
+        # 内存中没有该源的频道（如重新启用的源），需要由调用方重新并入
+        return _make_result(url, status_code, channels, cached['header_attrs'] if cached else {},
+                            unchanged=False)
+
+    def load_all(self, sources: List[Dict], existing_by_source: Optional[Dict[str, List[Dict]]] = None,
+                 headers: Optional[Dict] = None,
+                 on_batch: Optional[Callable[[List[Dict]], None]] = None,
+                 on_source_done: Optional[Callable[[int, int, Dict], None]] = None) -> List[Optional[Dict]]:
+        """并行拉取所有启用的订阅源
+
+        Returns:
+            与 sources 一一对应的结果列表（按配置顺序，与完成顺序无关）；
+            未启用或没有 URL 的源对应 None
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        existing_by_source = existing_by_source or {}
+        results: List[Optional[Dict]] = [None] * len(sources)
+        pending = [
+            (i, source['url']) for i, source in enumerate(sources)
+            if source.get('url') and source.get('enabled', True)
+        ]
+        if not pending:
+            return results
+        with ThreadPoolExecutor(max_workers=min(len(pending), self._max_parallel),
+                                thread_name_prefix="playlist-loader") as pool:
+            futures = {
+                pool.submit(self.fetch, url, existing_by_source.get(url), headers, on_batch): (i, url)
+                for i, url in pending
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                i, url = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    results[i] = _make_result(url, error=str(e)[:60])
+                    self.logger.warning(f"加载源 {url} 异常: {e}")
+                if on_source_done:
+                    on_source_done(done, len(pending), results[i])
+        return results
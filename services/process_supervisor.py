@@ -0,0 +1,165 @@
+"""
+子进程监管服务
+
+所有受监管的子进程由同一个事件循环线程负责：
+- 等待子进程退出（事件驱动，工作线程阻塞在完成事件上，不再轮询 poll()）
+- 并发读取 stdout/stderr，避免输出较多的进程写满管道后卡死
+- 按截止时间强制结束超时进程
+
+对外提供 Popen 风格的句柄（poll/kill/wait），可直接放入 _active_processes
+供 terminate_all 等既有逻辑使用。
+"""
+
+import asyncio
+import subprocess
+import threading
+import time
+from typing import List, Tuple
+from core.log_manager import global_logger
+from utils.singleton import Singleton
+
+
+class SupervisedProcess:
+    """受监管子进程的句柄，接口与 subprocess.Popen 的 poll/kill/wait 一致"""
+
+    def __init__(self, supervisor: 'ProcessSupervisor', cmd: List[str], deadline: float):
+        self._supervisor = supervisor
+        self._proc: asyncio.subprocess.Process | None = None
+        self._done = threading.Event()
+        self.cmd = cmd
+        self.deadline = deadline
+        self.pid: int | None = None
+        self.returncode: int | None = None
+        self.stdout: bytes = b''
+        self.stderr: bytes = b''
+        self.timed_out = False
+        self.start_time = time.time()
+
+    def poll(self) -> int | None:
+        return self.returncode if self._done.is_set() else None
+
+    def kill(self):
+        """结束进程（线程安全，立即返回）"""
+        self._supervisor._call_soon(self._kill_in_loop)
+
+    def wait(self, timeout: float | None = None) -> int | None:
+        if not self._done.wait(timeout):
+            raise subprocess.TimeoutExpired(self.cmd, timeout)
+        return self.returncode
+
+    def result(self) -> Tuple[int | None, bytes, bytes, bool]:
+        """阻塞直到进程结束
+
+        Returns:
+            (returncode, stdout, stderr, timed_out)
+        """
+        # 截止时间由事件循环负责；这里的额外等待只防止监管线程异常退出后永久阻塞
+        if not self._done.wait(self.deadline + 5):
+            self.timed_out = True
+            self.kill()
+            self._done.wait(1)
+        return self.returncode, self.stdout, self.stderr, self.timed_out
+
+    def _kill_in_loop(self):
+        proc = self._proc
+        if proc is not None and proc.returncode is None:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+
+
+class ProcessSupervisor(Singleton):
+    """单线程事件循环的子进程监管器"""
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._initialized = True
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is None or self._thread is None or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def _run():
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=_run, name="ProcessSupervisor", daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+                global_logger.debug("子进程监管线程已启动")
+            return self._loop
+
+    def _call_soon(self, callback):
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(callback)
+            except RuntimeError:
+                pass
+
+    def spawn(self, cmd: List[str], deadline: float, creationflags: int = 0) -> SupervisedProcess:
+        """启动子进程并交由监管线程管理
+
+        启动失败（如可执行文件不存在）时异常会在调用线程中抛出。
+
+        Args:
+            cmd: 命令行
+            deadline: 最长运行时间（秒），超时后强制结束
+            creationflags: 传给 Popen 的 creationflags（Windows 隐藏控制台窗口）
+        """
+        loop = self._ensure_loop()
+        handle = SupervisedProcess(self, cmd, deadline)
+        future = asyncio.run_coroutine_threadsafe(self._spawn(handle, creationflags), loop)
+        future.result()
+        return handle
+
+    def run(self, cmd: List[str], deadline: float, creationflags: int = 0) -> SupervisedProcess:
+        """启动子进程并阻塞等待其结束"""
+        handle = self.spawn(cmd, deadline, creationflags)
+        handle.result()
+        return handle
+
+    async def _spawn(self, handle: SupervisedProcess, creationflags: int):
+        proc = await asyncio.create_subprocess_exec(
+            *handle.cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            creationflags=creationflags
+        )
+        handle._proc = proc
+        handle.pid = proc.pid
+        asyncio.get_running_loop().create_task(self._supervise(handle))
+
+    async def _supervise(self, handle: SupervisedProcess):
+        proc = handle._proc
+        try:
+            handle.stdout, handle.stderr = await asyncio.wait_for(
+                proc.communicate(), timeout=handle.deadline
+            )
+        except asyncio.TimeoutError:
+            handle.timed_out = True
+            handle._kill_in_loop()
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=1)
+            except asyncio.TimeoutError:
+                pass
+        except Exception as e:
+            global_logger.debug(f"子进程监管异常(pid={handle.pid}): {e}")
+            handle._kill_in_loop()
+        finally:
+            handle.returncode = proc.returncode
+            handle._done.set()
+
+
+def get_process_supervisor() -> ProcessSupervisor:
+    """获取全局子进程监管器"""
+    return ProcessSupervisor()
@@ -0,0 +1,255 @@
+"""
+范围扫描断点
+
+长时间的网段扫描定期把进度写入磁盘，崩溃或停止后可从断点继续：
+- expression / total：范围表达式与展开后的 URL 总数（二者一致才允许续扫）
+- cursor：笛卡尔积中该位置之前的 URL 已全部探测完毕
+- done / valid 位图：cursor 之后已完成、有效的 URL。并发探测乱序完成，
+  位图只需覆盖 cursor 之后的 in-flight 窗口，随 cursor 前进整体左移
+- results：已发现的有效频道（带展开序号），续扫时重新加入列表
+
+文件按表达式的哈希命名。状态文件只有 cursor、位图与计数，体积很小，每次先写临时
+文件再替换，写入过程中崩溃不会损坏断点；有效频道逐行追加到旁边的 .results.jsonl，
+每次保存只写入上次保存之后新发现的频道。状态文件记下结果文件的有效长度，崩溃后
+多出的行（对应序号尚未记入位图，续扫时会重新探测）在加载时截掉。
+"""
+
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Tuple
+from core.log_manager import global_logger
+
+
+_VERSION = 2
+# 两次自动保存之间的最短间隔（秒）
+_SAVE_INTERVAL = 5.0
+# cursor 之前累计多少字节的位图后整体左移
+_TRIM_BYTES = 64
+
+
+def get_checkpoint_dir() -> str:
+    from models.channel_mappings import get_app_data_dir
+    from core.config_manager import ConfigManager
+    cache_dir = ConfigManager().get_value('General', 'cache_dir', 'cache') or 'cache'
+    if not os.path.isabs(cache_dir):
+        cache_dir = os.path.join(get_app_data_dir(), cache_dir)
+    path = os.path.join(cache_dir, 'scan_checkpoints')
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+class ScanCheckpoint:
+    """单个范围扫描任务的断点（线程安全）"""
+
+    def __init__(self, path: str, expression: str, total: int):
+        self.path = path
+        self.expression = expression
+        self.total = total
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._cursor = 0
+        self._base = 0
+        self._done = bytearray()
+        self._valid = bytearray()
+        self._done_count = 0
+        self._valid_count = 0
+        # 尚未追加到结果文件的有效频道；结果文件中已保存部分的字节数
+        self._pending_results: List[Dict] = []
+        self._results_size = 0
+        self._dirty = False
+        self._last_save = time.monotonic()
+
+    @classmethod
+    def open(cls, expression: str, total: int, resume: bool = True,
+             directory: str | None = None) -> 'ScanCheckpoint':
+        """打开表达式对应的断点；resume 为 False 或断点与当前范围不符时重新开始"""
+        directory = directory or get_checkpoint_dir()
+        name = hashlib.sha1(expression.encode('utf-8')).hexdigest()
+        checkpoint = cls(os.path.join(directory, f'{name}.json'), expression, total)
+        if resume and checkpoint._load():
+            global_logger.info(
+                f"从断点继续扫描: 已完成 {checkpoint.done_count}/{total}，"
+                f"已发现有效 {checkpoint.valid_count} 个"
+            )
+        else:
+            checkpoint.delete()
+        return checkpoint
+
+    @property
+    def results_path(self) -> str:
+        return os.path.splitext(self.path)[0] + '.results.jsonl'
+
+    @property
+    def cursor(self) -> int:
+        return self._cursor
+
+    @property
+    def done_count(self) -> int:
+        return self._done_count
+
+    @property
+    def valid_count(self) -> int:
+        return self._valid_count
+
+    @property
+    def complete(self) -> bool:
+        return self._cursor >= self.total
+
+    def is_done(self, index: int) -> bool:
+        if index < self._cursor:
+            return True
+        offset = index - self._base
+        byte = offset >> 3
+        done = self._done
+        return byte < len(done) and bool(done[byte] & (1 << (offset & 7)))
+
+    def done_snapshot(self) -> Tuple[int, int, bytes]:
+        """(cursor, base, 完成位图)，供子进程判断哪些序号已完成"""
+        with self._lock:
+            return self._cursor, self._base, bytes(self._done)
+
+    def results(self) -> List[Dict]:
+        with self._save_lock:
+            results = []
+            try:
+                if self._results_size:
+                    with open(self.results_path, 'rb') as f:
+                        data = f.read(self._results_size)
+                    results = [json.loads(line) for line in data.splitlines() if line]
+            except (OSError, ValueError) as e:
+                global_logger.warning(f"读取扫描断点结果失败: {e}")
+            with self._lock:
+                results.extend(dict(item) for item in self._pending_results)
+            return results
+
+    def mark(self, index: int, valid: bool, channel: Dict | None = None):
+        """记录一个 URL 的探测结果，到达保存间隔时自动落盘"""
+        with self._lock:
+            if index < self._cursor or not (0 <= index < self.total):
+                return
+            offset = index - self._base
+            byte, bit = offset >> 3, 1 << (offset & 7)
+            if byte >= len(self._done):
+                grow = byte + 1 - len(self._done)
+                self._done.extend(bytes(grow))
+                self._valid.extend(bytes(grow))
+            if self._done[byte] & bit:
+                return
+            self._done[byte] |= bit
+            self._done_count += 1
+            if valid:
+                self._valid[byte] |= bit
+                self._valid_count += 1
+                if channel is not None:
+                    item = dict(channel)
+                    item['_index'] = index
+                    self._pending_results.append(item)
+            self._advance_cursor()
+            self._dirty = True
+            due = time.monotonic() - self._last_save >= _SAVE_INTERVAL
+        if due:
+            self.save()
+
+    def save(self, force: bool = False):
+        """写入断点文件（只在有变化时写入）：先追加新结果，再替换状态文件"""
+        # 整个保存过程持有 _save_lock，状态快照与结果文件长度按保存顺序一一对应
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty and not force:
+                    return
+                pending = self._pending_results
+                self._pending_results = []
+                state = {
+                    'version': _VERSION,
+                    'expression': self.expression,
+                    'total': self.total,
+                    'cursor': self._cursor,
+                    'base': self._base,
+                    'done': base64.b64encode(bytes(self._done)).decode('ascii'),
+                    'valid': base64.b64encode(bytes(self._valid)).decode('ascii'),
+                    'done_count': self._done_count,
+                    'valid_count': self._valid_count,
+                    'updated_at': time.time(),
+                }
+                self._dirty = False
+                self._last_save = time.monotonic()
+            tmp_path = self.path + '.tmp'
+            try:
+                results_size = self._results_size
+                if pending:
+                    lines = b''.join(
+                        json.dumps(item, ensure_ascii=False, default=str).encode('utf-8') + b'\n'
+                        for item in pending
+                    )
+                    with open(self.results_path, 'ab') as f:
+                        # 丢掉上次保存失败时留下的半截内容
+                        f.truncate(results_size)
+                        f.write(lines)
+                    results_size += len(lines)
+                state['results_size'] = results_size
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(state, f, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+                self._results_size = results_size
+            except OSError as e:
+                global_logger.warning(f"保存扫描断点失败: {e}")
+                with self._lock:
+                    self._pending_results[:0] = pending
+                    self._dirty = True
+
+    def delete(self):
+        for path in (self.path, self.results_path):
+            try:
+                if os.path.exists(path):
+                    os.remove(path)
+            except OSError as e:
+                global_logger.debug(f"删除扫描断点失败: {e}")
+
+    def _advance_cursor(self):
+        done = self._done
+        while True:
+            offset = self._cursor - self._base
+            byte = offset >> 3
+            if byte >= len(done) or not done[byte] & (1 << (offset & 7)):
+                break
+            if offset & 7 == 0 and done[byte] == 0xFF:
+                self._cursor += 8
+            else:
+                self._cursor += 1
+        self._cursor = min(self._cursor, self.total)
+        shift = (self._cursor - self._base) >> 3
+        if shift >= _TRIM_BYTES:
+            del self._done[:shift]
+            del self._valid[:shift]
+            self._base += shift * 8
+
+    def _load(self) -> bool:
+        try:
+            if not os.path.exists(self.path):
+                return False
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if (state.get('version') != _VERSION or state.get('expression') != self.expression
+                    or state.get('total') != self.total):
+                return False
+            results_size = int(state['results_size'])
+            if results_size:
+                with open(self.results_path, 'ab') as f:
+                    if f.seek(0, os.SEEK_END) < results_size:
+                        raise ValueError('结果文件不完整')
+                    f.truncate(results_size)
+            self._cursor = int(state['cursor'])
+            self._base = int(state['base'])
+            self._done = bytearray(base64.b64decode(state['done']))
+            self._valid = bytearray(base64.b64decode(state['valid']))
+            self._done_count = int(state['done_count'])
+            self._valid_count = int(state['valid_count'])
+            self._results_size = results_size
+            return True
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            global_logger.warning(f"扫描断点文件无效，重新开始: {e}")
+            return False
@@ -0,0 +1,348 @@
+"""
+多进程扫描农场
+
+大范围扫描时，结果处理（构建频道信息、质量评分、解析探测输出）与 Qt 事件循环
+在同一个进程中争抢 GIL。开启后范围扫描改由多个子进程完成：
+- 每个子进程负责 URL 空间的一个交错分片，自行编译范围表达式并按序号枚举
+- 子进程内有独立的验证器与并发控制器（线程模型或 asyncio 引擎），预筛选、探测、
+  频道信息构建都在子进程中完成
+- 结果以紧凑记录 (序号, url, error_type, 是否预筛选淘汰, 频道信息或 None) 攒批后
+  经 multiprocessing 队列送回主进程，主进程只负责入列表与统计
+
+子进程只导入不依赖 Qt 的模块，使用 spawn 方式启动（各平台行为一致）。
+"""
+
+import math
+import multiprocessing
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+from core.log_manager import global_logger
+from models.channel_mappings import extract_channel_name_from_url
+
+
+# 每批最多携带的记录数
+_BATCH_SIZE = 64
+# 不足一批时最长等待多久发送（秒）
+_FLUSH_INTERVAL = 0.2
+_MSG_RECORDS = 'records'
+_MSG_DONE = 'done'
+# 记录的 error_type：追加扫描跳过的已有 URL（未探测）
+SKIPPED_EXISTING = 'skipped_existing'
+
+# (序号, url, error_type, 是否预筛选淘汰, 有效时的频道信息)
+FarmRecord = Tuple[int, str, str | None, bool, Dict | None]
+
+
+def build_channel_info(url: str, valid: bool, latency, resolution: str, result: dict) -> dict:
+    """由探测结果构建基本的频道信息（不含映射信息，映射由主进程异步补充）"""
+    from services.stream_quality_scorer import StreamQualityScorer
+
+    channel_name = extract_channel_name_from_url(url)
+    channel_info = {
+        'url': url,
+        'name': channel_name,
+        'raw_name': channel_name,
+        'valid': valid,
+        'latency': latency,
+        'resolution': result.get('resolution', '') or resolution,
+        'codec': result.get('codec', '') or '',
+        'bitrate': result.get('bitrate', '') or '',
+        'status': '有效' if valid else '无效',
+        'group': '未分类',
+        'logo': None,
+        'needs_details': False
+    }
+    # 计算流质量评分（基于 latency/bitrate/resolution/valid）
+    score_info = StreamQualityScorer.score_from_channel(channel_info)
+    channel_info['quality_score'] = score_info.get('total', 0)
+    channel_info['quality_grade'] = score_info.get('grade', 'F')
+    return channel_info
+
+
+def resolve_process_count(processes: int) -> int:
+    """0 表示按 CPU 核数"""
+    if processes and processes > 0:
+        return processes
+    return max(1, multiprocessing.cpu_count() or 1)
+
+
+class ScanFarm:
+    """在多个子进程中执行范围扫描，结果回传到主进程"""
+
+    def __init__(self, config: Dict, processes: int,
+                 on_records: Callable[[List[FarmRecord]], None],
+                 on_finished: Callable[[], None] | None = None):
+        """
+        Args:
+            config: 子进程扫描参数（expression/order/seed/start/done/skip_urls/timeout/engine/
+                user_agent/referer/threads/max_limit/per_host_limit/adaptive/
+                prefilter/udp_dwell/async_max_inflight/native_ts_probe/ts_probe_dwell），需可被 pickle
+            processes: 子进程数
+            on_records: 收到一批结果记录时的回调（在收集线程中调用）
+            on_finished: 所有子进程结束后的回调
+        """
+        self.logger = global_logger
+        self.config = config
+        self.processes = max(1, processes)
+        self.on_records = on_records
+        self.on_finished = on_finished
+        self._ctx = multiprocessing.get_context('spawn')
+        self._queue = None
+        self._stop_event = None
+        self._procs: List = []
+        self._thread: threading.Thread | None = None
+
+    def start(self, name: str = "ScanFarmCollector") -> threading.Thread:
+        """启动子进程与收集线程，返回收集线程（作为扫描的唯一工作线程登记）"""
+        self._queue = self._ctx.Queue()
+        self._stop_event = self._ctx.Event()
+        for shard in range(self.processes):
+            proc = self._ctx.Process(
+                target=_farm_worker_main,
+                args=(dict(self.config, shard=shard, shards=self.processes),
+                      self._queue, self._stop_event),
+                name=f"ScanFarm-{shard}",
+                daemon=True
+            )
+            proc.start()
+            self._procs.append(proc)
+        self.logger.info(f"扫描引擎: 多进程（{self.processes} 个子进程）")
+        self._thread = threading.Thread(target=self._collect, name=name, daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self):
+        """通知子进程停止，超时未退出的强制结束"""
+        if self._stop_event is not None:
+            self._stop_event.set()
+        deadline = time.monotonic() + 3.0
+        for proc in self._procs:
+            proc.join(max(0.0, deadline - time.monotonic()))
+        for proc in self._procs:
+            if proc.is_alive():
+                self.logger.warning(f"扫描子进程 {proc.name} 未及时退出，强制结束")
+                proc.terminate()
+
+    def join(self, timeout: float | None = None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _collect(self):
+        finished = set()
+        try:
+            while len(finished) < self.processes:
+                try:
+                    kind, payload = self._queue.get(timeout=0.5)
+                except queue.Empty:
+                    if not any(proc.is_alive() for proc in self._procs):
+                        break
+                    continue
+                if kind == _MSG_DONE:
+                    finished.add(payload)
+                elif kind == _MSG_RECORDS:
+                    try:
+                        self.on_records(payload)
+                    except Exception as e:
+                        self.logger.error(f"处理扫描子进程结果失败: {e}")
+        finally:
+            for proc in self._procs:
+                proc.join(1.0)
+            if len(finished) < self.processes and not self._stop_event.is_set():
+                self.logger.warning(f"{self.processes - len(finished)} 个扫描子进程异常退出")
+            if self.on_finished:
+                self.on_finished()
+
+
+class _RecordSink:
+    """子进程中的结果攒批发送（线程安全）"""
+
+    def __init__(self, result_queue, shard: int):
+        self._queue = result_queue
+        self._shard = shard
+        self._lock = threading.Lock()
+        self._records: List[FarmRecord] = []
+        self._last_flush = time.monotonic()
+
+    def add(self, index: int, url: str, result: Dict):
+        valid = bool(result.get('valid'))
+        channel = None
+        if valid:
+            channel = build_channel_info(
+                url, True, result.get('latency'), result.get('resolution') or '', result
+            )
+        record = (index, url, result.get('error_type'), bool(result.get('prefiltered')), channel)
+        with self._lock:
+            self._records.append(record)
+            if len(self._records) < _BATCH_SIZE:
+                return
+        self.flush()
+
+    def flush(self, only_if_due: bool = False):
+        with self._lock:
+            if not self._records:
+                return
+            if only_if_due and time.monotonic() - self._last_flush < _FLUSH_INTERVAL:
+                return
+            records = self._records
+            self._records = []
+            self._last_flush = time.monotonic()
+        self._queue.put((_MSG_RECORDS, records))
+
+    def close(self):
+        self.flush()
+        self._queue.put((_MSG_DONE, self._shard))
+
+
+def _done_filter(done):
+    """由断点快照 (cursor, base, bitmap) 构造已完成判断"""
+    if not done:
+        return None
+    cursor, base, bitmap = done
+
+    def is_done(index: int) -> bool:
+        if index < cursor:
+            return True
+        offset = index - base
+        byte = offset >> 3
+        return byte < len(bitmap) and bool(bitmap[byte] & (1 << (offset & 7)))
+    return is_done
+
+
+def _farm_worker_main(config: Dict, result_queue, stop_event):
+    """子进程入口"""
+    sink = _RecordSink(result_queue, config['shard'])
+    try:
+        _run_shard(config, sink, stop_event)
+    except Exception as e:
+        global_logger.error(f"扫描子进程 {config['shard']} 异常: {e}")
+    finally:
+        sink.close()
+
+
+def _run_shard(config: Dict, sink: _RecordSink, stop_event):
+    from services.url_parser_service import URLRangeParser, ORDER_SEQUENTIAL
+
+    engine = config.get('engine', 'ffprobe')
+    if engine in ('ffprobe', 'async'):
+        from services.ffprobe_validator_service import FfprobeStreamValidator as ValidatorClass
+    else:
+        from services.mpv_validator_service import MpvStreamValidator as ValidatorClass
+    ValidatorClass.reset_terminating()
+    if config.get('user_agent') is not None:
+        ValidatorClass.set_user_agent(config['user_agent'])
+    if config.get('referer') is not None:
+        ValidatorClass.set_referer(config['referer'])
+    threads = max(1, config.get('threads', 1))
+    max_limit = max(threads, config.get('max_limit', threads))
+    ValidatorClass.set_max_concurrent(
+        threads, max_limit=max_limit,
+        per_host_limit=config.get('per_host_limit', 0), adaptive=config.get('adaptive', True)
+    )
+    native_probe = bool(config.get('native_ts_probe', True)) and hasattr(ValidatorClass, 'set_native_probe')
+    if hasattr(ValidatorClass, 'set_native_probe'):
+        # 子进程里的类属性是默认值，关闭时也要显式设置
+        ValidatorClass.set_native_probe(native_probe, config.get('ts_probe_dwell'))
+    timeout = config.get('timeout', 10)
+    prefilter = None
+    if config.get('prefilter', True):
+        from services.stream_prefilter import StreamPrefilter
+        prefilter = StreamPrefilter(
+            timeout=timeout, headers=ValidatorClass.get_headers(),
+            udp_dwell=config.get('udp_dwell') or timeout, skip_udp=native_probe
+        )
+
+    space = URLRangeParser().compile(config['expression'])
+    shard, shards = config['shard'], config['shards']
+    order = config.get('order', ORDER_SEQUENTIAL)
+    is_done = _done_filter(config.get('done'))
+    start = config.get('start', 0) if order == ORDER_SEQUENTIAL else 0
+    skip_urls = config.get('skip_urls') or ()
+
+    def items(sub_shard: int, sub_shards: int):
+        # 进程 p 的第 j 个线程负责全局分片 p + P·j（共 P·T 片），合起来正好是进程 p 的分片
+        for index, url in space.iter_urls(sub_shard, sub_shards, order=order,
+                                          seed=config.get('seed'), start=start, interleave=True):
+            if stop_event.is_set():
+                return
+            if is_done is not None and is_done(index):
+                continue
+            if url in skip_urls:
+                sink.add(index, url, {'valid': False, 'error_type': SKIPPED_EXISTING})
+                continue
+            yield url, index
+
+    finished = threading.Event()
+
+    def watch_stop():
+        # 停止时终止进行中的探测；空闲时把不足一批的结果按时发送
+        while not finished.is_set():
+            if stop_event.wait(_FLUSH_INTERVAL):
+                ValidatorClass.set_terminating()
+                return
+            sink.flush(only_if_due=True)
+
+    threading.Thread(target=watch_stop, name="ScanFarmWatcher", daemon=True).start()
+    try:
+        if engine == 'async':
+            _run_async(ValidatorClass, prefilter, timeout, config, items(shard, shards), sink, stop_event)
+        else:
+            _run_threads(ValidatorClass, prefilter, timeout, max_limit,
+                         [items(shard + shards * j, shards * max_limit) for j in range(max_limit)],
+                         sink, stop_event)
+    finally:
+        finished.set()
+        if stop_event.is_set():
+            ValidatorClass.terminate_all()
+        ValidatorClass.destroy_all_handles()
+
+
+def _run_threads(ValidatorClass, prefilter, timeout, count, sources, sink, stop_event):
+    from services.stream_prefilter import make_rejected_result
+
+    validator = ValidatorClass(None)
+
+    def work(source):
+        for url, index in source:
+            try:
+                rejection = prefilter.check(url) if prefilter is not None else None
+                if rejection is not None:
+                    result = make_rejected_result(url, rejection)
+                else:
+                    result = validator.validate_stream(url, timeout=timeout)
+            except Exception as e:
+                result = {'valid': False, 'error_type': 'exception', 'error': str(e)}
+            if stop_event.is_set() or result.get('error_type') == 'terminating':
+                return
+            sink.add(index, url, result)
+
+    workers = [
+        threading.Thread(target=work, args=(source,), name=f"ScanFarmWorker-{i}", daemon=True)
+        for i, source in enumerate(sources[:count])
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+def _run_async(ValidatorClass, prefilter, timeout, config, source, sink, stop_event):
+    from services.async_scan_engine import AsyncScanEngine, DEFAULT_MAX_INFLIGHT
+
+    def on_result(url, index, result):
+        if result.get('error_type') != 'terminating':
+            sink.add(index, url, result)
+
+    engine = AsyncScanEngine(
+        ValidatorClass(None),
+        timeout=timeout,
+        max_inflight=max(1, math.ceil(
+            config.get('async_max_inflight', DEFAULT_MAX_INFLIGHT) / config['shards']
+        )),
+        concurrency=ValidatorClass._get_controller(),
+        on_result=on_result,
+        stop_event=stop_event,
+        prefilter=prefilter
+    )
+    engine.start(source).join()
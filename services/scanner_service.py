@@ -2,9 +2,12 @@ import threading
 import queue
 import time
 import functools
+import math
 from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
-from services.url_parser_service import URLRangeParser
+from services.url_parser_service import URLRangeParser, ORDER_SEQUENTIAL, SCAN_ORDERS
+from services.scan_checkpoint import ScanCheckpoint
+from services.scan_farm import ScanFarm, SKIPPED_EXISTING, build_channel_info, resolve_process_count
 from core.log_manager import global_logger
 from models.channel_model import ChannelListModel
 from PySide6 import QtCore
@@ -13,53 +16,6 @@ from models.channel_mappings import extract_channel_name_from_url
 from utils.scan_state_manager import get_scan_state_manager
 
 
-def calculate_optimal_queue_size(thread_count: int = 10) -> int:
-    """根据系统资源动态计算最优队列大小
-
-    Args:
-        thread_count: 扫描线程数
-
-    Returns:
-        int: 最优队列大小（URL数量）
-
-    算法说明：
-    - 基于可用内存：每个URL条目约占用1KB内存
-    - 基于线程数：队列应至少能容纳线程数 * 10 的任务量
-    - 限制范围：1000 - 50000，避免过大或过小
-    """
-    try:
-        import psutil
-
-        # 获取系统资源信息
-        memory_mb = psutil.virtual_memory().available / (1024 * 1024)
-        cpu_count = psutil.cpu_count() or 4
-
-        # 基于内存计算（使用5%的可用内存，假设每条目1KB）
-        memory_based = int(memory_mb * 0.05 * 1024)  # 转换为条目数
-
-        # 基于线程数计算（每个线程至少有10个待处理任务）
-        thread_based = thread_count * 10
-
-        # 基于CPU核心数计算（每个核心至少1000个任务）
-        cpu_based = cpu_count * 1000
-
-        # 取三者中的最小值，确保不会过度占用资源
-        optimal = min(memory_based, thread_based, cpu_based)
-
-        # 限制在合理范围内
-        optimal = max(1000, min(optimal, 50000))
-
-        return optimal
-
-    except ImportError:
-        # psutil不可用，使用基于线程数的简单计算
-        return max(1000, thread_count * 100)
-    except Exception as e:
-        # 出错时返回保守的默认值
-        global_logger.debug(f"计算最优队列大小失败: {e}，使用默认值")
-        return 10000
-
-
 class ScannerController(QObject):
     """扫描控制器，管理多线程扫描过程"""
 
@@ -88,13 +44,13 @@ class ScannerController(QObject):
         self.timeout = 10  # 默认超时时间
         self.channel_counter = 0
         self.counter_lock = threading.Lock()
-        self._optimal_queue_size = 10000  # 动态计算的队列大小（默认值）
         self.stats: Dict[str, Any] = {
             'total': 0,
             'valid': 0,
             'invalid': 0,
             'start_time': 0,
-            'elapsed': 0
+            'elapsed': 0,
+            'prefiltered': 0
         }
         # 记录无效的URL，用于重试扫描（委托给scan_state_manager）
         self._max_invalid_urls = 50000
@@ -104,6 +60,11 @@ class ScannerController(QObject):
         self.scan_id = 'main_scan'
         self._validator = None
         self._scan_engine = None
+        self._async_engine = None
+        self._scan_farm = None
+        self._prefilter = None
+        self._checkpoint = None
+        self._skip_urls = set()
         self._mapping_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mapper")
         self._pending_channels = []
         self._pending_lock = threading.Lock()
@@ -112,15 +73,6 @@ class ScannerController(QObject):
         self._pending_validations = []
         self._validation_flush_timer = None
 
-    def _force_ui_refresh(self):
-        try:
-            if hasattr(self.model, 'update_view'):
-                self.model.update_view()
-            elif hasattr(self.model, 'layoutChanged'):
-                self.model.layoutChanged.emit()
-        except Exception as e:
-            self.logger.debug(f"UI刷新失败: {e}")
-
     @staticmethod
     def _run_on_main(func, *args):
         from PySide6.QtWidgets import QApplication
@@ -131,89 +83,130 @@ class ScannerController(QObject):
         else:
             QtCore.QTimer.singleShot(0, functools.partial(func, *args))
 
-    def _worker(self) -> None:
-        """工作线程函数"""
+    def _worker(self, items=None) -> None:
+        """工作线程函数
+
+        items 为本线程独占的 (url, 展开序号) 序列（范围扫描按分片枚举）；
+        为 None 时从 scan_queue 取任务（URL 列表扫描）。
+        """
+        if items is not None:
+            for url, index in items:
+                if self.stop_event.is_set():
+                    break
+                self._scan_one(url, index)
+            self._on_scan_worker_finished()
+            return
+
         while not self.stop_event.is_set():
             try:
-                url = self.scan_queue.get(timeout=0.5)
+                url, index = self.scan_queue.get_nowait()
             except queue.Empty:
-                if hasattr(self, 'filler_thread') and not self.filler_thread.is_alive():
-                    try:
-                        url = self.scan_queue.get_nowait()
-                    except queue.Empty:
-                        break
-                else:
-                    continue
+                break
+            self._scan_one(url, index)
 
-            try:
-                result = self._check_channel(url)
-                valid = result['valid']
-                latency = result['latency']
-                resolution = result.get('resolution', '')
+        self._on_scan_worker_finished()
 
-                try:
-                    channel_info = self._build_channel_info(
-                        url, valid, latency, resolution, result
-                    )
-                except Exception:
-                    channel_info = {
-                        'url': url,
-                        'name': url.split('/')[-1] if '/' in url else url,
-                        'raw_name': url.split('/')[-1] if '/' in url else url,
-                        'valid': valid,
-                        'latency': latency,
-                        'resolution': resolution,
-                        'status': '有效' if valid else '无效',
-                        'group': '未分类',
-                        'logo': None,
-                        'needs_details': False
-                    }
-
-                if valid:
-                    channel_info.setdefault(
-                        'name', channel_info.get(
-                            'raw_name', extract_channel_name_from_url(url)
-                        )
-                    )
-                    self._run_on_main(self._handle_channel_add, channel_info.copy())
-                    self._start_async_mapping_check(channel_info.copy())
+    def _scan_one(self, url: str, index: int | None) -> None:
+        try:
+            result = self._check_channel(url)
+            self._handle_scan_result(url, result, index)
+        except Exception as e:
+            self._record_scan_exception(url, e, index)
 
-                with self.stats_lock:
-                    if valid:
-                        self.stats['valid'] += 1
-                    else:
-                        self.stats['invalid'] += 1
-                        error_type = result.get('error_type') or 'unknown_error'
-                        error_msg = result.get('error', '')
-                        self.logger.debug(f"扫描无效: {url} | error_type={error_type} | error={error_msg}")
-                        if self.stats['invalid'] % 50 == 1:
-                            self.logger.debug(
-                                f"扫描进度: 有效={self.stats['valid']}, "
-                                f"无效={self.stats['invalid']}, "
-                                f"最新错误类型={error_type}"
-                            )
-                        self.scan_state_manager.add_invalid_url(self.scan_id, url, error_type)
+    def _handle_scan_result(self, url: str, result: Dict[str, Any], index: int | None = None) -> None:
+        """处理单个扫描结果（线程工作者与异步引擎共用）
 
-                    current = self.stats['valid'] + self.stats['invalid']
-                    total = self.stats['total']
+        index 为 URL 在范围展开中的序号，用于记录断点；重试扫描没有序号。
+        """
+        valid = result['valid']
+        latency = result['latency']
+        resolution = result.get('resolution', '')
 
-                if total <= 0:
-                    total = 100
-                    self._run_on_main(self.progress_updated.emit, current, total)
+        try:
+            channel_info = self._build_channel_info(
+                url, valid, latency, resolution, result
+            )
+        except Exception:
+            channel_info = {
+                'url': url,
+                'name': url.split('/')[-1] if '/' in url else url,
+                'raw_name': url.split('/')[-1] if '/' in url else url,
+                'valid': valid,
+                'latency': latency,
+                'resolution': resolution,
+                'status': '有效' if valid else '无效',
+                'group': '未分类',
+                'logo': None,
+                'needs_details': False
+            }
 
-            except Exception as e:
-                self.logger.warning(f"扫描URL异常: {url} - {e}")
-                with self.stats_lock:
-                    self.stats['invalid'] += 1
-                    self.scan_state_manager.add_invalid_url(self.scan_id, url, f'exception: {e}')
-                    current = self.stats['valid'] + self.stats['invalid']
-                    total = self.stats['total']
-                    if total <= 0:
-                        total = 100
-                    self._run_on_main(self.progress_updated.emit, current, total)
+        self._apply_scan_outcome(url, valid, channel_info, result, index)
 
-                continue
+    def _apply_scan_outcome(self, url: str, valid: bool, channel_info: dict | None,
+                            result: Dict[str, Any], index: int | None) -> None:
+        """把一个扫描结果计入列表、断点与统计（本进程探测与扫描子进程回传共用）"""
+        if valid:
+            channel_info.setdefault(
+                'name', channel_info.get(
+                    'raw_name', extract_channel_name_from_url(url)
+                )
+            )
+            self._run_on_main(self._handle_channel_add, channel_info.copy())
+            self._start_async_mapping_check(channel_info.copy())
 
+        self._mark_checkpoint(index, valid, result, channel_info)
+
+        with self.stats_lock:
+            if valid:
+                self.stats['valid'] += 1
+            else:
+                self.stats['invalid'] += 1
+                if result.get('prefiltered'):
+                    self.stats['prefiltered'] = self.stats.get('prefiltered', 0) + 1
+                error_type = result.get('error_type') or 'unknown_error'
+                error_msg = result.get('error', '')
+                self.logger.debug(f"扫描无效: {url} | error_type={error_type} | error={error_msg}")
+                if self.stats['invalid'] % 50 == 1:
+                    self.logger.debug(
+                        f"扫描进度: 有效={self.stats['valid']}, "
+                        f"无效={self.stats['invalid']}, "
+                        f"最新错误类型={error_type}"
+                    )
+                self.scan_state_manager.add_invalid_url(self.scan_id, url, error_type)
+
+            current = self.stats['valid'] + self.stats['invalid']
+            total = self.stats['total']
+
+        if total <= 0:
+            total = 100
+            self._run_on_main(self.progress_updated.emit, current, total)
+
+    def _mark_checkpoint(self, index, valid, result=None, channel_info=None):
+        """把结果写入断点；停止扫描时被中断的探测不算完成，续扫时重新探测"""
+        checkpoint = self._checkpoint
+        if checkpoint is None or index is None:
+            return
+        if self.stop_event.is_set() or (result and result.get('error_type') == 'terminating'):
+            return
+        if valid and channel_info is not None:
+            channel = {k: v for k, v in channel_info.items() if k != 'needs_details'}
+            checkpoint.mark(index, True, channel)
+        else:
+            checkpoint.mark(index, False)
+
+    def _record_scan_exception(self, url: str, e: Exception, index: int | None = None) -> None:
+        self.logger.warning(f"扫描URL异常: {url} - {e}")
+        self._mark_checkpoint(index, False)
+        with self.stats_lock:
+            self.stats['invalid'] += 1
+            self.scan_state_manager.add_invalid_url(self.scan_id, url, f'exception: {e}')
+            current = self.stats['valid'] + self.stats['invalid']
+            total = self.stats['total']
+            if total <= 0:
+                total = 100
+            self._run_on_main(self.progress_updated.emit, current, total)
+
+    def _on_scan_worker_finished(self) -> None:
         self._run_on_main(self._flush_pending_channels)
 
         with self.stats_lock:
@@ -222,6 +215,24 @@ class ScannerController(QObject):
             if current < total:
                 self._run_on_main(self.progress_updated.emit, total, total)
 
+    def _on_farm_records(self, records) -> None:
+        """扫描子进程回传的一批紧凑结果记录"""
+        for index, url, error_type, prefiltered, channel in records:
+            if error_type == SKIPPED_EXISTING:
+                self._skip_existing(index)
+                continue
+            result = {'error_type': error_type, 'prefiltered': prefiltered}
+            try:
+                self._apply_scan_outcome(url, channel is not None, channel, result, index)
+            except Exception as e:
+                self._record_scan_exception(url, e, index)
+
+    def _on_async_scan_result(self, url: str, context, result: Dict[str, Any]) -> None:
+        try:
+            self._handle_scan_result(url, result, context)
+        except Exception as e:
+            self._record_scan_exception(url, e, context)
+
     def _handle_channel_add(self, channel_info: dict):
         """处理频道添加：攒批后一次性插入模型，减少视图通知次数"""
         with self._pending_lock:
@@ -233,18 +244,15 @@ class ScannerController(QObject):
         QtCore.QTimer.singleShot(100, self._flush_pending_channels)
 
     def _flush_pending_channels(self):
-        """将攒批的频道一次性添加到模型，扫描期间使用 reset 模式避免竞态崩溃"""
+        """将攒批的频道一次性追加到模型（插入行通知，不重置模型）"""
         with self._pending_lock:
             channels = self._pending_channels
             self._pending_channels = []
             self._batch_flush_pending = None
 
         if channels:
-            is_scanning = not self.stop_event.is_set()
-            self.model.add_channels(channels, is_from_file=False, use_reset=is_scanning)
+            self.model.add_channels(channels, is_from_file=False)
         self._apply_pending_mappings()
-        if channels or self._pending_mappings:
-            self._force_ui_refresh()
 
     def _apply_pending_mappings(self):
         """应用暂存的映射结果到已加入模型的频道"""
@@ -258,77 +266,12 @@ class ScannerController(QObject):
         for url in applied_urls:
             del self._pending_mappings[url]
 
-    def _apply_pending_mappings_and_refresh(self):
-        """应用暂存映射并刷新UI"""
-        self._apply_pending_mappings()
-        self._force_ui_refresh()
-
     def _build_channel_info(
         self, url: str, valid: bool, latency: int,
         resolution: str, result: dict
     ) -> dict:
-        """构建基本的频道信息字典 - 优化版本，只在异步线程中检查映射"""
-        from models.channel_mappings import extract_channel_name_from_url
-
-        try:
-            # 直接从URL提取频道名
-            channel_name = extract_channel_name_from_url(url)
-
-            # 重要修改：验证有效后不立即检查映射！
-            # 只在异步线程中检查映射，避免重复日志和性能浪费
-
-            # 注意：这里不再调用 mapping_manager.get_channel_info
-            # 映射检查将在异步线程 _fetch_channel_details 中进行
-
-            # 构建频道信息（只包含基本信息，不包含映射信息）
-            channel_info = {
-                'url': url,
-                'name': channel_name,  # 使用URL提取的名称
-                'raw_name': channel_name,
-                'valid': valid,
-                'latency': latency,
-                'resolution': result.get('resolution', ''),
-                'codec': result.get('codec', '') or '',
-                'bitrate': result.get('bitrate', '') or '',
-                'status': '有效' if valid else '无效',
-                'group': '未分类',  # 默认分组，异步线程中更新
-                'logo': None,   # 默认无logo，异步线程中更新
-                'needs_details': False  # 重要：这里设为False，异步线程中再决定是否需要获取详情
-            }
-
-            # 计算流质量评分（基于 latency/bitrate/resolution/valid）
-            from services.stream_quality_scorer import StreamQualityScorer
-            score_info = StreamQualityScorer.score_from_channel(channel_info)
-            channel_info['quality_score'] = score_info.get('total', 0)
-            channel_info['quality_grade'] = score_info.get('grade', 'F')
-
-            # 注意：这里不启动异步获取详细信息
-            # 异步获取将在 _start_async_mapping_check 方法中决定
-
-            return channel_info
-
-        except Exception as e:
-            # 返回基本的频道信息，即使构建失败
-            from services.stream_quality_scorer import StreamQualityScorer
-            fallback_info = {
-                'url': url,
-                'name': extract_channel_name_from_url(url),
-                'raw_name': extract_channel_name_from_url(url),
-                'valid': valid,
-                'latency': latency,
-                'resolution': result.get('resolution', ''),
-                'codec': result.get('codec', '') or '',
-                'bitrate': result.get('bitrate', '') or '',
-                'status': '有效' if valid else '无效',
-                'group': '未分类',
-                'logo': None,
-                'error': str(e),
-                'needs_details': False
-            }
-            score_info = StreamQualityScorer.score_from_channel(fallback_info)
-            fallback_info['quality_score'] = score_info.get('total', 0)
-            fallback_info['quality_grade'] = score_info.get('grade', 'F')
-            return fallback_info
+        """构建基本的频道信息字典 - 映射信息只在异步线程中检查"""
+        return build_channel_info(url, valid, latency, resolution, result)
 
     def _start_async_details_fetch(self, channel_info: dict):
         if self._mapping_executor is None:
@@ -426,12 +369,10 @@ class ScannerController(QObject):
                 success = self.model.update_channel_by_url(url, channel_info)
                 if not success:
                     self._pending_mappings[url] = channel_info
-                    QtCore.QTimer.singleShot(150, self._apply_pending_mappings_and_refresh)
+                    QtCore.QTimer.singleShot(150, self._apply_pending_mappings)
             else:
                 self.logger.debug("频道信息缺少URL，跳过更新")
 
-            self._force_ui_refresh()
-
         except Exception as e:
             self.logger.debug(f"更新频道详细信息失败: {e}")
 
@@ -445,16 +386,77 @@ class ScannerController(QObject):
         except Exception:
             pass
         self._scan_engine = engine
-        if engine == 'ffprobe':
+        # 异步引擎的第二阶段探测同样使用 ffprobe，共享其请求头与终止标志
+        if engine in ('ffprobe', 'async'):
             from services.ffprobe_validator_service import FfprobeStreamValidator
             return FfprobeStreamValidator
         else:
             from services.mpv_validator_service import MpvStreamValidator
             return MpvStreamValidator
 
+    def _concurrency_plan(self, thread_count: int):
+        """按配置计算 (初始并发, 并发上限, 扫描引擎设置)"""
+        thread_count = max(1, thread_count)
+        try:
+            from core.config_manager import ConfigManager
+            settings = ConfigManager().load_scan_engine_settings()
+        except Exception:
+            settings = {}
+        max_limit = thread_count
+        if settings.get('adaptive_concurrency', True):
+            max_limit = settings.get('max_concurrency', 0) or max(thread_count, min(thread_count * 4, 64))
+            max_limit = max(thread_count, max_limit)
+        return thread_count, max_limit, settings
+
+    def _configure_concurrency(self, ValidatorClass, thread_count: int) -> int:
+        """按配置设定验证器的并发控制（及组播原生探测），返回需要启动的工作线程数
+
+        界面设置的线程数作为初始并发；开启自适应时控制器在 [1, 上限] 内自动调整，
+        工作线程按上限启动，实际同时探测的数量由控制器决定。
+        """
+        thread_count, max_limit, settings = self._concurrency_plan(thread_count)
+        adaptive = settings.get('adaptive_concurrency', True)
+        ValidatorClass.set_max_concurrent(
+            thread_count, max_limit=max_limit,
+            per_host_limit=settings.get('per_host_limit', 0), adaptive=adaptive
+        )
+        if hasattr(ValidatorClass, 'set_native_probe'):
+            ValidatorClass.set_native_probe(
+                settings.get('native_ts_probe', True), settings.get('ts_probe_dwell')
+            )
+        if adaptive:
+            self.logger.debug(f"自适应并发: 初始 {thread_count}，上限 {max_limit}")
+        return max_limit
+
+    def _create_prefilter(self):
+        """按配置创建第一阶段预筛选器（需在设置请求头之后调用）"""
+        try:
+            from core.config_manager import ConfigManager
+            settings = ConfigManager().load_scan_engine_settings()
+        except Exception:
+            settings = {}
+        if not settings.get('prefilter', True):
+            return None
+        from services.stream_prefilter import StreamPrefilter
+        ValidatorClass = self._get_validator_class()
+        return StreamPrefilter(
+            timeout=self.timeout,
+            headers=ValidatorClass.get_headers(),
+            udp_dwell=settings.get('prefilter_udp_dwell') or self.timeout,
+            skip_udp=settings.get('native_ts_probe', True) and hasattr(ValidatorClass, 'uses_native_probe')
+        )
+
     def _check_channel(
         self, url: str, raw_channel_name: str | None = None
     ) -> Dict[str, Any]:
+        if self._prefilter is not None:
+            start_time = time.time()
+            rejection = self._prefilter.check(url)
+            if rejection is not None:
+                from services.stream_prefilter import make_rejected_result
+                return make_rejected_result(
+                    url, rejection, int((time.time() - start_time) * 1000)
+                )
         if self._validator is None:
             ValidatorClass = self._get_validator_class()
             self._validator = ValidatorClass(self.main_window)
@@ -465,46 +467,38 @@ class ScannerController(QObject):
             timeout=self.timeout
         )
 
-    def _fill_queue(self):
-        """动态填充扫描队列 - 优化版，避免内存爆炸"""
-        try:
-            batch_count = 0
-            skip_urls = getattr(self, '_skip_urls', set())
-            for batch in self.url_generator:
-                if self.stop_event.is_set():
-                    break
+    def _iter_range_items(self, shard: int = 0, shards: int = 1):
+        """枚举本分片负责的 (url, 展开序号)，跳过断点中已完成的序号与列表中已有的 URL
 
-                batch_count += 1
-
-                if skip_urls:
-                    filtered = [url for url in batch if url not in skip_urls]
-                    skipped = len(batch) - len(filtered)
-                    with self.stats_lock:
-                        self.stats['total'] += len(filtered)
-                    if skipped > 0:
-                        self.logger.debug(f"追加扫描跳过 {skipped} 个已存在URL")
-                else:
-                    filtered = batch
-                    with self.stats_lock:
-                        self.stats['total'] += len(batch)
-
-                for url in filtered:
-                    if self.stop_event.is_set():
-                        break
-                    self.scan_queue.put(url)
-
-                # 保持队列适度填充，避免内存占用过高（使用动态计算的队列大小）
-                while self.scan_queue.qsize() > self._optimal_queue_size and not self.stop_event.is_set():
-                    time.sleep(0.1)
-
-                # 每处理100个批次后稍微休息，避免CPU占用过高
-                if batch_count % 100 == 0:
-                    time.sleep(0.01)
+        多个工作线程各自交错枚举自己的分片，不需要共享的填充线程与队列；
+        顺序扫描续扫时直接从断点游标处开始。
+        """
+        space = self._url_space
+        checkpoint = self._checkpoint
+        order = self._scan_order
+        start = checkpoint.cursor if checkpoint is not None and order == ORDER_SEQUENTIAL else 0
+        items = space.iter_urls(
+            shard, shards, order=order, seed=self._scan_seed, start=start, interleave=True
+        )
+        skip_urls = self._skip_urls
+        if checkpoint is None and not skip_urls:
+            return items
+        return self._filter_range_items(items, checkpoint, skip_urls)
+
+    def _filter_range_items(self, items, checkpoint, skip_urls):
+        for index, url in items:
+            if checkpoint is not None and checkpoint.is_done(index):
+                continue
+            if url in skip_urls:
+                self._skip_existing(index)
+                continue
+            yield url, index
 
-        except Exception as e:
-            self.logger.debug(f"队列填充线程异常: {e}")
-        finally:
-            self.logger.debug(f"队列填充完成，共处理 {batch_count} 个批次")
+    def _skip_existing(self, index: int) -> None:
+        """追加扫描跳过列表中已有的 URL：不计入总数，断点中记为已完成"""
+        self._mark_checkpoint(index, False)
+        with self.stats_lock:
+            self.stats['total'] -= 1
 
     def is_scanning(self):
         """检查是否正在扫描"""
@@ -513,9 +507,14 @@ class ScannerController(QObject):
     def start_scan(
         self, base_url: str, thread_count: int = 10, timeout: int = 10,
         user_agent: str | None = None, referer: str | None = None,
-        skip_urls: set | None = None
+        skip_urls: set | None = None, resume: bool = False
     ) -> None:
-        """开始扫描 - 优化版本"""
+        """开始扫描 - 优化版本
+
+        Args:
+            skip_urls: 不再探测的 URL（追加扫描时为列表中已有的 URL）
+            resume: 存在同一范围的断点时从断点继续，否则重新开始并覆盖旧断点
+        """
         # 确保停止之前的扫描
         self.stop_scan()
         self.stop_event.clear()
@@ -525,11 +524,37 @@ class ScannerController(QObject):
         self._validator = None
 
         self._skip_urls = skip_urls or set()
+        self._checkpoint = self._open_checkpoint(base_url, resume)
 
         # 注册扫描状态（不使用上下文管理器，因为扫描是异步的）
         self.scan_state_manager.register_scan(self.scan_id, self)
         self._start_scan_internal(base_url, thread_count, timeout, user_agent, referer)
 
+    def _open_checkpoint(self, base_url: str, resume: bool):
+        """为含范围的扫描打开断点，单个 URL 的扫描不需要断点"""
+        try:
+            if not self.url_parser.has_range(base_url):
+                return None
+            total = self.url_parser.estimate_url_count(base_url)
+            return ScanCheckpoint.open(base_url, total, resume=resume)
+        except Exception as e:
+            self.logger.warning(f"打开扫描断点失败，本次扫描不记录断点: {e}")
+            return None
+
+    def _restore_checkpoint_results(self):
+        """续扫时把断点中已发现的有效频道重新加入列表"""
+        checkpoint = self._checkpoint
+        if checkpoint is None:
+            return
+        restored = checkpoint.results()
+        if not restored:
+            return
+        # 列表中已有的 URL 由模型按 URL 去重
+        for channel in restored:
+            channel.pop('_index', None)
+            self._run_on_main(self._handle_channel_add, channel)
+        self.logger.info(f"已从断点恢复 {len(restored)} 个有效频道")
+
     def _start_scan_internal(
         self, base_url: str, thread_count: int = 10, timeout: int = 10,
         user_agent: str | None = None, referer: str | None = None
@@ -540,24 +565,36 @@ class ScannerController(QObject):
 
         self.scan_state_manager.clear_invalid_urls(self.scan_id)
 
-        self._optimal_queue_size = calculate_optimal_queue_size(thread_count)
-        self.logger.debug(f"动态计算最优队列大小: {self._optimal_queue_size}（线程数: {thread_count}）")
-
         ValidatorClass = self._get_validator_class()
-        ValidatorClass.set_max_concurrent(thread_count)
+        worker_count = self._configure_concurrency(ValidatorClass, thread_count)
         ValidatorClass.reset_terminating()
         if user_agent is not None:
             ValidatorClass.set_user_agent(user_agent)
         if referer is not None:
             ValidatorClass.set_referer(referer)
+        self._prefilter = self._create_prefilter()
+
+        # 范围表达式编译为可按序号访问的 URL 空间，总数在开始前即可确定
+        self._url_space = self.url_parser.compile(base_url)
+        self._scan_order, self._scan_seed = self._load_scan_order(base_url)
+        if self._skip_urls:
+            # 只保留可能落在本范围内的 URL，交给扫描子进程时也小得多
+            prefix = self._url_space.prefix
+            self._skip_urls = {url for url in self._skip_urls if url.startswith(prefix)}
+        remaining = len(self._url_space)
+        if self._checkpoint is not None:
+            remaining -= self._checkpoint.done_count
+            if self._checkpoint.done_count:
+                self.logger.debug(f"断点续扫跳过 {self._checkpoint.done_count} 个已探测URL")
 
         # 初始化统计信息
         self.stats = {
-            'total': 0,  # 初始为0，由填充线程动态更新
+            'total': remaining,
             'valid': 0,
             'invalid': 0,
             'start_time': time.time(),
-            'elapsed': 0
+            'elapsed': 0,
+            'prefiltered': 0
         }
 
         # 更新扫描状态管理器
@@ -567,40 +604,100 @@ class ScannerController(QObject):
         })
         self.scan_state_manager.update_stats(self.scan_id, self.stats)
 
-        # 初始化队列和生成器
         self.scan_queue = queue.Queue()
-        self.url_generator = self.url_parser.parse_url(base_url)
+        self._restore_checkpoint_results()
 
-        # 启动队列填充线程（不再预填充，所有URL都由填充线程处理）
-        self.filler_thread = threading.Thread(
-            target=self._fill_queue,
-            name="QueueFiller",
-            daemon=True
-        )
-        self.filler_thread.start()
-        optimal_threads = thread_count if thread_count > 0 else 1  # 至少1个线程
+        if self._start_scan_farm(base_url, thread_count):
+            self._start_stats_thread("StatsUpdater")
+            self._run_on_main(self.progress_updated.emit, 0, 1)
+            return
 
-        # 使用优化后的线程数
+        if self._scan_engine == 'async':
+            self._start_async_engine(
+                self._iter_range_items(), worker_count,
+                self._on_async_scan_result, self._on_scan_worker_finished
+            )
+            self._start_stats_thread("StatsUpdater")
+            self._run_on_main(self.progress_updated.emit, 0, 1)
+            return
+
+        # 工作线程按并发上限启动，各自枚举一个交错分片；同时探测的数量由验证器的并发控制器调整
         self.workers = []
-        for i in range(optimal_threads):
+        for i in range(worker_count):
             worker = threading.Thread(
                 target=self._worker,
+                args=(self._iter_range_items(i, worker_count),),
                 name=f"ScannerWorker-{i}",
                 daemon=True
             )
             worker.start()
             self.workers.append(worker)
 
-        self.stats_thread = threading.Thread(
-            target=self._update_stats,
-            name="StatsUpdater",
-            daemon=True
-        )
-        self.stats_thread.start()
+        self._start_stats_thread("StatsUpdater")
 
         # 扫描开始时发送进度更新信号
         self._run_on_main(self.progress_updated.emit, 0, 1)
 
+    def _start_scan_farm(self, base_url: str, thread_count: int) -> bool:
+        """配置开启多进程扫描时，把范围扫描交给扫描子进程；未开启返回 False
+
+        界面设置的并发按进程数均分，每个子进程有独立的验证器与并发控制器。
+        """
+        thread_count, max_limit, settings = self._concurrency_plan(thread_count)
+        if not settings.get('scan_farm', False):
+            return False
+        processes = min(resolve_process_count(settings.get('scan_processes', 0)), len(self._url_space))
+        ValidatorClass = self._get_validator_class()
+        checkpoint = self._checkpoint
+        config = {
+            'expression': base_url,
+            'order': self._scan_order,
+            'seed': self._scan_seed,
+            'start': checkpoint.cursor if checkpoint is not None else 0,
+            'done': checkpoint.done_snapshot() if checkpoint is not None else None,
+            'skip_urls': frozenset(self._skip_urls),
+            'timeout': self.timeout,
+            'engine': self._scan_engine,
+            'user_agent': ValidatorClass.get_user_agent(),
+            'referer': ValidatorClass.get_referer(),
+            'threads': math.ceil(thread_count / processes),
+            'max_limit': math.ceil(max_limit / processes),
+            'per_host_limit': settings.get('per_host_limit', 0),
+            'adaptive': settings.get('adaptive_concurrency', True),
+            'prefilter': settings.get('prefilter', True),
+            'udp_dwell': settings.get('prefilter_udp_dwell', 0),
+            'async_max_inflight': settings.get('async_max_inflight', 1000),
+            'native_ts_probe': settings.get('native_ts_probe', True),
+            'ts_probe_dwell': settings.get('ts_probe_dwell'),
+        }
+        self._scan_farm = ScanFarm(
+            config, processes,
+            on_records=self._on_farm_records,
+            on_finished=self._on_scan_worker_finished
+        )
+        self.workers = [self._scan_farm.start()]
+        return True
+
+    def _stop_scan_farm(self):
+        farm = self._scan_farm
+        if farm is not None:
+            farm.stop()
+            farm.join(timeout=2.0)
+            self._scan_farm = None
+
+    def _load_scan_order(self, base_url: str):
+        """读取范围扫描顺序；随机顺序的种子取自表达式，续扫时排列不变"""
+        order = ORDER_SEQUENTIAL
+        try:
+            from core.config_manager import ConfigManager
+            order = ConfigManager().load_scan_engine_settings().get('scan_order', ORDER_SEQUENTIAL)
+        except Exception:
+            pass
+        if order not in SCAN_ORDERS:
+            self.logger.warning(f"未知的扫描顺序 '{order}'，按顺序扫描")
+            order = ORDER_SEQUENTIAL
+        return order, base_url
+
     def start_scan_from_urls(
         self, urls: list, thread_count: int = 10, timeout: int = 10,
         user_agent: str | None = None, referer: str | None = None,
@@ -642,14 +739,16 @@ class ScannerController(QObject):
         """内部从URL列表开始扫描方法"""
 
         self.timeout = timeout
+        self._checkpoint = None
 
         ValidatorClass = self._get_validator_class()
-        ValidatorClass.set_max_concurrent(thread_count)
+        worker_count = self._configure_concurrency(ValidatorClass, thread_count)
         ValidatorClass.reset_terminating()
         if user_agent is not None:
             ValidatorClass.set_user_agent(user_agent)
         if referer is not None:
             ValidatorClass.set_referer(referer)
+        self._prefilter = self._create_prefilter()
 
         # 初始化统计信息
         self.stats = {
@@ -657,7 +756,8 @@ class ScannerController(QObject):
             'valid': 0,
             'invalid': 0,
             'start_time': time.time(),
-            'elapsed': 0
+            'elapsed': 0,
+            'prefiltered': 0
         }
 
         # 更新扫描状态管理器
@@ -670,13 +770,20 @@ class ScannerController(QObject):
         # 初始化队列
         self.scan_queue = queue.Queue()
 
+        if self._scan_engine == 'async':
+            self._start_async_engine(
+                ((url, None) for url in urls), worker_count,
+                self._on_async_scan_result, self._on_scan_worker_finished
+            )
+            self._start_stats_thread("RetryStatsUpdater")
+            return
+
         # 填充队列
         for url in urls:
-            self.scan_queue.put(url)
+            self.scan_queue.put((url, None))
 
-        # 使用用户设置的线程数
         self.workers = []
-        for i in range(thread_count):
+        for i in range(worker_count):
             worker = threading.Thread(
                 target=self._worker,
                 name=f"RetryScannerWorker-{i}",
@@ -685,15 +792,57 @@ class ScannerController(QObject):
             worker.start()
             self.workers.append(worker)
 
+        self._start_stats_thread("RetryStatsUpdater")
+
+    def _start_stats_thread(self, name: str):
         self.stats_thread = threading.Thread(
             target=self._update_stats,
-            name="RetryStatsUpdater",
+            name=name,
             daemon=True
         )
         self.stats_thread.start()
 
+    def _start_async_engine(self, items, thread_count: int, on_result, on_finished=None):
+        """启动 asyncio 扫描引擎；其事件循环线程作为唯一工作线程登记到 self.workers
+
+        ffprobe 进程数由验证器的并发控制器决定，thread_count 仅用于日志。
+        """
+        from services.async_scan_engine import AsyncScanEngine, DEFAULT_MAX_INFLIGHT
+        max_inflight = DEFAULT_MAX_INFLIGHT
+        try:
+            from core.config_manager import ConfigManager
+            settings = ConfigManager().load_scan_engine_settings()
+            max_inflight = settings.get('async_max_inflight', DEFAULT_MAX_INFLIGHT)
+        except Exception:
+            pass
+
+        ValidatorClass = self._get_validator_class()
+        self._async_engine = AsyncScanEngine(
+            ValidatorClass(self.main_window),
+            timeout=self.timeout,
+            max_inflight=max_inflight,
+            concurrency=ValidatorClass._get_controller(),
+            on_result=on_result,
+            on_finished=on_finished,
+            stop_event=self.stop_event,
+            prefilter=self._prefilter
+        )
+        self.logger.info(
+            f"扫描引擎: async (in-flight上限={max_inflight}, ffprobe进程上限={thread_count})"
+        )
+        self.workers = [self._async_engine.start(items)]
+
+    def _stop_async_engine(self):
+        engine = self._async_engine
+        if engine is not None:
+            engine.stop()
+            engine.join(timeout=2.0)
+            self._async_engine = None
+
     def stop_scan(self):
         self.stop_event.set()
+        self._stop_async_engine()
+        self._stop_scan_farm()
 
         self.scan_state_manager.update_scan_state(self.scan_id, {
             'is_scanning': False
@@ -712,6 +861,9 @@ class ScannerController(QObject):
             if still_alive:
                 self.logger.warning(f"{len(still_alive)} 个扫描工作线程未在2秒内退出")
 
+        if self._checkpoint is not None:
+            self._checkpoint.save(force=True)
+
         ValidatorClass.destroy_all_handles()
         self._validator = None
 
@@ -741,14 +893,11 @@ class ScannerController(QObject):
             except queue.Empty:
                 break
 
-        # 如果有队列填充线程，设置标志让它停止
-        if hasattr(self, 'filler_thread') and self.filler_thread and self.filler_thread.is_alive():
-            pass
-
     def _terminate_all_processes(self):
         try:
             ValidatorClass = self._get_validator_class()
             ValidatorClass.set_terminating()
+            self._stop_async_engine()
             alive_workers = [w for w in self.workers if w.is_alive()]
             if alive_workers:
                 for worker in alive_workers:
@@ -829,12 +978,15 @@ class ScannerController(QObject):
             'is_validating': True
         })
 
-        ValidatorClass.set_max_concurrent(threads)
+        worker_count = self._configure_concurrency(ValidatorClass, threads)
         if user_agent is not None:
             ValidatorClass.set_user_agent(user_agent)
         if referer is not None:
             ValidatorClass.set_referer(referer)
+        self._prefilter = self._create_prefilter()
 
+        use_async = self._scan_engine == 'async'
+        async_items = []
         total = 0
         for i in range(model.rowCount()):
             channel = model.get_channel(i)
@@ -842,7 +994,10 @@ class ScannerController(QObject):
             if not url:
                 self.logger.debug(f"验证跳过: 频道'{channel.get('name', '?')}' URL为空 (索引={i})")
                 continue
-            self.validation_queue.put((url, i))
+            if use_async:
+                async_items.append((url, i))
+            else:
+                self.validation_queue.put((url, i))
             total += 1
 
         self.stats = {
@@ -850,25 +1005,24 @@ class ScannerController(QObject):
             'valid': 0,
             'invalid': 0,
             'start_time': time.time(),
-            'elapsed': 0
+            'elapsed': 0,
+            'prefiltered': 0
         }
 
-        self.workers = []
-        for i in range(threads):
-            worker = threading.Thread(
-                target=self._validation_worker,
-                name=f"ValidationWorker-{i}",
-                daemon=True
-            )
-            worker.start()
-            self.workers.append(worker)
+        if use_async:
+            self._start_async_engine(async_items, worker_count, self._on_async_validation_result)
+        else:
+            self.workers = []
+            for i in range(worker_count):
+                worker = threading.Thread(
+                    target=self._validation_worker,
+                    name=f"ValidationWorker-{i}",
+                    daemon=True
+                )
+                worker.start()
+                self.workers.append(worker)
 
-        self.stats_thread = threading.Thread(
-            target=self._update_stats,
-            name="ValidationStatsUpdater",
-            daemon=True
-        )
-        self.stats_thread.start()
+        self._start_stats_thread("ValidationStatsUpdater")
 
         # 验证开始时发送进度更新信号
         self._run_on_main(self.progress_updated.emit, 0, 1)
@@ -884,6 +1038,7 @@ class ScannerController(QObject):
 
         ValidatorClass = self._get_validator_class()
         ValidatorClass.set_terminating()
+        self._stop_async_engine()
 
         while not self.validation_queue.empty():
             try:
@@ -911,32 +1066,44 @@ class ScannerController(QObject):
                     break
 
                 result = self._check_channel(url)
-                valid = result['valid']
-                latency = result['latency']
-                resolution = result.get('resolution', '')
-
-                self._run_on_main(self._handle_validation_result, url, valid, index, latency, resolution, result)
-
-                with self.stats_lock:
-                    if valid:
-                        self.stats['valid'] += 1
-                    else:
-                        self.stats['invalid'] += 1
-                        error_type = result.get('error_type', 'unknown')
-                        error_msg = result.get('error', '')
-                        self.logger.debug(f"验证无效: {url} | error_type={error_type} | error={error_msg}")
-
-                    current = self.stats['valid'] + self.stats['invalid']
-                    total = self.stats['total']
-                    if total <= 0:
-                        total = 1
-
-                    self._run_on_main(self.progress_updated.emit, current, total)
+                self._record_validation_result(url, index, result)
             except queue.Empty:
                 break
             except Exception as e:
                 self.logger.error(f"验证线程错误: {e}", exc_info=True)
 
+    def _record_validation_result(self, url: str, index: int, result: Dict[str, Any]) -> None:
+        """处理单个验证结果（线程工作者与异步引擎共用）"""
+        valid = result['valid']
+        latency = result['latency']
+        resolution = result.get('resolution', '')
+
+        self._run_on_main(self._handle_validation_result, url, valid, index, latency, resolution, result)
+
+        with self.stats_lock:
+            if valid:
+                self.stats['valid'] += 1
+            else:
+                self.stats['invalid'] += 1
+                if result.get('prefiltered'):
+                    self.stats['prefiltered'] = self.stats.get('prefiltered', 0) + 1
+                error_type = result.get('error_type', 'unknown')
+                error_msg = result.get('error', '')
+                self.logger.debug(f"验证无效: {url} | error_type={error_type} | error={error_msg}")
+
+            current = self.stats['valid'] + self.stats['invalid']
+            total = self.stats['total']
+            if total <= 0:
+                total = 1
+
+            self._run_on_main(self.progress_updated.emit, current, total)
+
+    def _on_async_validation_result(self, url: str, index: int, result: Dict[str, Any]) -> None:
+        try:
+            self._record_validation_result(url, index, result)
+        except Exception as e:
+            self.logger.error(f"验证结果处理错误: {e}", exc_info=True)
+
     def _handle_validation_result(self, url, valid, index, latency, resolution, result=None):
         """攒批处理验证结果，减少视图通知"""
         with self._pending_lock:
@@ -955,28 +1122,30 @@ class ScannerController(QObject):
 
         if validations:
             from services.stream_quality_scorer import StreamQualityScorer
-            self.model.beginResetModel()
             for url, valid, result in validations:
-                for ch in self.model.channels:
-                    if ch.get('url') == url:
-                        ch['valid'] = valid
-                        ch['status'] = '有效' if valid else '无效'
-                        # 同步更新验证时探测到的字段（保留最新值）
-                        if result:
-                            if result.get('latency') is not None:
-                                ch['latency'] = result['latency']
-                            if result.get('resolution'):
-                                ch['resolution'] = result['resolution']
-                            if result.get('codec'):
-                                ch['codec'] = result['codec']
-                            if result.get('bitrate'):
-                                ch['bitrate'] = result['bitrate']
-                        # 重新计算流质量评分
-                        score_info = StreamQualityScorer.score_from_channel(ch)
-                        ch['quality_score'] = score_info.get('total', 0)
-                        ch['quality_grade'] = score_info.get('grade', 'F')
-                        break
-            self.model.endResetModel()
+                row = self.model.find_row_by_url(url)
+                if row < 0:
+                    continue
+                ch = self.model.channels[row]
+                ch['valid'] = valid
+                ch['status'] = '有效' if valid else '无效'
+                # 同步更新验证时探测到的字段（保留最新值）
+                if result:
+                    if result.get('latency') is not None:
+                        ch['latency'] = result['latency']
+                    if result.get('resolution'):
+                        ch['resolution'] = result['resolution']
+                    if result.get('codec'):
+                        ch['codec'] = result['codec']
+                    if result.get('bitrate'):
+                        ch['bitrate'] = result['bitrate']
+                # 重新计算流质量评分
+                score_info = StreamQualityScorer.score_from_channel(ch)
+                ch['quality_score'] = score_info.get('total', 0)
+                ch['quality_grade'] = score_info.get('grade', 'F')
+                self.model.mark_row_changed(row)
+                # 智能排序生效时，分辨率/状态变化后把该行移回有序位置
+                self.model._keep_row_sorted(row)
 
     def _update_stats(self):
         """更新统计信息线程"""
@@ -1011,11 +1180,7 @@ class ScannerController(QObject):
                                 'stats': stats_copy, 'is_validation': is_validating_copy
                             })
 
-                    # 检查扫描是否完成：填充线程结束、所有工作线程都完成且队列为空
-                    filler_alive = (
-                        self.filler_thread.is_alive()
-                        if hasattr(self, 'filler_thread') and self.filler_thread else False
-                    )
+                    # 检查扫描是否完成：所有工作线程都完成且队列为空
                     workers_alive = (
                         any(w.is_alive() for w in self.workers)
                         if self.workers else False
@@ -1029,8 +1194,8 @@ class ScannerController(QObject):
                         if hasattr(self, 'validation_queue') else True
                     )
 
-                    # 如果填充线程结束、所有工作线程都完成且队列为空，则扫描完成
-                    if not filler_alive and not workers_alive and queue_empty and validation_queue_empty:
+                    # 所有工作线程都完成且队列为空，则扫描完成
+                    if not workers_alive and queue_empty and validation_queue_empty:
                         break
 
                     time.sleep(0.5)  # 恢复到合理的更新频率，避免UI假死
@@ -1069,6 +1234,13 @@ class ScannerController(QObject):
                     f"有效={self.stats['valid']}, "
                     f"无效={self.stats['invalid']}"
                 )
+                checkpoint = self._checkpoint
+                if checkpoint is not None:
+                    # 范围全部探测完毕后断点不再需要；仍有缺口（如个别异常）时保留以便续扫
+                    if checkpoint.complete:
+                        checkpoint.delete()
+                    else:
+                        checkpoint.save(force=True)
 
                 invalid_urls = self.scan_state_manager.get_invalid_urls(self.scan_id)
                 if invalid_urls:
@@ -1080,6 +1252,9 @@ class ScannerController(QObject):
                     self.logger.info(f"无效URL错误类型分布（前5）: {error_summary}")
                     if 'timeout' in error_counts:
                         self.logger.warning(f"⚠️ 有 {error_counts['timeout']} 个URL因超时被标记为无效，考虑增加超时时间")
+                    prefiltered = self.stats.get('prefiltered', 0)
+                    if prefiltered:
+                        self.logger.info(f"第一阶段预筛选淘汰 {prefiltered} 个URL（未启动探测进程）")
                     if 'mpv_create_failed' in error_counts:
                         self.logger.error(f"❌ 有 {error_counts['mpv_create_failed']} 个mpv实例创建失败，可能是资源不足")
 
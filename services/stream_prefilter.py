@@ -0,0 +1,372 @@
+"""
+扫描第一阶段预筛选
+
+在启动 ffprobe/mpv（第二阶段）之前，用代价极低的探测剔除明显无效的 URL：
+- http/https（含 udpxy 的 /rtp/ 代理）：带 Range 头的 GET，只读状态行
+- rtsp/rtmp 等 TCP 协议：TCP connect
+- udp/rtp：加入组播组，等待首个带 TS 同步字节 0x47 的数据报
+
+预筛选只淘汰"确定无效"的 URL，无法判断时一律放行给第二阶段。
+同一套规则提供同步（线程工作者）与异步（AsyncScanEngine）两种实现。
+"""
+
+import asyncio
+import socket
+import ssl
+import struct
+import time
+from typing import Dict, Tuple
+from urllib.parse import urlsplit
+from core.log_manager import global_logger
+from utils.platform_utils import is_linux, is_windows
+
+
+TS_SYNC_BYTE = 0x47
+TS_PACKET_SIZE = 188
+
+# 各 TCP 协议的默认端口
+_TCP_DEFAULT_PORTS = {
+    'http': 80,
+    'https': 443,
+    'rtsp': 554,
+    'rtmp': 1935,
+}
+
+# Linux 上 IP_MULTICAST_ALL 默认开启：绑定 INADDR_ANY 的套接字会收到本机加入的所有组的数据，
+# 并发扫描同一端口的不同组时会互相"串台"，需要关闭
+_IP_MULTICAST_ALL = 49
+
+# 预筛选淘汰结果：(error_type, error)
+Rejection = Tuple[str, str]
+
+
+def make_rejected_result(url: str, rejection: Rejection, latency: int | None = None) -> Dict:
+    """构造与验证器格式一致的无效结果"""
+    error_type, error = rejection
+    return {
+        'url': url,
+        'valid': False,
+        'latency': latency,
+        'error': error,
+        'error_type': error_type,
+        'service_name': None,
+        'resolution': None,
+        'codec': None,
+        'bitrate': None,
+        'hdr_type': None,
+        'prefiltered': True,
+    }
+
+
+def has_ts_sync(data: bytes) -> bool:
+    """判断数据报是否承载 MPEG-TS（裸 TS 或 RTP 封装的 TS）"""
+    if not data:
+        return False
+    if data[0] == TS_SYNC_BYTE:
+        return True
+    # RTP 头：V=2，12 字节固定头 + CSRC + 可选扩展头
+    if len(data) > 12 and (data[0] >> 6) == 2:
+        offset = 12 + (data[0] & 0x0F) * 4
+        if data[0] & 0x10 and len(data) >= offset + 4:
+            ext_words = struct.unpack('!H', data[offset + 2:offset + 4])[0]
+            offset += 4 + ext_words * 4
+        return len(data) > offset and data[offset] == TS_SYNC_BYTE
+    return False
+
+
+def classify_http_status(status: int) -> Rejection | None:
+    """HTTP 状态码分类：仅资源不存在或服务端错误判为无效，其余交给第二阶段"""
+    if status in (404, 410):
+        return 'http_404', f'服务器返回{status}'
+    if status >= 500:
+        return 'http_error', f'服务器错误({status})'
+    return None
+
+
+def parse_udp_target(parts) -> Tuple[str, int] | None:
+    # udp://@239.1.1.1:5000 / rtp://239.1.1.1:5000
+    netloc = parts.netloc.lstrip('@')
+    if not netloc:
+        return None
+    host, _, port = netloc.rpartition(':')
+    if not host or not port.isdigit():
+        return None
+    return host.strip('[]'), int(port)
+
+
+def _is_multicast(host: str) -> bool:
+    try:
+        return 224 <= int(host.split('.', 1)[0]) <= 239
+    except ValueError:
+        return False
+
+
+def open_udp_socket(host: str, port: int) -> socket.socket:
+    """打开接收 UDP/组播数据的套接字（组播地址会加入 IGMP 组）"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        multicast = _is_multicast(host)
+        bound = False
+        if multicast and not is_windows():
+            # 绑定组地址，内核按目的地址过滤，避免同端口其他组的数据混入
+            try:
+                sock.bind((host, port))
+                bound = True
+            except OSError:
+                pass
+        if not bound:
+            sock.bind(('', port))
+        if multicast:
+            if is_linux():
+                try:
+                    sock.setsockopt(socket.IPPROTO_IP, _IP_MULTICAST_ALL, 0)
+                except OSError:
+                    pass
+            mreq = struct.pack('4s4s', socket.inet_aton(host), socket.inet_aton('0.0.0.0'))
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+        return sock
+    except Exception:
+        sock.close()
+        raise
+
+
+class StreamPrefilter:
+    """第一阶段预筛选器"""
+
+    def __init__(self, timeout: float = 3, headers: Dict[str, str] | None = None,
+                 udp_dwell: float | None = None, skip_udp: bool = False):
+        """
+        Args:
+            timeout: TCP/HTTP 预检超时（秒）
+            headers: 附加请求头（user-agent/referer），与验证器保持一致
+            udp_dwell: 等待首个组播数据报的时长（秒），默认与 timeout 相同
+            skip_udp: 组播由第二阶段的原生探测处理（同样只是加入组播组收包）时，
+                不再重复加入一次
+        """
+        self.timeout = timeout
+        self.skip_udp = skip_udp
+        self.headers = headers or {}
+        self.udp_dwell = udp_dwell if udp_dwell is not None else timeout
+        self._ssl_context = ssl.create_default_context()
+        self._ssl_context.check_hostname = False
+        self._ssl_context.verify_mode = ssl.CERT_NONE
+
+    @staticmethod
+    def _target(url: str):
+        """解析 URL → (kind, host, port, parts)；不支持的协议返回 None"""
+        try:
+            parts = urlsplit(url)
+            scheme = parts.scheme.lower()
+            if scheme in ('udp', 'rtp'):
+                target = parse_udp_target(parts)
+                if target is None:
+                    return None
+                return 'udp', target[0], target[1], parts
+            if scheme in _TCP_DEFAULT_PORTS and parts.hostname:
+                port = parts.port or _TCP_DEFAULT_PORTS[scheme]
+                kind = 'http' if scheme in ('http', 'https') else 'tcp'
+                return kind, parts.hostname, port, parts
+        except ValueError:
+            pass
+        return None
+
+    def _build_http_request(self, parts) -> bytes:
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        lines = [
+            f'GET {path} HTTP/1.1',
+            f'Host: {parts.netloc.rsplit("@", 1)[-1]}',
+            f'Range: bytes=0-{TS_PACKET_SIZE * 7 - 1}',
+            'Connection: close',
+            'Accept: */*',
+        ]
+        user_agent = self.headers.get('user-agent')
+        if user_agent:
+            lines.append(f'User-Agent: {user_agent}')
+        referer = self.headers.get('referer')
+        if referer:
+            lines.append(f'Referer: {referer}')
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1', errors='ignore')
+
+    @staticmethod
+    def _parse_status_line(line: bytes) -> int | None:
+        try:
+            fields = line.split(None, 2)
+            if len(fields) >= 2 and fields[0].startswith(b'HTTP/'):
+                return int(fields[1])
+        except ValueError:
+            pass
+        return None
+
+    # ---------- 同步实现（线程工作者） ----------
+
+    def check(self, url: str) -> Rejection | None:
+        """同步预筛选
+
+        Returns:
+            None 表示通过（或无法判断），否则返回 (error_type, error)
+        """
+        target = self._target(url)
+        if target is None:
+            return None
+        kind, host, port, parts = target
+        if kind == 'udp' and self.skip_udp:
+            return None
+        try:
+            if kind == 'udp':
+                return self._check_udp(host, port)
+            if kind == 'http':
+                return self._check_http(host, port, parts)
+            return self._check_tcp(host, port)
+        except Exception as e:
+            global_logger.debug(f"预筛选异常，交由第二阶段判断: {url} - {e}")
+            return None
+
+    def _connect(self, host: str, port: int) -> Tuple[socket.socket | None, Rejection | None]:
+        try:
+            return socket.create_connection((host, port), timeout=self.timeout), None
+        except socket.timeout:
+            return None, ('timeout', '连接超时')
+        except ConnectionRefusedError:
+            return None, ('connection_refused', '连接被拒绝')
+        except OSError as e:
+            return None, ('connection_failed', f'连接失败: {e}')
+
+    def _check_tcp(self, host: str, port: int) -> Rejection | None:
+        sock, rejection = self._connect(host, port)
+        if sock is not None:
+            sock.close()
+        return rejection
+
+    def _check_http(self, host: str, port: int, parts) -> Rejection | None:
+        sock, rejection = self._connect(host, port)
+        if sock is None:
+            return rejection
+        try:
+            if parts.scheme.lower() == 'https':
+                sock = self._ssl_context.wrap_socket(sock, server_hostname=host)
+            sock.sendall(self._build_http_request(parts))
+            status_line = sock.makefile('rb').readline(1024)
+        except socket.timeout:
+            return 'timeout', '响应超时'
+        except OSError:
+            return None
+        finally:
+            sock.close()
+        status = self._parse_status_line(status_line)
+        return classify_http_status(status) if status is not None else None
+
+    def _check_udp(self, host: str, port: int) -> Rejection | None:
+        sock = open_udp_socket(host, port)
+        try:
+            deadline = time.monotonic() + self.udp_dwell
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return 'timeout', f'{self.udp_dwell:g}秒内未收到TS数据'
+                sock.settimeout(remaining)
+                try:
+                    data = sock.recv(2048)
+                except socket.timeout:
+                    continue
+                if has_ts_sync(data):
+                    return None
+        finally:
+            sock.close()
+
+    # ---------- 异步实现（AsyncScanEngine） ----------
+
+    async def check_async(self, url: str) -> Rejection | None:
+        """异步预筛选，语义与 check() 相同"""
+        target = self._target(url)
+        if target is None:
+            return None
+        kind, host, port, parts = target
+        if kind == 'udp' and self.skip_udp:
+            return None
+        try:
+            if kind == 'udp':
+                return await self._check_udp_async(host, port)
+            if kind == 'http':
+                return await self._check_http_async(host, port, parts)
+            return await self._check_tcp_async(host, port)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            global_logger.debug(f"预筛选异常，交由第二阶段判断: {url} - {e}")
+            return None
+
+    async def _connect_async(self, host: str, port: int, use_ssl: bool = False):
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    host, port,
+                    ssl=self._ssl_context if use_ssl else None,
+                    server_hostname=host if use_ssl else None
+                ),
+                timeout=self.timeout
+            )
+            return reader, writer, None
+        except asyncio.TimeoutError:
+            return None, None, ('timeout', '连接超时')
+        except ConnectionRefusedError:
+            return None, None, ('connection_refused', '连接被拒绝')
+        except ssl.SSLError:
+            # TLS 握手问题交给第二阶段判断
+            return None, None, None
+        except OSError as e:
+            return None, None, ('connection_failed', f'连接失败: {e}')
+
+    @staticmethod
+    async def _close_writer(writer):
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:
+            pass
+
+    async def _check_tcp_async(self, host: str, port: int) -> Rejection | None:
+        _, writer, rejection = await self._connect_async(host, port)
+        if writer is not None:
+            await self._close_writer(writer)
+        return rejection
+
+    async def _check_http_async(self, host: str, port: int, parts) -> Rejection | None:
+        use_ssl = parts.scheme.lower() == 'https'
+        reader, writer, rejection = await self._connect_async(host, port, use_ssl)
+        if writer is None:
+            return rejection
+        try:
+            writer.write(self._build_http_request(parts))
+            await writer.drain()
+            status_line = await asyncio.wait_for(reader.readline(), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            return 'timeout', '响应超时'
+        except OSError:
+            return None
+        finally:
+            await self._close_writer(writer)
+        status = self._parse_status_line(status_line)
+        return classify_http_status(status) if status is not None else None
+
+    async def _check_udp_async(self, host: str, port: int) -> Rejection | None:
+        loop = asyncio.get_running_loop()
+        first_ts: asyncio.Future = loop.create_future()
+
+        class _Protocol(asyncio.DatagramProtocol):
+            def datagram_received(self, data, addr):
+                if not first_ts.done() and has_ts_sync(data):
+                    first_ts.set_result(True)
+
+        sock = open_udp_socket(host, port)
+        sock.setblocking(False)
+        transport, _ = await loop.create_datagram_endpoint(_Protocol, sock=sock)
+        try:
+            await asyncio.wait_for(first_ts, timeout=self.udp_dwell)
+            return None
+        except asyncio.TimeoutError:
+            return 'timeout', f'{self.udp_dwell:g}秒内未收到TS数据'
+        finally:
+            transport.close()
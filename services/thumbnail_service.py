@@ -4,21 +4,18 @@ import sys
 import threading
 import time
 from collections import deque
-from typing import Optional
+from typing import Dict, Optional
 from PySide6.QtCore import QObject, Signal
 from services.mpv_common import (
     MPV_EVENT_FILE_LOADED,
     MPV_EVENT_END_FILE,
     MPV_EVENT_SHUTDOWN,
-    create_mpv_handle,
-    initialize_mpv,
-    destroy_mpv,
     set_option_string as _mpv_set_option_string,
-    set_property_string as _mpv_set_property_string,
     send_command as _mpv_send_command,
     wait_for_specific_event,
     _is_mpv_available,
 )
+from services.mpv_handle_pool import MpvHandlePool
 
 # Android Chaquopy 环境：优先使用 IPTV_DATA_DIR（已指向 ISEP 目录）下的 cache 目录
 from utils.platform_utils import get_android_data_dir
@@ -63,6 +60,59 @@ def get_thumbnail_path(url: str) -> Optional[str]:
     return None
 
 
+# 截图句柄池：按渲染窗口 wid 区分，每个窗口复用同一个已初始化的 gpu 句柄
+_capture_pools: Dict[int, MpvHandlePool] = {}
+_capture_pools_lock = threading.Lock()
+
+
+def _configure_capture_mpv(handle, wid: int):
+    if wid:
+        _mpv_set_option_string(handle, 'wid', str(wid))
+    _mpv_set_option_string(handle, 'vo', 'gpu')
+    _mpv_set_option_string(handle, 'ao', 'null')
+    if sys.platform == 'win32':
+        _mpv_set_option_string(handle, 'gpu-api', 'd3d11')
+        _mpv_set_option_string(handle, 'hwdec', 'd3d11va')
+    else:
+        _mpv_set_option_string(handle, 'hwdec', 'auto')
+    _mpv_set_option_string(handle, 'osc', 'no')
+    _mpv_set_option_string(handle, 'osd-bar', 'no')
+    _mpv_set_option_string(handle, 'idle', 'yes')
+    _mpv_set_option_string(handle, 'ytdl', 'no')
+    _mpv_set_option_string(handle, 'keep-open', 'yes')
+    _mpv_set_option_string(handle, 'log-level', 'error')
+    _mpv_set_option_string(handle, 'config', 'no')
+    _mpv_set_option_string(handle, 'force-window', 'no')
+
+    try:
+        from services.ffprobe_validator_service import FfprobeStreamValidator
+        headers = FfprobeStreamValidator.get_headers()
+        if headers:
+            header_val = ','.join(f'{key}: {value}' for key, value in headers.items())
+            _mpv_set_option_string(handle, 'http-header-fields', header_val)
+    except Exception:
+        pass
+
+
+def _get_capture_pool(wid: int) -> MpvHandlePool:
+    with _capture_pools_lock:
+        pool = _capture_pools.get(wid)
+        if pool is None:
+            pool = MpvHandlePool(
+                'thumbnail', lambda handle: _configure_capture_mpv(handle, wid), max_idle=1
+            )
+            _capture_pools[wid] = pool
+        return pool
+
+
+def release_capture_handles(wid: int = 0):
+    """销毁指定窗口的空闲截图句柄（窗口销毁前调用）"""
+    with _capture_pools_lock:
+        pool = _capture_pools.pop(wid, None)
+    if pool is not None:
+        pool.clear()
+
+
 def _capture_single(url: str, timeout: int = 8, wid: int = 0, force: bool = False) -> Optional[str]:
     if not _is_mpv_available():
         return None
@@ -71,30 +121,16 @@ def _capture_single(url: str, timeout: int = 8, wid: int = 0, force: bool = Fals
     if os.path.exists(thumb_path) and not force:
         return thumb_path
 
-    handle = None
+    pool = _get_capture_pool(wid)
+    lease = None
+    reusable = False
     try:
-        handle = create_mpv_handle()
-        if not handle:
+        lease = pool.acquire()
+        if not lease:
             return None
+        handle = lease.handle
 
-        if wid:
-            _mpv_set_option_string(handle, 'wid', str(wid))
-        _mpv_set_option_string(handle, 'vo', 'gpu')
-        _mpv_set_option_string(handle, 'ao', 'null')
-        if sys.platform == 'win32':
-            _mpv_set_option_string(handle, 'gpu-api', 'd3d11')
-            _mpv_set_option_string(handle, 'hwdec', 'd3d11va')
-        else:
-            _mpv_set_option_string(handle, 'hwdec', 'auto')
-        _mpv_set_option_string(handle, 'osc', 'no')
-        _mpv_set_option_string(handle, 'osd-bar', 'no')
-        _mpv_set_option_string(handle, 'idle', 'yes')
-        _mpv_set_option_string(handle, 'ytdl', 'no')
-        _mpv_set_option_string(handle, 'keep-open', 'yes')
-        _mpv_set_option_string(handle, 'log-level', 'error')
-        _mpv_set_option_string(handle, 'config', 'no')
-        _mpv_set_option_string(handle, 'force-window', 'no')
-
+        # 按 URL 设置的属性只对本次截图生效，句柄归还时恢复
         u = url.lower()
         if u.startswith('rtsp://'):
             try:
@@ -104,30 +140,18 @@ def _capture_single(url: str, timeout: int = 8, wid: int = 0, force: bool = Fals
                 rtsp_transport = playback.get('rtsp_transport', 'tcp')
             except Exception:
                 rtsp_transport = 'tcp'
-            _mpv_set_option_string(handle, 'rtsp-transport', rtsp_transport)
+            lease.set_override('rtsp-transport', rtsp_transport)
         elif '/rtp/' in u or u.endswith('.ts') or u.startswith('udp://'):
-            _mpv_set_option_string(handle, 'demuxer-lavf-format', 'mpegts')
-
-        try:
-            from services.ffprobe_validator_service import FfprobeStreamValidator
-            headers = FfprobeStreamValidator.get_headers()
-            if headers:
-                import json
-                headers_json = json.dumps(headers).encode('utf-8')
-                _mpv_set_option_string(handle, 'http-header-fields', headers_json)
-        except Exception:
-            pass
-
-        if not initialize_mpv(handle):
-            destroy_mpv(handle)
-            return None
+            lease.set_override('demuxer-lavf-format', 'mpegts')
 
         _mpv_send_command(handle, ['loadfile', url])
 
         event_id, _, _ = wait_for_specific_event(handle, timeout, {MPV_EVENT_FILE_LOADED, MPV_EVENT_END_FILE})
+        reusable = event_id != MPV_EVENT_SHUTDOWN
 
         if event_id == MPV_EVENT_FILE_LOADED:
-            wait_for_specific_event(handle, 2, {MPV_EVENT_END_FILE})
+            event_id, _, _ = wait_for_specific_event(handle, 2, {MPV_EVENT_END_FILE})
+            reusable = event_id != MPV_EVENT_SHUTDOWN
 
             _mpv_send_command(handle, ['screenshot-to-file', thumb_path, 'video'])
 
@@ -138,10 +162,11 @@ def _capture_single(url: str, timeout: int = 8, wid: int = 0, force: bool = Fals
 
         return None
     except Exception:
+        reusable = False
         return None
     finally:
-        if handle:
-            destroy_mpv(handle)
+        if lease:
+            pool.release(lease, reusable=reusable)
 
 
 class ThumbnailService(QObject):
@@ -192,6 +217,7 @@ class ThumbnailService(QObject):
         self._thread = None
         with self._lock:
             self._queue.clear()
+        release_capture_handles(self._hidden_winid)
 
     def _worker(self):
         while not self._stop_event.is_set():
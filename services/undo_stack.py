@@ -152,8 +152,8 @@ class AddChannelCommand(Command):
             self._model.add_channel(self._channel, is_from_file=False)
             after_count = len(self._model.channels)
             if after_count > before_count:
-                # 新增成功，记录新增位置
-                self._row = after_count - 1
+                # 新增成功，记录新增位置（列表处于排序状态时不一定在末尾）
+                self._row = self._model.find_row_by_url(self._channel.get('url'))
                 return True
             # 已存在相同URL，未新增
             return False
@@ -205,7 +205,7 @@ class RemoveChannelCommand(Command):
             after_count = len(self._model.channels)
             if after_count > before_count:
                 # 重新插入到原位置（如果可能）
-                new_row = after_count - 1
+                new_row = self._model.find_row_by_url(self._channel.get('url'))
                 if new_row != self._row and 0 <= self._row <= after_count - 1:
                     try:
                         # 移动到原位置
@@ -248,7 +248,11 @@ class UpdateChannelCommand(Command):
         try:
             if not self._old_channel:
                 return False
-            return self._model.update_channel(self._index, self._old_channel)
+            # 列表处于排序状态时，更新可能已把该行移到新的有序位置
+            index = self._model.find_row_by_url(self._new_channel.get('url', self._old_channel.get('url')))
+            if index < 0:
+                index = self._index
+            return self._model.update_channel(index, self._old_channel)
         except Exception as e:
             logger.error(f"UpdateChannelCommand undo 失败: {e}")
             return False
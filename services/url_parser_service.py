@@ -1,7 +1,18 @@
+import bisect
+import math
+import random
 import re
-from typing import List, Tuple, Generator
+from typing import Iterator, List, Tuple, Generator
 from core.log_manager import global_logger
 
+# 扫描顺序
+ORDER_SEQUENTIAL = 'sequential'
+ORDER_STRIDED = 'strided'
+ORDER_RANDOM = 'random'
+SCAN_ORDERS = (ORDER_SEQUENTIAL, ORDER_STRIDED, ORDER_RANDOM)
+# 取值数不超过该值的变量预先生成全部字符串
+_AXIS_CACHE_LIMIT = 65536
+
 
 class URLRangeParser:
 
@@ -46,75 +57,6 @@ class URLRangeParser:
                 first_pad = parsed[0][2]
         return all_values, first_pad or 1
 
-    def _count_range_size(self, parsed_segments) -> int:
-        total = 0
-        seen_ranges = set()
-        for start, end, _ in parsed_segments:
-            if (start, end) in seen_ranges:
-                continue
-            seen_ranges.add((start, end))
-            total += (end - start + 1)
-        return total
-
-    def _iter_range_values(self, parsed_segments, pad_width: int) -> Generator[str, None, None]:
-        seen = set()
-        for start, end, _ in parsed_segments:
-            for num in range(start, end + 1):
-                if num not in seen:
-                    seen.add(num)
-                    yield str(num).zfill(pad_width)
-
-    def _create_range_iterator(self, parsed_segments, pad_width: int):
-        class RangeIterator:
-            def __init__(self, segments, pad):
-                self.segments = segments
-                self.pad = pad
-                self.seg_idx = 0
-                self.current = None
-                self.end = None
-                self.needs_dedup = len(segments) > 1
-                self.seen = set() if self.needs_dedup else None
-                self._advance_segment()
-
-            def _advance_segment(self):
-                while self.seg_idx < len(self.segments):
-                    start, end, _ = self.segments[self.seg_idx]
-                    self.current = start
-                    self.end = end
-                    self.seg_idx += 1
-                    if not self.needs_dedup or self.current not in self.seen:
-                        return
-                self.current = None
-
-            def __iter__(self):
-                return self
-
-            def __next__(self):
-                while self.current is not None:
-                    val = self.current
-                    if not self.needs_dedup or val not in self.seen:
-                        if self.needs_dedup:
-                            self.seen.add(val)
-                        result = str(val).zfill(self.pad)
-                        self.current += 1
-                        if self.current > self.end:
-                            self._advance_segment()
-                        return result
-                    self.current += 1
-                    if self.current > self.end:
-                        self._advance_segment()
-                raise StopIteration
-
-            def reset(self):
-                self.seg_idx = 0
-                self.current = None
-                self.end = None
-                if self.needs_dedup:
-                    self.seen = set()
-                self._advance_segment()
-
-        return RangeIterator(parsed_segments, pad_width)
-
     def _find_valid_ranges(self, url):
         """找出所有有效的范围定义 match（排除 IPv6 方括号）。"""
         ipv6_spans = [m.span() for m in self.ipv6_pattern.finditer(url)]
@@ -174,63 +116,34 @@ class URLRangeParser:
         return len(self._find_all_slots(url)) > 0
 
     def estimate_url_count(self, url: str) -> int:
-        slots = self._find_all_slots(url)
-        if not slots:
-            return 1
-        # 命名变量只算一次（定义处），引用不算；未命名范围各自独立
-        named_counts = {}  # var_name -> count
-        unnamed_counts = []
-        for slot in slots:
-            if slot['type'] == 'range_def':
-                content = slot['content']
-                parsed_segments, _ = self._parse_bracket_content(content)
-                count = self._count_range_size(parsed_segments)
-                if slot['var_name']:
-                    if slot['var_name'] not in named_counts:
-                        named_counts[slot['var_name']] = count
-                else:
-                    unnamed_counts.append(count)
-        total = 1
-        for count in named_counts.values():
-            total *= count
-        for count in unnamed_counts:
-            total *= count
-        return total
+        """展开后的 URL 总数（与 parse_url / compile 的枚举结果一致，重叠区间只计一次）"""
+        return len(self.compile(url))
 
-    def parse_url(
-        self, url: str, batch_size: int = 10000
-    ) -> Generator[List[str], None, None]:
-        """展开 URL 中的范围表达式与变量引用。
+    def compile(self, url: str) -> 'URLRangeSpace':
+        """把范围表达式编译为可按序号随机访问的 URL 空间。
 
         支持两种可替换位置：
         - 范围定义：[1-255] / [1,5,10] / [1-10,20-30]（未命名，各自独立）
         - 命名变量：[1-255:n] 定义变量 n，{n} 引用并与之同步变化
           （同一变量名多处出现共享同一取值，零填充宽度以首次定义为准）
 
-        多个独立变量（命名变量 + 未命名范围）按笛卡尔积展开。
+        多个独立变量（命名变量 + 未命名范围）按笛卡尔积展开，最后一个变量变化最快。
         """
         slots = self._find_all_slots(url)
         if not slots:
-            yield [url]
-            return
-
-        self.logger.info(f"开始解析范围URL: {url}")
+            return URLRangeSpace([url], [], [])
 
-        # 第一遍：为每个命名变量创建独立变量条目（取首次定义的范围与零填充）
-        independent_vars = []  # [{'segments', 'pad_width'}]
-        name_to_var_idx = {}   # var_name -> independent_vars 索引
+        # 第一遍：为每个命名变量创建独立变量（取首次定义的范围与零填充）
+        axes: List[_RangeAxis] = []
+        name_to_var_idx = {}   # var_name -> axes 索引
         for slot in slots:
             if slot['type'] != 'range_def':
                 continue
             var_name = slot['var_name']
             if var_name and var_name not in name_to_var_idx:
-                content = slot['content']
-                parsed_segments, min_pad = self._parse_bracket_content(content)
-                name_to_var_idx[var_name] = len(independent_vars)
-                independent_vars.append({
-                    'segments': parsed_segments,
-                    'pad_width': min_pad,
-                })
+                parsed_segments, min_pad = self._parse_bracket_content(slot['content'])
+                name_to_var_idx[var_name] = len(axes)
+                axes.append(_RangeAxis(parsed_segments, min_pad))
             elif var_name and var_name in name_to_var_idx:
                 # 重复定义：警告，后续定义的范围被忽略（当作引用同步）
                 self.logger.warning(
@@ -246,21 +159,12 @@ class URLRangeParser:
                 if var_name:
                     slot_to_var[i] = name_to_var_idx[var_name]
                 else:
-                    content = slot['content']
-                    parsed_segments, min_pad = self._parse_bracket_content(content)
-                    var_idx = len(independent_vars)
-                    independent_vars.append({
-                        'segments': parsed_segments,
-                        'pad_width': min_pad,
-                    })
-                    slot_to_var[i] = var_idx
+                    parsed_segments, min_pad = self._parse_bracket_content(slot['content'])
+                    slot_to_var[i] = len(axes)
+                    axes.append(_RangeAxis(parsed_segments, min_pad))
             else:  # ref
                 slot_to_var[i] = name_to_var_idx[slot['var_name']]
 
-        if not independent_vars:
-            yield [url]
-            return
-
         # 将 URL 按 slot 位置拆分为固定片段
         url_parts = []
         last_pos = 0
@@ -268,21 +172,24 @@ class URLRangeParser:
             url_parts.append(url[last_pos:slot['start_pos']])
             last_pos = slot['end_pos']
         url_parts.append(url[last_pos:])
+        return URLRangeSpace(url_parts, axes, slot_to_var)
+
+    def parse_url(
+        self, url: str, batch_size: int = 10000
+    ) -> Generator[List[str], None, None]:
+        """按顺序逐批展开 URL 中的范围表达式与变量引用（语法见 compile）"""
+        space = self.compile(url)
+        if not space.axes:
+            yield [url]
+            return
 
-        var_count = len(independent_vars)
-        total_urls = self.estimate_url_count(url)
+        self.logger.info(f"开始解析范围URL: {url}")
         self.logger.info(
-            f"URL解析: 找到 {len(slots)} 个可替换位置，"
-            f"{var_count} 个独立变量，将生成 {total_urls} 个URL"
+            f"URL解析: 找到 {space.slot_count} 个可替换位置，"
+            f"{len(space.axes)} 个独立变量，将生成 {len(space)} 个URL"
         )
-
-        # 笛卡尔积惰性展开；每个 slot 用其所属变量的当前值填充
         batch = []
-        for values in self._generate_range_values_lazy(independent_vars):
-            url_str = ""
-            for i in range(len(slots)):
-                url_str += url_parts[i] + values[slot_to_var[i]]
-            url_str += url_parts[-1]
+        for _, url_str in space.iter_urls():
             batch.append(url_str)
             if len(batch) >= batch_size:
                 yield batch
@@ -291,42 +198,6 @@ class URLRangeParser:
         if batch:
             yield batch
 
-    def _generate_range_values_lazy(self, ranges_info):
-        if not ranges_info:
-            yield ()
-            return
-
-        iterators = []
-        current_values = []
-        for r in ranges_info:
-            it = self._create_range_iterator(r['segments'], r['pad_width'])
-            first = next(it, None)
-            if first is None:
-                return
-            iterators.append(it)
-            current_values.append(first)
-
-        yield tuple(current_values)
-
-        while iterators:
-            idx = len(iterators) - 1
-            while idx >= 0:
-                nxt = next(iterators[idx], None)
-                if nxt is not None:
-                    current_values[idx] = nxt
-                    break
-                iterators[idx].reset()
-                first = next(iterators[idx], None)
-                if first is None:
-                    return
-                current_values[idx] = first
-                idx -= 1
-
-            if idx < 0:
-                return
-
-            yield tuple(current_values)
-
     def _build_url_from_parts(self, url_parts, range_count, values):
         url = ""
         for i in range(range_count):
@@ -343,3 +214,204 @@ class URLRangeParser:
                 full_match = f"{start}-{end}" if start != end else str(start)
                 ranges.append((start, end, full_match))
         return ranges
+
+
+class _RangeAxis:
+    """一个独立变量的取值序列：多个区间去重后按出现顺序排列，可按位置 O(log 区间数) 取值"""
+
+    def __init__(self, parsed_segments, pad_width: int):
+        self.pad = pad_width
+        self.runs: List[Tuple[int, int]] = []
+        covered: List[Tuple[int, int]] = []
+        for start, end, _ in parsed_segments:
+            # 与原逐值去重一致：后续区间中已出现过的值跳过，剩余部分按升序排列
+            pieces = [(start, end)]
+            for c_start, c_end in covered:
+                next_pieces = []
+                for p_start, p_end in pieces:
+                    if c_end < p_start or c_start > p_end:
+                        next_pieces.append((p_start, p_end))
+                        continue
+                    if p_start < c_start:
+                        next_pieces.append((p_start, c_start - 1))
+                    if c_end < p_end:
+                        next_pieces.append((c_end + 1, p_end))
+                pieces = next_pieces
+            self.runs.extend(pieces)
+            covered.append((start, end))
+        self.offsets: List[int] = []
+        total = 0
+        for start, end in self.runs:
+            self.offsets.append(total)
+            total += end - start + 1
+        self.count = total
+        self._values = [self._format(i) for i in range(total)] if total <= _AXIS_CACHE_LIMIT else None
+
+    def _format(self, pos: int) -> str:
+        run = bisect.bisect_right(self.offsets, pos) - 1
+        return str(self.runs[run][0] + pos - self.offsets[run]).zfill(self.pad)
+
+    def value_at(self, pos: int) -> str:
+        if self._values is not None:
+            return self._values[pos]
+        return self._format(pos)
+
+
+class URLRangeSpace:
+    """展开后的 URL 空间：按线性序号 O(1) 随机访问，支持分片与多种遍历顺序。
+
+    序号与 parse_url 的顺序一致（最后一个变量变化最快），断点、分片都以序号为准。
+    """
+
+    def __init__(self, url_parts: List[str], axes: List[_RangeAxis], slot_to_var: List[int]):
+        self.axes = axes
+        self.slot_count = len(slot_to_var)
+        self._slot_to_var = slot_to_var
+        # 片段与取值交替排列，拼接时只替换取值位置后一次 join
+        self._pieces = []
+        for part in url_parts[:-1]:
+            self._pieces.extend((part, ''))
+        self._pieces.append(url_parts[-1])
+        self._total = math.prod(axis.count for axis in axes) if axes else 1
+        # 各变量的位权：序号 = Σ 位置 × 位权
+        self._weights = []
+        weight = 1
+        for axis in reversed(axes):
+            self._weights.append(weight)
+            weight *= axis.count
+        self._weights.reverse()
+
+    def __len__(self) -> int:
+        return self._total
+
+    @property
+    def prefix(self) -> str:
+        """所有 URL 共有的开头（第一个变量之前的固定部分）"""
+        return self._pieces[0]
+
+    def __getitem__(self, index: int) -> str:
+        return self.url_at(index)
+
+    def url_at(self, index: int) -> str:
+        """第 index 个 URL（0 起）"""
+        if index < 0:
+            index += self._total
+        if not 0 <= index < self._total:
+            raise IndexError(f"URL序号越界: {index}（共 {self._total} 个）")
+        positions = []
+        for weight, axis in zip(self._weights, self.axes):
+            pos, index = divmod(index, weight)
+            positions.append(pos)
+        return self._build(positions, list(self._pieces))
+
+    def _build(self, positions, pieces: List[str]) -> str:
+        """把各变量取值填入 pieces（调用方独占的 _pieces 副本）后拼接。
+
+        同一个 URLRangeSpace 会被多个扫描线程共享，不能直接改写 self._pieces。
+        """
+        axes = self.axes
+        for i, var in enumerate(self._slot_to_var):
+            pieces[2 * i + 1] = axes[var].value_at(positions[var])
+        return ''.join(pieces)
+
+    def shard_bounds(self, shard: int, shards: int) -> Tuple[int, int]:
+        """把遍历位置均分为 shards 个互不重叠的连续分片，返回第 shard 片的 [start, stop)"""
+        if shards < 1 or not 0 <= shard < shards:
+            raise ValueError(f"无效分片: {shard}/{shards}")
+        return self._total * shard // shards, self._total * (shard + 1) // shards
+
+    def iter_indices(self, shard: int = 0, shards: int = 1, order: str = ORDER_SEQUENTIAL,
+                     seed=None, start: int = 0, interleave: bool = False,
+                     stride: int | None = None) -> Iterator[int]:
+        """按给定顺序枚举本分片负责的 URL 序号。
+
+        Args:
+            shard/shards: 分片编号与分片总数，各分片的序号互不重叠、合起来覆盖全部
+            order: sequential 顺序；strided 按步长跳跃（默认步长为最后一个变量的取值数，
+                即先遍历其他变量，同一主机/组播组的请求被分散开）；random 伪随机排列
+            seed: random 顺序的种子，相同种子各分片得到同一排列
+            start: 从第几个遍历位置开始（顺序遍历时即断点游标，O(1) 定位）
+            interleave: True 时按 shard, shard+shards, ... 交错分片（同进程多线程使用，
+                整体进度接近顺序推进）；False 时取连续的一段（多进程使用）
+            stride: strided 顺序的步长
+        """
+        permute = self._permutation(order, seed, stride)
+        if interleave:
+            if shards < 1 or not 0 <= shard < shards:
+                raise ValueError(f"无效分片: {shard}/{shards}")
+            first = max(start, 0)
+            first += (shard - first) % shards
+            positions = range(first, self._total, shards)
+        else:
+            lo, hi = self.shard_bounds(shard, shards)
+            positions = range(max(lo, start), hi)
+        if permute is None:
+            return iter(positions)
+        return map(permute, positions)
+
+    def iter_urls(self, shard: int = 0, shards: int = 1, order: str = ORDER_SEQUENTIAL,
+                  seed=None, start: int = 0, interleave: bool = False,
+                  stride: int | None = None) -> Iterator[Tuple[int, str]]:
+        """枚举 (序号, URL)，参数同 iter_indices；顺序遍历时逐位进位，不必每个 URL 都做除法"""
+        if order != ORDER_SEQUENTIAL or interleave and shards > 1:
+            url_at = self.url_at
+            for index in self.iter_indices(shard, shards, order, seed, start, interleave, stride):
+                yield index, url_at(index)
+            return
+        lo, hi = self.shard_bounds(shard, shards)
+        lo = max(lo, start)
+        if lo >= hi:
+            return
+        if not self.axes:
+            yield 0, self._pieces[0]
+            return
+        positions = []
+        rest = lo
+        for weight in self._weights:
+            pos, rest = divmod(rest, weight)
+            positions.append(pos)
+        counts = [axis.count for axis in self.axes]
+        last = len(positions) - 1
+        pieces = list(self._pieces)
+        for index in range(lo, hi):
+            yield index, self._build(positions, pieces)
+            idx = last
+            while idx >= 0:
+                positions[idx] += 1
+                if positions[idx] < counts[idx]:
+                    break
+                positions[idx] = 0
+                idx -= 1
+
+    def _permutation(self, order: str, seed, stride: int | None):
+        total = self._total
+        if order == ORDER_SEQUENTIAL or total <= 1:
+            return None
+        if order == ORDER_STRIDED:
+            if stride is None:
+                stride = self.axes[-1].count if len(self.axes) > 1 else math.isqrt(total)
+            stride = max(1, min(int(stride), total))
+            if stride == 1:
+                return None
+            # 按余数分组：先 0, s, 2s, ...，再 1, 1+s, ...；前 extra 组比其余多一个元素
+            base, extra = divmod(total, stride)
+            head = extra * (base + 1)
+
+            def strided(pos: int) -> int:
+                if pos < head:
+                    residue, k = divmod(pos, base + 1)
+                else:
+                    residue, k = divmod(pos - head, base)
+                    residue += extra
+                return residue + k * stride
+            return strided
+        if order == ORDER_RANDOM:
+            # 仿射置换 pos -> (a·pos + c) mod total，a 与 total 互素即为一一映射
+            rng = random.Random(seed)
+            while True:
+                a = rng.randrange(1, total)
+                if math.gcd(a, total) == 1:
+                    break
+            c = rng.randrange(total)
+            return lambda pos: (a * pos + c) % total
+        raise ValueError(f"未知的扫描顺序: {order}")
@@ -1,10 +1,22 @@
 import sys
 import os
+import shutil
+import tempfile
 import pytest
 from unittest.mock import MagicMock, patch, PropertyMock
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# 配置、日志、缓存等运行时文件默认写到项目根目录；测试期间重定向到临时数据目录，
+# 避免 config.ini / app.log / cache/ 等落进工作区
+_TEST_DATA_DIR = os.path.join(tempfile.mkdtemp(prefix='iptv-test-'), 'ISEP')
+os.makedirs(_TEST_DATA_DIR, exist_ok=True)
+os.environ['IPTV_DATA_DIR'] = _TEST_DATA_DIR
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(os.path.dirname(_TEST_DATA_DIR), ignore_errors=True)
+
 
 class MockMainWindow:
     """模拟 MainWindowProtocol 的最小实现，用于 Mixin 单元测试"""
@@ -0,0 +1,83 @@
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.async_scan_engine import AsyncScanEngine  # noqa: E402
+from services.ffprobe_validator_service import FfprobeStreamValidator  # noqa: E402
+from services.stream_prefilter import StreamPrefilter  # noqa: E402
+
+
+_FAKE_PROBE = (
+    'import json, sys, time; time.sleep(float(sys.argv[1])); '
+    'print(json.dumps({"streams": [{"codec_type": "video", "width": 1920, '
+    '"height": 1080, "codec_name": "h264"}], "format": {"bit_rate": "4000000"}}))'
+)
+
+
+class _FakeValidator(FfprobeStreamValidator):
+    """用 python 子进程模拟 ffprobe 输出"""
+
+    delay = 0.0
+    # 这里验证 ffprobe 路径，组播地址不走内置 TS 探测
+    _native_probe = False
+
+    def _get_ffprobe_path(self):
+        return sys.executable
+
+    def _build_ffprobe_command(self, ffprobe_path, url, timeout):
+        return [ffprobe_path, '-c', _FAKE_PROBE, str(self.delay)]
+
+
+def _run_engine(items, **kwargs):
+    results = []
+    finished = threading.Event()
+    engine = AsyncScanEngine(
+        kwargs.pop('validator', _FakeValidator()),
+        on_result=lambda url, ctx, result: results.append((url, ctx, result)),
+        on_finished=finished.set,
+        **kwargs
+    )
+    engine.start(items)
+    return engine, results, finished
+
+
+class TestAsyncScanEngine:
+    def setup_method(self):
+        FfprobeStreamValidator.reset_terminating()
+
+    def test_probes_all_items_with_context(self):
+        items = [(f'udp://239.1.1.{i}:5000', i) for i in range(8)]
+        _, results, finished = _run_engine(items, timeout=5, max_processes=4)
+        assert finished.wait(30)
+        assert sorted(ctx for _, ctx, _ in results) == list(range(8))
+        for _, _, result in results:
+            assert result['valid'] is True
+            assert result['resolution'] == '1920x1080'
+            assert result['codec'] == 'h264'
+            assert result['bitrate'] == '4000kbps'
+
+    def test_refused_tcp_skips_ffprobe(self):
+        _, results, finished = _run_engine(
+            [('http://127.0.0.1:1/live.ts', None)], timeout=2, prefilter=StreamPrefilter(timeout=2)
+        )
+        assert finished.wait(10)
+        assert len(results) == 1
+        assert results[0][2]['valid'] is False
+        assert results[0][2]['error_type'] == 'connection_refused'
+        assert results[0][2]['prefiltered'] is True
+
+    def test_stop_event_cancels_immediately(self):
+        validator = _FakeValidator()
+        validator.delay = 10
+        stop_event = threading.Event()
+        items = ((f'udp://239.1.2.{i}:5000', None) for i in range(1000))
+        _, results, finished = _run_engine(
+            items, validator=validator, timeout=20, max_processes=4, stop_event=stop_event
+        )
+        time.sleep(0.3)
+        stop_event.set()
+        assert finished.wait(5)
+        assert results == []
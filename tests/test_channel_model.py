@@ -0,0 +1,230 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6 import QtCore  # noqa: E402
+
+from models.channel_model import ChannelListModel  # noqa: E402
+
+
+def _channel(url, name=None, valid=True):
+    return {'url': url, 'name': name or url, 'valid': valid}
+
+
+class TestUrlIndex:
+    def test_add_dedups_by_url(self):
+        model = ChannelListModel()
+        model.add_channel(_channel('http://a'))
+        model.add_channels([_channel('http://b'), _channel('http://c'), _channel('http://a', 'dup')])
+        assert model.rowCount() == 3
+        assert model.find_row_by_url('http://c') == 2
+        assert model.find_row_by_url('http://missing') == -1
+
+    def test_index_follows_remove_and_reorder(self):
+        model = ChannelListModel()
+        model.add_channels([_channel(f'http://{i}') for i in range(5)])
+        model.remove_channel(0)
+        assert model.find_row_by_url('http://4') == 3
+        model.sort_by_indices([3, 2, 1, 0])
+        assert model.find_row_by_url('http://4') == 0
+        assert model.find_row_by_url('http://1') == 3
+
+    def test_update_by_url_and_url_change(self):
+        model = ChannelListModel()
+        model.add_channels([_channel('http://a'), _channel('http://b')])
+        assert model.set_channel_valid('http://b', False)
+        assert model.channels[1]['valid'] is False
+        assert model.update_channel(0, _channel('http://z'))
+        assert model.find_row_by_url('http://z') == 0
+        assert model.find_row_by_url('http://a') == -1
+
+    def test_external_list_mutation_self_heals(self):
+        model = ChannelListModel()
+        model.add_channels([_channel('http://a'), _channel('http://b')])
+        assert model.find_row_by_url('http://b') == 1
+        model.channels.reverse()
+        assert model.find_row_by_url('http://b') == 0
+
+
+class TestChangeTracker:
+    def _model(self, count=6):
+        model = ChannelListModel()
+        model.add_channels([_channel(f'http://{i}') for i in range(count)])
+        emitted = []
+        model.dataChanged.connect(
+            lambda tl, br, roles: emitted.append((tl.row(), br.row(), tl.column(), br.column())))
+        layouts = []
+        model.layoutChanged.connect(lambda *args: layouts.append(1))
+        model.modelReset.connect(lambda *args: layouts.append(1))
+        return model, emitted, layouts
+
+    def test_updates_coalesce_into_contiguous_ranges(self):
+        model, emitted, layouts = self._model()
+        for row in (4, 1, 2):
+            model.update_channel(row, {'name': f'n{row}'})
+        model.update_channel_by_url('http://2', {'group': 'g'})
+        assert emitted == []
+        model.flush_changes()
+        name_col, group_col = ChannelListModel.COL_NAME, ChannelListModel.COL_GROUP
+        assert emitted == [(1, 2, name_col, group_col), (4, 4, name_col, name_col)]
+        assert layouts == []
+
+    def test_validity_change_refreshes_whole_row(self):
+        model, emitted, _ = self._model()
+        model.set_channel_valid('http://3', False)
+        model.flush_changes()
+        assert emitted == [(3, 3, 0, model.columnCount() - 1)]
+
+    def test_pending_rows_flushed_before_removal(self):
+        model, emitted, layouts = self._model()
+        model.update_channel(5, {'name': 'x'})
+        model.remove_channel(0)
+        assert emitted and emitted[0][:2] == (5, 5)
+        emitted.clear()
+        model.flush_changes()
+        assert emitted == []
+
+    def test_append_during_updates_uses_insert_rows(self):
+        model, emitted, layouts = self._model()
+        inserted = []
+        model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+        model.update_channel(1, {'name': 'x'})
+        model.add_channels([_channel('http://new1'), _channel('http://new2')])
+        assert inserted == [(6, 7)]
+        assert emitted[0][:2] == (1, 1)
+        assert layouts == []
+
+
+class TestRowCache:
+    def test_values_cached_until_row_changes(self, monkeypatch):
+        from services.stream_quality_scorer import StreamQualityScorer
+        calls = []
+        real = StreamQualityScorer.score_from_channel
+        monkeypatch.setattr(StreamQualityScorer, 'score_from_channel',
+                            staticmethod(lambda ch: calls.append(1) or real(ch)))
+        model = ChannelListModel()
+        model.add_channels([_channel('http://a', 'A'), _channel('http://b', 'B')])
+        name = model.index(1, model._actual_to_logical_column(model.COL_NAME))
+        from models.channel_model import QUALITY_GRADE_ROLE, QUALITY_SCORE_ROLE
+        for _ in range(3):
+            assert model.data(name) == 'B'
+            model.data(name, QUALITY_SCORE_ROLE)
+            model.data(name, QUALITY_GRADE_ROLE)
+        assert len(calls) == 1
+
+        model.update_channel(1, {'name': 'B2'})
+        assert model.data(name) == 'B2'
+        model.set_channel_valid('http://b', False)
+        bg = model.data(name, QtCore.Qt.ItemDataRole.BackgroundRole)
+        assert bg == model._palette_color('error_background')
+
+    def test_row_structure_changes_drop_stale_rows(self):
+        model = ChannelListModel()
+        model.add_channels([_channel(f'http://{i}', f'n{i}') for i in range(3)])
+        name_col = model._actual_to_logical_column(model.COL_NAME)
+        assert [model.data(model.index(r, name_col)) for r in range(3)] == ['n0', 'n1', 'n2']
+        model.remove_channel(0)
+        assert [model.data(model.index(r, name_col)) for r in range(2)] == ['n1', 'n2']
+        model.sort_by_indices([1, 0])
+        assert model.data(model.index(0, 0)) == '1'
+        assert model.data(model.index(0, name_col)) == 'n2'
+        model.toggle_column_visibility(model.COL_RESOLUTION)
+        assert model.data(model.index(0, model._actual_to_logical_column(model.COL_URL))) == 'http://2'
+
+    def test_palette_follows_theme(self, monkeypatch):
+        from ui.styles import AppStyles
+        model = ChannelListModel()
+        model.add_channel(_channel('http://a'))
+        index = model.index(0, 1)
+        monkeypatch.setattr(AppStyles, '_color_mode', 'dark')
+        AppStyles._invalidate_caches()
+        dark = model.data(index, QtCore.Qt.ItemDataRole.ForegroundRole)
+        monkeypatch.setattr(AppStyles, '_color_mode', 'light')
+        AppStyles._invalidate_caches()
+        light = model.data(index, QtCore.Qt.ItemDataRole.ForegroundRole)
+        assert light != dark
+        emitted = []
+        model.dataChanged.connect(lambda tl, br, roles: emitted.append((tl.row(), br.row())))
+        model._on_theme_changed('light+flat')
+        assert model._palette is None and emitted == [(0, 0)]
+
+
+class TestSortedInsert:
+    def test_new_rows_bisected_into_active_sort(self):
+        model = ChannelListModel()
+        model.add_channels([_channel(f'http://{i}', f'CH{i}') for i in (10, 2, 7)])
+        model.sort(model.COL_NAME)
+        assert [c['name'] for c in model.channels] == ['CH2', 'CH7', 'CH10']
+        inserted, resets = [], []
+        model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+        model.modelReset.connect(lambda: resets.append(1))
+        model.add_channels([_channel('http://8', 'CH8'), _channel('http://1', 'CH1'), _channel('http://9', 'CH9')])
+        model.add_channel(_channel('http://20', 'CH20'))
+        assert [c['name'] for c in model.channels] == ['CH1', 'CH2', 'CH7', 'CH8', 'CH9', 'CH10', 'CH20']
+        assert inserted == [(0, 0), (3, 4), (6, 6)] and resets == []
+        assert model.find_row_by_url('http://9') == 4
+
+        model.sort(model.COL_NAME, QtCore.Qt.SortOrder.DescendingOrder)
+        model.add_channel(_channel('http://5', 'CH5'))
+        assert [c['name'] for c in model.channels][-4:] == ['CH7', 'CH5', 'CH2', 'CH1']
+
+        # 手动移动后行序不再有序，新行追加到末尾
+        model.moveRow(0, 3)
+        model.add_channel(_channel('http://0', 'CH0'))
+        assert model.channels[len(model.channels) - 1]['name'] == 'CH0'
+
+    def test_smart_sort_keeps_scan_results_in_place(self):
+        model = ChannelListModel()
+        model.add_channels([
+            {'url': 'http://a', 'name': '湖南卫视', 'group': '卫视', 'resolution': '1920x1080'},
+            {'url': 'http://b', 'name': 'CCTV-13 新闻', 'group': '央视频道', 'resolution': '1920x1080'},
+            {'url': 'http://c', 'name': '济南新闻', 'group': '济南', 'resolution': '720x576'},
+        ])
+        model.sort_channels()
+        model.add_channel({'url': 'http://d', 'name': 'CCTV-1 综合', 'group': '央视频道', 'resolution': '1920x1080'})
+        assert [c['url'] for c in model.channels] == ['http://d', 'http://b', 'http://a', 'http://c']
+
+    def test_validation_results_keep_smart_sort(self):
+        from services.scanner_service import ScannerController
+        model = ChannelListModel()
+        model.add_channels([
+            {'url': 'http://a', 'name': '湖南卫视', 'group': '卫视', 'resolution': '1920x1080'},
+            {'url': 'http://b', 'name': 'CCTV-13 新闻', 'group': '央视频道', 'resolution': '1920x1080'},
+            {'url': 'http://c', 'name': '济南新闻', 'group': '济南', 'resolution': '720x576'},
+        ])
+        model.sort_channels()
+        scanner = ScannerController(model)
+        # 验证探测到更高/更低分辨率后，该行移到智能排序中的新位置
+        scanner._pending_validations = [
+            ('http://c', True, {'resolution': '1920x1080', 'latency': 30}),
+            ('http://b', True, {'resolution': '720x576'}),
+        ]
+        scanner._flush_pending_validations()
+        assert [c['url'] for c in model.channels] == ['http://a', 'http://c', 'http://b']
+        assert model.find_row_by_url('http://b') == 2
+        # 行序保持有序，新频道仍能二分插入
+        model.add_channel({'url': 'http://d', 'name': 'CCTV-1 综合', 'group': '央视频道', 'resolution': '1920x1080'})
+        assert [c['url'] for c in model.channels] == ['http://d', 'http://a', 'http://c', 'http://b']
+
+    def test_updates_keep_rows_in_sorted_position(self):
+        model = ChannelListModel()
+        model.add_channels([{'url': f'http://{i}', 'name': f'CH{i}', 'latency': str(i * 10)} for i in range(1, 6)])
+        model.sort(model.COL_LATENCY)
+        moved = []
+        model.rowsMoved.connect(lambda parent, first, last, dest, row: moved.append((first, row)))
+        # 延迟变化后该行移到新的有序位置，其余行不动
+        model.update_channel_by_url('http://1', {'latency': '35'})
+        assert [c['url'] for c in model.channels] == ['http://2', 'http://3', 'http://1', 'http://4', 'http://5']
+        model.update_channel(4, {'latency': '5'})
+        assert [c['url'] for c in model.channels] == ['http://5', 'http://2', 'http://3', 'http://1', 'http://4']
+        assert moved == [(0, 3), (4, 0)]
+        # 键仍在相邻行之间时不移动
+        model.update_channel_by_url('http://3', {'latency': '31'})
+        assert len(moved) == 2
+        # 行序保持有序，新频道仍能二分插入到正确位置
+        model.add_channel({'url': 'http://6', 'name': 'CH6', 'latency': '33'})
+        assert [c['url'] for c in model.channels] == ['http://5', 'http://2', 'http://3', 'http://6', 'http://1', 'http://4']
+        assert model.find_row_by_url('http://4') == 5
@@ -0,0 +1,185 @@
+import copy
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from models.channel_store import ChannelStore  # noqa: E402
+
+
+def _channel(i, **extra):
+    channel = {'name': f'频道{i}', 'url': f'http://host/{i}.m3u8', 'group': '央视', 'valid': i % 2 == 0}
+    channel.update(extra)
+    return channel
+
+
+class TestChannelRecord:
+    def test_record_behaves_like_dict(self):
+        store = ChannelStore([_channel(1, _groups=['央视', '高清'], custom='x')])
+        record = store[0]
+        assert record['name'] == '频道1' and record.get('logo', 'none') == 'none'
+        assert 'custom' in record and 'logo' not in record
+        assert record['_groups'] == ['央视', '高清']
+        record['logo'] = 'http://logo'
+        del record['custom']
+        assert record.to_dict() == {
+            'name': '频道1', 'url': 'http://host/1.m3u8', 'group': '央视', 'valid': False,
+            '_groups': ['央视', '高清'], 'logo': 'http://logo'
+        }
+        assert {**record} == dict(record) == copy.deepcopy(record) == record.copy()
+
+    def test_all_tags_derived_from_raw_extinf(self):
+        raw = '-1 tvg-id="cctv1" group-title="央视",CCTV-1'
+        store = ChannelStore([_channel(1, _raw_extinf=raw, _all_tags={'tvg-id': 'cctv1', 'group-title': '央视'})])
+        assert store[0]['_all_tags'] == {'tvg-id': 'cctv1', 'group-title': '央视'}
+        store[0]['_all_tags'] = {'tvg-id': 'other'}
+        assert store[0]['_all_tags'] == {'tvg-id': 'other'}
+
+    def test_in_place_edits_write_back(self):
+        import json
+        raw = '-1 tvg-id="cctv1",CCTV-1'
+        store = ChannelStore()
+        store.append(_channel(1, _groups=['央视'], _raw_extinf=raw, _all_tags={'tvg-id': 'cctv1'}), from_file=True)
+        record = store[0]
+        record['_groups'].append('高清')
+        record['_all_tags']['catchup'] = 'append'
+        assert record['_groups'] == ['央视', '高清']
+        assert record['_all_tags'] == {'tvg-id': 'cctv1', 'catchup': 'append'}
+        # 原地修改同样经过写时副本，原始字段保持不变
+        assert record.original()['_all_tags'] == {'tvg-id': 'cctv1'}
+        tags = record['_all_tags']
+        del tags['catchup']
+        assert record['_all_tags'] == {'tvg-id': 'cctv1'}
+        # 拷贝/序列化得到普通 list/dict
+        assert type(copy.deepcopy(record['_groups'])) is list
+        assert json.loads(json.dumps(record.to_dict()))['_groups'] == ['央视', '高清']
+
+    def test_original_copy_on_write(self):
+        store = ChannelStore()
+        store.append(_channel(1), from_file=True)
+        store.append(_channel(2))
+        assert store[1].original() is None
+        record = store[0]
+        record['name'] = '改名'
+        record['group'] = '卫视'
+        assert record.original()['name'] == '频道1' and record.original()['group'] == '央视'
+        record.sync_original(('name',))
+        assert record.original()['name'] == '改名' and record.original()['group'] == '央视'
+
+
+class TestChannelStore:
+    def test_sequence_operations(self):
+        store = ChannelStore(_channel(i) for i in range(5))
+        assert list(store.values('url')) == [f'http://host/{i}.m3u8' for i in range(5)]
+        del store[1]
+        store.sort(key=lambda c: c['name'], reverse=True)
+        assert [c['name'] for c in store] == ['频道4', '频道3', '频道2', '频道0']
+        store.reorder([3, 0])
+        assert [c['name'] for c in store] == ['频道0', '频道4', '频道3', '频道2']
+        assert [c['name'] for c in store[1:3]] == ['频道4', '频道3']
+
+    def test_pop_and_insert_keeps_original(self):
+        store = ChannelStore()
+        store.extend((_channel(i) for i in range(3)), from_file=True)
+        store[0]['name'] = '改名'
+        record = store.pop(0)
+        store.insert(2, record)
+        assert [c['name'] for c in store] == ['频道1', '频道2', '改名']
+        assert store[2].original()['name'] == '频道0'
+
+    def test_retain_and_restore_order(self):
+        store = ChannelStore(_channel(i) for i in range(6))
+        snapshot = store.order_snapshot()
+        store.retain(lambda c: c['valid'])
+        assert [c['name'] for c in store] == ['频道0', '频道2', '频道4']
+        del store[0]
+        store.append(_channel(9))
+        store.restore_order(snapshot)
+        assert [c['name'] for c in store] == ['频道1', '频道2', '频道3', '频道4', '频道5', '频道9']
+
+
+    def test_deleted_slots_reused(self):
+        store = ChannelStore(_channel(i) for i in range(4))
+        for i in range(10):
+            del store[0]
+            store.append(_channel(10 + i))
+        assert len(store._live) == 4
+        assert [c['name'] for c in store] == ['频道16', '频道17', '频道18', '频道19']
+        assert store[3].get('valid') is False and 'logo' not in store[3]
+
+    def test_stale_view_rejected_after_slot_reuse(self):
+        store = ChannelStore([_channel(0, _groups=['央视', '高清']), _channel(1)])
+        record = store[0]
+        groups = record['_groups']
+        del store[0]
+        store.append({'name': 'C', 'url': 'http://c'})
+        with pytest.raises(RuntimeError):
+            record.get('name')
+        with pytest.raises(RuntimeError):
+            record['name'] = 'X'
+        with pytest.raises(RuntimeError):
+            groups.append('4K')
+        assert [c.to_dict() for c in store] == [_channel(1), {'name': 'C', 'url': 'http://c'}]
+        # 移动、排序不释放槽位，原有视图仍然可用
+        record = store[1]
+        store.insert(0, store.pop(1))
+        store.sort(key=lambda c: c['name'], reverse=True)
+        assert record['name'] == 'C'
+        store.clear()
+        store.append(_channel(5))
+        with pytest.raises(RuntimeError):
+            record.get('name')
+
+    def test_dropped_detached_rows_freed(self):
+        store = ChannelStore(_channel(i, note=f'备注{i}') for i in range(3))
+        for i in range(5):
+            store.pop(0)
+            store.detach_new([_channel(10 + i)])
+            store.append(_channel(20 + i))
+        assert len(store._live) == 3 and not store._extra
+        assert [c['name'] for c in store] == ['频道22', '频道23', '频道24']
+        # 插回的行不释放；同一槽位再次取出后，早先取出的行被丢弃也不影响它
+        first = store.pop(0)
+        store.insert(0, first)
+        second = store.pop(0)
+        del first
+        store.insert(2, second)
+        assert [c['name'] for c in store] == ['频道23', '频道24', '频道22']
+
+    def test_sort_keys_cached_until_row_changes(self):
+        store = ChannelStore([_channel(i) for i in (3, 1, 2)])
+        calls = []
+
+        def compute(record):
+            calls.append(record['name'])
+            return record['name']
+
+        key_of = store.cached_key('name', compute)
+        store.sort(key=key_of)
+        store.sort(key=key_of, reverse=True)
+        assert len(calls) == 3
+        store[0]['name'] = '频道0'
+        store.sort(key=key_of)
+        assert calls[3:] == ['频道0'] and store[0]['name'] == '频道0'
+        assert store.insertion_point(key_of, '频道15') == 2
+        assert store.insertion_point(key_of, '频道2') == 3
+
+
+class TestModelStore:
+    def test_hide_and_export_originals(self):
+        from models.channel_model import ChannelListModel
+
+        model = ChannelListModel()
+        model.add_channels([_channel(i) for i in range(4)], is_from_file=True)
+        model.setData(model.index(0, model._actual_to_logical_column(model.COL_NAME)), '新名称')
+        model.channels[2]['group'] = '临时分组'
+        model.hide_invalid()
+        assert model.rowCount() == 2
+        model.show_all()
+        assert [c['name'] for c in model.channels] == ['新名称', '频道1', '频道2', '频道3']
+        m3u = model.to_m3u()
+        assert '新名称' in m3u and '临时分组' not in m3u
@@ -0,0 +1,85 @@
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.concurrency_controller import AdaptiveConcurrencyController, url_host  # noqa: E402
+
+
+def _controller(initial=4, max_limit=16, cpu=None, **kwargs):
+    return AdaptiveConcurrencyController(
+        initial, max_limit=max_limit, adjust_interval=0,
+        cpu_sampler=lambda: cpu, **kwargs
+    )
+
+
+def _run_window(controller, results):
+    """占满当前上限后依次归还，模拟一个评估窗口"""
+    held = 0
+    while controller.try_acquire():
+        held += 1
+    for i in range(held):
+        controller.release(None, results[i % len(results)])
+
+
+_OK = {'valid': True, 'latency': 100, 'error_type': None}
+_TIMEOUT = {'valid': False, 'latency': 3000, 'error_type': 'timeout'}
+
+
+class TestAdaptiveConcurrencyController:
+    def test_fixed_limit_and_blocking_acquire(self):
+        controller = _controller(initial=2, adaptive=False)
+        assert controller.try_acquire() and controller.try_acquire()
+        assert not controller.try_acquire()
+        assert not controller.acquire(timeout=0.05)
+        threading.Timer(0.05, controller.release).start()
+        assert controller.acquire(timeout=2)
+        assert controller.limit == 2
+
+    def test_per_host_limit(self):
+        controller = _controller(initial=8, per_host_limit=2)
+        host_a = url_host('http://10.0.0.1:8080/rtp/239.1.1.1:5000')
+        assert host_a == '10.0.0.1:8080'
+        assert controller.try_acquire(host_a) and controller.try_acquire(host_a)
+        assert not controller.try_acquire(host_a)
+        assert controller.try_acquire('10.0.0.2')
+        controller.release(host_a)
+        assert controller.try_acquire(host_a)
+
+    def test_additive_increase_when_saturated_and_healthy(self):
+        controller = _controller(initial=4)
+        for _ in range(5):
+            _run_window(controller, [_OK])
+        assert controller.limit > 4
+
+    def test_no_increase_without_saturation(self):
+        controller = _controller(initial=8)
+        for _ in range(20):
+            assert controller.try_acquire()
+            controller.release(None, _OK)
+        assert controller.limit == 8
+
+    def test_multiplicative_decrease_on_timeout_spike(self):
+        controller = _controller(initial=12)
+        _run_window(controller, [_OK])
+        before = controller.limit
+        _run_window(controller, [_OK, _TIMEOUT])
+        assert controller.limit < before
+
+    def test_dead_link_timeout_floor_is_not_congestion(self):
+        controller = _controller(initial=8)
+        # 扫描网段时大量死链超时是常态：超时率稳定时不应持续降低
+        for _ in range(4):
+            _run_window(controller, [_OK, _TIMEOUT])
+        assert controller.limit >= 8
+
+    def test_cpu_overload_and_create_failures_back_off(self):
+        controller = _controller(initial=8, cpu=99.0)
+        _run_window(controller, [_OK])
+        assert controller.limit == 6
+
+        controller = _controller(initial=8)
+        assert controller.try_acquire()
+        controller.release(None, {'valid': False, 'error_type': 'mpv_create_failed'})
+        assert controller.limit == 6
@@ -0,0 +1,53 @@
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.epg_matcher import EpgIndex, EpgMatcher  # noqa: E402
+
+
+_CHANNELS = {
+    'CCTV1': 'CCTV-1 综合',
+    'CCTV5': 'CCTV-5 体育',
+    'HNWS': '湖南卫视',
+    'ZJWS': '浙江卫视',
+    'BTV1': '北京卫视',
+    'PHOENIX': '凤凰中文',
+}
+
+
+class TestEpgIndex:
+    def test_exact_and_normalized_match(self):
+        index = EpgIndex(_CHANNELS)
+        assert index.match('x', tvg_id='CCTV5') == 'CCTV5'
+        assert index.match('湖南卫视') == 'HNWS'
+        assert index.match('CCTV1 HD') == 'CCTV1'
+
+    def test_similarity_matches_linear_scan(self):
+        rng = random.Random(7)
+        alphabet = 'abcdef央视卫新闻体育123'
+        channels = {
+            f'id{i}': ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 10)))
+            for i in range(400)
+        }
+        index = EpgIndex(channels)
+        _, _, by_norm_name = EpgMatcher._build_index(channels)
+        for _ in range(300):
+            query = ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 10)))
+            assert index.similar(query) == EpgMatcher._fuzzy_match_by_similarity(query, by_norm_name)
+
+    def test_index_reused_until_epg_swap(self):
+        from core.subscription_manager import SubscriptionManager
+        manager = SubscriptionManager()
+        saved = manager._epg_data, manager._epg_channel_names, manager._epg_index
+        try:
+            with manager._epg_lock:
+                manager._epg_data = {cid: [] for cid in _CHANNELS}
+                manager._epg_channel_names = dict(_CHANNELS)
+                manager._epg_index = None
+            first = manager._get_epg_index()
+            manager.get_channel_epg('湖南卫视HD')
+            assert manager._get_epg_index() is first
+        finally:
+            manager._epg_data, manager._epg_channel_names, manager._epg_index = saved
@@ -0,0 +1,88 @@
+import json
+import os
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+import models.channel_mappings  # noqa: E402
+from services.logo_cache_service import (  # noqa: E402
+    LogoCacheService, WARMUP_BACKGROUND, WARMUP_FAVORITE, WARMUP_VISIBLE,
+)
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    QApplication.instance() or QApplication([])
+    monkeypatch.setattr(models.channel_mappings, 'get_app_data_dir', lambda: str(tmp_path))
+    created = []
+
+    def make():
+        svc = LogoCacheService()
+        created.append(svc)
+        return svc
+
+    yield make
+    for svc in created:
+        svc.shutdown()
+
+
+class TestLogoMetaStore:
+    def test_meta_persisted_and_legacy_json_migrated(self, tmp_path, service):
+        cache_dir = tmp_path / LogoCacheService.CACHE_DIR_NAME
+        cache_dir.mkdir()
+        legacy = {'k1': {'url': 'http://a/1.png', 'time': time.time(), 'ext': '.png'}}
+        (cache_dir / 'meta.json').write_text(json.dumps(legacy), encoding='utf-8')
+
+        svc = service()
+        assert svc._meta['k1']['url'] == 'http://a/1.png'
+        assert not (cache_dir / 'meta.json').exists() and (cache_dir / 'meta.json.migrated').exists()
+        svc._set_meta('k2', {'url': 'http://a/2.png', 'time': time.time(), 'ext': '.jpg'})
+        svc._drop_meta('k1')
+        svc.shutdown()
+
+        reopened = service()
+        assert set(reopened._meta) == {'k2'} and reopened._meta['k2']['ext'] == '.jpg'
+
+
+class TestWarmupScheduler:
+    def test_priority_order_host_cap_and_dedup(self, service, monkeypatch):
+        svc = service()
+        started = []
+        monkeypatch.setattr(svc, 'MAX_CONCURRENT_DOWNLOADS', 6)
+        monkeypatch.setattr(svc, 'MAX_DOWNLOADS_PER_HOST', 2)
+
+        def fake_start(url):
+            host = svc._host_of(url)
+            svc._host_inflight[host] = svc._host_inflight.get(host, 0) + 1
+            svc._pending_replies[url] = object()
+            started.append(url)
+
+        monkeypatch.setattr(svc, '_start_download', fake_start)
+        # 先占满并发，观察排队顺序
+        svc._pending_replies.update({f'busy{i}': object() for i in range(6)})
+        svc.warmup([f'http://a/{i}.png' for i in range(3)] + ['http://b/0.png', 'http://a/0.png'])
+        svc.warmup(['http://b/1.png', 'http://a/2.png'], WARMUP_FAVORITE)
+        svc.fetch_async('http://c/0.png')
+        assert svc._queued == {
+            'http://a/0.png': WARMUP_BACKGROUND, 'http://a/1.png': WARMUP_BACKGROUND,
+            'http://a/2.png': WARMUP_FAVORITE, 'http://b/0.png': WARMUP_BACKGROUND,
+            'http://b/1.png': WARMUP_FAVORITE, 'http://c/0.png': WARMUP_VISIBLE,
+        }
+
+        svc._pending_replies = {}
+        svc._pump_downloads()
+        # 可见 > 收藏 > 其余；a 主机同时最多 2 个
+        assert started == ['http://c/0.png', 'http://b/1.png', 'http://a/2.png',
+                           'http://a/0.png', 'http://b/0.png']
+        assert svc._queued == {'http://a/1.png': WARMUP_BACKGROUND}
+
+        svc._release_host('a')
+        svc._pending_replies.pop('http://a/0.png')
+        svc._pump_downloads()
+        assert started[-1] == 'http://a/1.png' and not svc._queued
+        svc._pending_replies.clear()
@@ -0,0 +1,80 @@
+import gzip
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from services.m3u_parser import (  # noqa: E402
+    M3UStreamParser, detect_encoding, iter_m3u_data_lines, iter_m3u_file_lines, parse_m3u_content
+)
+
+_PLAYLIST = (
+    '#EXTM3U x-tvg-url="http://epg/e.xml"\n'
+    '#EXTINF:-1 tvg-id="cctv1" group-title="央视",CCTV-1 综合\n'
+    'http://a/1.m3u8\n'
+    '#EXTINF:-1 group-title="卫视",湖南卫视\n'
+    '#EXTVLCOPT:video-resolution=1920x1080\n'
+    'rtp://239.1.1.1:5000\n'
+    '地方,#genre#\n'
+    '北京新闻,http://b/news\n'
+    'http://a/1.m3u8\n'
+)
+
+
+def _playlist(count):
+    lines = ['#EXTM3U']
+    for i in range(count):
+        lines.append(f'#EXTINF:-1 group-title="分组{i % 7}",频道{i}')
+        lines.append(f'http://host/{i}.m3u8')
+    return '\n'.join(lines)
+
+
+class TestStreamParser:
+    def test_batches_match_full_parse_for_any_chunking(self):
+        expected = parse_m3u_content(_PLAYLIST)
+        for encoding in ('utf-8', 'utf-8-sig', 'gb18030'):
+            data = _PLAYLIST.encode(encoding)
+            for chunk_size in (1, 5, 4096):
+                parser = M3UStreamParser()
+                batches = list(parser.iter_batches(iter_m3u_data_lines(data, chunk_size), batch_size=2))
+                assert [len(b) for b in batches] == [2, 2]
+                assert ([c for b in batches for c in b], parser.header_attrs) == expected
+        assert expected[1]['epg_url'] == 'http://epg/e.xml'
+        assert [c['id'] for c in expected[0]] == [1, 2, 3, 4]
+
+    def test_encoding_detected_from_prefix(self):
+        text = '频道,http://a/1\n'.encode('gb18030')
+        assert detect_encoding(text) == 'gb18030'
+        # 前缀截断在 UTF-8 多字节字符中间时仍判断为 UTF-8
+        assert detect_encoding('频道'.encode('utf-8')[:-1]) == 'utf-8'
+
+    def test_gzip_file_streamed(self, tmp_path):
+        path = tmp_path / 'list.m3u.gz'
+        path.write_bytes(gzip.compress(_playlist(1200).encode('utf-8')))
+        parser = M3UStreamParser()
+        channels = [c for b in parser.iter_batches(iter_m3u_file_lines(str(path), 1024)) for c in b]
+        assert len(channels) == 1200 and channels[-1]['name'] == '频道1199'
+
+
+class TestModelStreamLoad:
+    def test_rows_arrive_incrementally(self, tmp_path):
+        from PySide6.QtCore import QCoreApplication
+        from models.channel_model import ChannelListModel
+
+        app = QCoreApplication.instance() or QCoreApplication([])
+        path = tmp_path / 'big.m3u'
+        path.write_text(_playlist(5000) + '\n#EXTINF:-1,重复\nhttp://host/0.m3u8\n', encoding='utf-8')
+        model = ChannelListModel()
+        inserts = []
+        model.rowsInserted.connect(lambda parent, first, last: inserts.append(last - first + 1))
+        finished = []
+        model.load_from_path(str(path), on_finished=finished.append)
+        assert model.rowCount() > 0
+        while not finished:
+            app.processEvents()
+        assert finished == [True]
+        assert model.rowCount() == 5000 and sum(inserts) == 5000 and len(inserts) > 1
+        assert model.find_row_by_url('http://host/4999.m3u8') == 4999
+        assert model.channels[10].original()['url'] == 'http://host/10.m3u8'
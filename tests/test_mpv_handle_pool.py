@@ -0,0 +1,90 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import services.mpv_handle_pool as pool_module  # noqa: E402
+from services.mpv_handle_pool import MpvHandlePool  # noqa: E402
+
+
+class _FakeMpv:
+    """模拟 libmpv：记录创建/销毁次数与属性"""
+
+    def __init__(self):
+        self.created = 0
+        self.destroyed = []
+        self.props = {}
+
+    def install(self, monkeypatch):
+        monkeypatch.setattr(pool_module, '_is_mpv_available', lambda: True)
+        monkeypatch.setattr(pool_module, 'create_mpv_handle', self.create)
+        monkeypatch.setattr(pool_module, 'initialize_mpv', lambda handle: True)
+        monkeypatch.setattr(pool_module, 'destroy_mpv', self.destroyed.append)
+        monkeypatch.setattr(pool_module, 'get_property_string',
+                            lambda handle, name: self.props[handle].get(name))
+        monkeypatch.setattr(pool_module, 'set_property_string', self.set_property)
+        monkeypatch.setattr(pool_module, 'send_command', self.command)
+        monkeypatch.setattr(pool_module, 'wait_for_event', lambda handle, timeout: None)
+
+    def create(self):
+        self.created += 1
+        handle = self.created
+        self.props[handle] = {'idle-active': 'yes', 'demuxer': ''}
+        return handle
+
+    def set_property(self, handle, name, value):
+        self.props[handle][name] = value
+        return 0
+
+    def command(self, handle, parts):
+        if parts[0] == 'loadfile':
+            self.props[handle]['idle-active'] = 'no'
+        elif parts[0] == 'stop':
+            self.props[handle]['idle-active'] = 'yes'
+        return 0
+
+
+@pytest.fixture
+def fake_mpv(monkeypatch):
+    fake = _FakeMpv()
+    fake.install(monkeypatch)
+    return fake
+
+
+class TestMpvHandlePool:
+    def test_handle_reused_and_overrides_restored(self, fake_mpv):
+        configured = []
+        pool = MpvHandlePool('test', configured.append, max_idle=2)
+        lease = pool.acquire()
+        lease.set_override('demuxer', 'lavf')
+        pool_module.send_command(lease.handle, ['loadfile', 'http://x'])
+        pool.release(lease)
+
+        again = pool.acquire()
+        assert again.handle == lease.handle
+        assert fake_mpv.props[again.handle]['demuxer'] == ''
+        assert fake_mpv.created == 1 and configured == [lease.handle]
+
+    def test_unhealthy_and_stale_handles_are_destroyed(self, fake_mpv):
+        pool = MpvHandlePool('test', lambda handle: None)
+        lease = pool.acquire()
+        pool.release(lease)
+        fake_mpv.props[lease.handle]['idle-active'] = None
+        fresh = pool.acquire()
+        assert fresh.handle != lease.handle and fake_mpv.destroyed == [lease.handle]
+
+        pool.invalidate()
+        pool.release(fresh)
+        assert fresh.handle in fake_mpv.destroyed and pool.idle_count == 0
+
+    def test_max_idle_and_unreusable_release(self, fake_mpv):
+        pool = MpvHandlePool('test', lambda handle: None, max_idle=1)
+        first, second = pool.acquire(), pool.acquire()
+        pool.release(first)
+        pool.release(second)
+        assert pool.idle_count == 1 and fake_mpv.destroyed == [second.handle]
+        third = pool.acquire()
+        pool.release(third, reusable=False)
+        assert pool.idle_count == 0 and third.handle in fake_mpv.destroyed
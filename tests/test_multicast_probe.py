@@ -0,0 +1,188 @@
+import os
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.multicast_probe import (  # noqa: E402
+    TsAnalyzer, get_multicast_probe, is_native_probe_target, parse_h264_sps
+)
+
+_VIDEO_PID = 0x100
+_AUDIO_PID = 0x101
+_PMT_PID = 0x1000
+
+
+class _BitWriter:
+    def __init__(self):
+        self.bits = []
+
+    def u(self, n, value):
+        self.bits.extend((value >> (n - 1 - i)) & 1 for i in range(n))
+
+    def ue(self, value):
+        value += 1
+        length = value.bit_length()
+        self.u(length - 1, 0)
+        self.u(length, value)
+
+    def to_bytes(self):
+        bits = self.bits + [1]
+        bits += [0] * (-len(bits) % 8)
+        return bytes(int(''.join(map(str, bits[i:i + 8])), 2) for i in range(0, len(bits), 8))
+
+
+def _h264_sps_1080p() -> bytes:
+    w = _BitWriter()
+    w.u(8, 66)
+    w.u(16, 40)
+    w.ue(0)
+    w.ue(0)
+    w.ue(2)
+    w.ue(1)
+    w.u(1, 0)
+    w.ue(119)   # 120 个宏块宽 = 1920
+    w.ue(67)    # 68 个宏块高 = 1088
+    w.u(1, 1)
+    w.u(1, 1)
+    w.u(1, 1)   # frame_cropping_flag
+    for value in (0, 0, 0, 4):
+        w.ue(value)
+    w.u(1, 0)   # vui_parameters_present_flag
+    return b'\x67' + w.to_bytes()
+
+
+def _ts_packet(pid, payload=b'', pusi=False, pcr=None, cc=0):
+    header = bytes([0x47, (0x40 if pusi else 0) | (pid >> 8), pid & 0xFF])
+    if pcr is None:
+        body = payload[:184]
+        if len(body) < 184:
+            adaptation = bytes([183 - len(body)]) + (b'\x00' + b'\xff' * (182 - len(body)) if len(body) < 183 else b'')
+            return header + bytes([0x30 | cc]) + adaptation + body
+        return header + bytes([0x10 | cc]) + body
+    base, ext = divmod(pcr, 300)
+    pcr_field = bytes([
+        (base >> 25) & 0xFF, (base >> 17) & 0xFF, (base >> 9) & 0xFF, (base >> 1) & 0xFF,
+        ((base & 1) << 7) | 0x7E | (ext >> 8), ext & 0xFF
+    ])
+    adaptation = bytes([7, 0x10]) + pcr_field
+    body = payload[:184 - len(adaptation)]
+    stuffing = b'\xff' * (184 - len(adaptation) - len(body))
+    adaptation = bytes([len(adaptation) - 1 + len(stuffing)]) + adaptation[1:] + stuffing
+    return header + bytes([0x30 | cc]) + adaptation + body
+
+
+def _section(table_id, body):
+    length = len(body) + 4
+    return bytes([table_id, 0xB0 | (length >> 8), length & 0xFF]) + body + b'\x00' * 4
+
+
+def _build_stream(seconds=1.0, packets_per_tick=50, ticks_per_second=10):
+    pat = _section(0x00, b'\x00\x01\xc1\x00\x00' + bytes([0x00, 0x01, 0xE0 | (_PMT_PID >> 8), _PMT_PID & 0xFF]))
+    pmt_body = (b'\x00\x01\xc1\x00\x00' + bytes([0xE0 | (_VIDEO_PID >> 8), _VIDEO_PID & 0xFF, 0xF0, 0x00])
+                + bytes([0x1B, 0xE0 | (_VIDEO_PID >> 8), _VIDEO_PID & 0xFF, 0xF0, 0x00])
+                + bytes([0x0F, 0xE0 | (_AUDIO_PID >> 8), _AUDIO_PID & 0xFF, 0xF0, 0x00]))
+    pmt = _section(0x02, pmt_body)
+    pes = b'\x00\x00\x01\xe0\x00\x00\x80\x00\x00' + b'\x00\x00\x00\x01' + _h264_sps_1080p() + b'\x00\x00\x00\x01\x68\xce'
+    packets = [_ts_packet(0, b'\x00' + pat, pusi=True), _ts_packet(_PMT_PID, b'\x00' + pmt, pusi=True),
+               _ts_packet(_VIDEO_PID, pes, pusi=True)]
+    ticks = int(seconds * ticks_per_second)
+    for tick in range(ticks + 1):
+        packets.append(_ts_packet(_VIDEO_PID, b'', pcr=tick * 27_000_000 // ticks_per_second))
+        packets.extend(_ts_packet(_AUDIO_PID, b'\x00' * 184) for _ in range(packets_per_tick - 1))
+    return packets
+
+
+class TestTsAnalyzer:
+    def test_pat_pmt_sps_and_pcr_bitrate(self):
+        assert parse_h264_sps(_h264_sps_1080p()) == (1920, 1080)
+        analyzer = TsAnalyzer()
+        analyzer.feed(b''.join(_build_stream()))
+        assert analyzer.complete
+        result = {}
+        analyzer.fill_result(result)
+        assert result['codec'] == 'h264' and result['resolution'] == '1920x1080'
+        # 每 0.1 秒 50 个包：50 × 188 × 8 × 10 = 752kbps
+        assert result['bitrate'] == '752kbps'
+        assert {s['codec_name'] for s in result['streams']} == {'h264', 'aac'}
+
+    def test_native_targets(self):
+        assert is_native_probe_target('udp://@239.1.1.1:5000')
+        assert is_native_probe_target('rtp://239.1.1.1:5000')
+        assert is_native_probe_target('http://192.168.1.1:4022/rtp/239.1.1.1:5000')
+        assert not is_native_probe_target('http://example.com/live.m3u8')
+
+
+def _free_udp_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _send_udp(port, packets, delay=0.05):
+    time.sleep(delay)
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        for i in range(0, len(packets), 7):
+            sock.sendto(b''.join(packets[i:i + 7]), ('127.0.0.1', port))
+            time.sleep(0.0005)
+
+
+class TestMulticastProbe:
+    def test_local_udp_sender(self):
+        ports = [_free_udp_port() for _ in range(3)]
+        probe = get_multicast_probe()
+        futures = [probe.submit(f'udp://@127.0.0.1:{port}', timeout=2, dwell=2) for port in ports]
+        senders = [threading.Thread(target=_send_udp, args=(port, _build_stream())) for port in ports]
+        for sender in senders:
+            sender.start()
+        results = [future.result(timeout=10) for future in futures]
+        for sender in senders:
+            sender.join()
+        for result in results:
+            assert result['valid'] is True and result['native_probe']
+            assert result['codec'] == 'h264' and result['resolution'] == '1920x1080'
+
+    def test_silent_group_times_out(self):
+        result = get_multicast_probe().probe(f'udp://@127.0.0.1:{_free_udp_port()}', timeout=0.3, dwell=0.3)
+        assert result['valid'] is False and result['error_type'] == 'timeout'
+
+    def test_cancel_all_interrupts_waiting_probe(self):
+        probe = get_multicast_probe()
+        results = []
+        url = f'udp://@127.0.0.1:{_free_udp_port()}'
+        waiter = threading.Thread(target=lambda: results.append(probe.probe(url, timeout=5, dwell=5)))
+        start = time.monotonic()
+        waiter.start()
+        time.sleep(0.2)
+        probe.cancel_all()
+        waiter.join(5)
+        assert time.monotonic() - start < 2
+        assert results[0]['valid'] is False and results[0]['error_type'] == 'terminating'
+        # 终止标志在登记之前已置位：登记后检查一次即取消
+        result = probe.probe(url, timeout=5, dwell=5, cancelled=lambda: True)
+        assert result['error_type'] == 'terminating' and not probe._pending
+
+    def test_udpxy_http_proxy(self):
+        server = socket.socket()
+        server.bind(('127.0.0.1', 0))
+        server.listen(1)
+        port = server.getsockname()[1]
+
+        def serve():
+            conn, _ = server.accept()
+            with conn:
+                conn.recv(4096)
+                conn.sendall(b'HTTP/1.1 200 OK\r\nContent-Type: video/mp2t\r\n\r\n')
+                data = b''.join(_build_stream())
+                # 故意不按 188 字节切分，验证字节流重新对齐
+                for i in range(0, len(data), 1000):
+                    conn.sendall(data[i:i + 1000])
+            server.close()
+
+        threading.Thread(target=serve, daemon=True).start()
+        result = get_multicast_probe().probe(
+            f'http://127.0.0.1:{port}/rtp/239.1.1.1:5000', timeout=2, dwell=2
+        )
+        assert result['valid'] is True and result['resolution'] == '1920x1080'
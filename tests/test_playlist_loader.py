@@ -0,0 +1,155 @@
+import gzip
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.conditional_fetch import SourceValidators  # noqa: E402
+from services.playlist_loader import PlaylistSourceLoader  # noqa: E402
+
+
+def _playlist(prefix, count=3):
+    lines = ['#EXTM3U x-tvg-url="http://epg/e.xml"']
+    for i in range(count):
+        lines.append(f'#EXTINF:-1 group-title="{prefix}",{prefix}{i}')
+        lines.append(f'http://{prefix}/{i}.m3u8')
+    return '\n'.join(lines).encode('utf-8')
+
+
+_BODIES = {'/a.m3u': _playlist('a'), '/b.m3u': _playlist('b'), '/etag.m3u': _playlist('e')}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.startswith('/slow'):
+            time.sleep(0.6)
+        headers = {}
+        if self.path == '/etag.m3u':
+            if self.headers.get('If-None-Match') == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            headers['ETag'] = '"v1"'
+        if self.path == '/missing.m3u':
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = _BODIES.get(self.path) or _playlist(self.path.strip('/').split('.')[0])
+        if self.path.startswith('/gz'):
+            body = gzip.compress(body)
+            headers['Content-Encoding'] = 'gzip'
+        self.send_response(200)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestPlaylistSourceLoader:
+    @classmethod
+    def setup_class(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        cls.base = f'http://127.0.0.1:{cls.server.server_address[1]}'
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def teardown_class(cls):
+        cls.server.shutdown()
+
+    def _loader(self, tmp_path):
+        return PlaylistSourceLoader(SourceValidators(str(tmp_path / 'validators.json')))
+
+    def test_sources_fetched_in_parallel_in_config_order(self, tmp_path):
+        loader = self._loader(tmp_path)
+        sources = [{'url': f'{self.base}/slow{i}.m3u'} for i in range(4)]
+        sources.insert(1, {'url': f'{self.base}/a.m3u', 'enabled': False})
+        sources.append({'url': f'{self.base}/missing.m3u'})
+        started = time.monotonic()
+        results = loader.load_all(sources)
+        assert time.monotonic() - started < 1.5
+        assert results[1] is None
+        assert [r['channels'][0]['name'] for r in results[:5] if r] == ['slow00', 'slow10', 'slow20', 'slow30']
+        assert results[0]['channels'][0]['source'] == sources[0]['url']
+        assert results[-1]['channels'] is None and results[-1]['error'] == 'HTTP 404'
+        loader.close()
+
+    def test_unchanged_content_reuses_existing_and_cache(self, tmp_path):
+        loader = self._loader(tmp_path)
+        url = f'{self.base}/a.m3u'
+        first = loader.fetch(url)
+        assert not first['unchanged'] and first['header_attrs']['epg_url'] == 'http://epg/e.xml'
+        existing = [dict(c, valid=True) for c in first['channels']]
+        again = loader.fetch(url, existing)
+        assert again['unchanged'] and again['channels'] is existing
+        # 内存中没有该源的频道时使用解析缓存，仍需由调用方重新并入
+        batches = []
+        cached = loader.fetch(url, on_batch=batches.append)
+        assert not cached['unchanged'] and [c['name'] for c in cached['channels']] == ['a0', 'a1', 'a2']
+        assert sum(len(b) for b in batches) == 3
+        loader.prune([])
+        assert loader.fetch(url)['channels'][0]['name'] == 'a0'
+
+    def test_not_modified_source(self, tmp_path):
+        loader = self._loader(tmp_path)
+        url = f'{self.base}/etag.m3u'
+        existing = loader.fetch(url)['channels']
+        result = loader.fetch(url, existing)
+        assert result['status_code'] == 304 and result['channels'] is existing
+
+    def test_body_streamed_without_buffering(self, tmp_path, monkeypatch):
+        import requests
+
+        def no_content(resp):
+            raise AssertionError('响应体不应整体读入内存')
+        monkeypatch.setattr(requests.Response, 'content', property(no_content))
+        loader = self._loader(tmp_path)
+        url = f'{self.base}/gz.m3u'
+        batches = []
+        first = loader.fetch(url, on_batch=batches.append)
+        assert [c['name'] for c in first['channels']] == ['gz0', 'gz1', 'gz2'] and len(batches) == 1
+        # 哈希按解压后的内容计算，内容不变时沿用已有频道
+        again = loader.fetch(url, first['channels'])
+        assert again['unchanged'] and again['channels'] is first['channels']
+
+
+class TestSubscriptionSplice:
+    def _context(self, channels):
+        from server.context import ServerContext
+        ctx = ServerContext(main_window=object())
+        ctx._channels = channels
+        return ctx
+
+    def test_only_changed_source_range_replaced(self):
+        def ch(source, i):
+            return {'name': f'{source}{i}', 'url': f'http://{source}/{i}', 'source': source}
+
+        ctx = self._context([ch('a', 0), ch('a', 1), ch('b', 0), ch('b', 1),
+                             {'name': 'L', 'url': 'http://a/9'}, {'name': 'M', 'url': 'http://m'}])
+        existing = ctx._channels_by_source()
+        kept = ctx._channels[2]
+        results = [
+            {'url': 'a', 'channels': [ch('a', 9), ch('a', 8), ch('a', 7)], 'unchanged': False},
+            {'url': 'b', 'channels': existing['b'], 'unchanged': True},
+        ]
+        assert ctx._splice_subscription_channels(results, existing) == 6
+        assert [c['name'] for c in ctx._channels] == ['a9', 'a8', 'a7', 'b0', 'b1', 'M']
+        # 未变化的源原地保留，已取到的行视图仍然有效
+        assert kept['name'] == 'b0' and ctx._channels[3]['url'] == kept['url']
+
+        # 拉取失败的源被移除；保留模式下不动
+        failed = [{'url': 'a', 'channels': None, 'unchanged': False}, results[1]]
+        existing = ctx._channels_by_source()
+        assert ctx._splice_subscription_channels(failed, existing, remove_stale=False) == 6
+        assert ctx._splice_subscription_channels(failed, existing) == 3
+        assert [c['name'] for c in ctx._channels] == ['b0', 'b1', 'M']
+
+        # 新增的源无法原地插入，交给整体合并
+        added = [{'url': 'c', 'channels': [ch('c', 0)], 'unchanged': False}]
+        assert ctx._splice_subscription_channels(added, ctx._channels_by_source(), remove_stale=False) is None
@@ -0,0 +1,55 @@
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.ffprobe_validator_service import FfprobeStreamValidator  # noqa: E402
+from services.process_supervisor import get_process_supervisor  # noqa: E402
+
+
+def _py(code):
+    return [sys.executable, '-c', code]
+
+
+class TestProcessSupervisor:
+    def test_chatty_process_does_not_deadlock(self):
+        code = 'import sys; sys.stdout.write("x" * 4000000); sys.stderr.write("y" * 200000)'
+        proc = get_process_supervisor().run(_py(code), deadline=20)
+        assert proc.returncode == 0
+        assert len(proc.stdout) == 4000000
+        assert len(proc.stderr) == 200000
+        assert proc.timed_out is False
+
+    def test_deadline_kills_process(self):
+        start = time.time()
+        proc = get_process_supervisor().run(_py('import time; time.sleep(30)'), deadline=0.5)
+        assert proc.timed_out is True
+        assert time.time() - start < 5
+        assert proc.poll() is not None
+
+    def test_kill_from_other_thread(self):
+        proc = get_process_supervisor().spawn(_py('import time; time.sleep(30)'), deadline=30)
+        assert proc.poll() is None
+        threading.Timer(0.2, proc.kill).start()
+        assert proc.wait(timeout=5) is not None
+
+
+class TestFfprobeValidatorSupervision:
+    def setup_method(self):
+        FfprobeStreamValidator.reset_terminating()
+
+    def teardown_method(self):
+        FfprobeStreamValidator.reset_terminating()
+
+    def test_set_terminating_interrupts_running_probe(self):
+        validator = FfprobeStreamValidator()
+        validator._get_ffprobe_path = lambda: sys.executable
+        validator._build_ffprobe_command = lambda path, url, timeout: _py('import time; time.sleep(30)')
+        threading.Timer(0.3, FfprobeStreamValidator.set_terminating).start()
+        start = time.time()
+        result = validator.validate_stream('udp://239.0.0.1:1234', timeout=5)
+        assert result['error_type'] == 'terminating'
+        assert time.time() - start < 5
+        assert FfprobeStreamValidator._active_processes == {}
@@ -0,0 +1,90 @@
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.scan_checkpoint import ScanCheckpoint  # noqa: E402
+
+_EXPR = 'http://10.0.0.[1-255]:8080/rtp/239.1.1.1:5000'
+
+
+class TestScanCheckpoint:
+    def test_out_of_order_marks_advance_cursor(self, tmp_path):
+        checkpoint = ScanCheckpoint.open(_EXPR, 255, directory=str(tmp_path))
+        for index in (2, 1, 5):
+            checkpoint.mark(index, False)
+        assert checkpoint.cursor == 0 and checkpoint.is_done(5) and not checkpoint.is_done(3)
+        checkpoint.mark(0, True, {'url': 'http://10.0.0.1:8080/rtp/239.1.1.1:5000'})
+        assert checkpoint.cursor == 3
+        checkpoint.mark(0, False)
+        assert checkpoint.done_count == 4 and checkpoint.valid_count == 1
+
+    def test_cursor_trims_bitmap_and_completes(self, tmp_path):
+        checkpoint = ScanCheckpoint.open('x[1-2000]', 2000, directory=str(tmp_path))
+        for index in range(1999, -1, -1):
+            checkpoint.mark(index, index % 100 == 0)
+        assert checkpoint.complete and checkpoint.valid_count == 20
+        assert len(checkpoint._done) < 64
+
+    def test_save_and_resume(self, tmp_path):
+        checkpoint = ScanCheckpoint.open(_EXPR, 255, directory=str(tmp_path))
+        for index in range(10):
+            checkpoint.mark(index, index == 7, {'url': f'u{index}', 'name': 'CCTV1'})
+        checkpoint.mark(20, False)
+        checkpoint.save()
+        with open(checkpoint.path, encoding='utf-8') as f:
+            assert json.load(f)['cursor'] == 10
+
+        resumed = ScanCheckpoint.open(_EXPR, 255, resume=True, directory=str(tmp_path))
+        assert resumed.cursor == 10 and resumed.is_done(20) and not resumed.is_done(11)
+        assert resumed.results() == [{'url': 'u7', 'name': 'CCTV1', '_index': 7}]
+
+    def test_mismatch_or_fresh_start_discards_old_state(self, tmp_path):
+        checkpoint = ScanCheckpoint.open(_EXPR, 255, directory=str(tmp_path))
+        checkpoint.mark(0, False)
+        checkpoint.save()
+        assert ScanCheckpoint.open(_EXPR, 300, directory=str(tmp_path)).cursor == 0
+        checkpoint.save(force=True)
+        assert ScanCheckpoint.open(_EXPR, 255, resume=False, directory=str(tmp_path)).cursor == 0
+        assert not os.path.exists(checkpoint.path)
+
+    def test_results_appended_between_saves(self, tmp_path):
+        checkpoint = ScanCheckpoint.open(_EXPR, 255, directory=str(tmp_path))
+        checkpoint.mark(0, True, {'url': 'u0'})
+        checkpoint.save()
+        checkpoint.mark(1, True, {'url': 'u1'})
+        checkpoint.mark(2, False)
+        checkpoint.save()
+        with open(checkpoint.path, encoding='utf-8') as f:
+            assert 'results' not in json.load(f)
+        with open(checkpoint.results_path, encoding='utf-8') as f:
+            assert [json.loads(line)['url'] for line in f] == ['u0', 'u1']
+
+        # 追加结果后、替换状态文件前崩溃：多出的行在续扫时截掉
+        with open(checkpoint.results_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'url': 'u3', '_index': 3}) + '\n{"url": "u4"')
+        resumed = ScanCheckpoint.open(_EXPR, 255, directory=str(tmp_path))
+        assert resumed.cursor == 3 and not resumed.is_done(3)
+        assert [item['url'] for item in resumed.results()] == ['u0', 'u1']
+        resumed.mark(3, True, {'url': 'u3'})
+        resumed.save()
+        assert [item['_index'] for item in resumed.results()] == [0, 1, 3]
+        resumed.delete()
+        assert not os.path.exists(resumed.results_path)
+
+    def test_append_scan_skips_existing_urls(self, tmp_path):
+        from models.channel_model import ChannelListModel
+        from services.scanner_service import ScannerController
+        from services.url_parser_service import ORDER_SEQUENTIAL, URLRangeParser
+
+        scanner = ScannerController(ChannelListModel())
+        scanner._url_space = URLRangeParser().compile('http://h/[1-5]')
+        scanner._scan_order, scanner._scan_seed = ORDER_SEQUENTIAL, None
+        scanner._checkpoint = ScanCheckpoint.open('http://h/[1-5]', 5, directory=str(tmp_path))
+        scanner._skip_urls = {'http://h/2', 'http://h/4'}
+        scanner.stats['total'] = 5
+        assert list(scanner._iter_range_items()) == [('http://h/1', 0), ('http://h/3', 2), ('http://h/5', 4)]
+        # 已有的 URL 不计入总数，断点中记为已完成，游标不会停在它们前面
+        assert scanner.stats['total'] == 3
+        assert scanner._checkpoint.is_done(3) and scanner._checkpoint.valid_count == 0
@@ -0,0 +1,66 @@
+import os
+import queue
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import scan_farm  # noqa: E402
+from services.scan_farm import ScanFarm, _RecordSink, _done_filter  # noqa: E402
+
+
+class TestScanFarm:
+    def test_record_sink_batches_compact_records(self, monkeypatch):
+        monkeypatch.setattr(scan_farm, '_BATCH_SIZE', 2)
+        out = queue.Queue()
+        sink = _RecordSink(out, shard=3)
+        sink.add(0, 'http://h/1', {'valid': False, 'error_type': 'timeout'})
+        assert out.empty()
+        sink.add(1, 'http://h/cctv1', {'valid': True, 'latency': 80, 'resolution': '1920x1080'})
+        kind, records = out.get_nowait()
+        assert kind == 'records' and records[0] == (0, 'http://h/1', 'timeout', False, None)
+        channel = records[1][4]
+        assert channel['url'] == 'http://h/cctv1' and 'quality_score' in channel
+        sink.add(2, 'http://h/2', {'valid': False, 'error_type': 'refused', 'prefiltered': True})
+        sink.close()
+        assert out.get_nowait()[1] == [(2, 'http://h/2', 'refused', True, None)]
+        assert out.get_nowait() == ('done', 3)
+
+    def test_done_filter_uses_checkpoint_snapshot(self):
+        is_done = _done_filter((8, 8, bytes([0b00000101])))
+        assert is_done(7) and is_done(8) and not is_done(9) and is_done(10)
+        assert _done_filter(None) is None
+
+    def test_processes_cover_disjoint_shards(self):
+        records, finished = [], []
+        # 本机未监听的端口：预筛选直接以连接被拒淘汰，不需要 ffprobe
+        farm = ScanFarm(
+            {'expression': 'http://127.0.0.1:[1-30]/live', 'timeout': 1, 'engine': 'ffprobe',
+             'threads': 2, 'max_limit': 2, 'prefilter': True, 'start': 0,
+             'done': (0, 0, bytes([0x0F])), 'skip_urls': frozenset({'http://127.0.0.1:6/live'})},
+            processes=2, on_records=records.extend, on_finished=lambda: finished.append(True)
+        )
+        farm.start().join(60)
+        assert finished == [True]
+        assert sorted(record[0] for record in records) == list(range(4, 30))
+        # 追加扫描跳过的已有 URL 不探测，以专门的记录告知主进程
+        assert [record for record in records if record[0] == 5] == [
+            (5, 'http://127.0.0.1:6/live', scan_farm.SKIPPED_EXISTING, False, None)
+        ]
+
+    def test_native_probe_option_applied_in_worker(self, monkeypatch):
+        from services.ffprobe_validator_service import FfprobeStreamValidator
+        # 子进程中类属性是默认值（开启），关闭选项必须显式下发
+        monkeypatch.setattr(FfprobeStreamValidator, '_native_probe', True)
+        captured = {}
+        monkeypatch.setattr(scan_farm, '_run_threads',
+                            lambda validator, prefilter, *args: captured.update(prefilter=prefilter))
+        config = {'expression': 'udp://239.1.1.[1-2]:5000', 'engine': 'ffprobe', 'shard': 0, 'shards': 1,
+                  'native_ts_probe': False}
+        scan_farm._run_shard(config, _RecordSink(queue.Queue(), 0), threading.Event())
+        assert FfprobeStreamValidator._native_probe is False
+        assert captured['prefilter'].skip_udp is False
+
+        scan_farm._run_shard(dict(config, native_ts_probe=True), _RecordSink(queue.Queue(), 0), threading.Event())
+        assert FfprobeStreamValidator._native_probe is True
+        assert captured['prefilter'].skip_udp is True
@@ -0,0 +1,92 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from core import startup_cache  # noqa: E402
+from utils.lazy_component import LazyComponent, peek_component  # noqa: E402
+
+# 导入 pyqt_player 时项目模块自身耗时之和的上限（毫秒）；开发机实测约 300ms，
+# 其中大半是 PySide6 在模块级首次访问 Qt 枚举时的构建开销
+IMPORT_BUDGET_MS = 600
+
+# 启动时不应导入的模块：按需创建的功能、对话框、内置翻译源码、requests
+LAZY_MODULES = (
+    'controllers.pip_controller',
+    'controllers.multi_screen_controller',
+    'ui.multi_screen_widget',
+    'services.clip_export_service',
+    'services.scene_detect_service',
+    'core.builtin_translations',
+    'requests',
+)
+
+_PROBE = (
+    "import json, sys\n"
+    "from utils import startup_profiler\n"
+    "startup_profiler.enable()\n"
+    "import pyqt_player\n"
+    "print(json.dumps({'report': startup_profiler.import_report(), 'modules': sorted(sys.modules)}))\n"
+)
+
+
+class TestStartupCache:
+    def test_compiled_cache_rebuilt_when_stamp_changes(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(startup_cache, 'CACHE_DIR', str(tmp_path))
+        builds = []
+
+        def build():
+            builds.append(1)
+            return {'zh': {'play': '播放'}}
+
+        assert startup_cache.load_compiled('t', 'v1', build) == {'zh': {'play': '播放'}}
+        assert startup_cache.load_compiled('t', 'v1', build) == {'zh': {'play': '播放'}}
+        assert len(builds) == 1
+        startup_cache.load_compiled('t', 'v2', build)
+        assert len(builds) == 2
+        (tmp_path / 't.bin').write_bytes(b'broken')
+        assert startup_cache.load_compiled('t', 'v2', build)['zh']['play'] == '播放'
+        assert len(builds) == 3
+
+    def test_translations_match_source(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(startup_cache, 'CACHE_DIR', str(tmp_path))
+        from core.builtin_translations import BUILTIN_TRANSLATIONS
+        from core.language_manager import _load_builtin_translations
+        assert _load_builtin_translations() == BUILTIN_TRANSLATIONS
+
+
+class _Window:
+    ref = LazyComponent('weakref', 'ref', '测试组件')
+    broken = LazyComponent('collections', 'NoSuchClass', '损坏组件')
+
+
+class TestLazyComponent:
+    def test_created_on_first_access_only(self):
+        w = _Window()
+        assert peek_component(w, 'ref') is None
+        component = w.ref
+        assert component() is w and w.ref is component
+        assert peek_component(w, 'ref') is component
+        # 创建失败时记为 None，不反复重试
+        assert w.broken is None and 'broken' in vars(w)
+
+
+class TestStartupImports:
+    def test_import_budget_and_lazy_modules(self, tmp_path):
+        env = dict(os.environ, QT_QPA_PLATFORM='offscreen', PYTHONPYCACHEPREFIX=str(tmp_path / 'pyc'))
+        env.pop('PYTHONDONTWRITEBYTECODE', None)
+        result = None
+        # 第一次运行生成字节码缓存，第二次的耗时才有意义
+        for _ in range(2):
+            result = subprocess.run([sys.executable, '-c', _PROBE], cwd=ROOT, env=env,
+                                    capture_output=True, text=True, timeout=120)
+            assert result.returncode == 0, result.stderr
+        data = json.loads(result.stdout.strip().splitlines()[-1])
+        loaded = set(data['modules'])
+        assert not [m for m in LAZY_MODULES if m in loaded]
+        assert not [m for m in loaded if m.startswith('ui.dialogs.')]
+        report = data['report']
+        assert report['project_ms'] < IMPORT_BUDGET_MS, report['modules']
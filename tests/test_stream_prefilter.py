@@ -0,0 +1,116 @@
+import asyncio
+import os
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.stream_prefilter import StreamPrefilter, has_ts_sync  # noqa: E402
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.startswith('/live'):
+            self.send_response(206)
+            self.end_headers()
+            self.wfile.write(b'\x47' * 188)
+        else:
+            self.send_response(404)
+            self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def _free_udp_port():
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    s.bind(('127.0.0.1', 0))
+    port = s.getsockname()[1]
+    s.close()
+    return port
+
+
+def _send_udp_later(port, payload, delay=0.2):
+    def _send():
+        time.sleep(delay)
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        for _ in range(5):
+            s.sendto(payload, ('127.0.0.1', port))
+            time.sleep(0.05)
+        s.close()
+    threading.Thread(target=_send, daemon=True).start()
+
+
+class TestTsSync:
+    def test_raw_ts(self):
+        assert has_ts_sync(b'\x47' + b'\x00' * 187)
+
+    def test_rtp_wrapped_ts(self):
+        rtp_header = bytes([0x80, 33]) + b'\x00' * 10
+        assert has_ts_sync(rtp_header + b'\x47' + b'\x00' * 187)
+
+    def test_rtp_with_csrc(self):
+        rtp_header = bytes([0x82, 33]) + b'\x00' * 10 + b'\x00' * 8
+        assert has_ts_sync(rtp_header + b'\x47')
+
+    def test_not_ts(self):
+        assert not has_ts_sync(b'')
+        assert not has_ts_sync(b'\x00\x01\x02\x03')
+        assert not has_ts_sync(bytes([0x80, 33]) + b'\x00' * 10 + b'\x00' * 188)
+
+
+class TestStreamPrefilter:
+    @classmethod
+    def setup_class(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        cls.base = f'http://127.0.0.1:{cls.server.server_address[1]}'
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def teardown_class(cls):
+        cls.server.shutdown()
+
+    def setup_method(self):
+        self.prefilter = StreamPrefilter(timeout=2, udp_dwell=1)
+
+    def test_http_alive_passes(self):
+        assert self.prefilter.check(f'{self.base}/live/1.ts') is None
+
+    def test_http_404_rejected(self):
+        assert self.prefilter.check(f'{self.base}/missing.ts')[0] == 'http_404'
+
+    def test_refused_rejected(self):
+        assert self.prefilter.check('rtsp://127.0.0.1:1/stream')[0] == 'connection_refused'
+
+    def test_unknown_scheme_passes(self):
+        assert self.prefilter.check('mms://example/stream') is None
+
+    def test_udp_first_ts_datagram_passes(self):
+        port = _free_udp_port()
+        _send_udp_later(port, b'\x47' + b'\x11' * 187)
+        assert self.prefilter.check(f'udp://@127.0.0.1:{port}') is None
+
+    def test_udp_silent_rejected(self):
+        port = _free_udp_port()
+        assert self.prefilter.check(f'udp://@127.0.0.1:{port}')[0] == 'timeout'
+
+    def test_async_matches_sync(self):
+        port = _free_udp_port()
+        _send_udp_later(port, b'\x47' + b'\x11' * 187)
+
+        async def _run():
+            return await asyncio.gather(
+                self.prefilter.check_async(f'{self.base}/live/2.ts'),
+                self.prefilter.check_async(f'{self.base}/missing.ts'),
+                self.prefilter.check_async('http://127.0.0.1:1/x'),
+                self.prefilter.check_async(f'rtp://127.0.0.1:{port}'),
+            )
+
+        alive, missing, refused, udp = asyncio.run(_run())
+        assert alive is None
+        assert missing[0] == 'http_404'
+        assert refused[0] == 'connection_refused'
+        assert udp is None
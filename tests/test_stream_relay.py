@@ -0,0 +1,105 @@
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import aiohttp  # noqa: E402
+from aiohttp import web  # noqa: E402
+
+from server import stream_relay  # noqa: E402
+from server.stream_relay import get_stream_relay_hub, split_ts_blocks  # noqa: E402
+
+
+def _packet(pid, pusi=False, keyframe=False, fill=0):
+    header = bytes((0x47, (0x40 if pusi else 0) | (pid >> 8), pid & 0xFF))
+    if keyframe:
+        # adaptation field + payload，random_access_indicator 置位
+        return header + bytes((0x30, 1, 0x40)) + bytes([fill]) * 182
+    return header + bytes((0x10,)) + bytes([fill]) * 184
+
+
+def _gop(index):
+    """PAT + PMT + 关键帧 + 若干普通包"""
+    packets = [_packet(0, pusi=True), _packet(0x1000, pusi=True), _packet(0x100, pusi=True, keyframe=True)]
+    packets += [_packet(0x100, fill=index % 256) for _ in range(20)]
+    return b''.join(packets)
+
+
+class TestTsBlocks:
+    def test_split_at_pat_and_mark_keyframes(self):
+        data = _packet(0x100) + _gop(1) + _packet(0, pusi=True) + _packet(0x100)
+        blocks = split_ts_blocks(data)
+        assert [len(b) // 188 for b, _, _ in blocks] == [1, 23, 2]
+        assert [(pat, key) for _, pat, key in blocks] == [(False, False), (True, True), (True, False)]
+        assert b''.join(b for b, _, _ in blocks) == data
+
+
+class TestStreamRelay:
+    def test_viewers_share_one_upstream(self):
+        hits = []
+
+        async def upstream(request):
+            hits.append(request.path)
+            response = web.StreamResponse(headers={'Content-Type': 'video/mp2t'})
+            await response.prepare(request)
+            # 不对齐的起始垃圾字节，验证重新对齐
+            await response.write(b'\x00\x01')
+            for i in range(40):
+                await response.write(_gop(i))
+                await asyncio.sleep(0.02)
+            await response.write_eof()
+            return response
+
+        async def read(subscriber, limit=None):
+            data = b''
+            async for chunk in subscriber:
+                data += chunk
+                if limit and len(data) >= limit:
+                    break
+            return data
+
+        async def run():
+            app = web.Application()
+            app.router.add_get('/live.ts', upstream)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, '127.0.0.1', 0)
+            await site.start()
+            url = f'http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/live.ts'
+            async with aiohttp.ClientSession() as session:
+                hub = get_stream_relay_hub()
+                relay, first = hub.subscribe(url, session)
+                assert await relay.wait_ready() == (200, 'video/mp2t')
+                first_task = asyncio.ensure_future(read(first))
+                await asyncio.sleep(0.3)
+                late_relay, late = hub.subscribe(url, session)
+                late_data = await read(late, limit=188 * 23)
+                late.close()
+                first_data = await first_task
+                first.close()
+            await runner.cleanup()
+            return relay, late_relay, first_data, late_data
+
+        relay, late_relay, first_data, late_data = asyncio.run(run())
+        assert hits == ['/live.ts'] and late_relay is relay
+        assert first_data == b''.join(_gop(i) for i in range(40))
+        # 后加入的客户端从 PAT 开始，紧接着是关键帧
+        assert late_data[:3] == b'\x47\x40\x00' and late_data[2 * 188 + 5] & 0x40
+
+    def test_slow_subscriber_dropped(self, monkeypatch):
+        monkeypatch.setattr(stream_relay, '_SUBSCRIBER_MAX_PENDING', 188 * 30)
+
+        async def run():
+            hub = get_stream_relay_hub()
+            relay = stream_relay.StreamRelay(hub, 'http://example/live.ts', None)
+            slow, fast = relay.subscribe(), relay.subscribe()
+            received = []
+            for i in range(3):
+                relay._publish(_gop(i), True, True)
+                received.append(await fast.__anext__())
+            return slow, fast, received
+
+        slow, fast, received = asyncio.run(run())
+        assert slow.dropped and slow.closed
+        assert not fast.dropped and len(received) == 3
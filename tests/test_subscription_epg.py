@@ -0,0 +1,272 @@
+import gzip
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.subscription_manager import SubscriptionManager  # noqa: E402
+
+
+def _xmltv(encoding='utf-8', programmes=50):
+    lines = [f'<?xml version="1.0" encoding="{encoding}"?>', '<tv>',
+             '<channel id="CCTV1"><display-name>CCTV-1 综合</display-name></channel>',
+             '<channel id="HNWS"><display-name>湖南卫视</display-name></channel>']
+    for i in range(programmes):
+        channel = 'CCTV1' if i % 2 else 'HNWS'
+        lines.append(
+            f'<programme channel="{channel}" start="20260101{i % 24:02d}0000 +0800" '
+            f'stop="20260101{i % 24:02d}3000 +0800"><title>节目{i}</title><desc>简介{i}</desc></programme>'
+        )
+    lines.append('</tv>')
+    return '\n'.join(lines).encode(encoding)
+
+
+_BODIES = {
+    '/guide.xml': (_xmltv(), {}),
+    '/guide.xml.gz': (gzip.compress(_xmltv()), {}),
+    '/guide-ce.xml': (gzip.compress(_xmltv()), {'Content-Encoding': 'gzip'}),
+    '/guide-gbk.xml': (_xmltv('gbk'), {}),
+    '/guide.json': (b'{"X": [{"title": "t", "desc": "", "start": "s", "end": "e"}]}', {}),
+    '/slow-a.json': (b'{"CCTV1": [{"title": "A", "desc": "", "start": "s", "end": "e"}]}', {}),
+    '/fast-b.json': (b'{"CCTV1": [{"title": "B", "desc": "", "start": "s", "end": "e"}], "B": []}', {}),
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    not_modified = 0
+
+    def do_GET(self):
+        if self.path.startswith('/slow'):
+            time.sleep(0.8)
+        if self.path == '/always-304.xml':
+            _Handler.not_modified += 1
+            self.send_response(304)
+            self.end_headers()
+            return
+        if self.path == '/etag.xml':
+            if self.headers.get('If-None-Match') == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            body, headers = _xmltv(), {'ETag': '"v1"'}
+        elif self.path == '/plain.xml':
+            body, headers = _xmltv(), {}
+        else:
+            body, headers = _BODIES[self.path]
+        self.send_response(200)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestEpgStreaming:
+    @classmethod
+    def setup_class(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        cls.base = f'http://127.0.0.1:{cls.server.server_address[1]}'
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.manager = SubscriptionManager()
+        cls.expected = cls.manager._parse_xml_epg(_xmltv().decode('utf-8'))
+
+    @classmethod
+    def teardown_class(cls):
+        cls.server.shutdown()
+
+    @pytest.fixture(autouse=True)
+    def _isolated_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(self.manager, '_get_cache_dir', lambda: str(tmp_path))
+        monkeypatch.setattr(self.manager, '_epg_validators', None)
+
+    def test_expected_reference(self):
+        assert len(self.expected['CCTV1']) == 25
+        assert len(self.expected['HNWS']) == 25
+
+    def test_plain_xml(self):
+        from services.epg_store import EpgStore
+        data = self.manager._load_single_epg(f'{self.base}/guide.xml')
+        # 节目边解析边写入该源的缓存，返回映射缓存文件的 EpgStore
+        assert isinstance(data, EpgStore) and data == self.expected
+
+    def test_gzip_file(self):
+        assert self.manager._load_single_epg(f'{self.base}/guide.xml.gz') == self.expected
+
+    def test_gzip_content_encoding(self):
+        assert self.manager._load_single_epg(f'{self.base}/guide-ce.xml') == self.expected
+
+    def test_gbk_falls_back_to_buffered(self):
+        assert self.manager._load_single_epg(f'{self.base}/guide-gbk.xml') == self.expected
+
+    def test_json(self):
+        assert list(self.manager._load_single_epg(f'{self.base}/guide.json')) == ['X']
+
+    def test_parallel_load_keeps_source_priority(self, monkeypatch):
+        manager = self.manager
+        sources = [{'name': 'A', 'url': f'{self.base}/slow-a.json'},
+                   {'name': 'B', 'url': f'{self.base}/fast-b.json'},
+                   {'name': 'C', 'url': f'{self.base}/slow-a.json'}]
+        monkeypatch.setattr(manager, 'get_epg_sources', lambda: sources)
+        monkeypatch.setattr(manager, 'update_epg_source_last_update', lambda *args: None)
+        monkeypatch.setattr(manager, '_save_epg_cache', lambda data: None)
+        monkeypatch.setattr(manager, '_notify_update_callbacks', lambda: None)
+        saved = manager._epg_data, manager._epg_index
+        try:
+            start = time.monotonic()
+            assert manager.load_all_epg_data()
+            assert time.monotonic() - start < 1.5
+            assert manager.get_channel_epg('CCTV1')[0]['title'] == 'A'
+            assert 'B' in manager._epg_data
+        finally:
+            manager._epg_data, manager._epg_index = saved
+
+    def test_merge_copies_records_without_decoding(self, monkeypatch):
+        from services import epg_store
+        manager = self.manager
+        sources = [{'name': 'A', 'url': f'{self.base}/guide.xml'},
+                   {'name': 'B', 'url': f'{self.base}/plain.xml'},
+                   {'name': 'C', 'url': f'{self.base}/guide.json'}]
+        monkeypatch.setattr(manager, 'get_epg_sources', lambda: sources)
+        monkeypatch.setattr(manager, 'update_epg_source_last_update', lambda *args: None)
+        monkeypatch.setattr(manager, '_notify_update_callbacks', lambda: None)
+        decoded = []
+        original = epg_store._MappedFile.programmes
+        monkeypatch.setattr(epg_store._MappedFile, 'programmes',
+                            lambda self, first, count: decoded.append(count) or original(self, first, count))
+        saved = manager._epg_data, manager._epg_index, manager._epg_store
+        try:
+            assert manager.load_all_epg_data()
+            # 合并只按频道ID进行，节目记录从各源缓存直接复制到合并缓存
+            assert decoded == []
+            assert isinstance(manager._epg_data, epg_store.EpgStore)
+            assert list(manager._epg_data) == ['CCTV1', 'HNWS', 'X']
+            assert manager.get_epg_program_count() == 51
+            assert manager._epg_data['CCTV1'] == self.expected['CCTV1']
+        finally:
+            manager._epg_data, manager._epg_index, manager._epg_store = saved
+
+    def test_unchanged_sources_skip_parsing(self, monkeypatch):
+        import tempfile
+        manager = self.manager
+        parsed = []
+        spooled = []
+
+        class _Spooled(tempfile.SpooledTemporaryFile):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                spooled.append(self)
+
+        monkeypatch.setattr(tempfile, 'SpooledTemporaryFile', _Spooled)
+        original = manager._parse_epg_stream
+        monkeypatch.setattr(manager, '_parse_epg_stream',
+                            lambda *args: parsed.append(1) or original(*args))
+
+        for path in ('/etag.xml', '/plain.xml'):
+            url = f'{self.base}{path}'
+            first, unchanged = manager._fetch_epg_source(url, {})
+            assert first == self.expected and not unchanged
+            parsed.clear()
+            second, unchanged = manager._fetch_epg_source(url, {})
+            assert unchanged and parsed == []
+            assert dict(second) == self.expected
+        # 不支持条件请求的源先落地比对哈希，临时文件在提前返回时也要关闭
+        assert spooled and all(f.closed for f in spooled)
+
+    def test_304_without_cache_retries_once(self):
+        _Handler.not_modified = 0
+        assert self.manager._fetch_epg_source(f'{self.base}/always-304.xml', {}) == ({}, False)
+        assert _Handler.not_modified == 2
+
+
+class TestEpgStore:
+    def test_roundtrip(self, tmp_path):
+        import copy
+        from services.epg_store import EpgStore, write_epg_store
+        data = {
+            'CCTV1': [
+                {'title': '新闻联播', 'desc': '', 'start': '2026-01-01T19:00:00', 'end': '2026-01-01T19:30:00'},
+                {'title': '焦点访谈', 'desc': '简介', 'start': '2026-01-01T19:30:00', 'end': '2026-01-01T19:45:00'},
+            ],
+            'EMPTY': [],
+            'JSON': [{'title': 't', 'start': '2026-01-01T08:00:00+08:00', 'end': 'x', 'extra': 1}],
+        }
+        path = str(tmp_path / 'epg_cache.bin')
+        write_epg_store(path, data, {'CCTV1': 'CCTV-1 综合'})
+        store = EpgStore(path)
+        assert dict(store) == data
+        assert store.program_count() == 3
+        assert store.channel_names() == {'CCTV1': 'CCTV-1 综合'}
+
+        view = copy.deepcopy(store)
+        view['NEW'] = []
+        assert 'NEW' in view and 'NEW' not in store
+        store.close()
+        assert store['CCTV1'] == []
+
+    @pytest.mark.skipif(not hasattr(time, 'tzset'), reason='需要 time.tzset')
+    def test_dst_gap_times_kept_verbatim(self, tmp_path, monkeypatch):
+        from services.epg_store import EpgStore, _to_epoch, write_epg_store
+        monkeypatch.setenv('TZ', 'Europe/Berlin')
+        time.tzset()
+        try:
+            # 2026-03-29 02:00 → 03:00 夏令时跳过，02:30 这个本地时间不存在
+            assert _to_epoch('2026-03-29T02:30:00') is None
+            assert _to_epoch('2026-03-29T03:30:00') is not None
+            data = {'X': [{'title': 't', 'desc': '', 'start': '2026-03-29T02:30:00', 'end': '2026-03-29T03:30:00'}]}
+            path = str(tmp_path / 'dst.bin')
+            write_epg_store(path, data)
+            store = EpgStore(path)
+            assert dict(store) == data
+            store.close()
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+    def test_writer_groups_interleaved_programmes(self, tmp_path):
+        from services.epg_store import EpgStoreWriter
+        programmes = [
+            ('A', {'title': 'a1', 'desc': '', 'start': '2026-01-01T08:00:00', 'end': '2026-01-01T09:00:00'}),
+            ('B', {'title': 'b1', 'desc': 'x', 'start': '2026-01-01T08:00:00', 'end': '2026-01-01T08:30:00'}),
+            ('A', {'title': 'a2', 'desc': '', 'start': '2026-01-01T09:00:00', 'end': 'x'}),
+        ]
+        writer = EpgStoreWriter(str(tmp_path / 'source.bin'))
+        writer.add_channel('EMPTY')
+        for channel_id, programme in programmes:
+            writer.add(channel_id, programme)
+        store = writer.finish({'A': '频道A'})
+        assert list(store) == ['EMPTY', 'A', 'B']
+        assert dict(store) == {'EMPTY': [], 'A': [programmes[0][1], programmes[2][1]], 'B': [programmes[1][1]]}
+        assert store.channel_names() == {'A': '频道A'}
+        store.close()
+
+    def test_manager_save_and_load(self, tmp_path, monkeypatch):
+        from services.epg_store import EpgStore
+        manager = SubscriptionManager()
+        monkeypatch.setattr(manager, '_get_cache_dir', lambda: str(tmp_path))
+        saved = (manager._epg_data, manager._epg_channel_names,
+                 manager._epg_index, manager._epg_store)
+        try:
+            data = manager._parse_xml_epg(_xmltv().decode('utf-8'))
+            with manager._epg_lock:
+                manager._epg_data = data
+            manager._save_epg_cache(data)
+            assert isinstance(manager._epg_data, EpgStore)
+            assert dict(manager._epg_data) == data
+
+            with manager._epg_lock:
+                manager._epg_data = {}
+            assert manager.load_cached_epg_data()
+            assert manager.get_epg_program_count() == 50
+            assert manager.get_channel_epg('湖南卫视') == data['HNWS']
+        finally:
+            (manager._epg_data, manager._epg_channel_names,
+             manager._epg_index, manager._epg_store) = saved
+
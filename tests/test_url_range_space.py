@@ -0,0 +1,77 @@
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.url_parser_service import URLRangeParser, SCAN_ORDERS  # noqa: E402
+
+_EXPR = 'http://10.0.[1-3].[1-10,5-12]:80{a}/rtp/239.1.1.[01-2:a]'
+
+
+@pytest.fixture
+def parser():
+    return URLRangeParser()
+
+
+class TestURLRangeSpace:
+    def test_random_access_matches_sequential_expansion(self, parser):
+        space = parser.compile(_EXPR)
+        expanded = [url for batch in parser.parse_url(_EXPR, batch_size=7) for url in batch]
+        # 重叠区间 [1-10,5-12] 去重后为 12 个取值
+        assert len(space) == parser.estimate_url_count(_EXPR) == len(expanded) == 3 * 12 * 2
+        assert [space.url_at(i) for i in range(len(space))] == expanded
+        assert space[-1] == expanded[-1] == 'http://10.0.3.12:8002/rtp/239.1.1.02'
+        with pytest.raises(IndexError):
+            space.url_at(len(space))
+
+    @pytest.mark.parametrize('order', SCAN_ORDERS)
+    @pytest.mark.parametrize('interleave', [False, True])
+    def test_shards_are_disjoint_and_complete(self, parser, order, interleave):
+        space = parser.compile(_EXPR)
+        shards = [
+            list(space.iter_urls(k, 5, order=order, seed='x', interleave=interleave))
+            for k in range(5)
+        ]
+        indices = [index for shard in shards for index, _ in shard]
+        assert sorted(indices) == list(range(len(space)))
+        assert all(url == space.url_at(index) for shard in shards for index, url in shard)
+
+    def test_orders_and_resume_offset(self, parser):
+        space = parser.compile(_EXPR)
+        strided = list(space.iter_indices(order='strided'))[:3]
+        # 默认步长为最后一个变量的取值数，相邻探测落在不同主机上
+        assert strided == [0, 12, 24]
+        assert list(space.iter_indices(order='random', seed=1)) == \
+            list(space.iter_indices(order='random', seed=1))
+        assert [i for i, _ in space.iter_urls(start=70)] == [70, 71]
+        assert list(space.iter_indices(1, 2, start=5, interleave=True))[:2] == [5, 7]
+
+    @pytest.mark.parametrize('interleave', [False, True])
+    def test_shared_space_across_threads(self, parser, interleave):
+        # 扫描线程共享同一个 URLRangeSpace，并发拼接不能互相覆盖
+        space = parser.compile('http://10.[0-7].[0-31].[1-20]:[80-81]/x')
+        expected = list(parser.compile('http://10.[0-7].[0-31].[1-20]:[80-81]/x').iter_urls())
+        results = [None] * 8
+
+        def worker(k):
+            results[k] = list(space.iter_urls(k, 8, interleave=interleave))
+
+        original = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=worker, args=(k,)) for k in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            sys.setswitchinterval(original)
+        got = sorted(item for shard in results for item in shard)
+        assert got == expected
+
+    def test_plain_url_is_single_item(self, parser):
+        space = parser.compile('http://example.com/live.m3u8')
+        assert len(space) == 1 and list(space.iter_urls()) == [(0, 'http://example.com/live.m3u8')]
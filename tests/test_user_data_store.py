@@ -0,0 +1,117 @@
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.user_data_store import (  # noqa: E402
+    BOOKMARKS, FAVORITES, PLAY_HISTORY, RESUME_POSITIONS, UserDataStore, migrate_legacy_user_data
+)
+
+
+class _FakeConfig:
+    """只提供迁移与 FavoritesService 用到的 ConfigManager 接口"""
+
+    def __init__(self, sections, store=None):
+        self.sections = sections
+        self.saved = False
+        self.store = store
+
+    def get_value(self, section, key, default=None):
+        return self.sections.get(section, {}).get(key, default)
+
+    def _parse_int(self, value, default=0):
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return default
+
+    def remove_section(self, section):
+        self.sections.pop(section, None)
+
+    def save_config(self):
+        self.saved = True
+
+    def get_user_data_store(self):
+        return self.store
+
+
+class TestUserDataStore:
+    def test_writes_coalesced_and_visible_before_commit(self, tmp_path):
+        store = UserDataStore(str(tmp_path / 'user.db'), flush_delay=60)
+        for i in range(100):
+            store.put(RESUME_POSITIONS, 'http://a', {'position': i}, i)
+        store.put(RESUME_POSITIONS, 'http://b', {'position': 1}, 200)
+        store.delete(RESUME_POSITIONS, 'http://b')
+        assert store.get(RESUME_POSITIONS, 'http://a') == {'position': 99}
+        assert store.get(RESUME_POSITIONS, 'http://b') is None
+        assert store._pending_count == 2
+        assert store.items(RESUME_POSITIONS) == [('http://a', {'position': 99})]
+        store.close()
+        reopened = UserDataStore(str(tmp_path / 'user.db'))
+        assert reopened.get_meta('schema_version') == '1'
+        assert reopened.get(RESUME_POSITIONS, 'http://a') == {'position': 99}
+        reopened.close()
+
+    def test_limit_evicts_lowest_sort_key(self, tmp_path):
+        store = UserDataStore(str(tmp_path / 'user.db'))
+        store.set_limit(PLAY_HISTORY, 3)
+        for i in range(5):
+            store.put(PLAY_HISTORY, f'u{i}', {'url': f'u{i}'}, i)
+        assert [key for key, _ in store.items(PLAY_HISTORY)] == ['u4', 'u3', 'u2']
+        store.clear(PLAY_HISTORY)
+        assert store.get(PLAY_HISTORY, 'u4') is None and store.count(PLAY_HISTORY) == 0
+        store.close()
+
+
+class TestLegacyMigration:
+    def test_ini_and_json_imported_once(self, tmp_path):
+        favorites = [{'name': f'收藏{i}', 'url': f'http://f/{i}'} for i in range(3)]
+        history = [{'name': f'历史{i}', 'url': f'http://h/{i}'} for i in range(2)]
+        sections = {
+            'Favorites': {'count': '4', **{f'ch_{i}': json.dumps(c) for i, c in enumerate(favorites)},
+                          'ch_3': '{损坏'},
+            'PlayHistory': {'count': '2', **{f'ch_{i}': json.dumps(c) for i, c in enumerate(history)}},
+        }
+        resume_file = tmp_path / 'resume_positions.json'
+        resume_file.write_text(json.dumps({'http://r': {'url': 'http://r', 'position': 30.0, 'updated_at': 5}}))
+        bookmark_file = tmp_path / 'bookmarks.json'
+        bookmark_file.write_text(json.dumps({'http://r': [{'position': 1.0, 'name': '', 'created_at': 7}]}))
+        config = _FakeConfig(sections)
+        store = UserDataStore(str(tmp_path / 'user.db'))
+        migrate_legacy_user_data(store, config, str(resume_file), str(bookmark_file))
+
+        assert [c['name'] for _, c in store.items(FAVORITES, descending=False)] == ['收藏0', '收藏1', '收藏2']
+        assert [c['name'] for _, c in store.items(PLAY_HISTORY)] == ['历史0', '历史1']
+        assert store.get(RESUME_POSITIONS, 'http://r')['position'] == 30.0
+        assert store.get(BOOKMARKS, 'http://r')[0]['created_at'] == 7
+        assert config.saved and 'Favorites' not in config.sections
+        assert not resume_file.exists() and (tmp_path / 'resume_positions.json.migrated').exists()
+
+        # 再次打开不会重复导入
+        store.clear(FAVORITES)
+        migrate_legacy_user_data(store, _FakeConfig({'Favorites': sections.get('Favorites', {})}),
+                                 str(resume_file), str(bookmark_file))
+        assert store.count(FAVORITES) == 0
+        store.close()
+
+
+class TestFavoritesService:
+    def test_favorites_and_history_persisted(self, tmp_path):
+        from services.favorites_service import FavoritesService
+
+        store = UserDataStore(str(tmp_path / 'user.db'))
+        service = FavoritesService(_FakeConfig({}, store))
+        for i in range(3):
+            service.toggle_favorite({'name': f'频道{i}', 'url': f'http://c/{i}'})
+        service.toggle_favorite({'url': 'http://c/1'})
+        for i in range(FavoritesService.MAX_HISTORY + 5):
+            service.record_play({'name': f'频道{i}', 'url': f'http://c/{i}'})
+        service.record_play({'name': '频道0', 'url': 'http://c/0'})
+
+        reloaded = FavoritesService(_FakeConfig({}, store))
+        assert [f['url'] for f in reloaded.get_favorites()] == ['http://c/0', 'http://c/2']
+        history = reloaded.get_play_history()
+        assert len(history) == FavoritesService.MAX_HISTORY and history[0]['url'] == 'http://c/0'
+        assert store.count(PLAY_HISTORY) == FavoritesService.MAX_HISTORY
+        store.close()
@@ -197,7 +197,7 @@ class ScanChannelDialog(FloatingDialog):
             engine = settings.get('engine', 'ffprobe')
         except Exception:
             pass
-        if engine == 'ffprobe':
+        if engine in ('ffprobe', 'async'):
             from services.ffprobe_validator_service import FfprobeStreamValidator
             return FfprobeStreamValidator
         else:
@@ -580,6 +580,7 @@ class ScanChannelDialog(FloatingDialog):
         self.scan_engine_combo = QtWidgets.QComboBox()
         self.scan_engine_combo.addItem(tr('scan_engine_ffprobe', 'ffprobe (Detailed)'), "ffprobe")
         self.scan_engine_combo.addItem(tr('scan_engine_mpv', 'mpv (Lightweight)'), "mpv")
+        self.scan_engine_combo.addItem(tr('scan_engine_async', 'asyncio (High Concurrency)'), "async")
         self.scan_engine_combo.setFixedHeight(28)
         self.scan_engine_combo.setToolTip(
             tr("scan_engine_tooltip", "Select the core engine for scanning and validation")
@@ -626,6 +627,14 @@ class ScanChannelDialog(FloatingDialog):
         )
         self.enable_retry_checkbox.setChecked(False)
         retry_layout.addWidget(self.enable_retry_checkbox)
+
+        # 是否从断点继续范围扫描（每次扫描单独选择，不保存）
+        self.resume_scan_checkbox = QtWidgets.QCheckBox(tr("resume_from_checkpoint", "Resume From Checkpoint"))
+        self.resume_scan_checkbox.setToolTip(
+            tr("resume_from_checkpoint_tooltip", "Resume an interrupted scan of the same range")
+        )
+        self.resume_scan_checkbox.setChecked(False)
+        retry_layout.addWidget(self.resume_scan_checkbox)
         retry_layout.addStretch()
 
         # 连接复选框状态变化信号，保存设置
@@ -847,6 +856,8 @@ class ScanChannelDialog(FloatingDialog):
             options_section.addLayout(self.scan_engine_layout)
         self.enable_retry_checkbox.setFixedHeight(24)
         options_section.addWidget(self.enable_retry_checkbox)
+        self.resume_scan_checkbox.setFixedHeight(24)
+        options_section.addWidget(self.resume_scan_checkbox)
         self.enable_mapping_checkbox.setFixedHeight(24)
         options_section.addWidget(self.enable_mapping_checkbox)
 
@@ -1475,10 +1486,8 @@ class ScanChannelDialog(FloatingDialog):
                 if logo:
                     updates.append((i, logo))
 
-            self.model.layoutAboutToBeChanged.emit()
             for i, logo in updates:
                 self.model.setData(self.model.index(i, CLM.COL_LOGO), logo)
-            self.model.layoutChanged.emit()
             self._invalidate_channels_cache()
 
             result_dialog = FloatingDialog(self, stay_on_top=True)
@@ -2040,7 +2049,7 @@ class ScanChannelDialog(FloatingDialog):
             return
         parent = self.parent()
         if parent and hasattr(parent, 'play_channel'):
-            parent.play_channel(channel)
+            parent.play_channel(dict(channel))
             parent.activateWindow()
             parent.raise_()
 
@@ -2483,7 +2492,8 @@ class ScanChannelDialog(FloatingDialog):
 
         self.scanner.start_scan(
             url, scan_threads, scan_timeout,
-            user_agent=user_agent, referer=referer, skip_urls=skip_urls
+            user_agent=user_agent, referer=referer, skip_urls=skip_urls,
+            resume=self.resume_scan_checkbox.isChecked()
         )
 
         self._set_scan_model()
@@ -2529,6 +2539,7 @@ class ScanChannelDialog(FloatingDialog):
         self.btn_save_txt.setEnabled(not disabled)
         self.btn_batch_ops.setEnabled(not disabled)
         self.enable_retry_checkbox.setEnabled(not disabled)
+        self.resume_scan_checkbox.setEnabled(not disabled)
         self.enable_mapping_checkbox.setEnabled(not disabled)
 
     def _reset_scan_buttons(self):
@@ -2792,28 +2803,28 @@ class ScanChannelDialog(FloatingDialog):
             return
 
         try:
-            from services.m3u_parser import load_m3u_file
-            content = load_m3u_file(file_path)
-
-            if not self.model.load_from_file(content):
-                self.logger.warning("解析M3U文件失败")
-                return
-
-            count = self.model.rowCount()
-            self.logger.info(f"已导入 {count} 个频道到扫描列表")
-
-            if hasattr(self, 'channel_list'):
-                header = self.channel_list.horizontalHeader()
-                header.resizeSections(QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
-
-            self.btn_hide_invalid.setEnabled(True)
-            self.btn_hide_invalid.setStyleSheet(AppStyles.button_style(active=True))
-
+            # 流式导入：频道分批进入扫描列表，大文件也能立即看到首批结果
+            self.model.load_from_path(file_path, on_finished=self._on_list_file_loaded)
         except FileNotFoundError:
             self.logger.warning(f"文件不存在: {file_path}")
         except Exception as e:
             self.logger.error(f"打开列表文件失败: {str(e)}")
 
+    def _on_list_file_loaded(self, success: bool):
+        if not success:
+            self.logger.warning("解析M3U文件失败")
+            return
+
+        count = self.model.rowCount()
+        self.logger.info(f"已导入 {count} 个频道到扫描列表")
+
+        if hasattr(self, 'channel_list'):
+            header = self.channel_list.horizontalHeader()
+            header.resizeSections(QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
+
+        self.btn_hide_invalid.setEnabled(True)
+        self.btn_hide_invalid.setStyleSheet(AppStyles.button_style(active=True))
+
     def _on_generate_clicked(self):
         """处理直接生成列表按钮点击事件"""
         url = self.ip_range_input.currentText()
@@ -3045,7 +3056,8 @@ class ScanChannelDialog(FloatingDialog):
         remaining_invalid = []
         for url in getattr(self, '_validation_retry_urls', []):
             if url in found_urls and url in url_to_index:
-                idx = url_to_index[url]
+                # 列表处于排序状态时更新会移动行，按 URL 重新定位
+                idx = self.model.find_row_by_url(url)
                 self.model.update_channel(idx, {'valid': True, 'status': self.language_manager.tr('valid', '有效')})
                 newly_valid += 1
             else:
@@ -3231,6 +3243,7 @@ class ScanChannelDialog(FloatingDialog):
                     if hasattr(AppStyles, 'scroll_area_style') else ''
                 )
             for chk in [getattr(self, 'enable_retry_checkbox', None),
+                        getattr(self, 'resume_scan_checkbox', None),
                         getattr(self, 'enable_mapping_checkbox', None)]:
                 if chk and hasattr(chk, 'setStyleSheet'):
                     chk.setStyleSheet(AppStyles.common_check_box_style())
@@ -3290,6 +3303,8 @@ class ScanChannelDialog(FloatingDialog):
                 self.retry_label.setText(f"{tr('scan_retry_options', 'Scan Retry Options')}：")
             if hasattr(self, 'enable_retry_checkbox'):
                 self.enable_retry_checkbox.setText(tr("enable_smart_retry", "Enable Smart Retry"))
+            if hasattr(self, 'resume_scan_checkbox'):
+                self.resume_scan_checkbox.setText(tr("resume_from_checkpoint", "Resume From Checkpoint"))
             if hasattr(self, 'mapping_label'):
                 self.mapping_label.setText(f"{tr('mapping_options', 'Mapping Options')}：")
             if hasattr(self, 'enable_mapping_checkbox'):
@@ -79,6 +79,8 @@ class AppStyles:
     _sort_down_cache = {}
     _colors_cache = None
     _colors_cache_key = None
+    # 生成的 QSS：(颜色模式, 视觉风格, 样式函数名, 参数) -> 文本，见 _cache_style_builders
+    _qss_cache = {}
 
     # 固定颜色常量（不随主题变化）
     COLOR_WHITE          = '#ffffff'
@@ -1021,6 +1023,7 @@ class AppStyles:
     def _invalidate_caches(cls):
         cls._colors_cache = None
         cls._colors_cache_key = None
+        cls._qss_cache.clear()
         for cache in (cls._icon_cache, cls._arrow_cache, cls._check_cache,
                       cls._radio_cache, cls._spinup_cache, cls._spindown_cache,
                       cls._sort_up_cache, cls._sort_down_cache):
@@ -3887,3 +3890,30 @@ class AppStyles:
                 {btn_disabled}
             }}
         """
+
+
+def _cache_style_builders():
+    """QSS 只取决于当前主题，为 AppStyles 上公开的 *_style 函数加上按主题的结果缓存
+
+    同一主题下各控件反复 setStyleSheet 时直接复用已生成的文本；
+    切换颜色模式/视觉风格时缓存键随之变化，_invalidate_caches 会清空缓存。
+    """
+    def wrap(name, func):
+        def cached(*args, **kwargs):
+            key = (AppStyles._get_effective_color_mode(), AppStyles._visual_style, name, args, tuple(kwargs.items()))
+            qss = AppStyles._qss_cache.get(key)
+            if qss is None:
+                qss = func(*args, **kwargs)
+                AppStyles._qss_cache[key] = qss
+            return qss
+        cached.__name__ = name
+        cached.__doc__ = func.__doc__
+        cached.__wrapped__ = func
+        return cached
+
+    for name, attr in list(vars(AppStyles).items()):
+        if isinstance(attr, staticmethod) and name.endswith('_style') and not name.startswith('_'):
+            setattr(AppStyles, name, staticmethod(wrap(name, attr.__func__)))
+
+
+_cache_style_builders()
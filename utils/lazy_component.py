@@ -0,0 +1,50 @@
+"""
+按需创建的窗口组件
+
+画中画、多画面、切片导出等功能大多数会话用不到，不必在启动时导入和创建。
+在窗口类上声明 LazyComponent 描述符后，第一次访问该属性时才导入模块、
+以窗口为参数创建实例并写入实例字典，此后的访问与普通属性相同。
+
+只想判断组件是否已创建（例如鼠标事件、退出清理）时用 peek_component，
+它不会触发导入。
+"""
+
+import importlib
+from typing import Any, Optional
+
+from core.log_manager import global_logger as logger
+
+
+class LazyComponent:
+    """类属性描述符：首次访问时导入 module 并创建 class_name(owner_instance)"""
+
+    def __init__(self, module: str, class_name: str, label: str = ''):
+        self.module = module
+        self.class_name = class_name
+        self.label = label or class_name
+        self.name = ''
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        instance = None
+        try:
+            cls = getattr(importlib.import_module(self.module), self.class_name)
+            instance = cls(obj)
+            logger.debug(f"按需初始化{self.label}")
+        except Exception as e:
+            logger.error(f"初始化{self.label}失败: {e}")
+        # 失败时也写入 None，与启动时初始化失败的处理一致，不会反复重试
+        obj.__dict__[self.name] = instance
+        return instance
+
+
+def peek_component(obj: Any, name: str) -> Optional[Any]:
+    """返回已创建的组件，尚未创建（或不存在）时返回 None，不触发 LazyComponent 的创建"""
+    try:
+        return vars(obj).get(name)
+    except TypeError:
+        return getattr(obj, name, None)
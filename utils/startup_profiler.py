@@ -0,0 +1,183 @@
+"""
+启动性能分析
+
+设置环境变量 IPTV_PROFILE_STARTUP=1 或使用命令行参数 --profile-startup 开启：
+- 记录每个模块的导入耗时（累计时间与扣除子模块后的自身时间），
+  import 语句与 importlib.import_module 都会被统计
+- 记录启动各阶段的时间点（QApplication、主窗口创建、首次绘制等）
+- 主窗口第一次绘制后把报告写入日志和标准错误输出
+
+本模块不依赖项目其他模块，需在导入 PySide6 与业务模块之前 enable()。
+"""
+
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+ENV_VAR = 'IPTV_PROFILE_STARTUP'
+CLI_FLAG = '--profile-startup'
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_t0 = time.perf_counter()
+_enabled = False
+# 模块名 -> (累计秒数, 自身秒数, 文件路径)
+_records: Dict[str, Tuple[float, float, str]] = {}
+# 正在执行的模块各自已累计的子模块耗时
+_child_time: List[float] = []
+# 扩展模块主要耗时在 create_module（加载动态库），先记下再并入 exec_module 的记录
+_create_time: Dict[str, Tuple[float, float]] = {}
+_marks: List[Tuple[str, float]] = []
+_paint_watcher = None
+
+
+def requested(argv: Optional[List[str]] = None) -> bool:
+    """是否要求开启启动分析；命令行参数 --profile-startup 会从 argv 中移除"""
+    argv = sys.argv if argv is None else argv
+    flagged = CLI_FLAG in argv
+    while CLI_FLAG in argv:
+        argv.remove(CLI_FLAG)
+    return flagged or os.environ.get(ENV_VAR, '').lower() in ('1', 'true', 'yes', 'on')
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def enable():
+    """安装导入计时钩子，并以此刻作为启动计时起点"""
+    global _enabled, _t0
+    if _enabled:
+        return
+    _enabled = True
+    _t0 = time.perf_counter()
+    sys.meta_path.insert(0, _TimingFinder())
+
+
+def mark(label: str):
+    """记录一个启动阶段的时间点"""
+    if _enabled:
+        _marks.append((label, time.perf_counter() - _t0))
+
+
+def _timed(func, on_done):
+    def wrapper(arg):
+        start = time.perf_counter()
+        _child_time.append(0.0)
+        try:
+            return func(arg)
+        finally:
+            children = _child_time.pop()
+            elapsed = time.perf_counter() - start
+            if _child_time:
+                _child_time[-1] += elapsed
+            on_done(arg, elapsed, elapsed - children)
+    wrapper._startup_timed = True
+    return wrapper
+
+
+def _created(spec, elapsed, self_time):
+    _create_time[spec.name] = (elapsed, self_time)
+
+
+def _executed(module, elapsed, self_time):
+    created, created_self = _create_time.pop(module.__name__, (0.0, 0.0))
+    _records[module.__name__] = (elapsed + created, self_time + created_self, getattr(module, '__file__', None) or '')
+
+
+class _TimingFinder:
+    """位于 sys.meta_path 最前：交给后面的查找器定位模块，再给加载器的 exec_module 套上计时"""
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, 'find_spec', None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        loader = spec.loader
+        # 内置/冻结模块的导入器是类本身，不能改
+        if loader is not None and not isinstance(loader, type):
+            for attr, on_done in (('create_module', _created), ('exec_module', _executed)):
+                method = getattr(loader, attr, None)
+                if method is not None and not getattr(method, '_startup_timed', False):
+                    try:
+                        setattr(loader, attr, _timed(method, on_done))
+                    except (AttributeError, TypeError):
+                        pass
+        return spec
+
+    def invalidate_caches(self):
+        pass
+
+
+def _is_project_module(path: str) -> bool:
+    return bool(path) and path.startswith(_PROJECT_ROOT) and 'site-packages' not in path
+
+
+def import_report(top: int = 20) -> Dict:
+    """导入耗时汇总（毫秒）
+
+    Returns:
+        {'total_ms': 顶层导入累计, 'project_ms': 项目模块自身时间之和,
+         'third_party_ms': 其余模块自身时间之和, 'modules': [(模块, 自身, 累计)] 按自身时间降序前 top 个,
+         'marks': [(阶段, 距起点毫秒)]}
+    """
+    project = third_party = 0.0
+    for cumulative, self_time, path in _records.values():
+        if _is_project_module(path):
+            project += self_time
+        else:
+            third_party += self_time
+    ranked = sorted(_records.items(), key=lambda item: item[1][1], reverse=True)[:top]
+    return {
+        'total_ms': round((project + third_party) * 1000, 1),
+        'project_ms': round(project * 1000, 1),
+        'third_party_ms': round(third_party * 1000, 1),
+        'modules': [(name, round(rec[1] * 1000, 1), round(rec[0] * 1000, 1)) for name, rec in ranked],
+        'marks': [(label, round(t * 1000, 1)) for label, t in _marks],
+    }
+
+
+def report():
+    """把启动分析结果写入日志与标准错误输出"""
+    data = import_report()
+    lines = [
+        f"启动分析: 模块导入共 {data['total_ms']}ms（项目 {data['project_ms']}ms，"
+        f"第三方/Qt {data['third_party_ms']}ms）",
+        "启动阶段: " + '，'.join(f"{label} {t}ms" for label, t in data['marks']),
+        "导入最慢的模块（自身/累计 ms）:",
+    ]
+    lines += [f"  {name:<50} {self_ms:>8} {cumulative_ms:>8}" for name, self_ms, cumulative_ms in data['modules']]
+    text = '\n'.join(lines)
+    sys.stderr.write(text + '\n')
+    try:
+        from core.log_manager import global_logger as logger
+        logger.info(text)
+    except Exception:
+        pass
+
+
+def watch_first_paint(widget):
+    """主窗口第一次绘制时记录 first_paint 并输出报告"""
+    global _paint_watcher
+    if not _enabled:
+        return
+    from PySide6.QtCore import QEvent, QObject
+
+    class _PaintWatcher(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Paint:
+                obj.removeEventFilter(self)
+                mark('首次绘制')
+                report()
+            return False
+
+    _paint_watcher = _PaintWatcher(widget)
+    widget.installEventFilter(_paint_watcher)